@@ -1,4 +1,6 @@
 import os
+import sys
+import gzip
 import requests
 import math
 import time
@@ -6,12 +8,22 @@ import re
 import base64
 import hashlib
 import threading
+import abc
+import bisect
+import functools
+import inspect
 from flask import Flask, render_template, jsonify, request, redirect, Response
 from datetime import datetime, timezone, timedelta
 from zoneinfo import ZoneInfo
-from typing import Dict, List, Optional, Tuple
+from typing import Dict, List, NamedTuple, Optional, Tuple
 import json
+import queue
+from array import array
+import unicodedata
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor, as_completed
 from difflib import SequenceMatcher
+from statistics import NormalDist
+from urllib.parse import urlsplit
 from cryptography.hazmat.primitives import serialization, hashes
 from cryptography.hazmat.primitives.asymmetric import padding
 import websocket
@@ -22,6 +34,10 @@ app = Flask(__name__)
 ODDS_API_KEY = os.environ.get('ODDS_API_KEY')
 KALSHI_API_KEY_ID = os.environ.get('KALSHI_API_KEY_ID')
 KALSHI_PRIVATE_KEY = os.environ.get('KALSHI_PRIVATE_KEY')
+KALSHI_POOL_SIZE = int(os.environ.get('KALSHI_POOL_SIZE', '8'))  # Keep-alive connections to Kalshi
+KALSHI_SIGNER = os.environ.get('KALSHI_SIGNER', 'inline')  # inline | thread | process (see REQUEST SIGNING)
+KALSHI_KEEPALIVE_SECONDS = 30  # Ping Kalshi when idle this long so the next order skips the TLS handshake
+KALSHI_NEGATIVE_TTL = 10  # Seconds to remember 404s / empty books / empty series instead of re-asking
 TELEGRAM_BOT_TOKEN = os.environ.get('TELEGRAM_BOT_TOKEN')
 TELEGRAM_CHAT_ID = os.environ.get('TELEGRAM_CHAT_ID')
 
@@ -160,6 +176,19 @@ MIN_EDGE_PERCENT = 2.0  # Only notify/display edges >= 2% over fair value
 LIVE_PROP_MIN_EDGE = 5.0  # Live props need 5%+ (FD one-way comparison, noisier)
 MAX_BOOK_DIVERGENCE = 0.10  # Reject edge if FD & Pinnacle devigged probs differ by >10pp
 
+# Strike-ladder curves: price the spread/total strikes OddsAPI doesn't quote from a
+# per-game distribution fitted to the devigged FD + Pinnacle line.
+# sport prefix -> {'margin' | 'total': (model, std dev, max strike distance from the fitted line)}
+FAIR_CURVE_ENABLED = True
+_SOCCER_CURVES = {'margin': ('normal', 1.7, 1.0), 'total': ('poisson', None, 1.0)}
+FAIR_CURVE_MODELS = {
+    'KXNBA': {'margin': ('normal', 12.0, 8.0), 'total': ('normal', 18.0, 12.0)},
+    'KXNCAAMB': {'margin': ('normal', 10.5, 8.0), 'total': ('normal', 16.0, 12.0)},
+    'KXNFL': {'margin': ('normal', 13.5, 7.0), 'total': ('normal', 13.5, 7.0)},
+    'KXNHL': {'margin': ('normal', 2.2, 1.0), 'total': ('poisson', None, 1.0)},
+    **{prefix: _SOCCER_CURVES for prefix in ('KXEPL', 'KXLALIGA', 'KXBUNDESLIGA', 'KXSERIEA', 'KXLIGUE1', 'KXUCL')},
+}
+
 # Prop market-making: place resting NO limit orders based on FD one-way lines
 PROP_MM_ENABLED = True
 PROP_MM_EDGE_PP = 0.0      # Match FD exactly (no edge buffer — FD's vig IS our edge)
@@ -177,14 +206,31 @@ COMBO_MM_POLL_SECONDS = 0.25       # Poll for new RFQs every N seconds
 COMBO_MM_ELIGIBLE_PREFIXES = ('KXNBA', 'KXNCAAMB')  # NBA + NCAAB tickers only
 COMBO_MM_MIN_LEGS = 2              # Minimum legs to quote
 COMBO_MM_MAX_LEGS = 10             # Maximum legs to quote
+COMBO_MM_MAX_EXPOSURE = 1000.00    # Max $ across all outstanding combo quotes
+COMBO_MM_WORKERS = 4               # RFQs priced and quoted in parallel
+COMBO_MM_RFQ_MAX_AGE = 3.0         # Drop RFQs that waited longer than this (s) for a worker
+COMBO_MM_LEG_MOVE_CENTS = 3        # Withdraw a pending quote once any leg's mid moves this far
+COMBO_MM_REPRICE_WINDOW = 20       # Requote a withdrawn quote if it's younger than this (s), else just cancel
 COMBO_MM_BETS_FILE = '/tmp/combo_mm_bets.json'
 
+# Process layout. 'embedded' (default, what the Procfile runs): scanner, sniper and combo
+# MM threads run inside the web process (requires a single gunicorn worker). 'web': views
+# only, state is read from ENGINE_STATE_FILE so gunicorn can run N workers; engine.py runs
+# with 'engine'. Split mode needs both processes to see the same ENGINE_STATE_DIR (same
+# host or a shared volume) — separate dynos/containers don't share /tmp.
+ENGINE_MODE = os.environ.get('ENGINE_MODE', 'embedded')
+ENGINE_STATE_DIR = os.environ.get('ENGINE_STATE_DIR', '/tmp')
+ENGINE_STATE_FILE = os.path.join(ENGINE_STATE_DIR, 'engine_state.json')
+ENGINE_STATE_INTERVAL = 1.0  # Seconds between engine state publishes
+
 # Multi-book fair value configuration
 # Pre-game: FanDuel + Pinnacle combined devig (require both)
 # Live: Pinnacle only devig (sharpest book with live odds)
 PREGAME_BOOKS = ['fanduel', 'pinnacle']
 LIVE_BOOK = 'pinnacle'
 FAIR_VALUE_BOOKS = list(set(PREGAME_BOOKS + [LIVE_BOOK]))  # Combined for API fetch
+# Per-event OddsAPI requests (props, btts) in flight at once
+ODDS_API_PARALLELISM = int(os.environ.get('ODDS_API_PARALLELISM', '4'))
 
 # Crypto & Index: higher conviction (near-expiry / known outcomes), size more aggressively
 CRYPTO_TARGET_PROFIT = 15.00   # Target $15 profit per crypto trade
@@ -195,6 +241,571 @@ INDEX_MAX_RISK = 1000.00       # Max $1000 cost per index order
 # Track which edges we've already notified about
 _notified_edges = set()
 
+# ============================================================
+# METRICS (Prometheus text format, served at /metrics)
+# ============================================================
+
+METRICS_FILE = os.path.join(ENGINE_STATE_DIR, 'engine_metrics.prom')  # Engine process publishes here for web workers
+METRIC_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0, 120.0, 300.0)
+METRIC_HELP = {
+    'http_request_duration_seconds': ('histogram', 'Outbound HTTP latency by service and endpoint'),
+    'http_requests_total': ('counter', 'Outbound HTTP requests by service, endpoint and status'),
+    'http_rate_limited_total': ('counter', 'Outbound HTTP 429 responses by service'),
+    'scan_stage_duration_seconds': ('histogram', 'scan_all_sports stage wall time'),
+    'scan_duration_seconds': ('histogram', 'Full background scan wall time'),
+    'edges_emitted_total': ('counter', 'Edges at or above MIN_EDGE by market type'),
+    'edges_current': ('gauge', 'Edges in the latest scan by market type'),
+    'combo_rfq_to_quote_seconds': ('histogram', 'Combo RFQ receipt to quote submitted'),
+    'combo_rfqs_total': ('counter', 'Combo RFQs processed by outcome'),
+    'combo_exposure_dollars': ('gauge', 'Combo quote cost reserved against COMBO_MM_MAX_EXPOSURE'),
+    'combo_quote_withdrawals_total': ('counter', 'Combo quotes pulled on a leg move by result (repriced, cancelled, cancel_failed)'),
+    'combo_ob_cache_total': ('counter', 'Combo leg orderbook cache lookups by result'),
+    'sniper_cycle_seconds': ('histogram', 'Completed props sniper cycle wall time'),
+    'thresholds_crossed_total': ('counter', 'Prop / NHL total thresholds newly guaranteed, by kind'),
+    'box_score_events_total': ('counter', 'Box score stat change events by sport'),
+    'threshold_to_action_seconds': ('histogram', 'Stat change observed to first completed-prop action'),
+    'telegram_messages_total': ('counter', 'Telegram notifications by outcome (queued, sent, dropped, failed)'),
+    'telegram_queue_depth': ('gauge', 'Telegram notifications waiting to be sent'),
+    'orderbook_prefilter_total': ('counter', 'Orderbook fetch decisions from the market snapshot prefilter (fetch / skip)'),
+    'kalshi_reads_total': ('counter', 'Kalshi market/orderbook reads by kind and result (fetched, shared, negative_hit)'),
+    'slate_lookups_total': ('counter', 'Slate registry lookups by venue and result (hit, fallback, miss)'),
+    'player_lookups_total': ('counter', 'Player registry lookups by target source and result (hit, fallback, miss)'),
+    'kalshi_ws_messages_total': ('counter', 'Kalshi WebSocket messages received by type'),
+    'kalshi_ws_dropped_total': ('counter', 'Kalshi WebSocket messages dropped on a full consumer queue, by consumer'),
+    'kalshi_ws_connects_total': ('counter', 'Kalshi WebSocket connections opened (first connect + reconnects)'),
+    'kalshi_sign_seconds': ('histogram', 'Kalshi RSA-PSS signature wall time (incl. signer queue wait) by signer'),
+}
+
+_metrics_lock = threading.Lock()
+_metric_counters = {}    # {(name, labels): value}
+_metric_gauges = {}      # {(name, labels): value}
+_metric_histograms = {}  # {(name, labels): [bucket_counts..., sum, count]}
+
+
+def _metric_key(name: str, labels: Optional[Dict]) -> tuple:
+    return (name, tuple(sorted(labels.items())) if labels else ())
+
+
+def metric_inc(name: str, labels: Dict = None, value: float = 1):
+    key = _metric_key(name, labels)
+    with _metrics_lock:
+        _metric_counters[key] = _metric_counters.get(key, 0) + value
+
+
+def metric_set(name: str, value: float, labels: Dict = None):
+    with _metrics_lock:
+        _metric_gauges[_metric_key(name, labels)] = value
+
+
+def metric_observe(name: str, value: float, labels: Dict = None):
+    key = _metric_key(name, labels)
+    with _metrics_lock:
+        h = _metric_histograms.get(key)
+        if h is None:
+            h = _metric_histograms[key] = [0] * (len(METRIC_BUCKETS) + 2)
+        for i, bound in enumerate(METRIC_BUCKETS):
+            if value <= bound:
+                h[i] += 1
+        h[-2] += value
+        h[-1] += 1
+
+
+class metric_timer:
+    """Context manager observing elapsed wall time into a histogram."""
+    def __init__(self, name: str, labels: Dict = None):
+        self.name = name
+        self.labels = labels
+
+    def __enter__(self):
+        self.start = time.perf_counter()
+        return self
+
+    def __exit__(self, *exc):
+        metric_observe(self.name, time.perf_counter() - self.start, self.labels)
+        return False
+
+
+def _format_labels(labels: tuple, le: str = None) -> str:
+    parts = []
+    for k, v in labels:
+        v = str(v).replace('\\', '\\\\').replace('"', '\\"')
+        parts.append(f'{k}="{v}"')
+    if le is not None:
+        parts.append(f'le="{le}"')
+    return '{' + ','.join(parts) + '}' if parts else ''
+
+
+def render_metrics() -> str:
+    """Render all metrics in Prometheus text exposition format."""
+    with _metrics_lock:
+        counters = dict(_metric_counters)
+        gauges = dict(_metric_gauges)
+        histograms = {k: list(v) for k, v in _metric_histograms.items()}
+    lines = []
+    for name in sorted({k[0] for k in list(counters) + list(gauges) + list(histograms)}):
+        mtype, help_text = METRIC_HELP.get(name, ('untyped', name))
+        lines.append(f"# HELP {name} {help_text}")
+        lines.append(f"# TYPE {name} {mtype}")
+        for series in (counters, gauges):
+            for (n, labels), value in sorted(series.items()):
+                if n == name:
+                    lines.append(f"{name}{_format_labels(labels)} {value}")
+        for (n, labels), h in sorted(histograms.items()):
+            if n != name:
+                continue
+            for i, bound in enumerate(METRIC_BUCKETS):
+                lines.append(f"{name}_bucket{_format_labels(labels, bound)} {h[i]}")
+            lines.append(f"{name}_bucket{_format_labels(labels, '+Inf')} {h[-1]}")
+            lines.append(f"{name}_sum{_format_labels(labels)} {h[-2]:.6f}")
+            lines.append(f"{name}_count{_format_labels(labels)} {h[-1]}")
+    return '\n'.join(lines) + '\n'
+
+
+def _http_service(host: str) -> str:
+    if 'kalshi' in host:
+        return 'kalshi'
+    if 'the-odds-api' in host:
+        return 'oddsapi'
+    if 'espn' in host:
+        return 'espn'
+    if 'telegram' in host:
+        return 'telegram'
+    return host
+
+
+def _http_endpoint(path: str) -> str:
+    """Collapse tickers/ids in a URL path so endpoint labels stay low-cardinality."""
+    segments = []
+    for seg in path.split('/'):
+        if seg.isdigit() or len(seg) > 24 or (any(c.isdigit() for c in seg) and any(c.isupper() for c in seg)):
+            seg = '{id}'
+        elif len(seg) > 12 and any(c.isdigit() for c in seg):
+            seg = '{id}'
+        segments.append(seg)
+    return '/'.join(segments)
+
+
+def _observe_http(response, *args, **kwargs):
+    """requests response hook: per-endpoint latency, status counts and 429s."""
+    try:
+        url = urlsplit(response.url)
+        service = _http_service(url.netloc)
+        if service == 'telegram':
+            endpoint = '/sendMessage'  # Path embeds the bot token
+        else:
+            endpoint = _http_endpoint(url.path)
+        labels = {'service': service, 'endpoint': endpoint}
+        metric_observe('http_request_duration_seconds', response.elapsed.total_seconds(), labels)
+        _profile_add('network', response.elapsed.total_seconds())
+        metric_inc('http_requests_total', {**labels, 'status': str(response.status_code)})
+        if response.status_code == 429:
+            metric_inc('http_rate_limited_total', {'service': service})
+    except Exception:
+        pass
+    return response
+
+
+# Optional requests transport adapter mounted on every outbound session (see replay.py:
+# records live responses into a fixture bundle, or serves a bundle offline). None = live.
+HTTP_TRANSPORT = None
+
+
+def new_http_session(pool_size: int = None) -> requests.Session:
+    """Session with the metrics hook and HTTP_TRANSPORT (if set) mounted.
+    pool_size: keep-alive connections per host, for sessions shared by worker threads."""
+    session = requests.Session()
+    session.hooks['response'].append(_observe_http)
+    if HTTP_TRANSPORT is not None:
+        session.mount('https://', HTTP_TRANSPORT)
+        session.mount('http://', HTTP_TRANSPORT)
+    elif pool_size:
+        adapter = requests.adapters.HTTPAdapter(pool_connections=pool_size, pool_maxsize=pool_size)
+        session.mount('https://', adapter)
+        session.mount('http://', adapter)
+    return session
+
+
+# Shared session for OddsAPI, ESPN and Telegram calls (connection reuse + one place to mount transports)
+_http = new_http_session()
+
+# Frozen clock for offline replays/benchmarks (None = wall clock). Timezone-aware UTC.
+CLOCK_OVERRIDE = None
+# Multiplier for deliberate scan-path sleeps (0 in replays/benchmarks)
+SLEEP_SCALE = float(os.environ.get('SCAN_SLEEP_SCALE', '1'))
+
+
+def _utcnow() -> datetime:
+    """Current time in UTC (timezone-aware), honouring CLOCK_OVERRIDE."""
+    return CLOCK_OVERRIDE or datetime.now(timezone.utc)
+
+# ============================================================
+# SCAN PROFILER (SCAN_PROFILE=1 or the toggle on /debug/profile)
+# ============================================================
+
+PROFILE_FILE = os.path.join(ENGINE_STATE_DIR, 'scan_profile.json')
+PROFILE_FLAG_FILE = os.path.join(ENGINE_STATE_DIR, 'scan_profile.enabled')  # Lets a web worker toggle the engine process
+PROFILE_KEEP = 5  # Most recent scan profiles kept in PROFILE_FILE
+
+_profile_local = threading.local()  # .stack = [root, ..., current frame] while a scan is profiled
+_profile_lock = threading.Lock()  # Worker threads charge the scan thread's frames too
+
+
+def profiling_enabled() -> bool:
+    return os.environ.get('SCAN_PROFILE') == '1' or os.path.exists(PROFILE_FLAG_FILE)
+
+
+def _new_profile_node(name: str) -> Dict:
+    return {'name': name, 'calls': 0, 'wall': 0.0, 'cpu': 0.0, 'sleep': 0.0, 'network': 0.0, 'children': {}}
+
+
+def _profile_add(kind: str, seconds: float):
+    """Charge sleep/network seconds to every open frame on this thread (inclusive times),
+    or on a worker thread to the frames its task was submitted from (in_profile_context)."""
+    nodes = getattr(_profile_local, 'stack', None) or getattr(_profile_local, 'borrowed', None)
+    if nodes:
+        with _profile_lock:
+            for node in nodes:
+                node[kind] += seconds
+
+
+def in_profile_context(fn):
+    """Wrap fn for a worker pool so the sleep/network time it records is charged to the
+    submitting thread's open profile frames. Frames are not opened on the worker, and
+    concurrent requests can add up to more network time than the frame's wall time."""
+    nodes = tuple(getattr(_profile_local, 'stack', None) or ())
+    if not nodes:
+        return fn
+
+    @functools.wraps(fn)
+    def run(*args, **kwargs):
+        _profile_local.borrowed = nodes
+        try:
+            return fn(*args, **kwargs)
+        finally:
+            _profile_local.borrowed = None
+    return run
+
+
+def _sleep(seconds: float):
+    """time.sleep that the scan profiler can account for (scaled by SLEEP_SCALE)."""
+    seconds *= SLEEP_SCALE
+    if seconds > 0:
+        time.sleep(seconds)
+    _profile_add('sleep', seconds)
+
+
+class profile_frame:
+    """Context manager adding a named child frame under the current profile frame.
+    Repeated calls with the same name are aggregated (calls count, summed times).
+    No-op when this thread is not profiling a scan."""
+    def __init__(self, name: str):
+        self.name = name
+        self.node = None
+
+    def __enter__(self):
+        stack = getattr(_profile_local, 'stack', None)
+        if stack:
+            children = stack[-1]['children']
+            node = children.get(self.name)
+            if node is None:
+                node = children[self.name] = _new_profile_node(self.name)
+            node['calls'] += 1
+            stack.append(node)
+            self.node = node
+            self.wall_start = time.perf_counter()
+            self.cpu_start = time.thread_time()
+        return self
+
+    def __exit__(self, *exc):
+        if self.node is not None:
+            self.node['wall'] += time.perf_counter() - self.wall_start
+            self.node['cpu'] += time.thread_time() - self.cpu_start
+            _profile_local.stack.pop()
+        return False
+
+
+def profiled(label_arg: str = None):
+    """Decorator wrapping a function in a profile_frame. label_arg names a parameter whose
+    value is appended to the frame name, e.g. find_total_edges[KXNBATOTAL]."""
+    def decorator(func):
+        sig = inspect.signature(func) if label_arg else None
+
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            if not getattr(_profile_local, 'stack', None):
+                return func(*args, **kwargs)
+            name = func.__qualname__
+            if sig is not None:
+                try:
+                    name += f"[{sig.bind_partial(*args, **kwargs).arguments.get(label_arg)}]"
+                except TypeError:
+                    pass
+            with profile_frame(name):
+                return func(*args, **kwargs)
+        return wrapper
+    return decorator
+
+
+class profile_scan:
+    """Context manager profiling one full scan on the current thread when enabled,
+    then appending the frame tree to PROFILE_FILE."""
+    def __enter__(self):
+        self.root = None
+        if profiling_enabled():
+            self.root = _new_profile_node('scan_all_sports')
+            self.root['calls'] = 1
+            self.started_at = datetime.utcnow().isoformat()
+            self.wall_start = time.perf_counter()
+            self.cpu_start = time.thread_time()
+            _profile_local.stack = [self.root]
+        return self
+
+    def __exit__(self, *exc):
+        if self.root is None:
+            return False
+        self.root['wall'] = time.perf_counter() - self.wall_start
+        self.root['cpu'] = time.thread_time() - self.cpu_start
+        _profile_local.stack = None
+        _write_scan_profile({'started_at': self.started_at, 'tree': self.root})
+        return False
+
+
+def _write_scan_profile(profile: Dict):
+    try:
+        profiles = read_scan_profiles()
+        profiles.insert(0, profile)
+        tmp_file = PROFILE_FILE + '.tmp'
+        with open(tmp_file, 'w') as f:
+            json.dump({'profiles': profiles[:PROFILE_KEEP]}, f)
+        os.replace(tmp_file, PROFILE_FILE)
+        print(f"   Scan profile written: {profile['tree']['wall']:.1f}s wall")
+    except Exception as e:
+        print(f"   Scan profile write error: {e}")
+
+
+def read_scan_profiles() -> List[Dict]:
+    try:
+        with open(PROFILE_FILE) as f:
+            return json.load(f).get('profiles', [])
+    except (FileNotFoundError, json.JSONDecodeError):
+        return []
+
+# ============================================================
+# TELEGRAM NOTIFIER (callers enqueue; one worker thread posts)
+# ============================================================
+
+TELEGRAM_QUEUE_SIZE = 200        # Notifications waiting to send; further ones are dropped (and counted)
+TELEGRAM_COALESCE_SECONDS = 1.0  # Notifications arriving within this window go out as one message
+TELEGRAM_MIN_INTERVAL = 1.0      # Telegram allows ~1 message/sec per chat
+TELEGRAM_MAX_CHARS = 4096        # Telegram sendMessage text limit
+TELEGRAM_MAX_RETRIES = 3
+TELEGRAM_SEPARATOR = '\n\n- - -\n\n'
+
+
+class TelegramNotifier:
+    """Bounded queue drained by a single worker thread on its own keep-alive session.
+    send() never blocks: bursts are coalesced into as few sendMessage calls as fit
+    TELEGRAM_MAX_CHARS, posts are spaced TELEGRAM_MIN_INTERVAL apart, 429s honour
+    retry_after and transient failures are retried."""
+
+    def __init__(self):
+        self._queue = queue.Queue(maxsize=TELEGRAM_QUEUE_SIZE)
+        self._lock = threading.Lock()
+        self._thread = None
+        self._session = None
+        self._last_post = 0.0
+
+    def send(self, text: str) -> bool:
+        """Enqueue text for the configured chat. Returns False if Telegram is off or the queue is full."""
+        if not TELEGRAM_BOT_TOKEN or not TELEGRAM_CHAT_ID:
+            return False
+        self._ensure_worker()
+        try:
+            self._queue.put_nowait(text)
+        except queue.Full:
+            metric_inc('telegram_messages_total', {'outcome': 'dropped'})
+            print(f"   Telegram queue full, dropped: {text.splitlines()[0][:60]}")
+            return False
+        metric_inc('telegram_messages_total', {'outcome': 'queued'})
+        return True
+
+    def flush(self, timeout: float = 30) -> bool:
+        """Wait until everything queued so far has been posted (or given up on)."""
+        deadline = time.time() + timeout
+        while self._queue.unfinished_tasks and time.time() < deadline:
+            time.sleep(0.05)
+        return not self._queue.unfinished_tasks
+
+    def _ensure_worker(self):
+        if self._thread is None:
+            with self._lock:
+                if self._thread is None:
+                    self._session = new_http_session(pool_size=1)
+                    self._thread = threading.Thread(target=self._run, name='telegram-notifier', daemon=True)
+                    self._thread.start()
+
+    def _run(self):
+        while True:
+            batch = [self._queue.get()]
+            deadline = time.time() + TELEGRAM_COALESCE_SECONDS
+            while True:
+                remaining = deadline - time.time()
+                if remaining <= 0:
+                    break
+                try:
+                    batch.append(self._queue.get(timeout=remaining))
+                except queue.Empty:
+                    break
+            metric_set('telegram_queue_depth', self._queue.qsize())
+            try:
+                for message in self._pack(batch):
+                    self._post(message)
+            except Exception as e:
+                print(f"   Telegram notifier error: {e}")
+            finally:
+                for _ in batch:
+                    self._queue.task_done()
+
+    @staticmethod
+    def _pack(texts: List[str]) -> List[str]:
+        """Join texts into as few messages as fit TELEGRAM_MAX_CHARS (oversized texts are truncated)."""
+        messages = []
+        for text in texts:
+            text = text[:TELEGRAM_MAX_CHARS]
+            if messages and len(messages[-1]) + len(TELEGRAM_SEPARATOR) + len(text) <= TELEGRAM_MAX_CHARS:
+                messages[-1] += TELEGRAM_SEPARATOR + text
+            else:
+                messages.append(text)
+        return messages
+
+    def _post(self, text: str):
+        url = f"https://api.telegram.org/bot{TELEGRAM_BOT_TOKEN}/sendMessage"
+        for attempt in range(TELEGRAM_MAX_RETRIES + 1):
+            wait = self._last_post + TELEGRAM_MIN_INTERVAL - time.time()
+            if wait > 0:
+                time.sleep(wait)
+            self._last_post = time.time()
+            try:
+                response = self._session.post(url, json={'chat_id': TELEGRAM_CHAT_ID, 'text': text}, timeout=10)
+                if response.status_code == 429:
+                    retry_after = response.json().get('parameters', {}).get('retry_after', 1)
+                    print(f"   Telegram rate limited, retrying in {retry_after}s")
+                    self._last_post = time.time() + retry_after - TELEGRAM_MIN_INTERVAL
+                    continue
+                if response.status_code < 500:
+                    response.raise_for_status()
+                    metric_inc('telegram_messages_total', {'outcome': 'sent'})
+                    return
+                print(f"   Telegram HTTP {response.status_code} (attempt {attempt + 1})")
+            except requests.HTTPError:
+                break  # 4xx other than 429: retrying won't help
+            except Exception as e:
+                print(f"   Telegram send error (attempt {attempt + 1}): {e}")
+            self._last_post = time.time() + 2 ** attempt - TELEGRAM_MIN_INTERVAL
+        metric_inc('telegram_messages_total', {'outcome': 'failed'})
+        print(f"   Telegram failed: {text.splitlines()[0][:60]}")
+
+
+_telegram = TelegramNotifier()
+
+
+def notify_telegram(text: str) -> bool:
+    """Queue a Telegram message without blocking the caller."""
+    return _telegram.send(text)
+
+# ============================================================
+# TICKER PARSER (one cached parse per Kalshi ticker)
+# ============================================================
+
+# Series suffixes stripped to get the sport prefix (KXNHLGAME -> KXNHL). Longest first.
+SERIES_SUFFIXES = ['CHALLENGERMATCH', 'MATCH', 'BGAME', 'GAME', 'SPREAD', 'TOTALSETS', 'TOTAL', 'BTTS',
+                   'GOALS', 'PTS', 'REB', 'AST', '3PT', 'SAVES', 'SETWINNER', 'ANYSET', 'DD', 'TD']
+# Team maps for sports whose moneyline/spread series are paused (props still trade)
+PREFIX_TEAM_MAPS = {'KXNBA': NBA_TEAMS, 'KXNHL': NHL_TEAMS}
+
+_TICKER_DATE_RE = re.compile(r'(\d{2}[A-Z]{3}\d{2})')
+_TICKER_SUFFIX_RE = re.compile(r'([A-Z]*?)(\d+(?:\.\d+)?)')
+
+
+class KalshiTicker(NamedTuple):
+    """KXNBASPREAD-26JAN30DETGSW-GSW4 ->
+    series='KXNBASPREAD', sport_prefix='KXNBA', event='KXNBASPREAD-26JAN30DETGSW',
+    game_part='26JAN30DETGSW', date='26JAN30', teams='DETGSW', team_pair=('DET', 'GSW'),
+    suffix='GSW4', outcome='GSW', strike=4.0"""
+    ticker: str
+    series: str
+    sport_prefix: str
+    event: str                  # series + game part (the game code moneyline/spread/total group on)
+    game_part: str              # '' for series-only tickers
+    date: str                   # ET date code, '' if the game part has none
+    teams: str                  # game part with the date stripped
+    team_pair: Tuple[str, ...]  # teams split into two known abbrevs, () if it doesn't split
+    suffix: str                 # last segment, '' for two-part tickers
+    outcome: str                # letters of the suffix: team for moneyline/spread ('GSW'), '' for totals
+    strike: Optional[float]     # trailing number of the suffix (spread 4, total 239), None for moneyline
+
+
+@functools.lru_cache(maxsize=None)
+def _team_map_for_prefix(sport_prefix: str) -> Dict[str, str]:
+    """Merged abbrev -> name map of every moneyline/spread series under sport_prefix
+    (first map wins, same order _lookup_team_name searched). '' merges all sports."""
+    merged = {}
+    for sports_map in [MONEYLINE_SPORTS, SPREAD_SPORTS]:
+        for series_key, v in sports_map.items():
+            if series_key.startswith(sport_prefix):
+                for abbrev, name in (v[2] if len(v) > 2 else {}).items():
+                    merged.setdefault(abbrev, name)
+    if sport_prefix:
+        for abbrev, name in PREFIX_TEAM_MAPS.get(sport_prefix, {}).items():
+            merged.setdefault(abbrev, name)
+    return merged
+
+
+def _series_sport_prefix(series: str) -> str:
+    for suffix in SERIES_SUFFIXES:
+        if series.endswith(suffix):
+            return series[:-len(suffix)]
+    return series
+
+
+def _split_team_pair(teams: str, team_map: Dict[str, str]) -> Tuple[str, ...]:
+    for i in range(1, len(teams)):
+        if teams[:i] in team_map and teams[i:] in team_map:
+            return (teams[:i], teams[i:])
+    return ()
+
+
+@functools.lru_cache(maxsize=1 << 16)
+def parse_ticker(ticker: str) -> KalshiTicker:
+    """Parse a Kalshi market ticker once; repeat calls are a cache hit."""
+    parts = ticker.split('-')
+    series = parts[0]
+    sport_prefix = _series_sport_prefix(series)
+    game_part = parts[1] if len(parts) >= 2 else ''
+    date_match = _TICKER_DATE_RE.match(game_part)
+    date = date_match.group(1) if date_match else ''
+    teams = game_part[len(date):]
+    suffix = parts[-1] if len(parts) >= 3 else ''
+    suffix_match = _TICKER_SUFFIX_RE.fullmatch(suffix)
+    if suffix_match:
+        outcome, strike = suffix_match.group(1), float(suffix_match.group(2))
+    else:
+        outcome, strike = suffix, None
+    return KalshiTicker(
+        ticker=ticker,
+        series=series,
+        sport_prefix=sport_prefix,
+        event=f"{series}-{game_part}" if game_part else series,
+        game_part=game_part,
+        date=date,
+        teams=teams,
+        team_pair=_split_team_pair(teams, _team_map_for_prefix(sport_prefix)) if date else (),
+        suffix=suffix,
+        outcome=outcome,
+        strike=strike,
+    )
+
+
 # ============================================================
 # ORDER TRACKER (uses Kalshi API for positions, in-memory for session)
 # ============================================================
@@ -252,6 +863,15 @@ class OrderTracker:
     def get_open_count(self) -> int:
         return len(self._session_tickers | self._api_tickers)
 
+    def open_tickers(self) -> set:
+        """Every ticker held (per the API) or traded this session."""
+        return self._session_tickers | self._api_tickers
+
+    def load_open_tickers(self, tickers):
+        """Web mode: replace the held tickers with the engine process's published set."""
+        self._api_tickers = set(tickers)
+        self._position_count = len(self._api_tickers)
+
 
 # Global order tracker instance
 _order_tracker = OrderTracker()
@@ -266,9 +886,45 @@ _scan_cache = {
     'scan_count': 0,
     'is_scanning': False,
     'prop_comparisons': [],
+    'guaranteed_edges': {},  # ticker -> latest sniper edge since the last full scan
 }
 SCAN_REST_SECONDS = 30  # Rest between scans
 
+# Pre-encoded /api/edges payload, republished whenever _scan_cache changes.
+# Swapped as a whole (never mutated) so request handlers can read it without the lock.
+_EDGES_BOOT_ID = format(int(time.time()), 'x')  # Keeps ETags unique across restarts
+_edges_snapshot = {'version': 0, 'boot_id': _EDGES_BOOT_ID, 'etag': '', 'body': b'', 'gzip_body': b''}
+
+
+def _publish_edges_snapshot(version: Optional[int] = None, boot_id: str = _EDGES_BOOT_ID):
+    """Serialize the current scan cache into a new versioned /api/edges snapshot.
+    Web workers pass the engine's version/boot_id so ETags agree across workers.
+    Caller must hold _scan_lock."""
+    global _edges_snapshot
+    if version is None:
+        version = _edges_snapshot['version'] + 1
+    body = json.dumps({
+        'edges': _scan_cache['edges'],
+        'total_count': len(_scan_cache['edges']),
+        'sports_scanned': _scan_cache['sports_scanned'],
+        'sports_with_games': _scan_cache['sports_with_games'],
+        'timestamp': _scan_cache['timestamp'],
+        'scan_count': _scan_cache['scan_count'],
+        'is_scanning': _scan_cache['is_scanning'],
+        'version': version,
+    }, separators=(',', ':')).encode('utf-8')
+    _edges_snapshot = {
+        'version': version,
+        'boot_id': boot_id,
+        'etag': f"{boot_id}-{version}",
+        'body': body,
+        'gzip_body': gzip.compress(body, compresslevel=6),
+    }
+
+
+with _scan_lock:
+    _publish_edges_snapshot()
+
 # Team name mapping cache
 TEAM_NAME_CACHE_FILE = '/tmp/team_name_cache.json'
 
@@ -342,14 +998,11 @@ def match_kalshi_to_fanduel_game(team1_name, team2_name, fd_games, kalshi_date_s
             matched = (fd_away, fd_home, game_id)
         if matched:
             # Score by date proximity if we have both dates
-            if kalshi_date and game_info.get('commence_time'):
-                try:
-                    ct = datetime.fromisoformat(game_info['commence_time'].replace('Z', '+00:00'))
-                    # Game should be on the Kalshi date (allow same day or next day early AM)
-                    day_diff = abs((ct.date() - kalshi_date.date()).days)
-                    candidates.append((day_diff, matched))
-                except Exception:
-                    candidates.append((0, matched))
+            ct = _iso_ts(game_info.get('commence_time', ''))
+            if kalshi_date and ct is not None:
+                # Game should be on the Kalshi date (allow same day or next day early AM)
+                day_diff = abs((datetime.fromtimestamp(ct, timezone.utc).date() - kalshi_date.date()).days)
+                candidates.append((day_diff, matched))
             else:
                 candidates.append((0, matched))
 
@@ -384,32 +1037,135 @@ def _match_player_name(kalshi_name: str, fd_name: str) -> bool:
     return score >= 0.85
 
 
-def kalshi_fee(price: float, contracts: int = 100) -> float:
-    """Calculate Kalshi taker fee per contract."""
+def _kalshi_fee_exact(price: float, contracts: int = 100) -> float:
     fee_total = math.ceil(0.07 * contracts * price * (1 - price) * 100) / 100
     return fee_total / contracts
 
 
+# Per-contract taker fee at a 100-contract order for each whole-cent price, 0c..100c
+KALSHI_FEE_TABLE = tuple(_kalshi_fee_exact(cents / 100) for cents in range(101))
+_KALSHI_FEE_BY_PRICE = {cents / 100: fee for cents, fee in enumerate(KALSHI_FEE_TABLE)}
+
+
+def kalshi_fee(price: float, contracts: int = 100) -> float:
+    """Calculate Kalshi taker fee per contract (KALSHI_FEE_TABLE for whole-cent prices)."""
+    if contracts == 100:
+        cents = round(price * 100)
+        if 0 <= cents <= 100 and abs(price * 100 - cents) < 1e-6:
+            return KALSHI_FEE_TABLE[cents]
+    return _kalshi_fee_exact(price, contracts)
+
+
+def rank_edges(prices: List[float], opp_probs: List[float], sizes: List[int] = None,
+               min_edge: float = None) -> List[Tuple[int, float, float, float]]:
+    """Price every candidate entry in one pass.
+    prices[i] is the Kalshi ask for entry i, opp_probs[i] the fair probability of the
+    opposite outcome, sizes[i] the contract count (default 100). Returns
+    [(i, eff, total_implied, profit_pct)] for entries clearing min_edge (default
+    MIN_EDGE_PERCENT), best profit first; equal profits keep candidate order."""
+    min_edge = MIN_EDGE_PERCENT if min_edge is None else min_edge
+    fee_by_price = _KALSHI_FEE_BY_PRICE if sizes is None else {}
+    ranked = []
+    for i, price in enumerate(prices):
+        opp_prob = opp_probs[i]
+        if price is None or opp_prob is None:
+            continue
+        fee = fee_by_price.get(price)
+        if fee is None:
+            fee = kalshi_fee(price, sizes[i] if sizes else 100)
+        eff = price + fee
+        total = eff + opp_prob
+        if total < 1.0:
+            profit = (1.0 / total - 1) * 100
+            if profit >= min_edge:
+                ranked.append((i, eff, total, profit))
+    ranked.sort(key=lambda r: r[3], reverse=True)
+    return ranked
+
+
+def cheaper_entry(yes_price: float, other_no_price: float) -> Tuple[float, str]:
+    """Cheapest way to back one side of a two-way pair: its YES, or NO on the other
+    market. (price, 'yes' | 'no'); ties go to YES."""
+    return (yes_price, 'yes') if yes_price <= other_no_price else (other_no_price, 'no')
+
+
+def _priced_edge(cand: Dict, eff: float, total: float, profit: float) -> Dict:
+    """Edge dict for a rank_edges survivor; cand carries every field that doesn't depend on the fee."""
+    return {
+        'market_type': cand['market_type'],
+        'sport': cand['sport'],
+        'game': cand['game'],
+        'team': cand['team'],
+        'opposite_team': cand['opposite_team'],
+        'kalshi_price': cand['kalshi_price'],
+        'kalshi_price_after_fees': eff,
+        'kalshi_prob_after_fees': eff * 100,
+        'kalshi_method': cand['kalshi_method'],
+        'kalshi_ticker': cand['kalshi_ticker'],
+        'kalshi_side': cand['kalshi_side'],
+        'fanduel_opposite_team': cand['fanduel_opposite_team'],
+        'fanduel_opposite_odds': cand['fanduel_opposite_odds'],
+        'fanduel_opposite_prob': cand['fd_opp_prob'] * 100,
+        'total_implied_prob': total * 100,
+        'arbitrage_profit': profit,
+        'is_live': cand['is_live'],
+        'fair_value_mode': cand['fair_value_mode'],
+        'per_book_detail': cand['per_book_detail'],
+        'odds_last_update': cand['odds_last_update'],
+        'recommendation': cand['recommendation'],
+    }
+
+
+def emit_fair_value_edges(candidates: List[Dict], kalshi_api) -> List[Dict]:
+    """Rank a finder's candidates with one rank_edges call, then notify and trade the
+    survivors best first. Candidates sharing a 'group' (the sides of one game) emit
+    only their best entry whose books agree; 'skip' labels the books-diverge log line."""
+    ranked = rank_edges([c['kalshi_price'] for c in candidates], [c['fd_opp_prob'] for c in candidates])
+    edges = []
+    emitted_groups = set()
+    for i, eff, total, profit in ranked:
+        cand = candidates[i]
+        group = cand.get('group')
+        if group is not None and group in emitted_groups:
+            continue
+        edge = _priced_edge(cand, eff, total, profit)
+        if books_diverge(edge['per_book_detail']):
+            print(f"   Skipping {edge['game']} {cand['skip']}: books diverge >10pp")
+            continue
+        if group is not None:
+            emitted_groups.add(group)
+        edges.append(edge)
+        send_telegram_notification(edge)
+        auto_trade_edge(edge, kalshi_api)
+    return edges
+
+
+@functools.lru_cache(maxsize=4096)
+def _iso_ts(iso_time: str) -> Optional[float]:
+    """'2026-02-04T00:30:00Z' -> epoch seconds. None if empty or unparseable."""
+    if not iso_time:
+        return None
+    try:
+        return datetime.fromisoformat(iso_time.replace('Z', '+00:00')).timestamp()
+    except (TypeError, ValueError):
+        return None
+
+
 def is_game_live(commence_time_str: str) -> bool:
     """Check if a game is currently live based on commence_time."""
-    if not commence_time_str:
-        return False
-    try:
-        ct = datetime.fromisoformat(commence_time_str.replace('Z', '+00:00'))
-        return ct <= datetime.now(timezone.utc)
-    except Exception:
-        return False
+    ct = _iso_ts(commence_time_str)
+    return ct is not None and ct <= _utcnow().timestamp()
 
 
 def _get_eastern_now() -> datetime:
     """Get current time in US Eastern (handles EST/EDT automatically)."""
-    return datetime.now(ZoneInfo('America/New_York'))
+    return _utcnow().astimezone(ZoneInfo('America/New_York'))
 
 
 def _get_today_date_strs() -> set:
     """Return date strings for both UTC and US Eastern to handle evening overlap.
     Kalshi tickers use US Eastern dates but UTC can roll to the next day during evening games."""
-    now_utc = datetime.now(timezone.utc)
+    now_utc = _utcnow()
     utc_str = now_utc.strftime('%y%b%d').upper()
     eastern_str = _get_eastern_now().strftime('%y%b%d').upper()
     return {utc_str, eastern_str}
@@ -420,22 +1176,19 @@ def are_odds_stale(commence_time_str: str, last_update_str: str) -> bool:
     Returns True if the game has started but odds haven't updated since before
     the game started or are more than 15 seconds old.
     Returns False for pre-game games or if we can't determine staleness."""
-    if not commence_time_str or not last_update_str:
-        return False
-    try:
-        ct = datetime.fromisoformat(commence_time_str.replace('Z', '+00:00'))
-        lu = datetime.fromisoformat(last_update_str.replace('Z', '+00:00'))
-        now = datetime.now(timezone.utc)
-        # Game hasn't started yet — odds are fine
-        if ct > now:
-            return False
-        # Game is live: odds are stale if last_update is before game start
-        # or more than 15 seconds old (API data must be near real-time for live)
-        if lu < ct or (now - lu) > timedelta(seconds=15):
-            return True
+    return odds_stale_ts(_iso_ts(commence_time_str), _iso_ts(last_update_str), _utcnow().timestamp())
+
+
+def odds_stale_ts(commence_ts: Optional[float], last_update_ts: Optional[float], now_ts: float) -> bool:
+    """are_odds_stale on epoch seconds."""
+    if commence_ts is None or last_update_ts is None:
         return False
-    except Exception:
+    # Game hasn't started yet — odds are fine
+    if commence_ts > now_ts:
         return False
+    # Game is live: odds are stale if last_update is before game start
+    # or more than 15 seconds old (API data must be near real-time for live)
+    return last_update_ts < commence_ts or now_ts - last_update_ts > 15
 
 
 def books_diverge(per_book_detail: dict) -> bool:
@@ -472,7 +1225,7 @@ def send_telegram_notification(edge: Dict):
         if last_update_str:
             try:
                 lu = datetime.fromisoformat(last_update_str.replace('Z', '+00:00'))
-                age_sec = (datetime.now(timezone.utc) - lu).total_seconds()
+                age_sec = (_utcnow() - lu).total_seconds()
                 if age_sec < 60:
                     odds_age_str = f"\nOdds age: {int(age_sec)}s ago"
                 elif age_sec < 3600:
@@ -529,8 +1282,7 @@ Edge: {edge['arbitrage_profit']:.2f}%{odds_age_str}
 Would bet: {side} {ticker} @ {int(price*100)}c
 
 https://kalshi-edge-finder.onrender.com"""
-        url = f"https://api.telegram.org/bot{TELEGRAM_BOT_TOKEN}/sendMessage"
-        requests.post(url, json={'chat_id': TELEGRAM_CHAT_ID, 'text': message}, timeout=10)
+        notify_telegram(message)
     except Exception as e:
         print(f"   Telegram failed: {e}")
 
@@ -565,8 +1317,7 @@ Edge: {edge:.2f}%
 Order status: {order_status}
 
 https://kalshi-edge-finder.onrender.com/orders"""
-        url = f"https://api.telegram.org/bot{TELEGRAM_BOT_TOKEN}/sendMessage"
-        requests.post(url, json={'chat_id': TELEGRAM_CHAT_ID, 'text': message}, timeout=10)
+        notify_telegram(message)
     except Exception as e:
         print(f"   Telegram order notification failed: {e}")
 
@@ -621,10 +1372,86 @@ def consensus_fair_prob(book_probs: list) -> float:
     return sum(book_probs) / len(book_probs)
 
 
+# ============================================================
+# ODDSAPI INGEST
+# ============================================================
+# Each OddsAPI response is turned into slotted records once: float prices, epoch
+# timestamps, interned team/player names, and a live flag fixed at ingest time.
+# The FanDuelAPI get_* methods read these instead of the raw JSON. Every games dict
+# they return also carries 'commence_ts' and 'live', so the edge finders don't
+# re-parse commence_time.
+
+def _intern(name) -> str:
+    return sys.intern(name) if name else ''
+
+
+class OddsOutcome:
+    __slots__ = ('name', 'description', 'price', 'point')
+
+    def __init__(self, raw: Dict):
+        self.name = _intern(raw.get('name'))
+        self.description = _intern(raw.get('description'))  # player name on prop markets
+        self.price = float(raw['price'])                     # decimal odds
+        self.point = raw.get('point')                        # line, None on h2h/btts
+
+
+class OddsMarket:
+    __slots__ = ('key', 'last_update', 'last_update_ts', 'outcomes')
+
+    def __init__(self, raw: Dict, book_last_update: str):
+        self.key = raw['key']
+        self.last_update = raw.get('last_update', '') or book_last_update
+        self.last_update_ts = _iso_ts(self.last_update)
+        self.outcomes = [OddsOutcome(o) for o in raw.get('outcomes', []) if 'price' in o]
+
+
+class OddsEvent:
+    """One OddsAPI event (from /odds, /events or /events/{id}/odds) with its books' markets."""
+    __slots__ = ('id', 'home', 'away', 'commence_time', 'commence_ts', 'is_live', 'books')
+
+    def __init__(self, raw: Dict, now_ts: float):
+        self.id = raw.get('id', '')
+        self.home = _intern(raw.get('home_team'))
+        self.away = _intern(raw.get('away_team'))
+        self.commence_time = raw.get('commence_time', '')
+        self.commence_ts = _iso_ts(self.commence_time)
+        self.is_live = self.commence_ts is not None and self.commence_ts <= now_ts
+        self.books = {}  # book key -> {market key: OddsMarket}
+        for bm in raw.get('bookmakers', []):
+            markets = self.books.setdefault(bm['key'], {})
+            for mkt in bm.get('markets', []):
+                markets[mkt['key']] = OddsMarket(mkt, bm.get('last_update', ''))
+
+    def game_info(self) -> Dict:
+        return {'home': self.home, 'away': self.away, 'commence_time': self.commence_time,
+                'commence_ts': self.commence_ts, 'live': self.is_live}
+
+    def markets(self, market_key: str) -> List[Tuple[str, OddsMarket]]:
+        """[(book key, market)] for every book quoting market_key, in response order."""
+        return [(book, mkts[market_key]) for book, mkts in self.books.items() if market_key in mkts]
+
+
+def ingest_events(raw_events: list) -> List[OddsEvent]:
+    now_ts = _utcnow().timestamp()
+    return [OddsEvent(raw, now_ts) for raw in raw_events]
+
+
+def _game_live(game_info: Dict) -> bool:
+    """Live flag of a FanDuelAPI games-dict entry (precomputed at ingest when present)."""
+    if 'live' in game_info:
+        return game_info['live']
+    return is_game_live(game_info.get('commence_time', ''))
+
+
+# Per-event OddsAPI fetches, shared by every FanDuelAPI call (ODDS_API_PARALLELISM in flight)
+_oddsapi_pool = ThreadPoolExecutor(max_workers=max(1, ODDS_API_PARALLELISM), thread_name_prefix='oddsapi')
+
+
 class FanDuelAPI:
     def __init__(self, api_key: str):
         self.api_key = api_key
         self.base_url = "https://api.the-odds-api.com/v4"
+        self.session = new_http_session(pool_size=ODDS_API_PARALLELISM)
         self._active_sports_cache = None
         self._active_sports_ts = None
 
@@ -634,8 +1461,8 @@ class FanDuelAPI:
         if self._active_sports_cache and self._active_sports_ts and (now - self._active_sports_ts) < 1800:
             return self._active_sports_cache
         try:
-            resp = requests.get(f"{self.base_url}/sports",
-                               params={'apiKey': self.api_key}, timeout=10)
+            resp = self.session.get(f"{self.base_url}/sports",
+                             params={'apiKey': self.api_key}, timeout=10)
             resp.raise_for_status()
             active = {s['key'] for s in resp.json() if s.get('active')}
             self._active_sports_cache = active
@@ -645,11 +1472,45 @@ class FanDuelAPI:
             print(f"   Error fetching active sports: {e}")
             return self._active_sports_cache or set()
 
-    def _fetch(self, sport_key: str, markets: str = 'h2h', bookmakers: str = None) -> list:
+    def _iter_event_odds(self, sport_key: str, events: list, markets: str, bookmakers: str,
+                         timeout: int = 10):
+        """Fetch /events/{id}/odds for every event, up to ODDS_API_PARALLELISM at once.
+        Requests are submitted immediately; the returned iterator yields (event, data)
+        in completion order, data ingested as an OddsEvent. Failed events are logged and skipped."""
+        def fetch(event):
+            url = f"{self.base_url}/sports/{sport_key}/events/{event.id}/odds"
+            params = {
+                'apiKey': self.api_key,
+                'regions': 'us,us2',
+                'markets': markets,
+                'bookmakers': bookmakers,
+                'oddsFormat': 'decimal',
+            }
+            response = self.session.get(url, params=params, timeout=timeout)
+            response.raise_for_status()
+            return OddsEvent(response.json(), _utcnow().timestamp())
+
+        fetch = in_profile_context(fetch)
+        futures = {_oddsapi_pool.submit(fetch, event): event for event in events}
+
+        def results():
+            label = markets if ',' not in markets else 'props'
+            for future in as_completed(futures):
+                event = futures[future]
+                try:
+                    yield event, future.result()
+                except requests.exceptions.HTTPError as e:
+                    status = e.response.status_code if e.response is not None else 'unknown'
+                    print(f"   OddsAPI {sport_key} event {event.id} {label}: HTTP {status}")
+                except Exception as e:
+                    print(f"   OddsAPI {sport_key} event {event.id} {label}: {e}")
+        return results()
+
+    def _fetch(self, sport_key: str, markets: str = 'h2h', bookmakers: str = None) -> List[OddsEvent]:
         """Fetch odds for today and tomorrow from multiple books.
         If bookmakers is None, pulls from all FAIR_VALUE_BOOKS."""
         try:
-            now_utc = datetime.now(timezone.utc)
+            now_utc = _utcnow()
             start_of_today = now_utc.replace(hour=0, minute=0, second=0, microsecond=0)
             end_of_window = start_of_today + timedelta(days=2)  # Today + tomorrow
 
@@ -666,9 +1527,9 @@ class FanDuelAPI:
                 'commenceTimeFrom': start_of_today.strftime('%Y-%m-%dT%H:%M:%SZ'),
                 'commenceTimeTo': end_of_window.strftime('%Y-%m-%dT%H:%M:%SZ')
             }
-            response = requests.get(url, params=params, timeout=10)
+            response = self.session.get(url, params=params, timeout=10)
             response.raise_for_status()
-            return response.json()
+            return ingest_events(response.json())
         except requests.exceptions.HTTPError as e:
             status = e.response.status_code if e.response is not None else 'unknown'
             print(f"   OddsAPI {sport_key}/{markets}: HTTP {status}")
@@ -677,75 +1538,57 @@ class FanDuelAPI:
             print(f"   OddsAPI {sport_key}/{markets} error: {e}")
             return []
 
+    @profiled('sport_key')
     def get_moneyline(self, sport_key: str) -> Dict:
         """Get h2h moneyline fair probabilities.
         Pre-game: FanDuel + Pinnacle combined devig.
         Live: Pinnacle only devig."""
-        data = self._fetch(sport_key, 'h2h')
+        events = self._fetch(sport_key, 'h2h')
         games_dict = {}
-        # {game_id: [{'book': key, 'outcomes': {name: price}, 'last_update': str}]}
-        game_book_snapshots = {}
-
-        for game in data:
-            game_id = game.get('id', '')
-            home = game.get('home_team', '')
-            away = game.get('away_team', '')
-            if home and away:
-                games_dict[game_id] = {'home': home, 'away': away, 'commence_time': game.get('commence_time', '')}
-            if game_id not in game_book_snapshots:
-                game_book_snapshots[game_id] = []
-            for bm in game.get('bookmakers', []):
-                book_key = bm['key']
-                bm_last_update = bm.get('last_update', '')
-                for mkt in bm.get('markets', []):
-                    if mkt['key'] == 'h2h':
-                        mkt_last_update = mkt.get('last_update', '') or bm_last_update
-                        book_outcomes = {}
-                        for o in mkt.get('outcomes', []):
-                            book_outcomes[o['name']] = o['price']
-                        if len(book_outcomes) >= 2:
-                            game_book_snapshots[game_id].append({
-                                'book': book_key,
-                                'outcomes': book_outcomes,
-                                'last_update': mkt_last_update,
-                            })
-
         odds_dict = {}
         pregame_count = 0
         live_count = 0
-        for game_id, all_snaps in game_book_snapshots.items():
-            commence = games_dict.get(game_id, {}).get('commence_time', '')
-            game_live = is_game_live(commence)
+        now_ts = _utcnow().timestamp()
+
+        for event in events:
+            game_id = event.id
+            if event.home and event.away:
+                games_dict[game_id] = event.game_info()
+            # [(book key, {outcome name: price}, market)] for books quoting both sides
+            all_snaps = []
+            for book_key, mkt in event.markets('h2h'):
+                book_outcomes = {o.name: o.price for o in mkt.outcomes}
+                if len(book_outcomes) >= 2:
+                    all_snaps.append((book_key, book_outcomes, mkt))
+            game_live = event.is_live
 
             if game_live:
                 # Live: use Pinnacle only
-                pin_snaps = [s for s in all_snaps if s['book'] == LIVE_BOOK]
+                pin_snaps = [s for s in all_snaps if s[0] == LIVE_BOOK]
                 if not pin_snaps:
                     continue
                 # Check Pinnacle freshness — skip if odds older than 15 min
-                pin_update = pin_snaps[0]['last_update']
-                if are_odds_stale(commence, pin_update):
+                if odds_stale_ts(event.commence_ts, pin_snaps[0][2].last_update_ts, now_ts):
                     continue
                 snaps_to_use = pin_snaps
                 label = 'live/pinnacle'
             else:
                 # Pre-game: require both FanDuel AND Pinnacle
-                pregame_snaps = [s for s in all_snaps if s['book'] in PREGAME_BOOKS]
-                books_present = {s['book'] for s in pregame_snaps}
+                pregame_snaps = [s for s in all_snaps if s[0] in PREGAME_BOOKS]
+                books_present = {s[0] for s in pregame_snaps}
                 if not all(b in books_present for b in PREGAME_BOOKS):
                     continue
                 snaps_to_use = pregame_snaps
                 label = 'pregame/fd+pin'
 
-            outcome_names = list(snaps_to_use[0]['outcomes'].keys())
+            outcome_names = list(snaps_to_use[0][1].keys())
             if len(outcome_names) < 2:
                 continue
 
             fair_probs_per_outcome = {name: [] for name in outcome_names}
             # Track per-book devigged probs for telegram detail
             per_book_fair = {name: {} for name in outcome_names}  # {outcome: {book_key: fair_prob}}
-            for snap in snaps_to_use:
-                outcomes = snap['outcomes']
+            for book_key, outcomes, _ in snaps_to_use:
                 if not all(name in outcomes for name in outcome_names):
                     continue
                 implied = {name: 1.0 / outcomes[name] for name in outcome_names}
@@ -755,12 +1598,12 @@ class FanDuelAPI:
                 for name in outcome_names:
                     devigged = implied[name] / total_implied
                     fair_probs_per_outcome[name].append(devigged)
-                    per_book_fair[name][snap['book']] = devigged
+                    per_book_fair[name][book_key] = devigged
 
             if not all(len(v) > 0 for v in fair_probs_per_outcome.values()):
                 continue
 
-            best_update = max(s['last_update'] for s in snaps_to_use)
+            best_update = max(s[2].last_update for s in snaps_to_use)
 
             all_valid = True
             game_odds = {}
@@ -790,69 +1633,56 @@ class FanDuelAPI:
         print(f"   Fair value {sport_key} moneyline: {total_outcomes} outcomes ({pregame_count} pregame, {live_count} live)")
         return {'odds': odds_dict, 'games': games_dict}
 
+    @staticmethod
+    def _select_snaps(event: OddsEvent, all_snaps: list, now_ts: float) -> Optional[list]:
+        """Books to price from: Pinnacle alone while live (None if missing or stale),
+        FanDuel + Pinnacle pre-game (None unless both quote). all_snaps: [(book, data, market)]."""
+        if event.is_live:
+            pin_snaps = [s for s in all_snaps if s[0] == LIVE_BOOK]
+            if not pin_snaps or odds_stale_ts(event.commence_ts, pin_snaps[0][2].last_update_ts, now_ts):
+                return None
+            return pin_snaps
+        pregame_snaps = [s for s in all_snaps if s[0] in PREGAME_BOOKS]
+        books_present = {s[0] for s in pregame_snaps}
+        if not all(b in books_present for b in PREGAME_BOOKS):
+            return None
+        return pregame_snaps
+
+    @profiled('sport_key')
     def get_spreads(self, sport_key: str) -> Dict:
         """Get spread lines with fair probabilities.
         Pre-game: FanDuel + Pinnacle combined. Live: Pinnacle only."""
-        data = self._fetch(sport_key, 'spreads')
+        events = self._fetch(sport_key, 'spreads')
         spreads = {}
         games_dict = {}
-        game_book_spreads = {}  # {game_id: [{'book': key, 'outcomes': {...}, 'last_update': str}]}
-
-        for game in data:
-            game_id = game.get('id', '')
-            home = game.get('home_team', '')
-            away = game.get('away_team', '')
-            if home and away:
-                games_dict[game_id] = {'home': home, 'away': away, 'commence_time': game.get('commence_time', '')}
-            if game_id not in game_book_spreads:
-                game_book_spreads[game_id] = []
-            for bm in game.get('bookmakers', []):
-                book_key = bm['key']
-                bm_last_update = bm.get('last_update', '')
-                for mkt in bm.get('markets', []):
-                    if mkt['key'] == 'spreads':
-                        mkt_last_update = mkt.get('last_update', '') or bm_last_update
-                        book_snap = {}
-                        for o in mkt.get('outcomes', []):
-                            book_snap[o['name']] = {'point': o.get('point', 0), 'odds': o['price']}
-                        if len(book_snap) >= 2:
-                            game_book_spreads[game_id].append({
-                                'book': book_key,
-                                'outcomes': book_snap,
-                                'last_update': mkt_last_update,
-                            })
-
-        for game_id, all_snaps in game_book_spreads.items():
-            commence = games_dict.get(game_id, {}).get('commence_time', '')
-            game_live = is_game_live(commence)
+        now_ts = _utcnow().timestamp()
 
-            if game_live:
-                pin_snaps = [s for s in all_snaps if s['book'] == LIVE_BOOK]
-                if not pin_snaps:
-                    continue
-                if are_odds_stale(commence, pin_snaps[0]['last_update']):
-                    continue
-                snaps_to_use = pin_snaps
-            else:
-                pregame_snaps = [s for s in all_snaps if s['book'] in PREGAME_BOOKS]
-                books_present = {s['book'] for s in pregame_snaps}
-                if not all(b in books_present for b in PREGAME_BOOKS):
-                    continue
-                snaps_to_use = pregame_snaps
+        for event in events:
+            game_id = event.id
+            if event.home and event.away:
+                games_dict[game_id] = event.game_info()
+            all_snaps = []  # [(book key, {team: {'point', 'odds'}}, market)]
+            for book_key, mkt in event.markets('spreads'):
+                book_snap = {o.name: {'point': o.point if o.point is not None else 0, 'odds': o.price}
+                             for o in mkt.outcomes}
+                if len(book_snap) >= 2:
+                    all_snaps.append((book_key, book_snap, mkt))
+            snaps_to_use = self._select_snaps(event, all_snaps, now_ts)
+            if not snaps_to_use:
+                continue
 
             team_names = set()
             for s in snaps_to_use:
-                team_names.update(s['outcomes'].keys())
+                team_names.update(s[1].keys())
             if len(team_names) < 2:
                 continue
             team_list = sorted(team_names)
 
-            label = 'live/pin' if game_live else 'pregame/fd+pin'
+            label = 'live/pin' if event.is_live else 'pregame/fd+pin'
             fair_probs = {t: [] for t in team_list}
             per_book_fair = {t: {} for t in team_list}
             spread_points = {t: [] for t in team_list}
-            for snap in snaps_to_use:
-                outcomes = snap['outcomes']
+            for book_key, outcomes, _ in snaps_to_use:
                 if not all(t in outcomes for t in team_list):
                     continue
                 implied = {t: 1.0 / outcomes[t]['odds'] for t in team_list}
@@ -862,13 +1692,13 @@ class FanDuelAPI:
                 for t in team_list:
                     devigged = implied[t] / total
                     fair_probs[t].append(devigged)
-                    per_book_fair[t][snap['book']] = devigged
+                    per_book_fair[t][book_key] = devigged
                     spread_points[t].append(outcomes[t]['point'])
 
             if not all(len(v) > 0 for v in fair_probs.values()):
                 continue
 
-            best_update = max(s['last_update'] for s in snaps_to_use)
+            best_update = max(s[2].last_update for s in snaps_to_use)
             game_spreads = {'_last_update': best_update, '_mode': label}
             skip_game = False
             for t in team_list:
@@ -891,88 +1721,61 @@ class FanDuelAPI:
         print(f"   Fair value {sport_key} spreads: {len(spreads)} games")
         return {'spreads': spreads, 'games': games_dict}
 
+    @profiled('sport_key')
     def get_totals(self, sport_key: str) -> Dict:
         """Get over/under lines with fair probabilities.
         Pre-game: FanDuel + Pinnacle combined. Live: Pinnacle only."""
-        data = self._fetch(sport_key, 'totals')
+        events = self._fetch(sport_key, 'totals')
         totals = {}
         games_dict = {}
-        game_book_totals = {}  # {game_id: [{'book': key, 'data': {...}, 'last_update': str}]}
-
-        for game in data:
-            game_id = game.get('id', '')
-            home = game.get('home_team', '')
-            away = game.get('away_team', '')
-            if home and away:
-                games_dict[game_id] = {'home': home, 'away': away, 'commence_time': game.get('commence_time', '')}
-            if game_id not in game_book_totals:
-                game_book_totals[game_id] = []
-            for bm in game.get('bookmakers', []):
-                book_key = bm['key']
-                bm_last_update = bm.get('last_update', '')
-                for mkt in bm.get('markets', []):
-                    if mkt['key'] == 'totals':
-                        mkt_last_update = mkt.get('last_update', '') or bm_last_update
-                        book_total = {}
-                        for o in mkt.get('outcomes', []):
-                            if o['name'] == 'Over':
-                                book_total['over_odds'] = o['price']
-                                book_total['point'] = o.get('point', 0)
-                            elif o['name'] == 'Under':
-                                book_total['under_odds'] = o['price']
-                        if 'over_odds' in book_total and 'under_odds' in book_total:
-                            game_book_totals[game_id].append({
-                                'book': book_key,
-                                'data': book_total,
-                                'last_update': mkt_last_update,
-                            })
-
-        for game_id, all_snaps in game_book_totals.items():
-            commence = games_dict.get(game_id, {}).get('commence_time', '')
-            game_live = is_game_live(commence)
+        now_ts = _utcnow().timestamp()
 
-            if game_live:
-                pin_snaps = [s for s in all_snaps if s['book'] == LIVE_BOOK]
-                if not pin_snaps:
-                    continue
-                if are_odds_stale(commence, pin_snaps[0]['last_update']):
-                    continue
-                snaps_to_use = pin_snaps
-            else:
-                pregame_snaps = [s for s in all_snaps if s['book'] in PREGAME_BOOKS]
-                books_present = {s['book'] for s in pregame_snaps}
-                if not all(b in books_present for b in PREGAME_BOOKS):
-                    continue
-                snaps_to_use = pregame_snaps
+        for event in events:
+            game_id = event.id
+            if event.home and event.away:
+                games_dict[game_id] = event.game_info()
+            all_snaps = []  # [(book key, {'point', 'over_odds', 'under_odds'}, market)]
+            for book_key, mkt in event.markets('totals'):
+                book_total = {}
+                for o in mkt.outcomes:
+                    if o.name == 'Over':
+                        book_total['over_odds'] = o.price
+                        book_total['point'] = o.point if o.point is not None else 0
+                    elif o.name == 'Under':
+                        book_total['under_odds'] = o.price
+                if 'over_odds' in book_total and 'under_odds' in book_total:
+                    all_snaps.append((book_key, book_total, mkt))
+            snaps_to_use = self._select_snaps(event, all_snaps, now_ts)
+            if not snaps_to_use:
+                continue
 
             # Use most common total line among selected books
-            points = [s['data']['point'] for s in snaps_to_use]
+            points = [s[1]['point'] for s in snaps_to_use]
             most_common_point = max(set(points), key=points.count)
-            matching = [s for s in snaps_to_use if abs(s['data']['point'] - most_common_point) < 0.01]
+            matching = [s for s in snaps_to_use if abs(s[1]['point'] - most_common_point) < 0.01]
             if not matching:
                 matching = snaps_to_use
 
-            label = 'live/pin' if game_live else 'pregame/fd+pin'
+            label = 'live/pin' if event.is_live else 'pregame/fd+pin'
             over_fair_list = []
             under_fair_list = []
             per_book_over = {}
             per_book_under = {}
-            for snap in matching:
-                d = snap['data']
+            for book_key, d, _ in matching:
                 over_imp = 1.0 / d['over_odds']
                 under_imp = 1.0 / d['under_odds']
                 fair_over, fair_under = devig_two_way(over_imp, under_imp)
                 over_fair_list.append(fair_over)
                 under_fair_list.append(fair_under)
-                per_book_over[snap['book']] = fair_over
-                per_book_under[snap['book']] = fair_under
+                per_book_over[book_key] = fair_over
+                per_book_under[book_key] = fair_under
 
             over_fair = consensus_fair_prob(over_fair_list)
             under_fair = consensus_fair_prob(under_fair_list)
             if over_fair <= 0.001 or under_fair <= 0.001:
                 continue
 
-            best_update = max(s['last_update'] for s in snaps_to_use)
+            best_update = max(s[2].last_update for s in snaps_to_use)
             totals[game_id] = {
                 'point': most_common_point,
                 'over_odds': 1.0 / over_fair,
@@ -989,10 +1792,11 @@ class FanDuelAPI:
         print(f"   Fair value {sport_key} totals: {len(totals)} games")
         return {'totals': totals, 'games': games_dict}
 
-    def get_events(self, sport_key: str) -> list:
-        """Get event IDs for today and tomorrow (used for per-event prop fetching)."""
+    @profiled('sport_key')
+    def get_events(self, sport_key: str) -> List[OddsEvent]:
+        """Get events for today and tomorrow (used for per-event prop fetching)."""
         try:
-            now_utc = datetime.now(timezone.utc)
+            now_utc = _utcnow()
             start_of_today = now_utc.replace(hour=0, minute=0, second=0, microsecond=0)
             end_of_window = start_of_today + timedelta(days=2)
 
@@ -1002,13 +1806,14 @@ class FanDuelAPI:
                 'commenceTimeFrom': start_of_today.strftime('%Y-%m-%dT%H:%M:%SZ'),
                 'commenceTimeTo': end_of_window.strftime('%Y-%m-%dT%H:%M:%SZ')
             }
-            response = requests.get(url, params=params, timeout=10)
+            response = self.session.get(url, params=params, timeout=10)
             response.raise_for_status()
-            return response.json()
+            return ingest_events(response.json())
         except Exception as e:
             print(f"   FanDuel {sport_key} events error: {e}")
             return []
 
+    @profiled('sport_key')
     def get_btts(self, sport_key: str) -> Dict:
         """Get BTTS with fair probabilities.
         Pre-game: FanDuel + Pinnacle combined. Live: Pinnacle only."""
@@ -1024,78 +1829,47 @@ class FanDuelAPI:
         print(f"   OddsAPI {sport_key}: {len(events)} events, fetching btts...")
 
         for event in events:
-            event_id = event.get('id', '')
-            home = event.get('home_team', '')
-            away = event.get('away_team', '')
-            commence = event.get('commence_time', '')
-            if home and away:
-                games_dict[event_id] = {'home': home, 'away': away, 'commence_time': commence}
+            if event.home and event.away:
+                games_dict[event.id] = event.game_info()
 
+        for event, data in self._iter_event_odds(sport_key, events, 'btts', bookmakers_str):
+            event_id = event.id
             try:
-                url = f"{self.base_url}/sports/{sport_key}/events/{event_id}/odds"
-                params = {
-                    'apiKey': self.api_key,
-                    'regions': 'us,us2',
-                    'markets': 'btts',
-                    'bookmakers': bookmakers_str,
-                    'oddsFormat': 'decimal',
-                }
-                response = requests.get(url, params=params, timeout=10)
-                response.raise_for_status()
-                data = response.json()
-
-                all_snaps = []
-                for bm in data.get('bookmakers', []):
-                    book_key = bm['key']
-                    bm_last_update = bm.get('last_update', '')
-                    for mkt in bm.get('markets', []):
-                        if mkt['key'] == 'btts':
-                            mkt_last_update = mkt.get('last_update', '') or bm_last_update
-                            snap = {}
-                            for o in mkt.get('outcomes', []):
-                                if o['name'] == 'Yes':
-                                    snap['yes_odds'] = o['price']
-                                elif o['name'] == 'No':
-                                    snap['no_odds'] = o['price']
-                            if 'yes_odds' in snap and 'no_odds' in snap:
-                                all_snaps.append({'book': book_key, 'data': snap, 'last_update': mkt_last_update})
-
-                game_live = is_game_live(commence)
-                if game_live:
-                    pin_snaps = [s for s in all_snaps if s['book'] == LIVE_BOOK]
-                    if not pin_snaps:
-                        continue
-                    if are_odds_stale(commence, pin_snaps[0]['last_update']):
-                        continue
-                    snaps_to_use = pin_snaps
-                else:
-                    pregame_snaps = [s for s in all_snaps if s['book'] in PREGAME_BOOKS]
-                    books_present = {s['book'] for s in pregame_snaps}
-                    if not all(b in books_present for b in PREGAME_BOOKS):
-                        continue
-                    snaps_to_use = pregame_snaps
+                all_snaps = []  # [(book key, {'yes_odds', 'no_odds'}, market)]
+                for book_key, mkt in data.markets('btts'):
+                    snap = {}
+                    for o in mkt.outcomes:
+                        if o.name == 'Yes':
+                            snap['yes_odds'] = o.price
+                        elif o.name == 'No':
+                            snap['no_odds'] = o.price
+                    if 'yes_odds' in snap and 'no_odds' in snap:
+                        all_snaps.append((book_key, snap, mkt))
+
+                snaps_to_use = self._select_snaps(event, all_snaps, _utcnow().timestamp())
+                if not snaps_to_use:
+                    continue
 
-                label = 'live/pin' if game_live else 'pregame/fd+pin'
+                label = 'live/pin' if event.is_live else 'pregame/fd+pin'
                 yes_fair_list = []
                 no_fair_list = []
                 per_book_yes = {}
                 per_book_no = {}
-                for snap in snaps_to_use:
-                    d = snap['data']
+                for book_key, d, _ in snaps_to_use:
                     yes_imp = 1.0 / d['yes_odds']
                     no_imp = 1.0 / d['no_odds']
                     fair_yes, fair_no = devig_two_way(yes_imp, no_imp)
                     yes_fair_list.append(fair_yes)
                     no_fair_list.append(fair_no)
-                    per_book_yes[snap['book']] = fair_yes
-                    per_book_no[snap['book']] = fair_no
+                    per_book_yes[book_key] = fair_yes
+                    per_book_no[book_key] = fair_no
 
                 yes_fair = consensus_fair_prob(yes_fair_list)
                 no_fair = consensus_fair_prob(no_fair_list)
                 if yes_fair <= 0.001 or no_fair <= 0.001:
                     continue
 
-                best_update = max(s['last_update'] for s in snaps_to_use)
+                best_update = max(s[2].last_update for s in snaps_to_use)
                 btts[event_id] = {
                     'yes_odds': 1.0 / yes_fair,
                     'no_odds': 1.0 / no_fair,
@@ -1105,21 +1879,22 @@ class FanDuelAPI:
                     'per_book_yes': per_book_yes,
                     'per_book_no': per_book_no,
                 }
-            except requests.exceptions.HTTPError as e:
-                status = e.response.status_code if e.response is not None else 'unknown'
-                print(f"   OddsAPI {sport_key} event {event_id} btts: HTTP {status}")
             except Exception as e:
                 print(f"   OddsAPI {sport_key} event {event_id} btts: {e}")
 
-            time.sleep(0.5)
-
         print(f"   Fair value {sport_key} btts: {len(btts)} games")
         return {'btts': btts, 'games': games_dict}
 
-    def get_player_props_pregame(self, sport_key: str, market_keys: list) -> Dict:
+    @profiled('sport_key')
+    def get_player_props_pregame(self, sport_key: str, market_keys: list, stream: bool = False) -> Dict:
         """Get FanDuel one-way player prop lines for pre-game events.
         Returns raw FanDuel Over implied probabilities (no devigging, no Pinnacle).
-        Fetches all market_keys in one API call per event (saves API quota).
+        Fetches all market_keys in one API call per event (saves API quota), with
+        events fetched concurrently (ODDS_API_PARALLELISM).
+
+        stream=True returns immediately with 'games' filled in and a 'stream' iterator
+        yielding (event_id, event_props) as each event's odds arrive; 'props' fills up
+        as the stream is consumed (see compare_pregame_props).
 
         Returns:
         {
@@ -1137,7 +1912,7 @@ class FanDuelAPI:
                     ...
                 ],
             },
-            'games': {event_id: {'home': str, 'away': str, 'commence_time': str}},
+            'games': {event_id: {'home': str, 'away': str, 'commence_time': str, 'commence_ts': float, 'live': bool}},
         }
         """
         props = {}
@@ -1149,7 +1924,7 @@ class FanDuelAPI:
             return {'props': props, 'games': games_dict}
 
         # Only pre-game events
-        pregame_events = [e for e in events if not is_game_live(e.get('commence_time', ''))]
+        pregame_events = [e for e in events if not e.is_live]
         live_count = len(events) - len(pregame_events)
         if not pregame_events:
             print(f"   OddsAPI {sport_key} props: no pre-game events ({len(events)} total, {live_count} live)")
@@ -1159,75 +1934,59 @@ class FanDuelAPI:
         print(f"   OddsAPI {sport_key}: {len(pregame_events)} pre-game events ({live_count} live skipped), fetching {markets_str}...")
 
         for event in pregame_events:
-            event_id = event.get('id', '')
-            home = event.get('home_team', '')
-            away = event.get('away_team', '')
-            commence = event.get('commence_time', '')
-            if home and away:
-                games_dict[event_id] = {'home': home, 'away': away, 'commence_time': commence}
-
-            try:
-                url = f"{self.base_url}/sports/{sport_key}/events/{event_id}/odds"
-                params = {
-                    'apiKey': self.api_key,
-                    'regions': 'us,us2',
-                    'markets': markets_str,
-                    'bookmakers': 'fanduel',
-                    'oddsFormat': 'decimal',
-                }
-                response = requests.get(url, params=params, timeout=15)
-                response.raise_for_status()
-                data = response.json()
+            if event.home and event.away:
+                games_dict[event.id] = event.game_info()
 
-                event_props = []
-                for bm in data.get('bookmakers', []):
-                    if bm['key'] != 'fanduel':
-                        continue
-                    bm_last_update = bm.get('last_update', '')
-                    for mkt in bm.get('markets', []):
-                        mkt_key = mkt['key']
-                        if mkt_key not in market_keys:
-                            continue
-                        mkt_last_update = mkt.get('last_update', '') or bm_last_update
-                        for o in mkt.get('outcomes', []):
-                            if o.get('name') != 'Over':
-                                continue
-                            player = o.get('description', '')
-                            point = o.get('point')
-                            if not player or point is None:
-                                continue
-                            decimal_odds = o['price']
-                            fd_implied = 1.0 / decimal_odds
-                            # Convert to American for display
-                            if decimal_odds >= 2.0:
-                                american = int(round((decimal_odds - 1) * 100))
-                            else:
-                                american = int(round(-100 / (decimal_odds - 1)))
-                            event_props.append({
-                                'player': player,
-                                'point': point,
-                                'over_odds': decimal_odds,
-                                'fd_implied': fd_implied,
-                                'american_odds': american,
-                                'last_update': mkt_last_update,
-                                'market_key': mkt_key,
-                            })
+        fetches = self._iter_event_odds(sport_key, pregame_events, markets_str, 'fanduel', timeout=15)
 
+        def prop_stream():
+            for event, data in fetches:
+                try:
+                    event_props = self._parse_pregame_props(data, market_keys)
+                except Exception as e:
+                    print(f"   OddsAPI {sport_key} event {event.id} props: {e}")
+                    continue
                 if event_props:
-                    props[event_id] = event_props
-
-            except requests.exceptions.HTTPError as e:
-                status = e.response.status_code if e.response is not None else 'unknown'
-                print(f"   OddsAPI {sport_key} event {event_id} props: HTTP {status}")
-            except Exception as e:
-                print(f"   OddsAPI {sport_key} event {event_id} props: {e}")
-
-            time.sleep(0.5)
-
-        total_props = sum(len(v) for v in props.values())
-        print(f"   FD pregame props {sport_key}: {total_props} lines in {len(props)} games")
+                    props[event.id] = event_props
+                    yield event.id, event_props
+            total_props = sum(len(v) for v in props.values())
+            print(f"   FD pregame props {sport_key}: {total_props} lines in {len(props)} games")
+
+        if stream:
+            return {'props': props, 'games': games_dict, 'stream': prop_stream()}
+        for _ in prop_stream():
+            pass
         return {'props': props, 'games': games_dict}
 
+    @staticmethod
+    def _parse_pregame_props(data: OddsEvent, market_keys: list) -> List[Dict]:
+        """FanDuel Over lines from one event's /odds payload."""
+        event_props = []
+        for mkt_key, mkt in data.books.get('fanduel', {}).items():
+            if mkt_key not in market_keys:
+                continue
+            for o in mkt.outcomes:
+                if o.name != 'Over' or not o.description or o.point is None:
+                    continue
+                decimal_odds = o.price
+                fd_implied = 1.0 / decimal_odds
+                # Convert to American for display
+                if decimal_odds >= 2.0:
+                    american = int(round((decimal_odds - 1) * 100))
+                else:
+                    american = int(round(-100 / (decimal_odds - 1)))
+                event_props.append({
+                    'player': o.description,
+                    'point': o.point,
+                    'over_odds': decimal_odds,
+                    'fd_implied': fd_implied,
+                    'american_odds': american,
+                    'last_update': mkt.last_update,
+                    'market_key': mkt_key,
+                })
+        return event_props
+
+    @profiled('sport_key')
     def get_fd_live_props(self, sport_key: str, market_key: str) -> Dict:
         """Get FanDuel one-way (over) player prop lines for LIVE games only.
         Returns raw FD implied probabilities — no devigging."""
@@ -1239,7 +1998,7 @@ class FanDuelAPI:
             print(f"   OddsAPI {sport_key} {market_key}: no events today")
             return {'props': props, 'games': games_dict}
 
-        live_events = [e for e in events if is_game_live(e.get('commence_time', ''))]
+        live_events = [e for e in events if e.is_live]
         if not live_events:
             print(f"   OddsAPI {sport_key} {market_key}: no live events")
             return {'props': props, 'games': games_dict}
@@ -1247,112 +2006,362 @@ class FanDuelAPI:
         print(f"   OddsAPI {sport_key}: {len(live_events)} live events, fetching FD {market_key}...")
 
         for event in live_events:
-            event_id = event.get('id', '')
-            home = event.get('home_team', '')
-            away = event.get('away_team', '')
-            commence = event.get('commence_time', '')
-            if home and away:
-                games_dict[event_id] = {'home': home, 'away': away, 'commence_time': commence}
+            if event.home and event.away:
+                games_dict[event.id] = event.game_info()
 
-            try:
-                url = f"{self.base_url}/sports/{sport_key}/events/{event_id}/odds"
-                params = {
-                    'apiKey': self.api_key,
-                    'regions': 'us,us2',
-                    'markets': market_key,
-                    'bookmakers': 'fanduel',
-                    'oddsFormat': 'decimal',
-                }
-                response = requests.get(url, params=params, timeout=10)
-                response.raise_for_status()
-                data = response.json()
-
-                game_props = []
-                for bm in data.get('bookmakers', []):
-                    if bm['key'] != 'fanduel':
-                        continue
-                    bm_last_update = bm.get('last_update', '')
-                    for mkt in bm.get('markets', []):
-                        if mkt['key'] == market_key:
-                            mkt_last_update = mkt.get('last_update', '') or bm_last_update
-                            # Check staleness
-                            if are_odds_stale(commence, mkt_last_update):
-                                print(f"   FD {market_key} stale for {home} vs {away}, skipping")
-                                continue
-                            for o in mkt.get('outcomes', []):
-                                if o.get('name') == 'Over':
-                                    game_props.append({
-                                        'player': o.get('description', ''),
-                                        'point': o.get('point', 0),
-                                        'over_odds': o['price'],
-                                        'fd_over_implied': 1.0 / o['price'],
-                                        'last_update': mkt_last_update,
-                                    })
-                if game_props:
-                    props[event_id] = game_props
-            except requests.exceptions.HTTPError as e:
-                status = e.response.status_code if e.response is not None else 'unknown'
-                print(f"   OddsAPI {sport_key} event {event_id} {market_key}: HTTP {status}")
+        for event, data in self._iter_event_odds(sport_key, live_events, market_key, 'fanduel'):
+            mkt = data.books.get('fanduel', {}).get(market_key)
+            if mkt is None:
+                continue
+            # Check staleness
+            if odds_stale_ts(event.commence_ts, mkt.last_update_ts, _utcnow().timestamp()):
+                print(f"   FD {market_key} stale for {event.home} vs {event.away}, skipping")
+                continue
+            try:
+                game_props = [{
+                    'player': o.description,
+                    'point': o.point if o.point is not None else 0,
+                    'over_odds': o.price,
+                    'fd_over_implied': 1.0 / o.price,
+                    'last_update': mkt.last_update,
+                } for o in mkt.outcomes if o.name == 'Over']
             except Exception as e:
-                print(f"   OddsAPI {sport_key} event {event_id} {market_key}: {e}")
-
-            time.sleep(0.5)
+                print(f"   OddsAPI {sport_key} event {event.id} {market_key}: {e}")
+                continue
+            if game_props:
+                props[event.id] = game_props
 
         total_props = sum(len(v) for v in props.values())
         print(f"   FD live {sport_key} {market_key}: {total_props} props in {len(props)} games")
         return {'props': props, 'games': games_dict}
 
 
+# ============================================================
+# REQUEST SIGNING
+# ============================================================
+# Every authenticated Kalshi call (REST and the WebSocket handshake) carries an RSA-PSS
+# SHA-256 signature. Signers share one interface, sign(message) -> base64 signature:
+#   inline  - sign in the calling thread (lowest latency, holds the GIL for the whole sign)
+#   thread  - one dedicated signing thread; callers queue behind it instead of each other
+#   process - one signing process; the RSA work runs outside this interpreter's GIL at the
+#             cost of a pickle round trip per signature
+# `python bench.py --signing` measures signatures/sec and per-call latency for each.
+
+_PSS_PADDING = padding.PSS(mgf=padding.MGF1(hashes.SHA256()), salt_length=padding.PSS.DIGEST_LENGTH)
+
+
+def load_kalshi_private_key(pem: str):
+    """Parse a PEM private key, accepting env-var style escaped newlines."""
+    return serialization.load_pem_private_key(pem.replace('\\n', '\n').encode(), password=None)
+
+
+def _rsa_pss_sign(private_key, message: str) -> str:
+    return base64.b64encode(private_key.sign(message.encode('utf-8'), _PSS_PADDING, hashes.SHA256())).decode('utf-8')
+
+
+class InlineSigner:
+    kind = 'inline'
+
+    def __init__(self, private_key):
+        self.private_key = private_key
+
+    def _sign(self, message: str) -> str:
+        return _rsa_pss_sign(self.private_key, message)
+
+    def sign(self, message: str) -> str:
+        start = time.perf_counter()
+        signature = self._sign(message)
+        metric_observe('kalshi_sign_seconds', time.perf_counter() - start, {'signer': self.kind})
+        return signature
+
+    def close(self):
+        pass
+
+
+class ThreadSigner(InlineSigner):
+    kind = 'thread'
+
+    def __init__(self, private_key):
+        super().__init__(private_key)
+        self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix='kalshi-signer')
+
+    def _sign(self, message: str) -> str:
+        return self._executor.submit(_rsa_pss_sign, self.private_key, message).result()
+
+    def close(self):
+        self._executor.shutdown(wait=False)
+
+
+_signer_process_key = None  # private key inside a ProcessSigner worker
+
+
+def _signer_process_init(pem: str):
+    global _signer_process_key
+    _signer_process_key = load_kalshi_private_key(pem)
+
+
+def _signer_process_sign(message: str) -> str:
+    return _rsa_pss_sign(_signer_process_key, message)
+
+
+class ProcessSigner(InlineSigner):
+    """Signs in a worker process that loads its own copy of the key (the key object is not picklable)."""
+    kind = 'process'
+
+    def __init__(self, private_key, pem: str):
+        super().__init__(private_key)
+        self._executor = ProcessPoolExecutor(max_workers=1, initializer=_signer_process_init, initargs=(pem,))
+
+    def _sign(self, message: str) -> str:
+        return self._executor.submit(_signer_process_sign, message).result()
+
+    def close(self):
+        self._executor.shutdown(wait=False)
+
+
+def make_signer(pem: str, kind: str = None) -> Optional[InlineSigner]:
+    """Build a signer of kind (default KALSHI_SIGNER) for pem. Returns None if the key can't be loaded."""
+    kind = kind or KALSHI_SIGNER
+    try:
+        private_key = load_kalshi_private_key(pem)
+    except Exception as e:
+        print(f"   Kalshi: Failed to load private key: {e}")
+        return None
+    if kind == 'thread':
+        return ThreadSigner(private_key)
+    if kind == 'process':
+        return ProcessSigner(private_key, pem)
+    return InlineSigner(private_key)
+
+
+def kalshi_auth_headers(api_key_id: str, signer: InlineSigner, method: str, path: str) -> Dict[str, str]:
+    """KALSHI-ACCESS-* headers for method + path (query string is not signed)."""
+    timestamp_ms = str(int(time.time() * 1000))
+    return {
+        'KALSHI-ACCESS-KEY': api_key_id,
+        'KALSHI-ACCESS-SIGNATURE': signer.sign(timestamp_ms + method.upper() + path.split('?')[0]),
+        'KALSHI-ACCESS-TIMESTAMP': timestamp_ms,
+    }
+
+
+# ============================================================
+# SINGLE-FLIGHT READS (coalesce identical in-flight Kalshi reads)
+# ============================================================
+
+class _Flight:
+    __slots__ = ('done', 'result', 'error')
+
+    def __init__(self):
+        self.done = threading.Event()
+        self.result = None
+        self.error = None
+
+
+class SingleFlight:
+    """Concurrent calls with the same key share one execution of fn; results for which
+    cache_if(result) is true (404s, empty books) are remembered for KALSHI_NEGATIVE_TTL.
+    Shared results are the same object for every caller: treat them as read-only."""
+
+    def __init__(self, kind: str):
+        self.kind = kind
+        self._lock = threading.Lock()
+        self._inflight = {}  # key -> _Flight
+        self._negative = {}  # key -> (expires_at, result)
+
+    def do(self, key, fn, cache_if=None):
+        with self._lock:
+            cached = self._negative.get(key)
+            if cached:
+                if cached[0] > time.time():
+                    metric_inc('kalshi_reads_total', {'kind': self.kind, 'result': 'negative_hit'})
+                    return cached[1]
+                del self._negative[key]
+            flight = self._inflight.get(key)
+            leader = flight is None
+            if leader:
+                flight = self._inflight[key] = _Flight()
+        if not leader:
+            flight.done.wait()
+            metric_inc('kalshi_reads_total', {'kind': self.kind, 'result': 'shared'})
+            if flight.error:
+                raise flight.error
+            return flight.result
+        metric_inc('kalshi_reads_total', {'kind': self.kind, 'result': 'fetched'})
+        try:
+            flight.result = fn()
+            return flight.result
+        except BaseException as e:
+            flight.error = e
+            raise
+        finally:
+            with self._lock:
+                del self._inflight[key]
+                if flight.error is None and cache_if and cache_if(flight.result):
+                    self._negative[key] = (time.time() + KALSHI_NEGATIVE_TTL, flight.result)
+            flight.done.set()
+
+    def clear(self, key=None):
+        """Forget the negative entry for key, or all of them."""
+        with self._lock:
+            if key is None:
+                self._negative.clear()
+            else:
+                self._negative.pop(key, None)
+
+
+class OrderBook:
+    """One Kalshi market's book in fixed 1-99c integer arrays (index = price in cents).
+
+    Kalshi books are bids only: a YES ask at p is a NO bid at 100 - p. Best bids are kept
+    as indices (maintained through apply_delta), and cumulative depth is built on the
+    first depth query after a change, so best price, mid and "contracts available at or
+    below X cents" are O(1). ~1KB per market regardless of how many levels it has.
+    """
+    __slots__ = ('yes', 'no', 'best_yes_bid', 'best_no_bid', '_yes_cum', '_no_cum')
+
+    def __init__(self, yes_levels=(), no_levels=()):
+        self.yes = array('i', bytes(400))  # 100 zeroed int32s, [0] unused
+        self.no = array('i', bytes(400))
+        best_yes = best_no = 0  # cents, 0 = no bids
+        for price, qty in yes_levels:
+            self.yes[price] += qty
+            if qty > 0 and price > best_yes:
+                best_yes = price
+        for price, qty in no_levels:
+            self.no[price] += qty
+            if qty > 0 and price > best_no:
+                best_no = price
+        self.best_yes_bid, self.best_no_bid = best_yes, best_no
+        self._yes_cum = self._no_cum = None
+
+    @classmethod
+    def from_response(cls, payload: Dict) -> 'OrderBook':
+        """From a REST orderbook response ([[price_cents, qty], ...] per side)."""
+        data = payload.get('orderbook', payload)
+        return cls(data.get('yes') or (), data.get('no') or ())
+
+    @staticmethod
+    def _scan_best(levels: array, start: int) -> int:
+        for price in range(start, 0, -1):
+            if levels[price] > 0:
+                return price
+        return 0
+
+    def apply_delta(self, side: str, price: int, delta: int):
+        """WS orderbook_delta: add delta contracts at price on side ('yes' / 'no')."""
+        levels = self.yes if side == 'yes' else self.no
+        levels[price] = max(0, levels[price] + delta)
+        best = self.best_yes_bid if side == 'yes' else self.best_no_bid
+        if levels[price] > 0 and price > best:
+            best = price
+        elif price == best and levels[price] == 0:
+            best = self._scan_best(levels, price - 1)
+        if side == 'yes':
+            self.best_yes_bid, self._yes_cum = best, None
+        else:
+            self.best_no_bid, self._no_cum = best, None
+
+    @property
+    def empty(self) -> bool:
+        return not self.best_yes_bid and not self.best_no_bid
+
+    def yes_ask(self) -> Optional[float]:
+        """Best YES ask in dollars (100 - best NO bid), None if no NO bids."""
+        return (100 - self.best_no_bid) / 100 if self.best_no_bid else None
+
+    def no_ask(self) -> Optional[float]:
+        """Best NO ask in dollars (100 - best YES bid), None if no YES bids."""
+        return (100 - self.best_yes_bid) / 100 if self.best_yes_bid else None
+
+    def mid_yes(self) -> Optional[float]:
+        """YES mid probability from the two best bids, None unless both sides have bids."""
+        if not self.best_yes_bid or not self.best_no_bid:
+            return None
+        return (self.best_yes_bid + 100 - self.best_no_bid) / 200
+
+    @staticmethod
+    def _cum_from_top(levels: array) -> array:
+        cum = array('i', bytes(404))  # cum[p] = contracts bid at p cents or higher
+        for price in range(99, 0, -1):
+            cum[price] = cum[price + 1] + levels[price]
+        return cum
+
+    def yes_depth(self, max_cents: int) -> int:
+        """YES contracts buyable at max_cents or cheaper (NO bids at 100 - max_cents or higher)."""
+        if self._no_cum is None:
+            self._no_cum = self._cum_from_top(self.no)
+        return self._no_cum[min(99, max(1, 100 - max_cents))] if max_cents >= 1 else 0
+
+    def no_depth(self, max_cents: int) -> int:
+        """NO contracts buyable at max_cents or cheaper (YES bids at 100 - max_cents or higher)."""
+        if self._yes_cum is None:
+            self._yes_cum = self._cum_from_top(self.yes)
+        return self._yes_cum[min(99, max(1, 100 - max_cents))] if max_cents >= 1 else 0
+
+    def yes_asks(self, max_cents: int = 99) -> List[Tuple[int, int]]:
+        """[(yes_price_cents, qty)] cheapest first, up to max_cents."""
+        no = self.no
+        return [(100 - p, no[p]) for p in range(self.best_no_bid, max(0, 99 - max_cents), -1) if no[p]]
+
+
+def _is_empty_book(ob) -> bool:
+    """404 ({}) or a book with no bids on either side. None (transient error) is not cached."""
+    if ob is None:
+        return False
+    return ob == {} or ob.empty
+
+
 class KalshiAPI:
+    """Kalshi REST client. Thread-safe: auth headers are signed per request and never
+    stored on the shared session. Use get_kalshi_client() for the process-wide instance."""
+
     def __init__(self, api_key_id: str = None, private_key_str: str = None):
         self.BASE_URL = "https://api.elections.kalshi.com/trade-api/v2"
         self.api_key_id = api_key_id
         self.private_key = None
-        self.session = requests.Session()
+        self.signer = None
+        self.session = new_http_session(pool_size=KALSHI_POOL_SIZE)
         self.session.headers.update({'Accept': 'application/json', 'Content-Type': 'application/json'})
+        self.last_request_at = 0.0
+        self.session.hooks['response'].append(self._touch)
+        # Public market data reads: concurrent identical requests share one round trip
+        self._markets_reads = SingleFlight('markets')
+        self._market_reads = SingleFlight('market')
+        self._orderbook_reads = SingleFlight('orderbook')
 
         # Load RSA private key for signed requests
         if private_key_str:
-            try:
-                # Handle env var newline encoding
-                key_str = private_key_str.replace('\\n', '\n')
-                self.private_key = serialization.load_pem_private_key(
-                    key_str.encode(), password=None
-                )
-                print("   Kalshi: RSA private key loaded successfully")
-            except Exception as e:
-                print(f"   Kalshi: Failed to load private key: {e}")
+            self.signer = make_signer(private_key_str)
+            if self.signer:
+                self.private_key = self.signer.private_key
+                print(f"   Kalshi: RSA private key loaded successfully ({self.signer.kind} signer)")
 
     def _sign_request(self, method: str, path: str) -> Dict[str, str]:
         """Generate RSA-PSS signed auth headers for Kalshi API."""
-        timestamp_ms = str(int(time.time() * 1000))
-        # Strip query params for signing
-        path_only = path.split('?')[0]
-        msg = timestamp_ms + method.upper() + path_only
-        signature = self.private_key.sign(
-            msg.encode('utf-8'),
-            padding.PSS(
-                mgf=padding.MGF1(hashes.SHA256()),
-                salt_length=padding.PSS.DIGEST_LENGTH
-            ),
-            hashes.SHA256()
-        )
-        return {
-            'KALSHI-ACCESS-KEY': self.api_key_id,
-            'KALSHI-ACCESS-SIGNATURE': base64.b64encode(signature).decode('utf-8'),
-            'KALSHI-ACCESS-TIMESTAMP': timestamp_ms,
-        }
+        return kalshi_auth_headers(self.api_key_id, self.signer, method, path)
+
+    def _touch(self, response, *args, **kwargs):
+        self.last_request_at = time.time()
+
+    def keep_warm(self, idle_seconds: float = KALSHI_KEEPALIVE_SECONDS) -> bool:
+        """Ping the exchange if the pool has been idle for idle_seconds, so the pooled
+        connection is re-used (not re-handshaken) by the next order. Returns True if pinged."""
+        if time.time() - self.last_request_at < idle_seconds:
+            return False
+        try:
+            self.session.get(f"{self.BASE_URL}/exchange/status", timeout=5)
+        except Exception as e:
+            print(f"   Kalshi keep-warm error: {e}")
+        return True
 
     def _auth_get(self, path: str, params: Dict = None, timeout: int = 10) -> Optional[Dict]:
         """Authenticated GET request using session for connection reuse."""
         if not self.private_key:
             return None
         try:
-            headers = self._sign_request('GET', path)
-            self.session.headers.update(headers)
             response = self.session.get(
                 f"https://api.elections.kalshi.com{path}",
-                params=params, timeout=timeout
+                params=params, timeout=timeout, headers=self._sign_request('GET', path)
             )
             response.raise_for_status()
             return response.json()
@@ -1365,11 +2374,9 @@ class KalshiAPI:
         if not self.private_key:
             return None
         try:
-            headers = self._sign_request('POST', path)
-            self.session.headers.update(headers)
             response = self.session.post(
                 f"https://api.elections.kalshi.com{path}",
-                json=body, timeout=timeout
+                json=body, timeout=timeout, headers=self._sign_request('POST', path)
             )
             response.raise_for_status()
             return response.json()
@@ -1387,11 +2394,9 @@ class KalshiAPI:
         if not self.private_key:
             return False
         try:
-            headers = self._sign_request('DELETE', path)
-            self.session.headers.update(headers)
             response = self.session.delete(
                 f"https://api.elections.kalshi.com{path}",
-                timeout=10
+                timeout=10, headers=self._sign_request('DELETE', path)
             )
             response.raise_for_status()
             return True
@@ -1435,6 +2440,7 @@ class KalshiAPI:
             print(f"   Kalshi get_settlements error: {e}")
             return all_settlements
 
+    @profiled()
     def get_positions(self, limit: int = 200) -> List[Dict]:
         """Get current portfolio positions from Kalshi."""
         all_positions = []
@@ -1458,11 +2464,12 @@ class KalshiAPI:
             return all_positions
 
     def place_order(self, ticker: str, side: str, price_cents: int, count: int,
-                    client_order_id: str = None) -> Optional[Dict]:
+                    client_order_id: str = None, time_in_force: str = None) -> Optional[Dict]:
         """Place a limit order on Kalshi.
         side: 'yes' or 'no'
         price_cents: price in cents (e.g., 52 for $0.52)
         count: number of contracts
+        time_in_force: e.g. 'immediate_or_cancel' (default: rests until filled or canceled)
         """
         body = {
             'action': 'buy',
@@ -1478,10 +2485,14 @@ class KalshiAPI:
 
         if client_order_id:
             body['client_order_id'] = client_order_id
+        if time_in_force:
+            body['time_in_force'] = time_in_force
 
-        print(f"   >>> PLACING ORDER: {side.upper()} {count}x {ticker} @ {price_cents}¢")
+        print(f"   >>> PLACING ORDER: {side.upper()} {count}x {ticker} @ {price_cents}¢"
+              f"{' ' + time_in_force.upper() if time_in_force else ''}")
         result = self._auth_post('/trade-api/v2/portfolio/orders', body)
         if result:
+            self.clear_read_cache(ticker)  # a resting remainder means the book isn't empty any more
             order = result.get('order', {})
             status = order.get('status', 'unknown')
             order_id = order.get('order_id', 'unknown')
@@ -1524,6 +2535,11 @@ class KalshiAPI:
         """Get a single quote by ID."""
         return self._auth_get(f'/trade-api/v2/communications/quotes/{quote_id}')
 
+    def cancel_quote(self, quote_id: str) -> bool:
+        """Withdraw an open quote. False if it already executed or is gone."""
+        print(f"   >>> CANCELING QUOTE: {quote_id}")
+        return self._auth_delete(f'/trade-api/v2/communications/quotes/{quote_id}')
+
     def create_quote(self, rfq_id: str, yes_bid: float, no_bid: float,
                      rest_remainder: bool = False) -> Optional[Dict]:
         """Submit a quote in response to an RFQ.
@@ -1544,7 +2560,24 @@ class KalshiAPI:
             return result
         return None
 
+    def clear_read_cache(self, ticker: str = None):
+        """Forget negative-cached reads (404s, empty books, empty series), or just ticker's."""
+        if ticker is not None:
+            self._market_reads.clear(ticker)
+            self._orderbook_reads.clear(ticker)
+            return
+        for reads in (self._markets_reads, self._market_reads, self._orderbook_reads):
+            reads.clear()
+
+    @profiled('series_ticker')
     def get_markets(self, series_ticker: str, limit: int = 200, status: str = 'open') -> List[Dict]:
+        markets, complete = self._markets_reads.do(
+            (series_ticker, limit, status), lambda: self._fetch_markets(series_ticker, limit, status),
+            cache_if=lambda r: r[1] and not r[0])
+        return markets
+
+    def _fetch_markets(self, series_ticker: str, limit: int, status: str) -> Tuple[List[Dict], bool]:
+        """All pages for series_ticker. Returns (markets, complete); complete is False after an error."""
         all_markets = []
         cursor = None
         try:
@@ -1558,7 +2591,7 @@ class KalshiAPI:
                     if response.status_code != 429:
                         break
                     print(f"   Kalshi 429 on {series_ticker}, backing off {retry_delay}s...")
-                    time.sleep(retry_delay)
+                    _sleep(retry_delay)
                     response = self.session.get(f"{self.BASE_URL}/markets", params=params, timeout=10)
                 response.raise_for_status()
                 data = response.json()
@@ -1567,71 +2600,641 @@ class KalshiAPI:
                 cursor = data.get('cursor')
                 if not cursor:
                     break
-                time.sleep(1.5)
+                _sleep(1.5)
             print(f"   Kalshi {series_ticker}: {len(all_markets)} markets")
-            return all_markets
+            return all_markets, True
         except Exception as e:
             print(f"   Kalshi {series_ticker} error: {e}")
-            return all_markets
+            return all_markets, False
 
     def get_market(self, ticker: str) -> Optional[Dict]:
         """Get details for a single market by ticker."""
+        return self._market_reads.do(ticker, lambda: self._fetch_market(ticker), cache_if=lambda m: m == {}) or None
+
+    def _fetch_market(self, ticker: str) -> Optional[Dict]:
+        """Market dict, {} if Kalshi says 404, None on any other error."""
         try:
             response = self.session.get(f"{self.BASE_URL}/markets/{ticker}", timeout=10)
             if response.status_code == 429:
-                time.sleep(2.0)
+                _sleep(2.0)
                 response = self.session.get(f"{self.BASE_URL}/markets/{ticker}", timeout=10)
+            if response.status_code == 404:
+                return {}
             response.raise_for_status()
             return response.json().get('market', response.json())
         except Exception as e:
             return None
 
-    def get_orderbook(self, ticker: str) -> Optional[Dict]:
+    @profiled()
+    def get_orderbook(self, ticker: str) -> Optional[OrderBook]:
+        """Current book for ticker; None on 404 or error."""
+        return self._orderbook_reads.do(ticker, lambda: self._fetch_orderbook(ticker), cache_if=_is_empty_book) or None
+
+    def _fetch_orderbook(self, ticker: str):
+        """OrderBook, {} if Kalshi says 404, None on any other error."""
         try:
             response = self.session.get(f"{self.BASE_URL}/markets/{ticker}/orderbook", timeout=10)
             for retry_delay in [3, 8, 15]:
                 if response.status_code != 429:
                     break
                 print(f"   Kalshi 429 on {ticker} orderbook, backing off {retry_delay}s...")
-                time.sleep(retry_delay)
+                _sleep(retry_delay)
                 response = self.session.get(f"{self.BASE_URL}/markets/{ticker}/orderbook", timeout=10)
+            if response.status_code == 404:
+                return {}
             response.raise_for_status()
-            return response.json()
+            return OrderBook.from_response(response.json())
         except Exception as e:
             return None
 
 
-def get_best_yes_price(ob: Dict) -> Optional[float]:
+_kalshi_client = None
+_kalshi_client_lock = threading.Lock()
+
+
+def get_kalshi_client() -> KalshiAPI:
+    """Process-wide KalshiAPI (key parsed once, one warm connection pool), created on first use."""
+    global _kalshi_client
+    if _kalshi_client is None:
+        with _kalshi_client_lock:
+            if _kalshi_client is None:
+                _kalshi_client = KalshiAPI(KALSHI_API_KEY_ID, KALSHI_PRIVATE_KEY)
+    return _kalshi_client
+
+
+def _kalshi_keepalive_loop():
+    """Keep the shared client's pooled connection warm through quiet periods."""
+    while True:
+        time.sleep(KALSHI_KEEPALIVE_SECONDS / 2)
+        get_kalshi_client().keep_warm()
+
+
+# ============================================================
+# KALSHI WEBSOCKET (one authenticated connection, fanned out to consumers)
+# ============================================================
+
+KALSHI_WS_URL = 'wss://api.elections.kalshi.com/trade-api/ws/v2'
+KALSHI_WS_PATH = '/trade-api/ws/v2'
+KALSHI_WS_QUEUE_SIZE = 10000  # Per-consumer backlog before messages are dropped
+
+
+class KalshiWebSocket:
+    """Owns the process's single authenticated Kalshi WebSocket.
+
+    Consumers register a handler for the message types they want and each gets its own
+    queue and thread, so a slow handler never stalls the socket or the other consumers.
+    Subscriptions are kept in a registry ({channel: market tickers, or None for all}) and
+    replayed on every connect; every consumer then receives {'type': 'connected'} so it
+    can resync (snapshot channels such as orderbook_delta re-send their snapshot on subscribe).
+    Each channel is one server-side subscription: once Kalshi answers with its sid, later
+    ticker changes go out as update_subscription add_markets/delete_markets against it.
+    """
+
+    def __init__(self, kalshi_api: 'KalshiAPI'):
+        self.kalshi_api = kalshi_api
+        self.connected = threading.Event()
+        self._lock = threading.Lock()  # registry, consumers and sends
+        self._ws = None
+        self._thread = None
+        self._consumers = ()       # ((name, message types, queue), ...) — replaced, never mutated
+        self._subscriptions = {}   # {channel: set(tickers) | None}
+        self._sids = {}            # {channel: sid} on the current connection
+        self._live = {}            # {channel: set(tickers) | None} as last sent on the current connection
+        self._pending = {}         # {cmd id: channel} subscribes awaiting their sid
+        self._cmd_id = 0
+
+    def add_consumer(self, name: str, handler, types) -> None:
+        """Deliver messages whose 'type' is in types (plus 'connected') to handler(msg) on a thread of its own."""
+        q = queue.Queue(maxsize=KALSHI_WS_QUEUE_SIZE)
+        with self._lock:
+            self._consumers = self._consumers + ((name, frozenset(types), q),)
+        threading.Thread(target=self._drain, args=(name, handler, q), daemon=True,
+                         name=f'kalshi-ws-{name}').start()
+        self._ensure_running()
+
+    def subscribe(self, channel: str, market_tickers: List[str] = None) -> None:
+        """Add channel (all markets, or just market_tickers) to the registry; sent now if connected."""
+        with self._lock:
+            if market_tickers is None:
+                if channel in self._subscriptions and self._subscriptions[channel] is None:
+                    return
+                self._subscriptions[channel] = None
+            else:
+                have = self._subscriptions.setdefault(channel, set())
+                if have is None or have.issuperset(market_tickers):
+                    return  # already subscribed to every market / to all of these
+                have.update(market_tickers)
+            self._sync_channel(channel)
+
+    def unsubscribe(self, channel: str, market_tickers: List[str]) -> None:
+        """Drop market_tickers from a ticker-scoped channel; the channel closes once none are left."""
+        with self._lock:
+            have = self._subscriptions.get(channel)
+            if not have or have.isdisjoint(market_tickers):
+                return
+            have.difference_update(market_tickers)
+            self._sync_channel(channel)
+
+    def _sync_channel(self, channel: str):
+        """Bring the server-side subscription for channel in line with the registry. Caller
+        holds _lock. Nothing is sent while a subscribe awaits its sid; the reply re-runs this."""
+        if self._ws is None or channel in self._pending.values():
+            return
+        want = self._subscriptions.get(channel, set())
+        sid = self._sids.get(channel)
+        if sid is not None:
+            live = self._live.get(channel)
+            if want is None and live is None:
+                return
+            if want is None or not want:
+                # Widening to every market, or nothing left: drop the ticker-scoped subscription
+                self._send('unsubscribe', {'sids': [sid]})
+                del self._sids[channel]
+                self._live.pop(channel, None)
+                if want is None:
+                    self._sync_channel(channel)
+                return
+            add, remove = sorted(want - live), sorted(live - want)
+            if add:
+                self._send('update_subscription', {'sids': [sid], 'market_tickers': add, 'action': 'add_markets'})
+            if remove:
+                self._send('update_subscription', {'sids': [sid], 'market_tickers': remove, 'action': 'delete_markets'})
+            self._live[channel] = set(want)
+            return
+        if want is not None and not want:
+            return
+        params = {'channels': [channel]}
+        if want is not None:
+            params['market_tickers'] = sorted(want)
+        if self._send('subscribe', params):
+            self._pending[self._cmd_id] = channel
+            self._live[channel] = None if want is None else set(want)
+
+    def _send(self, cmd: str, params: Dict) -> bool:
+        """Send one command. Caller holds _lock; a failed send is replayed on reconnect."""
+        self._cmd_id += 1
+        try:
+            self._ws.send(json.dumps({'id': self._cmd_id, 'cmd': cmd, 'params': params}))
+            return True
+        except Exception as e:
+            print(f"   Kalshi WS: {cmd} {params.get('channels') or params.get('sids')} failed: {e}")
+            return False
+
+    def _on_reply(self, msg: Dict):
+        """'subscribed' / 'error' answer to one of our subscribe commands."""
+        with self._lock:
+            channel = self._pending.pop(msg.get('id'), None)
+            if channel is None:
+                return
+            if msg.get('type') == 'subscribed':
+                self._sids[channel] = (msg.get('msg') or {}).get('sid')
+                self._sync_channel(channel)  # tickers added/removed while we waited
+            else:
+                self._live.pop(channel, None)  # retried on the next connect
+                print(f"   Kalshi WS: subscribe {channel} rejected: {msg.get('msg')}")
+
+    def _ensure_running(self):
+        with self._lock:
+            if self._thread is None:
+                self._thread = threading.Thread(target=self._run, daemon=True, name='kalshi-ws')
+                self._thread.start()
+
+    def _publish(self, msg: Dict, everyone: bool = False):
+        msg_type = msg.get('type', '')
+        for name, types, q in self._consumers:
+            if everyone or msg_type in types:
+                try:
+                    q.put_nowait(msg)
+                except queue.Full:
+                    metric_inc('kalshi_ws_dropped_total', {'consumer': name})
+
+    def _drain(self, name: str, handler, q: queue.Queue):
+        while True:
+            msg = q.get()
+            try:
+                handler(msg)
+            except Exception as e:
+                print(f"   Kalshi WS consumer {name} error: {e}")
+
+    def _run(self):
+        """Connect, replay subscriptions, pump messages; reconnect with exponential backoff (max 30s)."""
+        reconnect_delay = 1
+        while True:
+            ws = None
+            try:
+                auth_headers = kalshi_auth_headers(KALSHI_API_KEY_ID, self.kalshi_api.signer, 'GET', KALSHI_WS_PATH)
+                ws = websocket.create_connection(
+                    KALSHI_WS_URL,
+                    header=[f"{k}: {v}" for k, v in auth_headers.items()],
+                    timeout=30,
+                )
+                metric_inc('kalshi_ws_connects_total')
+                with self._lock:
+                    self._ws = ws
+                    self._sids.clear()
+                    self._live.clear()
+                    self._pending.clear()
+                    for channel in self._subscriptions:
+                        self._sync_channel(channel)
+                    channels = sorted(self._subscriptions)
+                print(f"   Kalshi WS: connected, subscribed to {', '.join(channels) or 'nothing yet'}")
+                self.connected.set()
+                self._publish({'type': 'connected'}, everyone=True)
+                reconnect_delay = 1  # Reset on successful connection
+                self._pump(ws)
+            except websocket.WebSocketException as e:
+                print(f"   Kalshi WS error: {e}")
+            except Exception as e:
+                print(f"   Kalshi WS error: {e}")
+            finally:
+                self.connected.clear()
+                with self._lock:
+                    self._ws = None
+                if ws:
+                    try:
+                        ws.close()
+                    except Exception:
+                        pass
+
+            print(f"   Kalshi WS: reconnecting in {reconnect_delay}s...")
+            time.sleep(reconnect_delay)
+            reconnect_delay = min(30, reconnect_delay * 2)
+
+    def _pump(self, ws):
+        """Receive until the socket fails. A quiet 30s gets a ping; a failed ping raises and reconnects."""
+        ws.settimeout(30)
+        while True:
+            try:
+                raw = ws.recv()
+            except websocket.WebSocketTimeoutException:
+                ws.ping()
+                continue
+            if not raw:
+                continue
+            try:
+                msg = json.loads(raw)
+            except json.JSONDecodeError:
+                continue
+            msg_type = msg.get('type', '')
+            metric_inc('kalshi_ws_messages_total', {'type': msg_type})
+            if msg_type in ('subscribed', 'error') and 'id' in msg:
+                self._on_reply(msg)
+            self._publish(msg)
+
+
+_kalshi_ws = None
+_kalshi_ws_lock = threading.Lock()
+
+
+def get_kalshi_ws() -> KalshiWebSocket:
+    """Process-wide Kalshi WebSocket manager on the shared client's key, created on first use."""
+    global _kalshi_ws
+    if _kalshi_ws is None:
+        with _kalshi_ws_lock:
+            if _kalshi_ws is None:
+                _kalshi_ws = KalshiWebSocket(get_kalshi_client())
+    return _kalshi_ws
+
+
+def get_best_yes_price(ob: OrderBook) -> Optional[float]:
     """Get best YES ask price (what you'd pay to buy YES instantly).
     In Kalshi's binary market: YES ask = 100 - best NO bid."""
-    data = ob.get('orderbook', {})
-    no_bids = data.get('no', [])
-    if not no_bids:
-        return None
-    best_no_bid = max(no_bids, key=lambda x: x[0])[0]
-    return (100 - best_no_bid) / 100
+    return ob.yes_ask()
 
 
-def get_best_no_price(ob: Dict) -> Optional[float]:
+def get_best_no_price(ob: OrderBook) -> Optional[float]:
     """Get best NO ask price (what you'd pay to buy NO instantly).
     In Kalshi's binary market: NO ask = 100 - best YES bid."""
-    data = ob.get('orderbook', {})
-    yes_bids = data.get('yes', [])
-    if not yes_bids:
+    return ob.no_ask()
+
+
+# ============================================================
+# SNAPSHOT PREFILTER (skip orderbooks that can't produce an edge)
+# ============================================================
+# get_markets() rows carry top-of-book (yes_bid/yes_ask/no_bid/no_ask, cents). Finders
+# check an optimistic bound from those before paying for a full orderbook: if even the
+# snapshot ask improved by SNAPSHOT_SLACK_CENTS can't clear the threshold, skip the fetch.
+
+SNAPSHOT_SLACK_CENTS = 2  # How far the book may have improved since the get_markets snapshot
+
+
+def _snapshot_cents(market: Dict, field: str) -> Optional[float]:
+    value = market.get(field)
+    if value is None:
+        value = market.get(f'{field}_dollars')
+        return float(value) * 100 if value is not None else None
+    return float(value)
+
+
+def snapshot_price(market: Dict, side: str) -> Optional[float]:
+    """Optimistic ask (dollars) for side from a market snapshot: the snapshot ask less
+    SNAPSHOT_SLACK_CENTS. None if the snapshot has no ask field."""
+    ask = _snapshot_cents(market, f'{side}_ask')
+    if ask is None or ask <= 0:
         return None
-    best_yes_bid = max(yes_bids, key=lambda x: x[0])[0]
-    return (100 - best_yes_bid) / 100
+    return max(1.0, ask - SNAPSHOT_SLACK_CENTS) / 100
+
+
+def _prefilter_result(fetch: bool) -> bool:
+    metric_inc('orderbook_prefilter_total', {'result': 'fetch' if fetch else 'skip'})
+    return fetch
+
+
+def snapshot_could_clear(checks: List[Tuple[Dict, str, float]], min_edge: float = None) -> bool:
+    """True if any (market, side, fd_opposite_prob) could clear min_edge (default MIN_EDGE_PERCENT)
+    at its optimistic snapshot price, after fees. Unknown snapshot prices always pass."""
+    min_edge = MIN_EDGE_PERCENT if min_edge is None else min_edge
+    for market, side, opp_prob in checks:
+        price = snapshot_price(market, side)
+        if price is None:
+            return _prefilter_result(True)
+        total = price + kalshi_fee(price) + opp_prob
+        if total < 1.0 and (1.0 / total - 1) * 100 >= min_edge:
+            return _prefilter_result(True)
+    return _prefilter_result(False)
+
+
+# ============================================================
+# SLATE REGISTRY (one identity per game across Kalshi / OddsAPI / ESPN)
+# ============================================================
+
+def _et_date_code(iso_time: str) -> str:
+    """'2026-02-04T00:30:00Z' -> '26FEB03' (Kalshi ticker date, US Eastern). '' if unparseable."""
+    try:
+        when = datetime.fromisoformat(iso_time.replace('Z', '+00:00'))
+        return when.astimezone(ZoneInfo('America/New_York')).strftime('%y%b%d').upper()
+    except (AttributeError, ValueError):
+        return ''
+
+
+class SlateGame:
+    """One real game on today's slate and its id on each venue."""
+    __slots__ = ('prefix', 'date', 'teams', 'odds_id', 'odds_names', 'espn_id', 'game_parts')
+
+    def __init__(self, prefix: str, date: str, teams: frozenset):
+        self.prefix = prefix       # Kalshi sport prefix, e.g. 'KXNBA'
+        self.date = date           # ET date code, e.g. '26FEB03'
+        self.teams = teams         # team identities: team-map name, else the Kalshi abbrev
+        self.odds_id = None        # OddsAPI event id
+        self.odds_names = {}       # team identity -> OddsAPI team name
+        self.espn_id = None
+        self.game_parts = set()    # Kalshi game parts ('26FEB03MIAWAS'), shared by every series
+
+
+class SlateRegistry:
+    """Kalshi game part <-> OddsAPI event id <-> ESPN event id for the current ET day.
+
+    Games are keyed by (sport prefix, ET date, team identities), where a team's identity
+    is its _team_map_for_prefix name, so 'GS', 'GSW' and 'Golden State Warriors' meet.
+    Venues register lazily as finders see them and everything is dropped at ET midnight.
+    Pairs the key can't resolve (no team map, abbreviation drift) fall back to the old
+    fuzzy matching once, and the answer is memoised."""
+
+    def __init__(self):
+        self._lock = threading.RLock()
+        self.day = None
+        self._reset()
+
+    def _reset(self):
+        self._games = {}      # (prefix, date, teams) -> SlateGame
+        self._by_odds = {}    # (prefix, OddsAPI id) -> SlateGame, None if its teams don't resolve
+        self._by_espn = {}    # (prefix, ESPN id) -> SlateGame
+        self._odds_team = {}  # (prefix, OddsAPI team name) -> identity or None
+        self._fuzzy = {}      # (Kalshi event, t1 name, t2 name) -> match_kalshi_to_fanduel_game result
+
+    def _roll(self):
+        today = _get_eastern_now().strftime('%y%b%d').upper()
+        if today != self.day:
+            self._reset()
+            self.day = today
+
+    def _game(self, prefix: str, date: str, teams: frozenset) -> SlateGame:
+        key = (prefix, date, teams)
+        game = self._games.get(key)
+        if game is None:
+            game = self._games[key] = SlateGame(prefix, date, teams)
+        return game
+
+    def kalshi_teams(self, prefix: str, abbrs) -> frozenset:
+        team_map = _team_map_for_prefix(prefix)
+        return frozenset(team_map.get(a, a) for a in abbrs)
+
+    def game_part_teams(self, prefix: str, game_part: str) -> frozenset:
+        """'26JAN31SACHA' -> team identities of SAC and CHA."""
+        team_map = _team_map_for_prefix(prefix)
+        return self.kalshi_teams(prefix, _split_team_pair(_split_game_code(game_part)[1], team_map))
+
+    def _resolve_odds_team(self, prefix: str, name: str) -> Optional[str]:
+        key = (prefix, name)
+        if key not in self._odds_team:
+            names = dict.fromkeys(_team_map_for_prefix(prefix).values())
+            self._odds_team[key] = name if name in names else next(
+                (n for n in names if _name_matches(n, name)), None)
+        return self._odds_team[key]
+
+    def _add_odds_events(self, prefix: str, fd_games: Dict):
+        for gid, info in fd_games.items():
+            if (prefix, gid) in self._by_odds:
+                continue
+            game = None
+            names = {}
+            for side in ('home', 'away'):
+                identity = self._resolve_odds_team(prefix, info.get(side, ''))
+                if identity:
+                    names[identity] = info[side]
+            date = _et_date_code(info.get('commence_time', ''))
+            if len(names) == 2 and date:
+                game = self._game(prefix, date, frozenset(names))
+                game.odds_id = gid
+                game.odds_names = names
+            self._by_odds[(prefix, gid)] = game
+
+    def odds_event_teams(self, prefix: str, game_id: str, fd_games: Dict) -> frozenset:
+        """Team identities of an OddsAPI event (empty if its names don't resolve)."""
+        with self._lock:
+            self._roll()
+            self._add_odds_events(prefix, fd_games)
+            game = self._by_odds.get((prefix, game_id))
+            return game.teams if game else frozenset()
+
+    def match_odds_event(self, event_code: str, t1_name: str, t2_name: str, fd_games: Dict,
+                         t1_abbr: str = '', t2_abbr: str = '') -> Tuple:
+        """(fd_t1, fd_t2, OddsAPI id) for a Kalshi event, as match_kalshi_to_fanduel_game returns."""
+        rec = parse_ticker(event_code)
+        prefix = rec.sport_prefix
+        fuzzy_key = (event_code, t1_name, t2_name)
+        with self._lock:
+            self._roll()
+            self._add_odds_events(prefix, fd_games)
+            if t1_abbr and t2_abbr:
+                team_map = _team_map_for_prefix(prefix)
+                id1, id2 = team_map.get(t1_abbr, t1_abbr), team_map.get(t2_abbr, t2_abbr)
+                game = self._games.get((prefix, rec.date, frozenset((id1, id2))))
+                if game and game.odds_id in fd_games and id1 != id2:
+                    metric_inc('slate_lookups_total', {'venue': 'odds', 'result': 'hit'})
+                    return game.odds_names[id1], game.odds_names[id2], game.odds_id
+            cached = self._fuzzy.get(fuzzy_key)
+            if cached and cached[2] in fd_games:
+                metric_inc('slate_lookups_total', {'venue': 'odds', 'result': 'fallback'})
+                return cached
+        result = match_kalshi_to_fanduel_game(t1_name, t2_name, fd_games)
+        metric_inc('slate_lookups_total', {'venue': 'odds', 'result': 'fallback' if result[2] else 'miss'})
+        if result[2]:
+            with self._lock:
+                self._fuzzy[fuzzy_key] = result
+        return result
+
+    def espn_game_parts(self, prefix: str, espn_game: Dict, kalshi_parts) -> List[str]:
+        """Kalshi game parts (from kalshi_parts) for an ESPN scoreboard game with Kalshi-style
+        home/away abbrevs: both teams in the part, same ET date (any date if ESPN gave none)."""
+        home, away = espn_game.get('home', ''), espn_game.get('away', '')
+        date = espn_game.get('game_date_str', '')
+        if not home or not away:
+            return []
+        with self._lock:
+            self._roll()
+            game = None
+            if date:
+                key = (prefix, espn_game.get('game_id', ''))
+                game = self._by_espn.get(key)
+                if game is None:
+                    game = self._by_espn[key] = self._game(prefix, date, self.kalshi_teams(prefix, (home, away)))
+                    game.espn_id = espn_game.get('game_id')
+                for part in (date + away + home, date + home + away):
+                    if part in kalshi_parts:
+                        game.game_parts.add(part)
+                parts = [p for p in game.game_parts if p in kalshi_parts]
+                if parts:
+                    metric_inc('slate_lookups_total', {'venue': 'espn', 'result': 'hit'})
+                    return parts
+        # Abbreviation drift between ESPN and Kalshi: substring match, remembered on the game
+        parts = []
+        for part in kalshi_parts:
+            ticker_date, teams = _split_game_code(part)
+            if ticker_date and home in teams and away in teams and (not date or ticker_date == date):
+                parts.append(part)
+        metric_inc('slate_lookups_total', {'venue': 'espn', 'result': 'fallback' if parts else 'miss'})
+        if parts and game is not None:
+            with self._lock:
+                game.game_parts.update(parts)
+        return parts
+
+    def summary(self) -> Dict:
+        with self._lock:
+            games = list(self._games.values())
+        return {
+            'day': self.day,
+            'games': len(games),
+            'with_odds': sum(1 for g in games if g.odds_id),
+            'with_espn': sum(1 for g in games if g.espn_id),
+            'with_kalshi': sum(1 for g in games if g.game_parts),
+        }
+
+
+_slate = SlateRegistry()
+
+
+# ============================================================
+# PLAYER REGISTRY
+# ============================================================
+
+_NAME_SUFFIXES = frozenset(('jr', 'sr', 'ii', 'iii', 'iv'))
+
+
+@functools.lru_cache(maxsize=8192)
+def normalize_player_name(name: str) -> str:
+    """'Luka Dončić' -> 'luka doncic', 'Jaren Jackson Jr.' -> 'jaren jackson', 'P.J. Tucker' -> 'pj tucker'."""
+    folded = unicodedata.normalize('NFKD', name).encode('ascii', 'ignore').decode().lower()
+    words = re.sub(r'[^a-z0-9 ]', '', folded.replace('-', ' ')).split()
+    while len(words) > 1 and words[-1] in _NAME_SUFFIXES:
+        words.pop()
+    return ' '.join(words)
+
+
+class PlayerRegistry:
+    """Kalshi <-> FanDuel <-> ESPN player names for the current ET day.
+
+    Players are keyed by (sport prefix, team scope, normalized name). Kalshi and FanDuel
+    only place a prop inside a game, so the team scope is the game's SlateRegistry team
+    identities, which every source can derive. Names sharing a normalized form link
+    directly; anything else is matched once with the source's old heuristic and
+    remembered as an alias, so the prop comparison, prop MM and completed-props sniper
+    all reuse the same answer."""
+
+    def __init__(self):
+        self._lock = threading.RLock()
+        self.day = None
+        self._reset()
+
+    def _reset(self):
+        self._players = {}  # (sport, scope, normalized name) -> {source: name}
+        self._misses = {}   # (sport, scope, normalized name, target) -> hash of the candidates that didn't match
+
+    def _roll(self):
+        today = _get_eastern_now().strftime('%y%b%d').upper()
+        if today != self.day:
+            self._reset()
+            self.day = today
+
+    def resolve(self, sport: str, scope: frozenset, source: str, name: str, target: str,
+                candidates, match) -> Optional[str]:
+        """The `target` source's name (one of candidates) for `source`'s `name`, or None.
+        match(name, candidates) is the fallback for names we haven't linked yet; a miss is
+        remembered until the candidate pool changes (pass a frozenset to hash it once)."""
+        norm = normalize_player_name(name)
+        key = (sport, scope, norm)
+        with self._lock:
+            self._roll()
+            player = self._players.setdefault(key, {})
+            player[source] = name
+            known = player.get(target)
+            if known is not None and known in candidates:
+                metric_inc('player_lookups_total', {'target': target, 'result': 'hit'})
+                return known
+            pool = hash(frozenset(candidates))
+            if self._misses.get(key + (target,)) == pool:
+                metric_inc('player_lookups_total', {'target': target, 'result': 'miss'})
+                return None
+        found = next((c for c in candidates if normalize_player_name(c) == norm), None) or match(name, candidates)
+        metric_inc('player_lookups_total', {'target': target, 'result': 'fallback' if found else 'miss'})
+        with self._lock:
+            if found is None:
+                self._misses[key + (target,)] = pool
+            else:
+                self._misses.pop(key + (target,), None)
+                player[target] = found
+                self._players.setdefault((sport, scope, normalize_player_name(found)), {}).update(
+                    {target: found, source: name})
+        return found
+
+    def summary(self) -> Dict:
+        with self._lock:
+            players = list(self._players.values())
+        return {
+            'day': self.day,
+            'names': len(players),
+            'linked': sum(1 for p in players if len(p) > 1),
+        }
+
+
+def _first_player_match(name: str, candidates) -> Optional[str]:
+    return next((c for c in candidates if _match_player_name(name, c)), None)
+
+
+_players = PlayerRegistry()
 
 
 # ============================================================
 # MONEYLINE EDGE FINDER (existing logic, cleaned up)
 # ============================================================
 
+@profiled('series_ticker')
 def find_moneyline_edges(kalshi_api, fd_data, series_ticker, sport_name, team_map):
     converter = OddsConverter()
     fanduel_odds = fd_data['odds']
     fanduel_games = fd_data['games']
     edges = []
+    candidates = []  # one per (game, side), priced together by emit_fair_value_edges
     date_strs = _get_today_date_strs()
 
     kalshi_markets = kalshi_api.get_markets(series_ticker)
@@ -1643,15 +3246,12 @@ def find_moneyline_edges(kalshi_api, fd_data, series_ticker, sport_name, team_ma
     # Group by game
     games = {}
     for m in today_markets:
-        ticker = m.get('ticker', '')
-        parts = ticker.split('-')
-        if len(parts) < 3:
+        rec = parse_ticker(m.get('ticker', ''))
+        if not rec.suffix:
             continue
-        game_code = '-'.join(parts[:-1])
-        team_abbrev = parts[-1]
-        if game_code not in games:
-            games[game_code] = {}
-        games[game_code][team_abbrev] = m
+        if rec.event not in games:
+            games[rec.event] = {}
+        games[rec.event][rec.suffix] = m
 
     for game_code, team_markets in games.items():
         # Soccer has 3-way markets (Home/Draw/Away), other sports have 2-way
@@ -1676,24 +3276,36 @@ def find_moneyline_edges(kalshi_api, fd_data, series_ticker, sport_name, team_ma
         t1_name = team_map.get(team_abbrevs_list[0], team_abbrevs_list[0])
         t2_name = team_map.get(team_abbrevs_list[1], team_abbrevs_list[1])
 
-        fd_t1, fd_t2, matched_gid = match_kalshi_to_fanduel_game(t1_name, t2_name, fanduel_games)
+        fd_t1, fd_t2, matched_gid = _slate.match_odds_event(
+            game_code, t1_name, t2_name, fanduel_games, team_abbrevs_list[0], team_abbrevs_list[1])
         if not fd_t1 or not matched_gid or matched_gid not in fanduel_odds:
             continue
         game_odds = fanduel_odds[matched_gid]  # {outcome_name: {odds, fair_prob, ...}}
         if fd_t1 not in game_odds or fd_t2 not in game_odds:
             continue
-        commence_str = fanduel_games.get(matched_gid, {}).get('commence_time', '')
-        game_live = is_game_live(commence_str)
+        game_live = _game_live(fanduel_games.get(matched_gid, {}))
 
         # Skip live games — The Odds API live data is unreliable (timestamps fresh but odds stale)
         if game_live:
             continue
 
+        m1, m2 = team_markets[team_abbrevs_list[0]], team_markets[team_abbrevs_list[1]]
+        fd_p1 = converter.decimal_to_implied_prob(game_odds[fd_t1]['odds'])
+        fd_p2 = converter.decimal_to_implied_prob(game_odds[fd_t2]['odds'])
+        if is_three_way and 'Draw' in game_odds:
+            fd_pd = converter.decimal_to_implied_prob(game_odds['Draw']['odds'])
+            checks = [(m1, 'yes', fd_p2 + fd_pd), (m2, 'yes', fd_p1 + fd_pd),
+                      (team_markets[draw_abbrev], 'yes', fd_p1 + fd_p2)]
+        else:
+            checks = [(m1, 'yes', fd_p2), (m2, 'no', fd_p2), (m2, 'yes', fd_p1), (m1, 'no', fd_p1)]
+        if not snapshot_could_clear(checks):
+            continue
+
         # Fetch orderbooks for team markets
         ob1 = kalshi_api.get_orderbook(team_markets[team_abbrevs_list[0]]['ticker'])
-        time.sleep(0.3)
+        _sleep(0.3)
         ob2 = kalshi_api.get_orderbook(team_markets[team_abbrevs_list[1]]['ticker'])
-        time.sleep(0.3)
+        _sleep(0.3)
         if not ob1 or not ob2:
             continue
 
@@ -1704,11 +3316,9 @@ def find_moneyline_edges(kalshi_api, fd_data, series_ticker, sport_name, team_ma
         if None in [t1_yes, t1_no, t2_yes, t2_no]:
             continue
 
-        # Build entries with ticker and side info for auto-trading
-        entries = []
-
         # For 3-way soccer: each Kalshi outcome's "opposite" is the sum of the other
         # two FD outcomes' implied probabilities. For 2-way: standard opposite.
+        game_name = f"{fd_t1} vs {fd_t2}"
         if is_three_way and 'Draw' in game_odds:
             fd_draw_prob = converter.decimal_to_implied_prob(game_odds['Draw']['odds'])
             fd_t1_prob = converter.decimal_to_implied_prob(game_odds[fd_t1]['odds'])
@@ -1716,183 +3326,175 @@ def find_moneyline_edges(kalshi_api, fd_data, series_ticker, sport_name, team_ma
 
             # Fetch draw orderbook
             ob_draw = kalshi_api.get_orderbook(team_markets[draw_abbrev]['ticker'])
-            time.sleep(0.3)
+            _sleep(0.3)
             draw_yes = get_best_yes_price(ob_draw) if ob_draw else None
-            draw_no = get_best_no_price(ob_draw) if ob_draw else None
-
-            # Team 1 YES: opposite is P(team2 wins) + P(draw)
-            opp_prob_t1 = fd_t2_prob + fd_draw_prob
-            fee_t1 = kalshi_fee(t1_yes)
-            eff_t1 = t1_yes + fee_t1
-            if eff_t1 + opp_prob_t1 < 1.0:
-                profit = (1.0 / (eff_t1 + opp_prob_t1) - 1) * 100
-                entries.append({
-                    'name': t1_name, 'price': t1_yes, 'eff': eff_t1,
-                    'method': f"YES on {t1_name}", 'fd_opp_name': f"{fd_t2} + Draw",
-                    'fd_opp_prob': opp_prob_t1, 'fd_opp_odds': game_odds[fd_t2]['odds'],
-                    'ticker': team_markets[team_abbrevs_list[0]]['ticker'], 'side': 'yes',
-                    'profit': profit,
-                })
-
-            # Team 2 YES: opposite is P(team1 wins) + P(draw)
-            opp_prob_t2 = fd_t1_prob + fd_draw_prob
-            fee_t2 = kalshi_fee(t2_yes)
-            eff_t2 = t2_yes + fee_t2
-            if eff_t2 + opp_prob_t2 < 1.0:
-                profit = (1.0 / (eff_t2 + opp_prob_t2) - 1) * 100
-                entries.append({
-                    'name': t2_name, 'price': t2_yes, 'eff': eff_t2,
-                    'method': f"YES on {t2_name}", 'fd_opp_name': f"{fd_t1} + Draw",
-                    'fd_opp_prob': opp_prob_t2, 'fd_opp_odds': game_odds[fd_t1]['odds'],
-                    'ticker': team_markets[team_abbrevs_list[1]]['ticker'], 'side': 'yes',
-                    'profit': profit,
-                })
 
-            # Draw YES: opposite is P(team1) + P(team2)
+            # (name, YES price, market, opposite FD outcomes, opposite label, opposite odds)
+            entries = [
+                (t1_name, t1_yes, m1, [fd_t2, 'Draw'], f"{fd_t2} + Draw", game_odds[fd_t2]['odds']),
+                (t2_name, t2_yes, m2, [fd_t1, 'Draw'], f"{fd_t1} + Draw", game_odds[fd_t1]['odds']),
+            ]
             if draw_yes is not None:
-                opp_prob_draw = fd_t1_prob + fd_t2_prob
-                fee_draw = kalshi_fee(draw_yes)
-                eff_draw = draw_yes + fee_draw
-                if eff_draw + opp_prob_draw < 1.0:
-                    profit = (1.0 / (eff_draw + opp_prob_draw) - 1) * 100
-                    entries.append({
-                        'name': 'Draw', 'price': draw_yes, 'eff': eff_draw,
-                        'method': f"YES on Draw", 'fd_opp_name': f"{fd_t1} + {fd_t2}",
-                        'fd_opp_prob': opp_prob_draw, 'fd_opp_odds': game_odds[fd_t1]['odds'],
-                        'ticker': team_markets[draw_abbrev]['ticker'], 'side': 'yes',
-                        'profit': profit,
-                    })
-
-            # Build per-book opposite probs for 3-way outcomes
-            # For "YES on Team1", opposite = P(Team2) + P(Draw) per book
-            three_way_per_book = {}
-            for e_name, opp_outcomes in [(t1_name, [fd_t2, 'Draw']), (t2_name, [fd_t1, 'Draw']), ('Draw', [fd_t1, fd_t2])]:
-                book_opp = {}
-                all_books_set = set()
-                for oname in opp_outcomes:
-                    odata = game_odds.get(oname, {})
-                    for bk, bp in odata.get('per_book', {}).items():
-                        all_books_set.add(bk)
-                for bk in all_books_set:
-                    total = 0
-                    have_all = True
-                    for oname in opp_outcomes:
-                        bp = game_odds.get(oname, {}).get('per_book', {}).get(bk)
-                        if bp is None:
-                            have_all = False
-                            break
-                        total += bp
-                    if have_all:
-                        book_opp[bk] = total
-                three_way_per_book[e_name] = book_opp
-
-            # Build edge dicts from 3-way entries
-            game_edges = []
-            for e in entries:
-                if e['profit'] < MIN_EDGE_PERCENT:
-                    continue
-                edge = {
+                entries.append(('Draw', draw_yes, team_markets[draw_abbrev], [fd_t1, fd_t2], f"{fd_t1} + {fd_t2}", game_odds[fd_t1]['odds']))
+            fd_probs = {fd_t1: fd_t1_prob, fd_t2: fd_t2_prob, 'Draw': fd_draw_prob}
+            for name, yes_price, market, opp_outcomes, opp_label, opp_odds in entries:
+                opp_prob = sum(fd_probs[o] for o in opp_outcomes)
+                candidates.append({
+                    'group': game_code, 'skip': '3-way ML',
                     'market_type': 'Moneyline',
                     'sport': sport_name,
-                    'game': f"{fd_t1} vs {fd_t2}",
-                    'team': e['name'],
-                    'opposite_team': e['fd_opp_name'],
-                    'kalshi_price': e['price'],
-                    'kalshi_price_after_fees': e['eff'],
-                    'kalshi_prob_after_fees': e['eff'] * 100,
-                    'kalshi_method': e['method'],
-                    'kalshi_ticker': e['ticker'],
-                    'kalshi_side': e['side'],
-                    'fanduel_opposite_team': e['fd_opp_name'],
-                    'fanduel_opposite_odds': e['fd_opp_odds'],
-                    'fanduel_opposite_prob': e['fd_opp_prob'] * 100,
-                    'total_implied_prob': (e['eff'] + e['fd_opp_prob']) * 100,
-                    'arbitrage_profit': e['profit'],
+                    'game': game_name,
+                    'team': name,
+                    'opposite_team': opp_label,
+                    'kalshi_price': yes_price,
+                    'kalshi_method': f"YES on {name}",
+                    'kalshi_ticker': market['ticker'],
+                    'kalshi_side': 'yes',
+                    'fanduel_opposite_team': opp_label,
+                    'fanduel_opposite_odds': opp_odds,
+                    'fd_opp_prob': opp_prob,
                     'is_live': game_live,
                     'fair_value_mode': game_odds.get(fd_t1, {}).get('mode', ''),
-                    'per_book_detail': three_way_per_book.get(e['name'], {}),
+                    # For "YES on Team1", opposite = P(Team2) + P(Draw) per book
+                    'per_book_detail': _sum_per_book(game_odds, opp_outcomes),
                     'odds_last_update': game_odds.get(fd_t1, {}).get('last_update', ''),
-                    'recommendation': f"Buy {e['method']} on Kalshi at ${e['price']:.2f} (Fair value: {e['fd_opp_prob']*100:.1f}%)",
-                }
-                if books_diverge(edge['per_book_detail']):
-                    print(f"   Skipping {edge['game']} 3-way ML: books diverge >10pp")
-                    continue
-                game_edges.append(edge)
-
-            if game_edges:
-                game_edges.sort(key=lambda e: e['arbitrage_profit'], reverse=True)
-                best_edge = game_edges[0]
-                edges.append(best_edge)
-                send_telegram_notification(best_edge)
-                auto_trade_edge(best_edge, kalshi_api)
+                    'recommendation': f"Buy YES on {name} on Kalshi at ${yes_price:.2f} (Fair value: {opp_prob*100:.1f}%)",
+                })
         else:
-            # Standard 2-way moneyline (NBA, NHL, etc.)
-            if t1_yes <= t2_no:
-                entries.append((t1_name, t1_yes, f"YES on {t1_name}", fd_t2,
-                               team_markets[team_abbrevs_list[0]]['ticker'], 'yes'))
-            else:
-                entries.append((t1_name, t2_no, f"NO on {t2_name}", fd_t2,
-                               team_markets[team_abbrevs_list[1]]['ticker'], 'no'))
-            if t2_yes <= t1_no:
-                entries.append((t2_name, t2_yes, f"YES on {t2_name}", fd_t1,
-                               team_markets[team_abbrevs_list[1]]['ticker'], 'yes'))
+            # Standard 2-way moneyline (NBA, NHL, etc.): back each team via the cheaper of
+            # its YES or NO on the other team, against the other team's FD implied prob
+            for name, yes_p, mk, other_name, other_no, other_mk, fd_opp in (
+                    (t1_name, t1_yes, m1, t2_name, t2_no, m2, fd_t2),
+                    (t2_name, t2_yes, m2, t1_name, t1_no, m1, fd_t1)):
+                best_p, side = cheaper_entry(yes_p, other_no)
+                method = f"YES on {name}" if side == 'yes' else f"NO on {other_name}"
+                fd_opp_odds = game_odds[fd_opp]['odds']
+                candidates.append({
+                    'group': game_code, 'skip': '2-way ML',
+                    'market_type': 'Moneyline',
+                    'sport': sport_name,
+                    'game': game_name,
+                    'team': name,
+                    'opposite_team': fd_opp,
+                    'kalshi_price': best_p,
+                    'kalshi_method': method,
+                    'kalshi_ticker': (mk if side == 'yes' else other_mk)['ticker'],
+                    'kalshi_side': side,
+                    'fanduel_opposite_team': fd_opp,
+                    'fanduel_opposite_odds': fd_opp_odds,
+                    'fd_opp_prob': converter.decimal_to_implied_prob(fd_opp_odds),
+                    'is_live': game_live,
+                    'fair_value_mode': game_odds.get(fd_opp, {}).get('mode', ''),
+                    'per_book_detail': game_odds.get(fd_opp, {}).get('per_book', {}),
+                    'odds_last_update': game_odds.get(fd_opp, {}).get('last_update', ''),
+                    'recommendation': f"Buy {method} on Kalshi at ${best_p:.2f} (Fair value: {fd_opp} at {fd_opp_odds:.2f})",
+                })
+
+    # Only the best edge per game is emitted (don't bet both sides)
+    return emit_fair_value_edges(candidates, kalshi_api)
+
+
+def _sum_per_book(game_odds: Dict, outcome_names: List[str]) -> Dict[str, float]:
+    """{book: sum of its devigged probs for outcome_names}, for books quoting all of them."""
+    per_book = [game_odds.get(name, {}).get('per_book', {}) for name in outcome_names]
+    books = set().union(*per_book)
+    return {bk: sum(pb[bk] for pb in per_book) for bk in books if all(bk in pb for pb in per_book)}
+
+# ============================================================
+# FAIR PROBABILITY CURVES (spread / total strike ladders)
+# ============================================================
+# OddsAPI gives one line per book per game; Kalshi lists a ladder of strikes. A FairCurve
+# is P(X > strike) for the game's final margin or total, fitted once per game so that
+# P(X > fitted line) is the devigged consensus there. Strikes within the model's reach of
+# that line are priced off the curve; the quoted line itself keeps the direct price.
+
+_STD_NORMAL = NormalDist()
+
+
+def _poisson_sf(lam: float, strike: float) -> float:
+    """P(X > strike) for X ~ Poisson(lam)."""
+    k = math.floor(strike)
+    if k < 0:
+        return 1.0
+    term = cdf = math.exp(-lam)
+    for i in range(1, k + 1):
+        term *= lam / i
+        cdf += term
+    return max(0.0, 1.0 - cdf)
+
+
+class FairCurve:
+    __slots__ = ('model', 'sd', 'reach', 'line', 'loc')
+
+    def __init__(self, model: str, sd: Optional[float], reach: float, line: float, loc: float):
+        self.model = model  # 'normal' (loc = mean) or 'poisson' (loc = rate)
+        self.sd = sd
+        self.reach = reach  # furthest strike from line we price
+        self.line = line
+        self.loc = loc
+
+    @classmethod
+    def fit(cls, params: Tuple, line: float, p_over: float) -> Optional['FairCurve']:
+        """Curve with P(X > line) = p_over. params is a FAIR_CURVE_MODELS entry."""
+        model, sd, reach = params
+        if not 0.01 < p_over < 0.99:
+            return None
+        if model == 'normal':
+            return cls(model, sd, reach, line, line + sd * _STD_NORMAL.inv_cdf(p_over))
+        lo, hi = 1e-3, 50.0  # P(X > line) rises with the rate: bisect
+        for _ in range(60):
+            mid = (lo + hi) / 2
+            if _poisson_sf(mid, line) < p_over:
+                lo = mid
             else:
-                entries.append((t2_name, t1_no, f"NO on {t1_name}", fd_t1,
-                               team_markets[team_abbrevs_list[0]]['ticker'], 'no'))
-
-            # Evaluate both entries, pick only the best edge per game
-            game_edges = []
-            for name, best_p, method, fd_opp, trade_ticker, trade_side in entries:
-                fee = kalshi_fee(best_p)
-                eff = best_p + fee
-                fd_prob = converter.decimal_to_implied_prob(game_odds[fd_opp]['odds'])
-                total = eff + fd_prob
-                if total < 1.0:
-                    profit = (1.0 / total - 1) * 100
-                    if profit < MIN_EDGE_PERCENT:
-                        continue
-                    edge = {
-                        'market_type': 'Moneyline',
-                        'sport': sport_name,
-                        'game': f"{fd_t1} vs {fd_t2}",
-                        'team': name,
-                        'opposite_team': fd_opp,
-                        'kalshi_price': best_p,
-                        'kalshi_price_after_fees': eff,
-                        'kalshi_prob_after_fees': eff * 100,
-                        'kalshi_method': method,
-                        'kalshi_ticker': trade_ticker,
-                        'kalshi_side': trade_side,
-                        'fanduel_opposite_team': fd_opp,
-                        'fanduel_opposite_odds': game_odds[fd_opp]['odds'],
-                        'fanduel_opposite_prob': fd_prob * 100,
-                        'total_implied_prob': total * 100,
-                        'arbitrage_profit': profit,
-                        'is_live': game_live,
-                        'fair_value_mode': game_odds.get(fd_opp, {}).get('mode', ''),
-                        'per_book_detail': game_odds.get(fd_opp, {}).get('per_book', {}),
-                        'odds_last_update': game_odds.get(fd_opp, {}).get('last_update', ''),
-                        'recommendation': f"Buy {method} on Kalshi at ${best_p:.2f} (Fair value: {fd_opp} at {game_odds[fd_opp]['odds']:.2f})",
-                    }
-                    if books_diverge(edge['per_book_detail']):
-                        print(f"   Skipping {edge['game']} 2-way ML: books diverge >10pp")
-                        continue
-                    game_edges.append(edge)
-
-            # Only trade the best edge per game (don't bet both sides)
-            if game_edges:
-                game_edges.sort(key=lambda e: e['arbitrage_profit'], reverse=True)
-                best_edge = game_edges[0]
-                edges.append(best_edge)
-                send_telegram_notification(best_edge)
-                auto_trade_edge(best_edge, kalshi_api)
-    return edges
+                hi = mid
+        return cls(model, sd, reach, line, (lo + hi) / 2)
+
+    def refit(self, p_over: float) -> Optional['FairCurve']:
+        """Same model and line, another book's price (for the per-book divergence check)."""
+        return FairCurve.fit((self.model, self.sd, self.reach), self.line, p_over)
+
+    def covers(self, strike: float) -> bool:
+        return abs(strike - self.line) <= self.reach
+
+    def prob_over(self, strike: float) -> float:
+        if self.model == 'normal':
+            return 1.0 - _STD_NORMAL.cdf((strike - self.loc) / self.sd)
+        return _poisson_sf(self.loc, strike)
+
+    def prob_over_many(self, strikes: List[float]) -> List[float]:
+        """prob_over for a whole ladder in one pass."""
+        if self.model == 'normal':
+            cdf, loc, sd = _STD_NORMAL.cdf, self.loc, self.sd
+            return [1.0 - cdf((k - loc) / sd) for k in strikes]
+        return [_poisson_sf(self.loc, k) for k in strikes]
+
+
+def fair_curve_for(series_ticker: str, market: str, line: float, p_over: float) -> Optional[FairCurve]:
+    """Fitted curve for series_ticker's sport ('margin' or 'total'), None if disabled or unmodelled."""
+    if not FAIR_CURVE_ENABLED:
+        return None
+    params = FAIR_CURVE_MODELS.get(parse_ticker(series_ticker).sport_prefix, {}).get(market)
+    return FairCurve.fit(params, line, p_over) if params else None
+
+
+def _curve_per_book(curve: FairCurve, per_book_over: Dict[str, float], strike: float,
+                    over: bool) -> Dict[str, float]:
+    """Each book's price carried to strike through its own refit: {book: P(over) or P(under)}."""
+    out = {}
+    for book, p in per_book_over.items():
+        book_curve = curve.refit(p)
+        if book_curve:
+            p_strike = book_curve.prob_over(strike)
+            out[book] = p_strike if over else 1.0 - p_strike
+    return out
 
 
 # ============================================================
 # SPREAD EDGE FINDER
 # ============================================================
 
+@profiled('series_ticker')
 def find_spread_edges(kalshi_api, fd_data, series_ticker, sport_name, team_map):
     """
     Compare Kalshi spread markets against FanDuel spread lines.
@@ -1906,6 +3508,7 @@ def find_spread_edges(kalshi_api, fd_data, series_ticker, sport_name, team_map):
     fd_spreads = fd_data['spreads']
     fd_games = fd_data['games']
     edges = []
+    candidates = []
     date_strs = _get_today_date_strs()
 
     kalshi_markets = kalshi_api.get_markets(series_ticker)
@@ -1919,18 +3522,12 @@ def find_spread_edges(kalshi_api, fd_data, series_ticker, sport_name, team_map):
     game_groups = {}  # game_code -> [{ticker, team_abbrev, floor_strike, market}]
     for m in today_markets:
         ticker = m.get('ticker', '')
-        parts = ticker.split('-')
-        if len(parts) < 3:
+        rec = parse_ticker(ticker)
+        # e.g. game_code KXNBASPREAD-26JAN30DETGSW, suffix GSW4 -> team GSW
+        if not rec.outcome or rec.strike is None:
             continue
-
-        game_part = parts[1]  # e.g., 26JAN30DETGSW
-        game_code = f"{parts[0]}-{game_part}"
-        team_spread_part = parts[-1]  # e.g., GSW4
-
-        match = re.match(r'^([A-Z]+?)(\d+)$', team_spread_part)
-        if not match:
-            continue
-        team_abbrev = match.group(1)
+        game_code = rec.event
+        team_abbrev = rec.outcome
 
         floor_strike = m.get('floor_strike')
         if floor_strike is None:
@@ -1963,13 +3560,13 @@ def find_spread_edges(kalshi_api, fd_data, series_ticker, sport_name, team_map):
         t2_name = team_map.get(team_abbrevs[1], team_abbrevs[1])
 
         # Require BOTH teams match the SAME FanDuel game
-        fd_t1, fd_t2, matched_game_id = match_kalshi_to_fanduel_game(t1_name, t2_name, fd_games)
+        fd_t1, fd_t2, matched_game_id = _slate.match_odds_event(
+            game_code, t1_name, t2_name, fd_games, team_abbrevs[0], team_abbrevs[1])
         if not fd_t1 or not matched_game_id or matched_game_id not in fd_spreads:
             continue
 
         fd_game_spreads = fd_spreads[matched_game_id]
-        commence_str = fd_games.get(matched_game_id, {}).get('commence_time', '')
-        game_live = is_game_live(commence_str)
+        game_live = _game_live(fd_games.get(matched_game_id, {}))
 
         # Skip live games — The Odds API live data is unreliable
         if game_live:
@@ -1977,6 +3574,12 @@ def find_spread_edges(kalshi_api, fd_data, series_ticker, sport_name, team_map):
 
         print(f"   Spread match: {t1_name} vs {t2_name} -> {fd_t1} vs {fd_t2}")
 
+        # Margin curve for fd_t1 (M = fd_t1 score - fd_t2 score): its quoted spread
+        # covers with fair_prob, i.e. P(M > -point) = fair_prob
+        t1_spread = fd_game_spreads.get(fd_t1)
+        curve = (fair_curve_for(series_ticker, 'margin', -t1_spread['point'], t1_spread['fair_prob'])
+                 if t1_spread and fd_t2 in fd_game_spreads else None)
+
         # Step 3: For each market in this game, compare to FanDuel spread
         for mk in markets:
             team_name = mk['team_name']
@@ -1997,18 +3600,6 @@ def find_spread_edges(kalshi_api, fd_data, series_ticker, sport_name, team_map):
 
             fd_spread = fd_game_spreads[fd_team_name]
             fd_point = fd_spread['point']  # SIGNED: negative = favorite, positive = underdog
-            fd_odds = fd_spread['odds']
-
-            # Kalshi spread markets are "Team wins by X+" which means the team is FAVORED.
-            # FanDuel returns negative points for favorites (e.g., -1.5) and positive for underdogs (+1.5).
-            # Only match if FanDuel spread is negative (team is favorite), matching Kalshi's "wins by X+".
-            if fd_point >= 0:
-                # FanDuel says this team is underdog (getting points), skip - not comparable to Kalshi "wins by X+"
-                continue
-
-            # Compare absolute values: Kalshi floor_strike (always positive) vs FanDuel |spread|
-            if abs(floor_strike - abs(fd_point)) > 0.5:
-                continue
 
             # Find the OPPOSITE team's spread to get fair value
             # FD includes vig on both sides, so we use opposite side to derive true probability
@@ -2016,70 +3607,79 @@ def find_spread_edges(kalshi_api, fd_data, series_ticker, sport_name, team_map):
             if fd_opposite_name not in fd_game_spreads:
                 continue
             fd_opposite_spread = fd_game_spreads[fd_opposite_name]
-            fd_opposite_odds = fd_opposite_spread['odds']
-            fd_opposite_prob = converter.decimal_to_implied_prob(fd_opposite_odds)
-            # Fair prob for our side = 1 - opposite implied prob (strips vig from our side)
-            fd_fair_prob = 1.0 - fd_opposite_prob
+
+            # Kalshi spread markets are "Team wins by X+", i.e. the team laying X points.
+            # FanDuel returns negative points for favorites (e.g., -1.5) and positive for underdogs (+1.5);
+            # the exact price only applies when this team is the FD favorite at |spread| ~= X.
+            if fd_point < 0 and abs(floor_strike - abs(fd_point)) <= 0.5:
+                # Fair prob for our side = 1 - opposite implied prob (strips vig from our side)
+                fd_opposite_odds = fd_opposite_spread['odds']
+                fd_opposite_prob = converter.decimal_to_implied_prob(fd_opposite_odds)
+                opposite_label = f"{fd_opposite_name} {fd_opposite_spread['point']}"
+                mode = fd_game_spreads.get('_mode', '')
+                per_book = fd_opposite_spread.get('per_book', {})
+            elif curve:
+                # Any other strike (or the underdog's side) comes off the margin curve:
+                # fd_t1 wins by X+ is M > X, fd_t2 wins by X+ is M < -X
+                strike = floor_strike if fd_team_name == fd_t1 else -floor_strike
+                if not curve.covers(strike):
+                    continue
+                p_over = curve.prob_over(strike)
+                fd_opposite_prob = 1.0 - p_over if fd_team_name == fd_t1 else p_over
+                if not 0.01 < fd_opposite_prob < 0.99:
+                    continue
+                fd_opposite_odds = 1.0 / fd_opposite_prob
+                opposite_label = f"{fd_opposite_name} +{floor_strike} (curve from {fd_t1} {fd_game_spreads[fd_t1]['point']})"
+                mode = f"{fd_game_spreads.get('_mode', '')}+curve"
+                per_book = _curve_per_book(curve, fd_game_spreads[fd_t1].get('per_book', {}),
+                                           strike, fd_team_name != fd_t1)
+            else:
+                continue
+
+            if not snapshot_could_clear([(mk['market'], 'yes', fd_opposite_prob)]):
+                continue
 
             # Get Kalshi orderbook
             ob = kalshi_api.get_orderbook(ticker)
             if not ob:
                 continue
-            time.sleep(0.3)
+            _sleep(0.3)
 
             yes_price = get_best_yes_price(ob)
             if yes_price is None:
                 continue
 
-            fee = kalshi_fee(yes_price)
-            eff = yes_price + fee
-
-            # +EV if Kalshi price after fees < FanDuel fair value for this side
-            # Using opposite side: total_implied = kalshi_eff + fd_opposite_prob
-            # If < 1.0, there's an edge
-            total_implied = eff + fd_opposite_prob
-            if total_implied < 1.0:
-                profit = (1.0 / total_implied - 1) * 100
-                if profit < MIN_EDGE_PERCENT:
-                    continue
-                game_name = f"{fd_games[matched_game_id]['away']} at {fd_games[matched_game_id]['home']}"
-                edge = {
-                    'market_type': 'Spread',
-                    'sport': sport_name,
-                    'game': game_name,
-                    'team': f"{team_name} -{floor_strike}",
-                    'opposite_team': fd_opposite_name,
-                    'kalshi_price': yes_price,
-                    'kalshi_price_after_fees': eff,
-                    'kalshi_prob_after_fees': eff * 100,
-                    'kalshi_method': f"YES on {team_name} -{floor_strike}",
-                    'kalshi_ticker': ticker,
-                    'kalshi_side': 'yes',
-                    'fanduel_opposite_team': f"{fd_opposite_name} {fd_opposite_spread['point']}",
-                    'fanduel_opposite_odds': fd_opposite_odds,
-                    'fanduel_opposite_prob': fd_opposite_prob * 100,
-                    'total_implied_prob': total_implied * 100,
-                    'arbitrage_profit': profit,
-                    'is_live': game_live,
-                    'fair_value_mode': fd_game_spreads.get('_mode', ''),
-                    'per_book_detail': fd_opposite_spread.get('per_book', {}),
-                    'odds_last_update': fd_game_spreads.get('_last_update', ''),
-                    'recommendation': f"Buy YES {team_name} -{floor_strike} on Kalshi at ${yes_price:.2f} (Fair value: {fd_opposite_name} {fd_opposite_spread['point']} at {fd_opposite_odds:.2f})",
-                }
-                if books_diverge(edge['per_book_detail']):
-                    print(f"   Skipping {edge['game']} spread: books diverge >10pp")
-                    continue
-                edges.append(edge)
-                send_telegram_notification(edge)
-                auto_trade_edge(edge, kalshi_api)
+            # +EV if Kalshi price after fees < FanDuel fair value for this side:
+            # total_implied = kalshi_eff + fd_opposite_prob < 1.0 (priced by rank_edges)
+            candidates.append({
+                'skip': 'spread',
+                'market_type': 'Spread',
+                'sport': sport_name,
+                'game': f"{fd_games[matched_game_id]['away']} at {fd_games[matched_game_id]['home']}",
+                'team': f"{team_name} -{floor_strike}",
+                'opposite_team': fd_opposite_name,
+                'kalshi_price': yes_price,
+                'kalshi_method': f"YES on {team_name} -{floor_strike}",
+                'kalshi_ticker': ticker,
+                'kalshi_side': 'yes',
+                'fanduel_opposite_team': opposite_label,
+                'fanduel_opposite_odds': fd_opposite_odds,
+                'fd_opp_prob': fd_opposite_prob,
+                'is_live': game_live,
+                'fair_value_mode': mode,
+                'per_book_detail': per_book,
+                'odds_last_update': fd_game_spreads.get('_last_update', ''),
+                'recommendation': f"Buy YES {team_name} -{floor_strike} on Kalshi at ${yes_price:.2f} (Fair value: {opposite_label} at {fd_opposite_odds:.2f})",
+            })
 
-    return edges
+    return emit_fair_value_edges(candidates, kalshi_api)
 
 
 # ============================================================
 # TOTALS EDGE FINDER
 # ============================================================
 
+@profiled('series_ticker')
 def find_total_edges(kalshi_api, fd_data, series_ticker, sport_name, team_map):
     """
     Compare Kalshi total (over/under) markets against FanDuel totals.
@@ -2093,6 +3693,7 @@ def find_total_edges(kalshi_api, fd_data, series_ticker, sport_name, team_map):
     fd_totals = fd_data['totals']
     fd_games = fd_data['games']
     edges = []
+    candidates = []
     date_strs = _get_today_date_strs()
 
     kalshi_markets = kalshi_api.get_markets(series_ticker)
@@ -2106,20 +3707,18 @@ def find_total_edges(kalshi_api, fd_data, series_ticker, sport_name, team_map):
     game_groups = {}  # game_code -> [market_info]
     for m in today_markets:
         ticker = m.get('ticker', '')
-        parts = ticker.split('-')
-        if len(parts) < 3:
+        rec = parse_ticker(ticker)
+        if not rec.suffix:
             continue
 
-        game_part = parts[1]
-        game_code = f"{parts[0]}-{game_part}"
+        game_part = rec.game_part
+        game_code = rec.event
 
         floor_strike = m.get('floor_strike')
         if floor_strike is None:
-            line_part = parts[-1]
-            try:
-                floor_strike = float(line_part) + 0.5
-            except ValueError:
+            if rec.strike is None or rec.outcome:
                 continue
+            floor_strike = rec.strike + 0.5
         floor_strike = float(floor_strike)
 
         if game_code not in game_groups:
@@ -2134,21 +3733,26 @@ def find_total_edges(kalshi_api, fd_data, series_ticker, sport_name, team_map):
     for game_code, group in game_groups.items():
         game_part = group['game_part']
 
-        # Find which FanDuel game this matches by checking team abbreviations in game_part
+        pair = parse_ticker(game_code).team_pair
         matched_game_id = None
-        for gid, ginfo in fd_games.items():
-            home_found = False
-            away_found = False
-            for abbr, full_name in team_map.items():
-                if abbr in game_part:
-                    if _name_matches(full_name, ginfo['home']):
-                        home_found = True
-                    elif _name_matches(full_name, ginfo['away']):
-                        away_found = True
-            # Require BOTH teams found in the game_part
-            if home_found and away_found:
-                matched_game_id = gid
-                break
+        if pair:
+            _, _, matched_game_id = _slate.match_odds_event(
+                game_code, team_map.get(pair[0], pair[0]), team_map.get(pair[1], pair[1]), fd_games, *pair)
+        else:
+            # Find which FanDuel game this matches by checking team abbreviations in game_part
+            for gid, ginfo in fd_games.items():
+                home_found = False
+                away_found = False
+                for abbr, full_name in team_map.items():
+                    if abbr in game_part:
+                        if _name_matches(full_name, ginfo['home']):
+                            home_found = True
+                        elif _name_matches(full_name, ginfo['away']):
+                            away_found = True
+                # Require BOTH teams found in the game_part
+                if home_found and away_found:
+                    matched_game_id = gid
+                    break
 
         if not matched_game_id or matched_game_id not in fd_totals:
             continue
@@ -2156,124 +3760,96 @@ def find_total_edges(kalshi_api, fd_data, series_ticker, sport_name, team_map):
         fd_total = fd_totals[matched_game_id]
         fd_line = fd_total['point']
         game_name = f"{fd_games[matched_game_id]['away']} at {fd_games[matched_game_id]['home']}"
-        commence_str = fd_games.get(matched_game_id, {}).get('commence_time', '')
-        game_live = is_game_live(commence_str)
+        game_live = _game_live(fd_games.get(matched_game_id, {}))
 
         # Skip live games — The Odds API live data is unreliable
         if game_live:
             continue
 
+        # Off-line strikes are priced from the game's total curve (one fit, whole ladder)
+        curve = fair_curve_for(series_ticker, 'total', fd_line, fd_total['over_fair_prob'])
+        ladder = [mk['floor_strike'] for mk in group['markets']
+                  if curve and abs(mk['floor_strike'] - fd_line) > 0.5 and curve.covers(mk['floor_strike'])]
+        curve_over = dict(zip(ladder, curve.prob_over_many(ladder))) if ladder else {}
+
         # Step 3: For each total market in this game, compare to fair value
         for mk in group['markets']:
             floor_strike = mk['floor_strike']
             ticker = mk['ticker']
 
-            # Only compare EXACT matching lines (within 0.5 points)
-            if abs(floor_strike - fd_line) > 0.5:
+            if abs(floor_strike - fd_line) <= 0.5:
+                # Use OPPOSITE side FanDuel odds to derive fair value (strips vig from our side)
+                # For Over: fair value = 1 - FD_Under_implied_prob
+                # For Under: fair value = 1 - FD_Over_implied_prob
+                fd_over_prob = converter.decimal_to_implied_prob(fd_total['over_odds'])
+                fd_under_prob = converter.decimal_to_implied_prob(fd_total['under_odds'])
+                over_odds, under_odds = fd_total['over_odds'], fd_total['under_odds']
+                fair_line = fd_line
+                mode = fd_total.get('_mode', '')
+                book_over = fd_total.get('per_book_over', {})
+                book_under = fd_total.get('per_book_under', {})
+            elif floor_strike in curve_over and 0.01 < curve_over[floor_strike] < 0.99:
+                fd_over_prob = curve_over[floor_strike]
+                fd_under_prob = 1.0 - fd_over_prob
+                over_odds, under_odds = 1.0 / fd_over_prob, 1.0 / fd_under_prob
+                fair_line = f"{floor_strike} (curve from {fd_line})"
+                mode = f"{fd_total.get('_mode', '')}+curve"
+                book_over = _curve_per_book(curve, fd_total.get('per_book_over', {}), floor_strike, True)
+                book_under = _curve_per_book(curve, fd_total.get('per_book_over', {}), floor_strike, False)
+            else:
+                continue
+
+            if not snapshot_could_clear([(mk['market'], 'yes', fd_under_prob), (mk['market'], 'no', fd_over_prob)]):
                 continue
 
             ob = kalshi_api.get_orderbook(ticker)
             if not ob:
                 continue
-            time.sleep(0.3)
+            _sleep(0.3)
 
             yes_price = get_best_yes_price(ob)  # YES = Over
             no_price = get_best_no_price(ob)    # NO = Under
 
-            # Use OPPOSITE side FanDuel odds to derive fair value (strips vig from our side)
-            # For Over: fair value = 1 - FD_Under_implied_prob
-            # For Under: fair value = 1 - FD_Over_implied_prob
-            fd_over_prob = converter.decimal_to_implied_prob(fd_total['over_odds'])
-            fd_under_prob = converter.decimal_to_implied_prob(fd_total['under_odds'])
-
-            # Check Over: Kalshi YES price vs FanDuel Under (opposite side)
-            if yes_price is not None:
-                fee = kalshi_fee(yes_price)
-                eff = yes_price + fee
-                # total_implied = kalshi_over_eff + fd_under_prob; if < 1.0 -> edge
-                total_implied = eff + fd_under_prob
-                if total_implied < 1.0:
-                    profit = (1.0 / total_implied - 1) * 100
-                    if profit < MIN_EDGE_PERCENT:
-                        continue
-                    edge = {
-                        'market_type': 'Total',
-                        'sport': sport_name,
-                        'game': game_name,
-                        'team': f"Over {floor_strike}",
-                        'opposite_team': f"Under {floor_strike}",
-                        'kalshi_price': yes_price,
-                        'kalshi_price_after_fees': eff,
-                        'kalshi_prob_after_fees': eff * 100,
-                        'kalshi_method': f"YES Over {floor_strike}",
-                        'kalshi_ticker': ticker,
-                        'kalshi_side': 'yes',
-                        'fanduel_opposite_team': f"Under {fd_line}",
-                        'fanduel_opposite_odds': fd_total['under_odds'],
-                        'fanduel_opposite_prob': fd_under_prob * 100,
-                        'total_implied_prob': total_implied * 100,
-                        'arbitrage_profit': profit,
-                        'is_live': game_live,
-                        'fair_value_mode': fd_total.get('_mode', ''),
-                        'per_book_detail': fd_total.get('per_book_under', {}),
-                        'odds_last_update': fd_total.get('_last_update', ''),
-                        'recommendation': f"Buy YES Over {floor_strike} on Kalshi at ${yes_price:.2f} (FanDuel Under {fd_line} at {fd_total['under_odds']:.2f})",
-                    }
-                    if books_diverge(edge['per_book_detail']):
-                        print(f"   Skipping {edge['game']} Over total: books diverge >10pp")
-                        continue
-                    edges.append(edge)
-                    send_telegram_notification(edge)
-                    auto_trade_edge(edge, kalshi_api)
-
-            # Check Under: Kalshi NO price vs FanDuel Over (opposite side)
-            if no_price is not None:
-                under_cost = no_price
-                fee = kalshi_fee(under_cost)
-                eff = under_cost + fee
-                # total_implied = kalshi_under_eff + fd_over_prob; if < 1.0 -> edge
-                total_implied = eff + fd_over_prob
-                if total_implied < 1.0:
-                    profit = (1.0 / total_implied - 1) * 100
-                    if profit < MIN_EDGE_PERCENT:
-                        continue
-                    edge = {
-                        'market_type': 'Total',
-                        'sport': sport_name,
-                        'game': game_name,
-                        'team': f"Under {floor_strike}",
-                        'opposite_team': f"Over {floor_strike}",
-                        'kalshi_price': under_cost,
-                        'kalshi_price_after_fees': eff,
-                        'kalshi_prob_after_fees': eff * 100,
-                        'kalshi_method': f"NO (Under) {floor_strike}",
-                        'kalshi_ticker': ticker,
-                        'kalshi_side': 'no',
-                        'fanduel_opposite_team': f"Over {fd_line}",
-                        'fanduel_opposite_odds': fd_total['over_odds'],
-                        'fanduel_opposite_prob': fd_over_prob * 100,
-                        'total_implied_prob': total_implied * 100,
-                        'arbitrage_profit': profit,
-                        'is_live': game_live,
-                        'fair_value_mode': fd_total.get('_mode', ''),
-                        'per_book_detail': fd_total.get('per_book_over', {}),
-                        'odds_last_update': fd_total.get('_last_update', ''),
-                        'recommendation': f"Buy NO (Under {floor_strike}) on Kalshi at ${under_cost:.2f} (FanDuel Over {fd_line} at {fd_total['over_odds']:.2f})",
-                    }
-                    if books_diverge(edge['per_book_detail']):
-                        print(f"   Skipping {edge['game']} Under total: books diverge >10pp")
-                        continue
-                    edges.append(edge)
-                    send_telegram_notification(edge)
-                    auto_trade_edge(edge, kalshi_api)
+            # Over: Kalshi YES vs FanDuel Under; Under: Kalshi NO vs FanDuel Over (opposite sides)
+            # Edge if kalshi_eff + fd_opposite_prob < 1.0 (priced by rank_edges)
+            for side, price, label, opp_label, opp_odds, opp_prob, method, per_book in (
+                    ('yes', yes_price, 'Over', 'Under', under_odds, fd_under_prob,
+                     f"YES Over {floor_strike}", book_under),
+                    ('no', no_price, 'Under', 'Over', over_odds, fd_over_prob,
+                     f"NO (Under) {floor_strike}", book_over)):
+                if price is None:
+                    continue
+                candidates.append({
+                    'skip': f"{label} total",
+                    'market_type': 'Total',
+                    'sport': sport_name,
+                    'game': game_name,
+                    'team': f"{label} {floor_strike}",
+                    'opposite_team': f"{opp_label} {floor_strike}",
+                    'kalshi_price': price,
+                    'kalshi_method': method,
+                    'kalshi_ticker': ticker,
+                    'kalshi_side': side,
+                    'fanduel_opposite_team': f"{opp_label} {fair_line}",
+                    'fanduel_opposite_odds': opp_odds,
+                    'fd_opp_prob': opp_prob,
+                    'is_live': game_live,
+                    'fair_value_mode': mode,
+                    'per_book_detail': per_book,
+                    'odds_last_update': fd_total.get('_last_update', ''),
+                    'recommendation': (f"Buy YES Over {floor_strike} on Kalshi at ${price:.2f} (FanDuel Under {fair_line} at {opp_odds:.2f})"
+                                       if side == 'yes' else
+                                       f"Buy NO (Under {floor_strike}) on Kalshi at ${price:.2f} (FanDuel Over {fair_line} at {opp_odds:.2f})"),
+                })
 
-    return edges
+    return emit_fair_value_edges(candidates, kalshi_api)
 
 
 # ============================================================
 # LIVE PLAYER PROP VALUE — compare FD one-way over vs Kalshi one-way YES
 # ============================================================
 
+@profiled('series_ticker')
 def find_live_prop_value(kalshi_api, fd_data, series_ticker, sport_name, fd_market_key):
     """
     Compare FanDuel live one-way Over price to Kalshi YES price.
@@ -2308,18 +3884,10 @@ def find_live_prop_value(kalshi_api, fd_data, series_ticker, sport_name, fd_mark
                 'last_update': prop.get('last_update', ''),
             })
 
-    # Build team abbrev -> set of FD game_ids for game verification
-    prop_team_map = {}
-    if 'NBA' in series_ticker:
-        prop_team_map = NBA_TEAMS
-    elif 'NHL' in series_ticker:
-        prop_team_map = NHL_TEAMS
-    fd_game_team_abbrs = {}
-    for game_id, ginfo in fd_games.items():
-        fd_game_team_abbrs[game_id] = set()
-        for abbr, full_name in prop_team_map.items():
-            if _name_matches(full_name, ginfo.get('home', '')) or _name_matches(full_name, ginfo.get('away', '')):
-                fd_game_team_abbrs[game_id].add(abbr)
+    # Team identities of each FD game (slate registry) for game verification
+    sport_prefix = parse_ticker(series_ticker).sport_prefix
+    fd_game_teams = {game_id: _slate.odds_event_teams(sport_prefix, game_id, fd_games) for game_id in fd_games}
+    fd_players = frozenset(fd_lookup)
 
     for m in today_markets:
         ticker = m.get('ticker', '')
@@ -2327,18 +3895,7 @@ def find_live_prop_value(kalshi_api, fd_data, series_ticker, sport_name, fd_mark
         subtitle = m.get('subtitle', '')
 
         # Extract game teams from ticker
-        ticker_game_abbrs = set()
-        ticker_parts = ticker.split('-')
-        if len(ticker_parts) >= 2:
-            game_part = ticker_parts[1]
-            date_stripped = re.sub(r'^\d{2}[A-Z]{3}\d{2}', '', game_part)
-            if prop_team_map:
-                team_abbr_set = set(prop_team_map.keys())
-                for i in range(1, len(date_stripped)):
-                    t1, t2 = date_stripped[:i], date_stripped[i:]
-                    if t1 in team_abbr_set and t2 in team_abbr_set:
-                        ticker_game_abbrs = {t1, t2}
-                        break
+        ticker_game_teams = _slate.kalshi_teams(sport_prefix, parse_ticker(ticker).team_pair)
 
         # Extract player name and line: "Nikola Jokic: 25+ points"
         prop_match = re.match(r'^(.+?):\s*(\d+\.?\d*)\+', title or subtitle or '')
@@ -2352,28 +3909,34 @@ def find_live_prop_value(kalshi_api, fd_data, series_ticker, sport_name, fd_mark
         best_fd_match = None
         best_fd_score = 0
 
-        for fd_player, fd_entries in fd_lookup.items():
-            if _match_player_name(player_name, fd_player):
-                for entry in fd_entries:
-                    if ticker_game_abbrs and entry['game_id'] in fd_game_team_abbrs:
-                        game_abbrs = fd_game_team_abbrs[entry['game_id']]
-                        if not ticker_game_abbrs.issubset(game_abbrs):
-                            continue
-                    fd_line = entry['point']
-                    line_diff = abs(kalshi_line - (fd_line + 0.5))
-                    if line_diff <= 0.5:
-                        score = 1.0 - line_diff
-                        if score > best_fd_score:
-                            best_fd_score = score
-                            best_fd_match = entry
+        fd_player = _players.resolve(sport_prefix, ticker_game_teams, 'kalshi', player_name, 'fanduel',
+                                     fd_players, _first_player_match)
+        for entry in fd_lookup.get(fd_player, ()):
+            if ticker_game_teams and entry['game_id'] in fd_game_teams:
+                if not ticker_game_teams.issubset(fd_game_teams[entry['game_id']]):
+                    continue
+            fd_line = entry['point']
+            line_diff = abs(kalshi_line - (fd_line + 0.5))
+            if line_diff <= 0.5:
+                score = 1.0 - line_diff
+                if score > best_fd_score:
+                    best_fd_score = score
+                    best_fd_match = entry
 
         if not best_fd_match:
             continue
 
+        # Direct one-way comparison: FD over implied vs Kalshi effective
+        fd_implied = best_fd_match['fd_over_implied']
+        snap_yes = snapshot_price(m, 'yes')
+        if not _prefilter_result(snap_yes is None or
+                                 (fd_implied - snap_yes - kalshi_fee(snap_yes)) * 100 >= LIVE_PROP_MIN_EDGE):
+            continue
+
         ob = kalshi_api.get_orderbook(ticker)
         if not ob:
             continue
-        time.sleep(0.3)
+        _sleep(0.3)
 
         yes_price = get_best_yes_price(ob)
         if yes_price is None:
@@ -2382,9 +3945,6 @@ def find_live_prop_value(kalshi_api, fd_data, series_ticker, sport_name, fd_mark
         fee = kalshi_fee(yes_price)
         kalshi_eff = yes_price + fee
 
-        # Direct one-way comparison: FD over implied vs Kalshi effective
-        fd_implied = best_fd_match['fd_over_implied']
-
         # Edge = how much cheaper Kalshi is vs FD (in percentage points)
         edge_pct = (fd_implied - kalshi_eff) * 100
 
@@ -2426,6 +3986,7 @@ def find_live_prop_value(kalshi_api, fd_data, series_ticker, sport_name, fd_mark
 # PRE-GAME PLAYER PROP COMPARISON (FD one-way vs Kalshi YES/NO)
 # ============================================================
 
+@profiled('sport_name')
 def compare_pregame_props(kalshi_api, fd_data, prop_series_tickers, sport_name):
     """
     Compare FanDuel one-way player prop odds to Kalshi YES/NO prices.
@@ -2437,37 +3998,20 @@ def compare_pregame_props(kalshi_api, fd_data, prop_series_tickers, sport_name):
     - Difference between FD implied and Kalshi price
 
     prop_series_tickers: dict mapping market_key -> series_ticker
+    fd_data: get_player_props_pregame() result. With stream=True the Kalshi ladders
+    are listed while FD event odds are still in flight, and each event is matched
+    and priced as soon as it arrives.
     """
-    fd_props = fd_data['props']
     fd_games = fd_data['games']
     comparisons = []
     date_strs = _get_today_date_strs()
 
-    # Determine team map for game verification
-    first_ticker = next(iter(prop_series_tickers.values()), '')
-    if 'NBA' in first_ticker:
-        prop_team_map = NBA_TEAMS
-    elif 'NHL' in first_ticker:
-        prop_team_map = NHL_TEAMS
-    else:
-        prop_team_map = {}
-
-    # Build team abbrev -> set of FD game_ids
-    fd_game_team_abbrs = {}
-    for game_id, ginfo in fd_games.items():
-        fd_game_team_abbrs[game_id] = set()
-        for abbr, full_name in prop_team_map.items():
-            if _name_matches(full_name, ginfo.get('home', '')) or _name_matches(full_name, ginfo.get('away', '')):
-                fd_game_team_abbrs[game_id].add(abbr)
-
-    # Build FD lookup: {(player_lower, point, market_key): prop_data_with_game_id}
-    fd_lookup = {}
-    for game_id, event_props in fd_props.items():
-        for prop in event_props:
-            key = (prop['player'].lower().strip(), prop['point'], prop['market_key'])
-            fd_lookup[key] = {**prop, 'game_id': game_id}
+    # Team identities of each FD game (slate registry) for game verification
+    sport_prefix = parse_ticker(next(iter(prop_series_tickers.values()), '')).sport_prefix
+    fd_game_teams = {game_id: _slate.odds_event_teams(sport_prefix, game_id, fd_games) for game_id in fd_games}
 
-    # Process each prop series ticker
+    # Step 1: Parse today's Kalshi prop markets, per FD market key, awaiting an FD match
+    unmatched = {}  # market_key -> [{'ticker', 'market', 'player', 'threshold', 'fd_point', 'game_teams', 'stat'}]
     for market_key, series_ticker in prop_series_tickers.items():
         kalshi_markets = kalshi_api.get_markets(series_ticker)
         today_markets = [m for m in kalshi_markets
@@ -2484,99 +4028,137 @@ def compare_pregame_props(kalshi_api, fd_data, prop_series_tickers, sport_name):
             subtitle = m.get('subtitle', '')
 
             # Extract game teams from ticker
-            ticker_game_abbrs = set()
-            ticker_parts = ticker.split('-')
-            if len(ticker_parts) >= 2:
-                game_part = ticker_parts[1]
-                date_stripped = re.sub(r'^\d{2}[A-Z]{3}\d{2}', '', game_part)
-                if prop_team_map:
-                    team_abbr_set = set(prop_team_map.keys())
-                    for i in range(1, len(date_stripped)):
-                        t1, t2 = date_stripped[:i], date_stripped[i:]
-                        if t1 in team_abbr_set and t2 in team_abbr_set:
-                            ticker_game_abbrs = {t1, t2}
-                            break
+            ticker_game_teams = _slate.kalshi_teams(sport_prefix, parse_ticker(ticker).team_pair)
 
             # Extract player name and threshold: "Nikola Jokic: 25+ points"
             prop_match = re.match(r'^(.+?):\s*(\d+\.?\d*)\+', title or subtitle or '')
             if not prop_match:
                 continue
 
-            player_name = prop_match.group(1).strip()
             kalshi_threshold = float(prop_match.group(2))
-            fd_point = kalshi_threshold - 0.5  # Kalshi "20+" = FD Over 19.5
+            unmatched.setdefault(market_key, []).append({
+                'ticker': ticker,
+                'market': m,
+                'player': prop_match.group(1).strip(),
+                'threshold': kalshi_threshold,
+                'fd_point': kalshi_threshold - 0.5,  # Kalshi "20+" = FD Over 19.5
+                'game_teams': ticker_game_teams,
+                'stat': stat_label,
+            })
 
-            # Find matching FD prop
-            best_fd = None
-            for (fd_player, fd_pt, fd_mk), fd_entry in fd_lookup.items():
-                if fd_mk != market_key:
-                    continue
-                if abs(fd_pt - fd_point) > 0.5:
+    # Step 2: Match each FD event's props as they arrive; only FD-matched markets the
+    # prop MM could act on get an orderbook fetch, the rest are priced from the snapshot
+    events = fd_data['stream'] if 'stream' in fd_data else fd_data['props'].items()
+    for game_id, event_props in events:
+        game_teams = fd_game_teams.get(game_id)
+        props_by_market = {}
+        for prop in event_props:
+            props_by_market.setdefault(prop['market_key'], []).append(prop)
+
+        for market_key, fd_candidates in props_by_market.items():
+            fd_by_player = {}
+            for p in fd_candidates:
+                fd_by_player.setdefault(p['player'], []).append(p)
+            fd_players = frozenset(fd_by_player)
+            still_unmatched = []
+            for km in unmatched.get(market_key, []):
+                if km['game_teams'] and game_teams is not None and not km['game_teams'].issubset(game_teams):
+                    still_unmatched.append(km)
                     continue
-                if not _match_player_name(player_name, fd_entry['player']):
+                fd_player = _players.resolve(sport_prefix, km['game_teams'], 'kalshi', km['player'], 'fanduel',
+                                             fd_players, _first_player_match)
+                best_fd = next((p for p in fd_by_player.get(fd_player, ())
+                                if abs(p['point'] - km['fd_point']) <= 0.5), None)
+                if not best_fd:
+                    still_unmatched.append(km)
                     continue
-                if ticker_game_abbrs and fd_entry['game_id'] in fd_game_team_abbrs:
-                    game_abbrs = fd_game_team_abbrs[fd_entry['game_id']]
-                    if not ticker_game_abbrs.issubset(game_abbrs):
-                        continue
-                best_fd = fd_entry
-                break
+                comp = _price_prop_comparison(kalshi_api, km, best_fd, fd_games.get(game_id, {}))
+                if comp:
+                    comparisons.append(comp)
+            unmatched[market_key] = still_unmatched
 
-            # Only fetch orderbook for FD-matched markets (saves ~580 API calls)
-            if not best_fd:
-                continue
+    return comparisons
 
-            ob = kalshi_api.get_orderbook(ticker)
-            if not ob:
-                continue
-            time.sleep(0.15)
 
-            yes_price = get_best_yes_price(ob)
-            no_price = get_best_no_price(ob)
+def _prop_needs_book(market: Dict, fd_implied: float) -> bool:
+    """Could manage_prop_orders act on this prop if the book has moved SNAPSHOT_SLACK_CENTS
+    in our favour since the snapshot? (YES buy at PROP_MM_YES_MIN_DIFF, or a top-of-book NO bid.)"""
+    yes_price = snapshot_price(market, 'yes')
+    no_bid = _snapshot_cents(market, 'no_bid')
+    yes_bid = _snapshot_cents(market, 'yes_bid')
+    if yes_price is None or no_bid is None or yes_bid is None:
+        return _prefilter_result(True)
+    if (fd_implied - yes_price) * 100 >= PROP_MM_YES_MIN_DIFF:
+        return _prefilter_result(True)
+    if not PROP_MM_ENABLED:
+        return _prefilter_result(False)
+    no_bid_cents = int(100 - fd_implied * 100 - PROP_MM_EDGE_PP)
+    return _prefilter_result(5 <= no_bid_cents <= 95
+                             and no_bid_cents > no_bid - SNAPSHOT_SLACK_CENTS
+                             and no_bid_cents < 100 - (yes_bid - SNAPSHOT_SLACK_CENTS))
+
+
+def _price_prop_comparison(kalshi_api, km: Dict, best_fd: Dict, game_info: Dict) -> Optional[Dict]:
+    """Build the comparison row for an FD-matched prop market. The Kalshi book is fetched only
+    if the prop MM could act on it; otherwise prices come from the get_markets snapshot."""
+    ticker = km['ticker']
+    market = km['market']
+    if _prop_needs_book(market, best_fd['fd_implied']):
+        ob = kalshi_api.get_orderbook(ticker)
+        if not ob:
+            return None
+        _sleep(0.15)
+        book_source = 'orderbook'
 
-            # Raw orderbook data for market-making (top-of-book check)
-            ob_data = ob.get('orderbook', {})
-            no_bids = ob_data.get('no', [])
-            yes_bids = ob_data.get('yes', [])
-            best_no_bid_cents = max(no_bids, key=lambda x: x[0])[0] if no_bids else 0
-            best_yes_bid_cents = max(yes_bids, key=lambda x: x[0])[0] if yes_bids else 0
+        yes_price = get_best_yes_price(ob)
+        no_price = get_best_no_price(ob)
 
-            game_info = fd_games.get(best_fd['game_id'], {})
-            game_name = f"{game_info.get('away', '?')} at {game_info.get('home', '?')}"
+        # Top-of-book bids for market-making
+        best_no_bid_cents = ob.best_no_bid
+        best_yes_bid_cents = ob.best_yes_bid
+    else:
+        book_source = 'snapshot'
+        best_no_bid_cents = int(_snapshot_cents(market, 'no_bid') or 0)
+        best_yes_bid_cents = int(_snapshot_cents(market, 'yes_bid') or 0)
+        # Same convention as the book: YES ask = 100 - best NO bid, None if no bids
+        yes_price = (100 - best_no_bid_cents) / 100 if best_no_bid_cents else None
+        no_price = (100 - best_yes_bid_cents) / 100 if best_yes_bid_cents else None
 
-            comp = {
-                'player': player_name,
-                'stat': stat_label,
-                'threshold': int(kalshi_threshold) if kalshi_threshold == int(kalshi_threshold) else kalshi_threshold,
-                'game': game_name,
-                'ticker': ticker,
-                # FD side
-                'fd_matched': True,
-                'fd_american': best_fd['american_odds'],
-                'fd_implied': best_fd['fd_implied'] * 100,
-                'fd_player': best_fd['player'],
-                'fd_point': best_fd['point'],
-                # Kalshi side
-                'kalshi_yes': yes_price,
-                'kalshi_no': no_price,
-                'kalshi_yes_pct': yes_price * 100 if yes_price else None,
-                'kalshi_no_pct': no_price * 100 if no_price else None,
-                # Raw orderbook for market-making
-                'best_no_bid_cents': best_no_bid_cents,
-                'best_yes_bid_cents': best_yes_bid_cents,
-                # Difference (FD implied - Kalshi YES = how much cheaper Kalshi is)
-                'diff_yes': (best_fd['fd_implied'] * 100 - yes_price * 100) if yes_price else None,
-                'diff_no': ((1 - best_fd['fd_implied']) * 100 - no_price * 100) if no_price else None,
-            }
-            comparisons.append(comp)
+    game_name = f"{game_info.get('away', '?')} at {game_info.get('home', '?')}"
+    kalshi_threshold = km['threshold']
 
-    return comparisons
+    return {
+        'player': km['player'],
+        'stat': km['stat'],
+        'threshold': int(kalshi_threshold) if kalshi_threshold == int(kalshi_threshold) else kalshi_threshold,
+        'game': game_name,
+        'ticker': ticker,
+        # FD side
+        'fd_matched': True,
+        'fd_american': best_fd['american_odds'],
+        'fd_implied': best_fd['fd_implied'] * 100,
+        'fd_player': best_fd['player'],
+        'fd_point': best_fd['point'],
+        # Kalshi side
+        'kalshi_yes': yes_price,
+        'kalshi_no': no_price,
+        'kalshi_yes_pct': yes_price * 100 if yes_price else None,
+        'kalshi_no_pct': no_price * 100 if no_price else None,
+        # Raw orderbook for market-making
+        'best_no_bid_cents': best_no_bid_cents,
+        'best_yes_bid_cents': best_yes_bid_cents,
+        'book_source': book_source,
+        # Difference (FD implied - Kalshi YES = how much cheaper Kalshi is)
+        'diff_yes': (best_fd['fd_implied'] * 100 - yes_price * 100) if yes_price else None,
+        'diff_no': ((1 - best_fd['fd_implied']) * 100 - no_price * 100) if no_price else None,
+    }
 
 
 # ============================================================
 # PROP MARKET MAKER — Resting NO limit orders based on FD lines
 # ============================================================
 
+@profiled()
 def manage_prop_orders(kalshi_api, comparisons):
     """Place/adjust/cancel limit orders on player props based on FD lines.
 
@@ -2659,11 +4241,12 @@ def manage_prop_orders(kalshi_api, comparisons):
                         )
                         if result:
                             yes_placed += 1
+                            _balance.invalidate()
                             order_status = result.get('order', {}).get('status', 'unknown')
                             print(f"   YES BUY: {comp['player']} {comp['stat']} {comp['threshold']}+ @ {yes_cents}¢ (diff {yes_diff:+.1f}pp)")
                             record_propmm_bet(ticker, comp['player'], comp['stat'], comp['threshold'],
                                               'yes', yes_cents, yes_diff, order_status)
-                        time.sleep(0.3)
+                        _sleep(0.3)
             continue  # Don't also place NO on same ticker
 
         # --- NO SIDE: Bid at FD's implied NO, only if top of book ---
@@ -2682,7 +4265,7 @@ def manage_prop_orders(kalshi_api, comparisons):
             # Price changed significantly — cancel old order, will re-place below
             kalshi_api.cancel_order(existing['order_id'])
             adjusted += 1
-            time.sleep(0.3)
+            _sleep(0.3)
 
         # Top-of-book check: our NO bid must be highest (beat existing best)
         best_no_bid = comp.get('best_no_bid_cents', 0)
@@ -2709,18 +4292,19 @@ def manage_prop_orders(kalshi_api, comparisons):
         )
         if result:
             no_placed += 1
+            _balance.invalidate()
             order_status = result.get('order', {}).get('status', 'unknown')
             no_diff = comp.get('diff_no', 0) or 0
             record_propmm_bet(ticker, comp['player'], comp['stat'], comp['threshold'],
                               'no', no_bid_cents, no_diff, order_status)
-        time.sleep(0.3)
+        _sleep(0.3)
 
     # Cancel orders for tickers no longer in FD data (line removed or game started)
     for ticker, order_info in prop_resting.items():
         if ticker not in active_tickers and ticker not in filled_tickers:
             kalshi_api.cancel_order(order_info['order_id'])
             canceled += 1
-            time.sleep(0.2)
+            _sleep(0.2)
 
     print(f"   Prop MM: {no_placed} NO placed, {yes_placed} YES bought, {adjusted} adjusted, "
           f"{canceled} stale canceled, {skipped_filled} filled, {skipped_no_not_top} NO not top")
@@ -2837,8 +4421,7 @@ def send_propmm_status_telegram(kalshi_api):
     message = '\n'.join(lines)
 
     try:
-        url = f"https://api.telegram.org/bot{TELEGRAM_BOT_TOKEN}/sendMessage"
-        requests.post(url, json={'chat_id': TELEGRAM_CHAT_ID, 'text': message}, timeout=10)
+        notify_telegram(message)
         data['last_status_update'] = datetime.utcnow().isoformat()
         _write_propmm_bets(data)
         print(f"   Prop MM Telegram update sent ({active_count} active bets)")
@@ -2852,7 +4435,7 @@ def send_propmm_morning_summary(kalshi_api):
         return
 
     # Check if it's 9am Eastern
-    now_utc = datetime.now(timezone.utc)
+    now_utc = _utcnow()
     try:
         import zoneinfo
         et = zoneinfo.ZoneInfo('America/New_York')
@@ -2944,8 +4527,7 @@ def send_propmm_morning_summary(kalshi_api):
     message = '\n'.join(lines)
 
     try:
-        url = f"https://api.telegram.org/bot{TELEGRAM_BOT_TOKEN}/sendMessage"
-        requests.post(url, json={'chat_id': TELEGRAM_CHAT_ID, 'text': message}, timeout=10)
+        notify_telegram(message)
         # Mark sent and clean up settled bets
         data['last_morning_summary'] = today_str
         settled_tickers = set(settle_by_ticker.keys())
@@ -2960,12 +4542,59 @@ def send_propmm_morning_summary(kalshi_api):
 # COMBO (PARLAY) MARKET MAKER — Quote NO on incoming RFQs
 # ============================================================
 
-# In-memory tracking (combo MM runs in its own thread)
+# In-memory tracking (receive thread dedupes, COMBO_MM_WORKERS threads quote)
 _combo_quoted_rfqs = set()  # RFQ IDs we've already quoted on
-_combo_exposure_cents = 0    # Current total $ at risk in cents
-_combo_pending_quotes = {}   # {rfq_id: {'quote_id': str, 'no_bid_cents': int, 'contracts': int, 'cost_cents': int, 'legs': int}}
+_combo_pending_quotes = {}   # {rfq_id: {'quote_id': str, 'no_bid_cents': int, 'contracts': int, 'cost_cents': int, 'legs': int, 'leg_mids': {ticker: mid}, 'rfq': dict}}
+_combo_quotes_by_leg = {}    # {leg ticker: {rfq_id}} — pending quotes to re-check when that leg's mid moves
+_combo_legs_lock = threading.Lock()
 _combo_ob_cache = {}         # {ticker: {'mid_yes': float, 'ts': float}} — orderbook cache for fast pricing
 COMBO_OB_CACHE_TTL = 300     # Cache orderbook data for 5 minutes (pre-game markets are stable)
+_combo_bets_lock = threading.Lock()  # Serializes read-modify-write of COMBO_MM_BETS_FILE
+
+
+class ComboExposure:
+    """Cost of outstanding combo quotes, reserved before create_quote so parallel
+    workers can't jointly overshoot the per-quote or global cap. A reservation is
+    held from submit until the quote fills or expires (same lifetime as the
+    bets file's total_exposure_cents)."""
+
+    def __init__(self, max_quote_cents: int, max_total_cents: int):
+        self.max_quote_cents = max_quote_cents
+        self.max_total_cents = max_total_cents
+        self._lock = threading.Lock()
+        self._reserved = {}  # {rfq_id: cents}
+        self._total = 0
+
+    def reserve(self, rfq_id: str, cents: int) -> Optional[str]:
+        """Reserve cents for rfq_id. Returns None on success, else the cap that refused it."""
+        if cents > self.max_quote_cents:
+            return 'quote'
+        with self._lock:
+            if rfq_id in self._reserved:
+                return 'duplicate'
+            if self._total + cents > self.max_total_cents:
+                return 'global'
+            self._reserved[rfq_id] = cents
+            self._total += cents
+            total = self._total
+        metric_set('combo_exposure_dollars', total / 100)
+        return None
+
+    def release(self, rfq_id: str) -> int:
+        """Drop rfq_id's reservation (quote rejected, filled or expired). Returns the cents freed."""
+        with self._lock:
+            cents = self._reserved.pop(rfq_id, 0)
+            self._total -= cents
+            total = self._total
+        metric_set('combo_exposure_dollars', total / 100)
+        return cents
+
+    @property
+    def total_cents(self) -> int:
+        return self._total
+
+
+_combo_exposure = ComboExposure(int(COMBO_MM_MAX_QUOTE_COST * 100), int(COMBO_MM_MAX_EXPOSURE * 100))
 
 
 def _read_combo_bets():
@@ -2998,25 +4627,18 @@ def _get_leg_mid_market(kalshi_api, ticker: str) -> Optional[float]:
     # Check cache first
     cached = _combo_ob_cache.get(ticker)
     if cached and (now - cached['ts']) < COMBO_OB_CACHE_TTL:
+        metric_inc('combo_ob_cache_total', {'result': 'hit'})
         return cached['mid_yes']
+    metric_inc('combo_ob_cache_total', {'result': 'miss'})
 
     # Fetch fresh orderbook
     ob = kalshi_api.get_orderbook(ticker)
     if not ob:
         return None
-    data = ob.get('orderbook', {})
-    yes_bids = data.get('yes', [])
-    no_bids = data.get('no', [])
-
-    if not yes_bids or not no_bids:
+    mid_yes = ob.mid_yes()  # decimal probability
+    if mid_yes is None:
         return None
 
-    best_yes_bid = max(yes_bids, key=lambda x: x[0])[0]  # cents
-    best_no_bid = max(no_bids, key=lambda x: x[0])[0]    # cents
-    yes_ask = 100 - best_no_bid
-
-    mid_yes = (best_yes_bid + yes_ask) / 2 / 100  # decimal probability
-
     # Cache the result
     _combo_ob_cache[ticker] = {'mid_yes': mid_yes, 'ts': now}
 
@@ -3027,9 +4649,10 @@ def calculate_combo_fair_value(kalshi_api, legs: List[Dict]) -> Optional[Dict]:
     """Calculate fair combo YES/NO from Kalshi mid-market of each leg.
 
     legs: list of dicts with 'market_ticker' and 'side' ('yes' or 'no')
-    Returns: {'fair_yes': float, 'fair_no': float, 'leg_probs': list} or None
+    Returns: {'fair_yes': float, 'fair_no': float, 'leg_probs': list, 'leg_mids': {ticker: mid}} or None
     """
     leg_probs = []
+    leg_mids = {}
 
     for leg in legs:
         ticker = leg.get('market_ticker', '')
@@ -3038,6 +4661,7 @@ def calculate_combo_fair_value(kalshi_api, legs: List[Dict]) -> Optional[Dict]:
         mid_yes = _get_leg_mid_market(kalshi_api, ticker)
         if mid_yes is None:
             return None  # Can't price — orderbook empty
+        leg_mids[ticker] = mid_yes
 
         # Clamp to avoid 0/1 extremes
         mid_yes = max(0.02, min(0.98, mid_yes))
@@ -3055,6 +4679,7 @@ def calculate_combo_fair_value(kalshi_api, legs: List[Dict]) -> Optional[Dict]:
         'fair_yes': combo_yes,
         'fair_no': 1.0 - combo_yes,
         'leg_probs': leg_probs,
+        'leg_mids': leg_mids,
     }
 
 
@@ -3109,17 +4734,18 @@ Our NO bid: {no_bid_cents}c ({prob_to_american(no_bid_cents/100)})
 Contracts: {contracts} | Cost: ${cost_dollars:.2f} | Max win: ${max_win_dollars:.2f}
 RFQ: {rfq_id[:12]}..."""
 
-        url = f"https://api.telegram.org/bot{TELEGRAM_BOT_TOKEN}/sendMessage"
-        requests.post(url, json={'chat_id': TELEGRAM_CHAT_ID, 'text': message}, timeout=10)
+        notify_telegram(message)
     except Exception as e:
         print(f"   Combo Telegram failed: {e}")
 
 
-def process_combo_rfq(kalshi_api, rfq: Dict) -> bool:
+def process_combo_rfq(kalshi_api, rfq: Dict, received_at: float = None) -> bool:
     """Process a single combo RFQ: calculate fair value and submit a quote.
+    received_at (time.perf_counter() when the RFQ arrived) feeds the RFQ-to-quote metric.
     Returns True if quote was submitted.
     """
-    global _combo_exposure_cents
+    if received_at is None:
+        received_at = time.perf_counter()
 
     rfq_id = rfq.get('id', '')
     legs = rfq.get('mve_selected_legs', [])
@@ -3162,48 +4788,75 @@ def process_combo_rfq(kalshi_api, rfq: Dict) -> bool:
     if no_bid_cents < 10 or no_bid_cents > 99:
         return False
 
-    # Hard cap: skip RFQs where full cost exceeds max quote cost.
-    # The API fills ALL contracts in the RFQ — we can't partially fill.
+    # Hard caps: the API fills ALL contracts in the RFQ — we can't partially fill — so the
+    # full cost is reserved against the per-quote and global limits before submitting.
     full_cost_cents = no_bid_cents * contracts
-    max_quote_cents = int(COMBO_MM_MAX_QUOTE_COST * 100)
-    if full_cost_cents > max_quote_cents:
+    refused = _combo_exposure.reserve(rfq_id, full_cost_cents)
+    if refused == 'quote':
         print(f"   Combo RFQ {rfq_id[:8]}: skipped (full cost ${full_cost_cents/100:.2f} > ${COMBO_MM_MAX_QUOTE_COST} cap)")
         return False
+    if refused:
+        print(f"   Combo RFQ {rfq_id[:8]}: skipped ({refused} exposure cap, "
+              f"${_combo_exposure.total_cents/100:.2f} + ${full_cost_cents/100:.2f} > ${COMBO_MM_MAX_EXPOSURE})")
+        return False
     quote_cost_cents = full_cost_cents
 
     # Submit quote
-    result = kalshi_api.create_quote(
-        rfq_id=rfq_id,
-        yes_bid=yes_bid_cents / 100,
-        no_bid=no_bid_cents / 100,
-        rest_remainder=False,
-    )
+    try:
+        result = kalshi_api.create_quote(
+            rfq_id=rfq_id,
+            yes_bid=yes_bid_cents / 100,
+            no_bid=no_bid_cents / 100,
+            rest_remainder=False,
+        )
+    except Exception:
+        _combo_exposure.release(rfq_id)
+        raise
 
     if result:
+        metric_observe('combo_rfq_to_quote_seconds', time.perf_counter() - received_at)
         # Track the quote
-        data = _read_combo_bets()
         quote_id = result.get('id', rfq_id)
         quote_status = result.get('status', 'unknown')
         is_immediately_filled = quote_status in ('filled', 'executed')
 
-        data['bets'][quote_id] = {
-            'rfq_id': rfq_id,
-            'legs': len(legs),
-            'leg_tickers': [l.get('market_ticker', '') for l in legs],
-            'leg_sides': [l.get('side', '') for l in legs],
-            'fair_yes': round(fair_yes, 4),
-            'fair_no': round(fair_no, 4),
+        # Track for fill detection before anything slow: the receive thread may see
+        # the fill event while this worker is still writing the bets file
+        _combo_pending_quotes[rfq_id] = {
+            'quote_id': quote_id,
             'no_bid_cents': no_bid_cents,
-            'yes_bid_cents': yes_bid_cents,
             'contracts': contracts,
             'cost_cents': quote_cost_cents,
-            'quoted_at': datetime.utcnow().isoformat(),
-            'status': 'filled' if is_immediately_filled else 'quoted',
+            'legs': len(legs),
+            'leg_tickers': [l.get('market_ticker', '') for l in legs],
+            'leg_sides': [l.get('side', '') for l in legs],
+            'fair_yes': fair_yes,
+            'quoted_ts': time.time(),
+            'leg_mids': fv['leg_mids'],
+            'rfq': {'id': rfq_id, 'mve_selected_legs': legs, 'contracts': contracts},
         }
-        if is_immediately_filled:
-            data['bets'][quote_id]['filled_at'] = datetime.utcnow().isoformat()
-        data['total_exposure_cents'] = data.get('total_exposure_cents', 0) + quote_cost_cents
-        _write_combo_bets(data)
+        _watch_combo_legs(rfq_id, fv['leg_mids'])
+
+        with _combo_bets_lock:
+            data = _read_combo_bets()
+            data['bets'][quote_id] = {
+                'rfq_id': rfq_id,
+                'legs': len(legs),
+                'leg_tickers': [l.get('market_ticker', '') for l in legs],
+                'leg_sides': [l.get('side', '') for l in legs],
+                'fair_yes': round(fair_yes, 4),
+                'fair_no': round(fair_no, 4),
+                'no_bid_cents': no_bid_cents,
+                'yes_bid_cents': yes_bid_cents,
+                'contracts': contracts,
+                'cost_cents': quote_cost_cents,
+                'quoted_at': datetime.utcnow().isoformat(),
+                'status': 'filled' if is_immediately_filled else 'quoted',
+            }
+            if is_immediately_filled:
+                data['bets'][quote_id]['filled_at'] = datetime.utcnow().isoformat()
+            data['total_exposure_cents'] = data.get('total_exposure_cents', 0) + quote_cost_cents
+            _write_combo_bets(data)
 
         n_legs = len(legs)
         if is_immediately_filled:
@@ -3217,47 +4870,69 @@ def process_combo_rfq(kalshi_api, rfq: Dict) -> bool:
                   f"(fair NO {fair_no*100:.1f}%, edge {COMBO_MM_EDGE_CENTS}c, api_status={quote_status})")
             send_combo_telegram('QUOTED', rfq_id, legs, fair_yes, no_bid_cents, contracts)
 
-        # Track for fill detection
-        _combo_pending_quotes[rfq_id] = {
-            'quote_id': quote_id,
-            'no_bid_cents': no_bid_cents,
-            'contracts': contracts,
-            'cost_cents': quote_cost_cents,
-            'legs': len(legs),
-            'leg_tickers': [l.get('market_ticker', '') for l in legs],
-            'leg_sides': [l.get('side', '') for l in legs],
-            'fair_yes': fair_yes,
-            'quoted_ts': time.time(),
-        }
         return True
 
+    _combo_exposure.release(rfq_id)
     return False
 
 
+def _watch_combo_legs(rfq_id: str, leg_mids: Dict[str, float]):
+    """Index a pending quote under its legs and add them to the WS ticker subscription."""
+    with _combo_legs_lock:  # held across (un)subscribe so a close can't drop a leg just re-added
+        for ticker in leg_mids:
+            _combo_quotes_by_leg.setdefault(ticker, set()).add(rfq_id)
+        get_kalshi_ws().subscribe('ticker', list(leg_mids))
+
+
+def _close_combo_quote(rfq_id: str, status: str) -> Optional[Dict]:
+    """Claim pending quote rfq_id and close it out as status ('filled', 'expired', 'cancelled'):
+    release its exposure, unindex its legs and update the bets file. Returns the pending
+    entry, or None if another path (fill event, expiry, withdrawal) already closed it."""
+    pq = _combo_pending_quotes.pop(rfq_id, None)
+    if pq is None:
+        return None
+    _combo_exposure.release(rfq_id)
+    with _combo_legs_lock:
+        unwatched = []
+        for ticker in pq.get('leg_mids', ()):
+            rfqs = _combo_quotes_by_leg.get(ticker)
+            if rfqs:
+                rfqs.discard(rfq_id)
+                if not rfqs:
+                    del _combo_quotes_by_leg[ticker]
+                    unwatched.append(ticker)
+        if unwatched:
+            get_kalshi_ws().unsubscribe('ticker', unwatched)
+
+    with _combo_bets_lock:
+        data = _read_combo_bets()
+        bets = data.get('bets', {})
+        bet_key = pq.get('quote_id', rfq_id)
+        if bet_key not in bets:
+            bet_key = rfq_id
+        if bet_key in bets:
+            cost = bets[bet_key].get('cost_cents', 0)
+            bets[bet_key]['status'] = status
+            if status == 'filled':
+                bets[bet_key]['filled_at'] = datetime.utcnow().isoformat()
+            data['total_exposure_cents'] = max(0, data.get('total_exposure_cents', 0) - cost)
+            _write_combo_bets(data)
+    return pq
+
+
 def _check_combo_fills_ws(rfq_id, quote_id, kalshi_api):
     """Handle a fill detected via WebSocket event. Called on quote_executed/quote_filled only."""
-    pq = _combo_pending_quotes.get(rfq_id)
-    if not pq:
+    if rfq_id not in _combo_pending_quotes:
         # Try matching by quote_id
         for rid, p in list(_combo_pending_quotes.items()):
             if p.get('quote_id') == quote_id:
-                pq = p
                 rfq_id = rid
                 break
+    # Claim it: quote_executed and quote_filled can both arrive, and the expiry thread races us
+    pq = _close_combo_quote(rfq_id, 'filled')
     if not pq:
         return
-
-    # Update bets file
-    data = _read_combo_bets()
-    bet_key = pq.get('quote_id', rfq_id)
-    if bet_key not in data.get('bets', {}):
-        bet_key = rfq_id
-    if bet_key in data.get('bets', {}):
-        cost = data['bets'][bet_key].get('cost_cents', 0)
-        data['bets'][bet_key]['status'] = 'filled'
-        data['bets'][bet_key]['filled_at'] = datetime.utcnow().isoformat()
-        data['total_exposure_cents'] = max(0, data.get('total_exposure_cents', 0) - cost)
-        _write_combo_bets(data)
+    _balance.invalidate()
 
     n_legs = pq['legs']
     cost = pq['cost_cents']
@@ -3269,89 +4944,224 @@ def _check_combo_fills_ws(rfq_id, quote_id, kalshi_api):
     send_combo_telegram('FILLED', rfq_id, legs_for_tg,
                        pq['fair_yes'], pq['no_bid_cents'], pq['contracts'])
 
-    _combo_pending_quotes.pop(rfq_id, None)
 
+def _combo_leg_moves(ticker_msg: Dict) -> List[Tuple[str, Dict]]:
+    """Apply a ticker-channel update to the leg mid cache and return the pending quotes
+    [(rfq_id, pending)] it moved by COMBO_MM_LEG_MOVE_CENTS or more, marked as withdrawing."""
+    ticker = ticker_msg.get('market_ticker', '')
+    yes_bid, yes_ask = ticker_msg.get('yes_bid'), ticker_msg.get('yes_ask')
+    if not ticker or not yes_bid or not yes_ask:
+        return []
+    mid_yes = (yes_bid + yes_ask) / 2 / 100
+    _combo_ob_cache[ticker] = {'mid_yes': mid_yes, 'ts': time.time()}
+
+    moved = []
+    with _combo_legs_lock:
+        rfq_ids = list(_combo_quotes_by_leg.get(ticker, ()))
+    for rfq_id in rfq_ids:
+        pq = _combo_pending_quotes.get(rfq_id)
+        if not pq or pq.get('withdrawing'):
+            continue
+        if abs(mid_yes - pq['leg_mids'].get(ticker, mid_yes)) * 100 >= COMBO_MM_LEG_MOVE_CENTS:
+            pq['withdrawing'] = True
+            moved.append((rfq_id, pq))
+    return moved
+
+
+def _withdraw_combo_quote(kalshi_api, rfq_id: str, pq: Dict):
+    """Worker-pool task: cancel a quote whose leg moved, then requote it off the fresh
+    mids while the RFQ is still young."""
+    if not kalshi_api.cancel_quote(pq['quote_id']):
+        # Executed or gone — the fill / expiry paths own it now. It stays marked so later
+        # ticks on the moved leg don't cancel the same dead quote again.
+        metric_inc('combo_quote_withdrawals_total', {'result': 'cancel_failed'})
+        return
+    if _close_combo_quote(rfq_id, 'cancelled') is None:
+        return
+    age = time.time() - pq['quoted_ts']
+    print(f"   Combo MM: withdrew quote on RFQ {rfq_id[:8]} after a leg move ({age:.1f}s old)")
+    requoted = age < COMBO_MM_REPRICE_WINDOW and process_combo_rfq(kalshi_api, dict(pq['rfq']))
+    metric_inc('combo_quote_withdrawals_total', {'result': 'repriced' if requoted else 'cancelled'})
+
+
+def _expire_old_combo_quotes():
+    """Auto-expire pending quotes older than 60 seconds. No REST calls needed.
+    RFQs close within seconds, so anything >60s old is definitely dead.
+    """
+    if not _combo_pending_quotes:
+        return
+
+    now = time.time()
+    expired = []
+    for rfq_id, pq in list(_combo_pending_quotes.items()):
+        quoted_at = pq.get('quoted_ts', 0)
+        if quoted_at and (now - quoted_at) > 60:
+            expired.append(rfq_id)
+
+    expired = [rfq_id for rfq_id in expired if _close_combo_quote(rfq_id, 'expired')]
+    if expired:
+        print(f"   Combo MM: auto-expired {len(expired)} stale pending quotes")
+
+
+_combo_stats_lock = threading.Lock()
+_combo_stats = {'msgs': 0, 'seen': 0, 'quoted': 0, 'skipped_cost': 0, 'skipped': 0, 'stale': 0}
+
+
+def _count_combo_rfq(outcome: str):
+    metric_inc('combo_rfqs_total', {'outcome': outcome})
+    with _combo_stats_lock:
+        _combo_stats[outcome] += 1
+
+
+def _log_combo_heartbeat():
+    s = _combo_stats
+    print(f"   Combo MM WS heartbeat: {s['msgs']} msgs, {s['seen']} RFQs seen, "
+          f"{s['quoted']} quoted, {s['skipped_cost']} too expensive, "
+          f"{s['skipped']} skipped, {s['stale']} stale, {len(_combo_pending_quotes)} pending, "
+          f"{len(_combo_ob_cache)} cached OBs, exposure ${_combo_exposure.total_cents/100:.2f}")
+
+
+def _combo_fill_checker_loop(kalshi_api):
+    """Auto-expire old pending quotes and log the heartbeat. No REST calls.
+    Fill detection is handled by WebSocket quote_executed/accepted events.
+    """
+    while True:
+        time.sleep(60)  # Check every 60s — just cleanup, no API calls
+        try:
+            _expire_old_combo_quotes()
+            _log_combo_heartbeat()
+        except Exception as e:
+            print(f"   Combo fill checker error: {e}")
+
+
+def _handle_combo_rfq(kalshi_api, rfq_event: Dict, rfq_id: str, received_at: float):
+    """Worker-pool task for one rfq_created event: fetch legs over REST if the event
+    lacked them, then price and quote. Outcomes land in _combo_stats and combo_rfqs_total."""
+    if time.perf_counter() - received_at > COMBO_MM_RFQ_MAX_AGE:
+        _count_combo_rfq('stale')  # waited out a burst — competitors have quoted
+        return
+    try:
+        # Try to use leg data directly from WS event (fastest path — no REST call)
+        if rfq_event.get('mve_selected_legs'):
+            rfq = dict(rfq_event)
+        else:
+            rfq_data = kalshi_api.get_rfq(rfq_id)
+            if not rfq_data:
+                return
+            rfq = rfq_data.get('rfq', rfq_data)
+            if not rfq.get('mve_selected_legs'):
+                return
+        rfq['id'] = rfq_id
+        _count_combo_rfq('quoted' if process_combo_rfq(kalshi_api, rfq, received_at) else 'skipped')
+    except Exception as e:
+        if '429' not in str(e):
+            print(f"   Combo MM WS: error processing RFQ {rfq_id[:8]}: {e}")
+
+
+def _resync_combo_quotes(kalshi_api):
+    """After a (re)connect: fills that happened while the socket was down never reach
+    us as events, so ask REST about each pending quote."""
+    for rfq_id, pq in list(_combo_pending_quotes.items()):
+        quote_data = kalshi_api.get_quote(pq['quote_id'])
+        if quote_data:
+            status = quote_data.get('status', quote_data.get('quote', {}).get('status', 'unknown'))
+            if status in ('filled', 'executed'):
+                _check_combo_fills_ws(rfq_id, pq['quote_id'], kalshi_api)
+
+
+_combo_logged_raw_events = [0]  # Log first few raw rfq_created events for debugging
+
+
+def _on_combo_ws_message(kalshi, pool: ThreadPoolExecutor, data: Dict):
+    """Combo MM consumer of the shared Kalshi WebSocket (runs on its own queue thread).
+    Only dedupes and pre-filters RFQs here; pricing, REST and quoting go to pool."""
+    msg_type = data.get('type', '')
+    _combo_stats['msgs'] += 1
 
-def _expire_old_combo_quotes():
-    """Auto-expire pending quotes older than 60 seconds. No REST calls needed.
-    RFQs close within seconds, so anything >60s old is definitely dead.
-    """
-    if not _combo_pending_quotes:
+    if msg_type == 'connected':
+        if _combo_pending_quotes:
+            pool.submit(_resync_combo_quotes, kalshi)
         return
 
-    now = time.time()
-    expired = []
-    for rfq_id, pq in list(_combo_pending_quotes.items()):
-        quoted_at = pq.get('quoted_ts', 0)
-        if quoted_at and (now - quoted_at) > 60:
-            expired.append(rfq_id)
+    # Log first 3 raw rfq_created events to see what fields are available
+    if msg_type == 'rfq_created' and _combo_logged_raw_events[0] < 3:
+        print(f"   Combo MM WS RAW EVENT: {json.dumps(data)[:500]}")
+        _combo_logged_raw_events[0] += 1
 
-    if not expired:
-        return
+    # Handle rfq_created events
+    if msg_type == 'rfq_created':
+        if not COMBO_MM_ENABLED:
+            return
+        rfq_event = data.get('msg', data)
+        rfq_id = rfq_event.get('rfq_id', rfq_event.get('id', ''))
 
-    data = _read_combo_bets()
-    for rfq_id in expired:
-        pq = _combo_pending_quotes.get(rfq_id, {})
-        quote_id = pq.get('quote_id', rfq_id)
-        bet_key = quote_id if quote_id in data.get('bets', {}) else rfq_id
-        if bet_key in data.get('bets', {}):
-            cost = data['bets'][bet_key].get('cost_cents', 0)
-            data['bets'][bet_key]['status'] = 'expired'
-            data['total_exposure_cents'] = max(0, data.get('total_exposure_cents', 0) - cost)
+        if not rfq_id or rfq_id in _combo_quoted_rfqs:
+            return
 
-        _combo_pending_quotes.pop(rfq_id, None)
+        _combo_quoted_rfqs.add(rfq_id)
+        _combo_stats['seen'] += 1
 
-    _write_combo_bets(data)
-    if expired:
-        print(f"   Combo MM: auto-expired {len(expired)} stale pending quotes")
+        # Cheap pre-filter here; pricing, any REST get_rfq and create_quote run on the pool
+        if not rfq_event.get('mve_selected_legs'):
+            contracts = rfq_event.get('contracts', 0)
+            if not contracts:
+                try:
+                    contracts = int(float(rfq_event.get('contracts_fp', '0')))
+                except (ValueError, TypeError):
+                    contracts = 0
 
+            # Skip if likely too expensive (assume worst case ~90c NO bid)
+            if contracts > 0 and (90 * contracts) > int(COMBO_MM_MAX_QUOTE_COST * 100):
+                _count_combo_rfq('skipped_cost')
+                return
 
-def _combo_ws_auth_headers(api_key_id, private_key):
-    """Generate RSA-PSS signed auth headers for Kalshi WebSocket handshake."""
-    timestamp_ms = str(int(time.time() * 1000))
-    # For WebSocket, sign GET /trade-api/ws/v2
-    path = '/trade-api/ws/v2'
-    msg = timestamp_ms + 'GET' + path
-    signature = private_key.sign(
-        msg.encode('utf-8'),
-        padding.PSS(
-            mgf=padding.MGF1(hashes.SHA256()),
-            salt_length=padding.PSS.DIGEST_LENGTH
-        ),
-        hashes.SHA256()
-    )
-    return {
-        'KALSHI-ACCESS-KEY': api_key_id,
-        'KALSHI-ACCESS-SIGNATURE': base64.b64encode(signature).decode('utf-8'),
-        'KALSHI-ACCESS-TIMESTAMP': timestamp_ms,
-    }
+        pool.submit(_handle_combo_rfq, kalshi, rfq_event, rfq_id, time.perf_counter())
 
+    # Leg mid moved: pull (and maybe requote) pending quotes priced off the old mid
+    elif msg_type == 'ticker':
+        for rfq_id, pq in _combo_leg_moves(data.get('msg', {})):
+            pool.submit(_withdraw_combo_quote, kalshi, rfq_id, pq)
 
-def _combo_fill_checker_loop(kalshi_api):
-    """Background thread to auto-expire old pending quotes. No REST calls.
-    Fill detection is handled by WebSocket quote_executed/accepted events.
-    """
-    while True:
-        try:
-            _expire_old_combo_quotes()
-        except Exception as e:
-            print(f"   Combo fill checker error: {e}")
-        time.sleep(60)  # Check every 60s — just cleanup, no API calls
+    # Handle quote execution events for instant fill detection
+    elif msg_type in ('quote_executed', 'quote_accepted', 'quote_filled'):
+        quote_event = data.get('msg', data)
+        quote_id = quote_event.get('quote_id', quote_event.get('id', ''))
+        rfq_id = quote_event.get('rfq_id', '')
+        quote_status = quote_event.get('status', '')
+        print(f"   Combo MM WS: {msg_type} quote={quote_id[:12] if quote_id else '?'} "
+              f"rfq={rfq_id[:12] if rfq_id else '?'} status={quote_status}")
+
+        if msg_type in ('quote_executed', 'quote_filled'):
+            # These mean the trade actually filled — handle immediately
+            try:
+                _check_combo_fills_ws(rfq_id, quote_id, kalshi)
+            except Exception as e:
+                print(f"   Combo MM WS fill check error: {e}")
+        elif msg_type == 'quote_accepted':
+            # quote_accepted = Kalshi received our quote, NOT a fill.
+            # Verify actual status via REST to be sure.
+            try:
+                if quote_id and quote_id != '?':
+                    quote_data = kalshi.get_quote(quote_id)
+                    if quote_data:
+                        actual_status = quote_data.get('status', quote_data.get('quote', {}).get('status', 'unknown'))
+                        print(f"   Combo MM WS: quote_accepted → REST status: {actual_status}")
+                        if actual_status in ('filled', 'executed'):
+                            _check_combo_fills_ws(rfq_id, quote_id, kalshi)
+                        # else: quote is pending/open, not filled yet
+            except Exception as e:
+                print(f"   Combo MM WS quote_accepted verify error: {e}")
 
 
 def _combo_mm_loop():
-    """WebSocket-based combo market maker. Subscribes to the communications channel
-    for instant rfq_created events instead of REST polling.
-    Falls back to REST polling if WebSocket fails to connect.
+    """WebSocket-based combo market maker. Consumes rfq_created, quote and leg ticker
+    events from the shared Kalshi WebSocket instead of REST polling, then runs the
+    pending-quote expiry loop.
     """
     print("Combo market maker started (WebSocket mode)")
     time.sleep(10)  # Let other threads initialize first
 
-    kalshi = KalshiAPI(KALSHI_API_KEY_ID, KALSHI_PRIVATE_KEY)
-
-    # Start fill checker in a separate thread
-    fill_thread = threading.Thread(target=_combo_fill_checker_loop, args=(kalshi,), daemon=True)
-    fill_thread.start()
+    kalshi = get_kalshi_client()
 
     # Skip catch-up of existing open RFQs — they're already stale by startup.
     # Just mark them as seen so we don't re-process via WebSocket.
@@ -3366,207 +5176,17 @@ def _combo_mm_loop():
     except Exception as e:
         print(f"   Combo MM startup error: {e}")
 
-    reconnect_delay = 1  # Start with 1s, exponential backoff on repeated failures
-
-    while True:
-        if not COMBO_MM_ENABLED:
-            time.sleep(30)
-            continue
-
-        ws = None
-        try:
-            # Generate auth headers for WebSocket handshake
-            key_str = KALSHI_PRIVATE_KEY.replace('\\n', '\n')
-            private_key = serialization.load_pem_private_key(key_str.encode(), password=None)
-            auth_headers = _combo_ws_auth_headers(KALSHI_API_KEY_ID, private_key)
-
-            ws_url = 'wss://api.elections.kalshi.com/trade-api/ws/v2'
-            header_list = [f"{k}: {v}" for k, v in auth_headers.items()]
-
-            print(f"   Combo MM: connecting to WebSocket...")
-            ws = websocket.create_connection(
-                ws_url,
-                header=header_list,
-                timeout=30,
-            )
-            print(f"   Combo MM: WebSocket connected!")
-
-            # Subscribe to the communications channel (RFQ events)
-            sub_msg = json.dumps({
-                'id': 1,
-                'cmd': 'subscribe',
-                'params': {'channels': ['communications']}
-            })
-            ws.send(sub_msg)
-
-            # Read subscription confirmation
-            sub_resp = ws.recv()
-            print(f"   Combo MM: subscribed to communications channel: {sub_resp[:200]}")
-
-            reconnect_delay = 1  # Reset on successful connection
-            heartbeat_time = time.time()
-            msg_count = 0
-            rfqs_seen = 0
-            rfqs_quoted = 0
-            rfqs_skipped_cost = 0
-            rfqs_skipped_other = 0
-            logged_raw_events = 0  # Log first few raw events for debugging
-
-            # Main event loop
-            while True:
-                try:
-                    ws.settimeout(30)  # 30s timeout for recv to allow heartbeat checks
-                    raw = ws.recv()
-                    msg_count += 1
-                except websocket.WebSocketTimeoutException:
-                    # No message in 30s — send a ping to keep alive
-                    try:
-                        ws.ping()
-                    except Exception:
-                        print("   Combo MM: ping failed, reconnecting")
-                        break
-                    # Heartbeat log
-                    now = time.time()
-                    if now - heartbeat_time >= 60:
-                        n_pending = len(_combo_pending_quotes)
-                        n_cached = len(_combo_ob_cache)
-                        print(f"   Combo MM WS heartbeat: {msg_count} msgs, {rfqs_seen} RFQs seen, "
-                              f"{rfqs_quoted} quoted, {rfqs_skipped_cost} too expensive, "
-                              f"{rfqs_skipped_other} skipped, {n_pending} pending, {n_cached} cached OBs")
-                        heartbeat_time = now
-                    continue
-
-                if not raw:
-                    continue
-
-                try:
-                    data = json.loads(raw)
-                except json.JSONDecodeError:
-                    continue
-
-                msg_type = data.get('type', '')
-
-                # Log first 3 raw rfq_created events to see what fields are available
-                if msg_type == 'rfq_created' and logged_raw_events < 3:
-                    print(f"   Combo MM WS RAW EVENT: {json.dumps(data)[:500]}")
-                    logged_raw_events += 1
-
-                # Handle rfq_created events
-                if msg_type == 'rfq_created':
-                    rfq_event = data.get('msg', data)
-                    rfq_id = rfq_event.get('rfq_id', rfq_event.get('id', ''))
-
-                    if not rfq_id or rfq_id in _combo_quoted_rfqs:
-                        continue
-
-                    _combo_quoted_rfqs.add(rfq_id)
-                    rfqs_seen += 1
-
-                    # Try to use leg data directly from WS event (fastest path — no REST call)
-                    legs = rfq_event.get('mve_selected_legs', [])
-
-                    if legs:
-                        # We have legs from the WS event — skip REST get_rfq() entirely!
-                        rfq = dict(rfq_event)
-                        rfq['id'] = rfq_id
-                        try:
-                            if process_combo_rfq(kalshi, rfq):
-                                rfqs_quoted += 1
-                            else:
-                                rfqs_skipped_other += 1
-                        except Exception as e:
-                            print(f"   Combo MM WS: error processing RFQ {rfq_id[:8]}: {e}")
-                    else:
-                        # No legs in event — need REST call. Pre-filter first to save API calls.
-                        contracts = rfq_event.get('contracts', 0)
-                        if not contracts:
-                            try:
-                                contracts = int(float(rfq_event.get('contracts_fp', '0')))
-                            except (ValueError, TypeError):
-                                contracts = 0
-
-                        # Skip if likely too expensive (assume worst case ~90c NO bid)
-                        if contracts > 0 and (90 * contracts) > int(COMBO_MM_MAX_QUOTE_COST * 100):
-                            rfqs_skipped_cost += 1
-                            continue
-
-                        # Fetch full RFQ via REST
-                        try:
-                            rfq_data = kalshi.get_rfq(rfq_id)
-                            if rfq_data:
-                                rfq = rfq_data.get('rfq', rfq_data)
-                                rfq['id'] = rfq_id
-                                if rfq.get('mve_selected_legs'):
-                                    if process_combo_rfq(kalshi, rfq):
-                                        rfqs_quoted += 1
-                                    else:
-                                        rfqs_skipped_other += 1
-                        except Exception as e:
-                            if '429' not in str(e):
-                                print(f"   Combo MM WS: error processing RFQ {rfq_id[:8]}: {e}")
-
-                # Handle quote execution events for instant fill detection
-                elif msg_type in ('quote_executed', 'quote_accepted', 'quote_filled'):
-                    quote_event = data.get('msg', data)
-                    quote_id = quote_event.get('quote_id', quote_event.get('id', ''))
-                    rfq_id = quote_event.get('rfq_id', '')
-                    quote_status = quote_event.get('status', '')
-                    print(f"   Combo MM WS: {msg_type} quote={quote_id[:12] if quote_id else '?'} "
-                          f"rfq={rfq_id[:12] if rfq_id else '?'} status={quote_status}")
-
-                    if msg_type in ('quote_executed', 'quote_filled'):
-                        # These mean the trade actually filled — handle immediately
-                        try:
-                            _check_combo_fills_ws(rfq_id, quote_id, kalshi)
-                        except Exception as e:
-                            print(f"   Combo MM WS fill check error: {e}")
-                    elif msg_type == 'quote_accepted':
-                        # quote_accepted = Kalshi received our quote, NOT a fill.
-                        # Verify actual status via REST to be sure.
-                        try:
-                            if quote_id and quote_id != '?':
-                                quote_data = kalshi.get_quote(quote_id)
-                                if quote_data:
-                                    actual_status = quote_data.get('status', quote_data.get('quote', {}).get('status', 'unknown'))
-                                    print(f"   Combo MM WS: quote_accepted → REST status: {actual_status}")
-                                    if actual_status in ('filled', 'executed'):
-                                        _check_combo_fills_ws(rfq_id, quote_id, kalshi)
-                                    # else: quote is pending/open, not filled yet
-                        except Exception as e:
-                            print(f"   Combo MM WS quote_accepted verify error: {e}")
-
-                # Periodic heartbeat logging
-                now = time.time()
-                if now - heartbeat_time >= 60:
-                    n_quoted = len(_combo_quoted_rfqs)
-                    n_pending = len(_combo_pending_quotes)
-                    n_cached = len(_combo_ob_cache)
-                    print(f"   Combo MM WS heartbeat: {msg_count} msgs, {rfqs_seen} RFQs seen, "
-                          f"{rfqs_quoted} quoted, {rfqs_skipped_cost} too expensive, "
-                          f"{rfqs_skipped_other} skipped, {n_pending} pending, {n_cached} cached OBs")
-                    heartbeat_time = now
-
-        except websocket.WebSocketException as e:
-            print(f"   Combo MM WebSocket error: {e}")
-        except Exception as e:
-            print(f"   Combo MM error: {e}")
-        finally:
-            if ws:
-                try:
-                    ws.close()
-                except Exception:
-                    pass
+    # RFQ workers: the consumer thread only dedupes and hands off, so a burst (or one RFQ
+    # that needs REST get_rfq) doesn't queue the rest behind it
+    pool = ThreadPoolExecutor(max_workers=COMBO_MM_WORKERS, thread_name_prefix='combo-rfq')
 
-        # Reconnect with exponential backoff (max 30s)
-        print(f"   Combo MM: reconnecting in {reconnect_delay}s...")
-        time.sleep(reconnect_delay)
-        reconnect_delay = min(30, reconnect_delay * 2)
+    ws = get_kalshi_ws()
+    ws.add_consumer('combo', functools.partial(_on_combo_ws_message, kalshi, pool),
+                    ('rfq_created', 'ticker', 'quote_executed', 'quote_accepted', 'quote_filled'))
+    ws.subscribe('communications')  # RFQ + quote events
+    # Leg tickers for pending quotes are added by _watch_combo_legs
 
-        # Re-create API client on reconnect (auth may have expired)
-        try:
-            kalshi = KalshiAPI(KALSHI_API_KEY_ID, KALSHI_PRIVATE_KEY)
-        except Exception:
-            pass
+    _combo_fill_checker_loop(kalshi)
 
 
 def start_combo_mm():
@@ -3580,6 +5200,7 @@ def start_combo_mm():
 # BTTS (BOTH TEAMS TO SCORE) EDGE FINDER
 # ============================================================
 
+@profiled('series_ticker')
 def find_btts_edges(kalshi_api, fd_data, series_ticker, sport_name):
     """
     Compare Kalshi BTTS markets against FanDuel BTTS odds.
@@ -3593,6 +5214,7 @@ def find_btts_edges(kalshi_api, fd_data, series_ticker, sport_name):
     fd_btts = fd_data['btts']
     fd_games = fd_data['games']
     edges = []
+    candidates = []
     date_strs = _get_today_date_strs()
 
     kalshi_markets = kalshi_api.get_markets(series_ticker)
@@ -3605,24 +5227,17 @@ def find_btts_edges(kalshi_api, fd_data, series_ticker, sport_name):
     # Ticker format expected: KXEPLBTTS-26JAN31LIVARS or similar
     game_groups = {}
     for m in today_markets:
-        ticker = m.get('ticker', '')
-        parts = ticker.split('-')
-        if len(parts) < 2:
+        rec = parse_ticker(m.get('ticker', ''))
+        if not rec.game_part:
             continue
-        game_part = parts[1] if len(parts) >= 2 else ''
-        game_code = f"{parts[0]}-{game_part}"
-
-        if game_code not in game_groups:
-            game_groups[game_code] = []
-        game_groups[game_code].append(m)
+        if rec.event not in game_groups:
+            game_groups[rec.event] = []
+        game_groups[rec.event].append(m)
 
     for game_code, markets in game_groups.items():
         # Try to match this Kalshi game to a FanDuel game
         # Extract game_part for fuzzy matching
-        parts = game_code.split('-')
-        if len(parts) < 2:
-            continue
-        game_part = parts[1]
+        game_part = parse_ticker(game_code).game_part
 
         # Try to match by team names in the game_part against FD games
         matched_game_id = None
@@ -3645,8 +5260,7 @@ def find_btts_edges(kalshi_api, fd_data, series_ticker, sport_name):
         fd_game_btts = fd_btts[matched_game_id]
         game_info = fd_games.get(matched_game_id, {})
         game_name = f"{game_info.get('away', '?')} at {game_info.get('home', '?')}"
-        commence_str = game_info.get('commence_time', '')
-        game_live = is_game_live(commence_str)
+        game_live = _game_live(game_info)
 
         # Skip live games — The Odds API live data is unreliable
         if game_live:
@@ -3660,99 +5274,54 @@ def find_btts_edges(kalshi_api, fd_data, series_ticker, sport_name):
             title = (m.get('title', '') or '').lower()
             subtitle = (m.get('subtitle', '') or '').lower()
 
+            if not snapshot_could_clear([(m, 'yes', fd_no_prob), (m, 'no', fd_yes_prob)]):
+                continue
+
             ob = kalshi_api.get_orderbook(ticker)
             if not ob:
                 continue
-            time.sleep(0.3)
+            _sleep(0.3)
 
             yes_price = get_best_yes_price(ob)
             no_price = get_best_no_price(ob)
 
-            # Check YES (BTTS Yes): use opposite side (FD No) for fair value
-            if yes_price is not None:
-                fee = kalshi_fee(yes_price)
-                eff = yes_price + fee
-                total_implied = eff + fd_no_prob
-                if total_implied < 1.0:
-                    profit = (1.0 / total_implied - 1) * 100
-                    if profit < MIN_EDGE_PERCENT:
-                        continue
-                    edge = {
-                        'market_type': 'BTTS',
-                        'sport': sport_name,
-                        'game': game_name,
-                        'team': 'BTTS Yes',
-                        'opposite_team': 'BTTS No',
-                        'kalshi_price': yes_price,
-                        'kalshi_price_after_fees': eff,
-                        'kalshi_prob_after_fees': eff * 100,
-                        'kalshi_method': 'YES (Both Teams Score)',
-                        'kalshi_ticker': ticker,
-                        'kalshi_side': 'yes',
-                        'fanduel_opposite_team': 'BTTS No',
-                        'fanduel_opposite_odds': fd_game_btts['no_odds'],
-                        'fanduel_opposite_prob': fd_no_prob * 100,
-                        'total_implied_prob': total_implied * 100,
-                        'arbitrage_profit': profit,
-                        'is_live': game_live,
-                        'fair_value_mode': fd_game_btts.get('_mode', ''),
-                        'per_book_detail': fd_game_btts.get('per_book_no', {}),
-                        'odds_last_update': fd_game_btts.get('_last_update', ''),
-                        'recommendation': f"Buy YES BTTS on Kalshi at ${yes_price:.2f} (FanDuel BTTS No at {fd_game_btts['no_odds']:.2f})",
-                    }
-                    if books_diverge(edge['per_book_detail']):
-                        print(f"   Skipping {edge['game']} BTTS YES: books diverge >10pp")
-                        continue
-                    edges.append(edge)
-                    send_telegram_notification(edge)
-                    auto_trade_edge(edge, kalshi_api)
-
-            # Check NO (BTTS No): use opposite side (FD Yes) for fair value
-            if no_price is not None:
-                fee = kalshi_fee(no_price)
-                eff = no_price + fee
-                total_implied = eff + fd_yes_prob
-                if total_implied < 1.0:
-                    profit = (1.0 / total_implied - 1) * 100
-                    if profit < MIN_EDGE_PERCENT:
-                        continue
-                    edge = {
-                        'market_type': 'BTTS',
-                        'sport': sport_name,
-                        'game': game_name,
-                        'team': 'BTTS No',
-                        'opposite_team': 'BTTS Yes',
-                        'kalshi_price': no_price,
-                        'kalshi_price_after_fees': eff,
-                        'kalshi_prob_after_fees': eff * 100,
-                        'kalshi_method': 'NO (Both Teams Don\'t Score)',
-                        'kalshi_ticker': ticker,
-                        'kalshi_side': 'no',
-                        'fanduel_opposite_team': 'BTTS Yes',
-                        'fanduel_opposite_odds': fd_game_btts['yes_odds'],
-                        'fanduel_opposite_prob': fd_yes_prob * 100,
-                        'total_implied_prob': total_implied * 100,
-                        'arbitrage_profit': profit,
-                        'is_live': game_live,
-                        'fair_value_mode': fd_game_btts.get('_mode', ''),
-                        'per_book_detail': fd_game_btts.get('per_book_yes', {}),
-                        'odds_last_update': fd_game_btts.get('_last_update', ''),
-                        'recommendation': f"Buy NO BTTS on Kalshi at ${no_price:.2f} (FanDuel BTTS Yes at {fd_game_btts['yes_odds']:.2f})",
-                    }
-                    if books_diverge(edge['per_book_detail']):
-                        print(f"   Skipping {edge['game']} BTTS NO: books diverge >10pp")
-                        continue
-                    edges.append(edge)
-                    send_telegram_notification(edge)
-                    auto_trade_edge(edge, kalshi_api)
+            # BTTS Yes is priced against FD No and BTTS No against FD Yes (opposite sides)
+            for side, price, label, opp_label, opp_odds, opp_prob, method, per_book in (
+                    ('yes', yes_price, 'BTTS Yes', 'BTTS No', fd_game_btts['no_odds'], fd_no_prob,
+                     'YES (Both Teams Score)', fd_game_btts.get('per_book_no', {})),
+                    ('no', no_price, 'BTTS No', 'BTTS Yes', fd_game_btts['yes_odds'], fd_yes_prob,
+                     'NO (Both Teams Don\'t Score)', fd_game_btts.get('per_book_yes', {}))):
+                if price is None:
+                    continue
+                candidates.append({
+                    'skip': f"BTTS {side.upper()}",
+                    'market_type': 'BTTS',
+                    'sport': sport_name,
+                    'game': game_name,
+                    'team': label,
+                    'opposite_team': opp_label,
+                    'kalshi_price': price,
+                    'kalshi_method': method,
+                    'kalshi_ticker': ticker,
+                    'kalshi_side': side,
+                    'fanduel_opposite_team': opp_label,
+                    'fanduel_opposite_odds': opp_odds,
+                    'fd_opp_prob': opp_prob,
+                    'is_live': game_live,
+                    'fair_value_mode': fd_game_btts.get('_mode', ''),
+                    'per_book_detail': per_book,
+                    'odds_last_update': fd_game_btts.get('_last_update', ''),
+                    'recommendation': f"Buy {side.upper()} BTTS on Kalshi at ${price:.2f} (FanDuel {opp_label} at {opp_odds:.2f})",
+                })
 
-    return edges
+    return emit_fair_value_edges(candidates, kalshi_api)
 
 
 # ============================================================
 # TENNIS EDGE FINDER
 # ============================================================
 
+@functools.lru_cache(maxsize=8192)
 def _extract_player_from_title(title: str) -> Optional[str]:
     """Extract player name from Kalshi tennis title.
     e.g. 'Will Matteo Martineau win the Martineau vs Damm Jr : Qualification Round 1 match?'
@@ -3793,10 +5362,12 @@ def _tennis_name_matches(kalshi_name: str, fd_name: str) -> bool:
     return False
 
 
+@profiled('series_ticker')
 def find_tennis_edges(kalshi_api, fanduel_api, series_ticker: str, odds_api_keys: list, sport_name: str):
     """Find edges on tennis match-winner markets."""
     converter = OddsConverter()
     edges = []
+    candidates = []
     date_strs = _get_today_date_strs()
 
     # Step 1: Fetch Kalshi markets
@@ -3827,7 +5398,7 @@ def find_tennis_edges(kalshi_api, fanduel_api, series_ticker: str, odds_api_keys
                         outcome_count += 1
                 all_fd_games.update(fd['games'])
                 print(f"   Fair value {odds_key} moneyline: {outcome_count} outcomes across {len(fd['odds'])} games")
-            time.sleep(0.3)
+            _sleep(0.3)
         except Exception as e:
             continue
 
@@ -3881,8 +5452,7 @@ def find_tennis_edges(kalshi_api, fanduel_api, series_ticker: str, odds_api_keys
 
         # Staleness check
         game_id = fd_p1_odds.get('game_id', '')
-        commence_str = all_fd_games.get(game_id, {}).get('commence_time', '')
-        game_live = is_game_live(commence_str)
+        game_live = _game_live(all_fd_games.get(game_id, {}))
 
         # Skip live games — The Odds API live data is unreliable
         if game_live:
@@ -3890,11 +5460,18 @@ def find_tennis_edges(kalshi_api, fanduel_api, series_ticker: str, odds_api_keys
 
         game_name = f"{p1['name']} vs {p2['name']}"
 
+        if fd_p1_odds.get('odds') and fd_p2_odds.get('odds'):
+            fd_p1_prob = converter.decimal_to_implied_prob(fd_p1_odds['odds'])
+            fd_p2_prob = converter.decimal_to_implied_prob(fd_p2_odds['odds'])
+            if not snapshot_could_clear([(p1['market'], 'yes', fd_p2_prob), (p2['market'], 'no', fd_p2_prob),
+                                         (p2['market'], 'yes', fd_p1_prob), (p1['market'], 'no', fd_p1_prob)]):
+                continue
+
         # Get orderbooks
         ob1 = kalshi_api.get_orderbook(p1['market']['ticker'])
-        time.sleep(0.3)
+        _sleep(0.3)
         ob2 = kalshi_api.get_orderbook(p2['market']['ticker'])
-        time.sleep(0.3)
+        _sleep(0.3)
         if not ob1 or not ob2:
             continue
 
@@ -3905,73 +5482,38 @@ def find_tennis_edges(kalshi_api, fanduel_api, series_ticker: str, odds_api_keys
         if None in [p1_yes, p1_no, p2_yes, p2_no]:
             continue
 
-        # Build entries: for each player, find cheapest way to bet on them
-        # and compare to FD opposite side
-        entries = []
-        # Bet on player 1: YES on p1 or NO on p2 (whichever is cheaper)
-        if p1_yes <= p2_no:
-            entries.append((p1['name'], p1_yes, f"YES on {p1['name']}", fd_p2_name,
-                           p1['market']['ticker'], 'yes'))
-        else:
-            entries.append((p1['name'], p2_no, f"NO on {p2['name']}", fd_p2_name,
-                           p2['market']['ticker'], 'no'))
-        # Bet on player 2: YES on p2 or NO on p1
-        if p2_yes <= p1_no:
-            entries.append((p2['name'], p2_yes, f"YES on {p2['name']}", fd_p1_name,
-                           p2['market']['ticker'], 'yes'))
-        else:
-            entries.append((p2['name'], p1_no, f"NO on {p1['name']}", fd_p1_name,
-                           p1['market']['ticker'], 'no'))
-
-        match_edges = []
-        for name, best_p, method, fd_opp_name, trade_ticker, trade_side in entries:
-            fee = kalshi_fee(best_p)
-            eff = best_p + fee
+        # For each player, the cheaper of YES on them or NO on their opponent,
+        # priced against FD's odds on the opponent
+        for player, yes_p, other, other_no, fd_opp_name in ((p1, p1_yes, p2, p2_no, fd_p2_name),
+                                                            (p2, p2_yes, p1, p1_no, fd_p1_name)):
             fd_opp_data = all_fd_odds.get(fd_opp_name, {})
             if not fd_opp_data.get('odds'):
                 continue
-            fd_prob = converter.decimal_to_implied_prob(fd_opp_data['odds'])
-            total = eff + fd_prob
-            if total < 1.0:
-                profit = (1.0 / total - 1) * 100
-                if profit < MIN_EDGE_PERCENT:
-                    continue
-                edge = {
-                    'market_type': 'Tennis ML',
-                    'sport': sport_name,
-                    'game': game_name,
-                    'team': name,
-                    'opposite_team': fd_opp_name,
-                    'kalshi_price': best_p,
-                    'kalshi_price_after_fees': eff,
-                    'kalshi_prob_after_fees': eff * 100,
-                    'kalshi_method': method,
-                    'kalshi_ticker': trade_ticker,
-                    'kalshi_side': trade_side,
-                    'fanduel_opposite_team': fd_opp_name,
-                    'fanduel_opposite_odds': fd_opp_data['odds'],
-                    'fanduel_opposite_prob': fd_prob * 100,
-                    'total_implied_prob': total * 100,
-                    'arbitrage_profit': profit,
-                    'is_live': game_live,
-                    'fair_value_mode': fd_opp_data.get('mode', ''),
-                    'per_book_detail': fd_opp_data.get('per_book', {}),
-                    'odds_last_update': fd_opp_data.get('last_update', ''),
-                    'recommendation': f"Buy {method} on Kalshi at ${best_p:.2f} (Fair value: {fd_opp_name} at {fd_opp_data['odds']:.2f})",
-                }
-                if books_diverge(edge['per_book_detail']):
-                    print(f"   Skipping {edge['game']} tennis ML: books diverge >10pp")
-                    continue
-                match_edges.append(edge)
-        # Only trade the best edge per match to avoid betting both sides
-        if match_edges:
-            match_edges.sort(key=lambda e: e['arbitrage_profit'], reverse=True)
-            best_edge = match_edges[0]
-            edges.append(best_edge)
-            send_telegram_notification(best_edge)
-            auto_trade_edge(best_edge, kalshi_api)
+            best_p, side = cheaper_entry(yes_p, other_no)
+            method = f"YES on {player['name']}" if side == 'yes' else f"NO on {other['name']}"
+            candidates.append({
+                'group': event_ticker, 'skip': 'tennis ML',
+                'market_type': 'Tennis ML',
+                'sport': sport_name,
+                'game': game_name,
+                'team': player['name'],
+                'opposite_team': fd_opp_name,
+                'kalshi_price': best_p,
+                'kalshi_method': method,
+                'kalshi_ticker': (player if side == 'yes' else other)['market']['ticker'],
+                'kalshi_side': side,
+                'fanduel_opposite_team': fd_opp_name,
+                'fanduel_opposite_odds': fd_opp_data['odds'],
+                'fd_opp_prob': converter.decimal_to_implied_prob(fd_opp_data['odds']),
+                'is_live': game_live,
+                'fair_value_mode': fd_opp_data.get('mode', ''),
+                'per_book_detail': fd_opp_data.get('per_book', {}),
+                'odds_last_update': fd_opp_data.get('last_update', ''),
+                'recommendation': f"Buy {method} on Kalshi at ${best_p:.2f} (Fair value: {fd_opp_name} at {fd_opp_data['odds']:.2f})",
+            })
 
-    return edges
+    # Only the best edge per match is emitted, to avoid betting both sides
+    return emit_fair_value_edges(candidates, kalshi_api)
 
 
 # ============================================================
@@ -4045,24 +5587,30 @@ ESPN_SPORTS = {
 # Only include series confirmed to exist on Kalshi
 PROP_STAT_MAP = {
     # NBA
-    'KXNBAPTS':   {'sport': 'nba', 'stat_name': 'points',   'group': 'skater', 'display': 'NBA'},
-    'KXNBAREB':   {'sport': 'nba', 'stat_name': 'rebounds',  'group': 'skater', 'display': 'NBA'},
-    'KXNBAAST':   {'sport': 'nba', 'stat_name': 'assists',   'group': 'skater', 'display': 'NBA'},
-    'KXNBA3PT':   {'sport': 'nba', 'stat_name': 'threes',    'group': 'skater', 'display': 'NBA'},
-    # 'KXNBASTL':   {'sport': 'nba', 'stat_name': 'steals',    'group': 'skater', 'display': 'NBA'},  # DISABLED — paused
-    # 'KXNBABLK':   {'sport': 'nba', 'stat_name': 'blocks',    'group': 'skater', 'display': 'NBA'},  # DISABLED — paused
-    'KXNBADD':    {'sport': 'nba', 'stat_name': 'double_double', 'group': 'skater', 'display': 'NBA'},
-    'KXNBATD':    {'sport': 'nba', 'stat_name': 'triple_double', 'group': 'skater', 'display': 'NBA'},
+    # 'near': a player within this many of their next rung makes the game hot for the sniper
+    'KXNBAPTS':   {'sport': 'nba', 'stat_name': 'points',   'group': 'skater', 'display': 'NBA', 'near': 3},
+    'KXNBAREB':   {'sport': 'nba', 'stat_name': 'rebounds',  'group': 'skater', 'display': 'NBA', 'near': 1},
+    'KXNBAAST':   {'sport': 'nba', 'stat_name': 'assists',   'group': 'skater', 'display': 'NBA', 'near': 1},
+    'KXNBA3PT':   {'sport': 'nba', 'stat_name': 'threes',    'group': 'skater', 'display': 'NBA', 'near': 1},
+    # 'KXNBASTL':   {'sport': 'nba', 'stat_name': 'steals',    'group': 'skater', 'display': 'NBA', 'near': 1},  # DISABLED — paused
+    # 'KXNBABLK':   {'sport': 'nba', 'stat_name': 'blocks',    'group': 'skater', 'display': 'NBA', 'near': 1},  # DISABLED — paused
+    'KXNBADD':    {'sport': 'nba', 'stat_name': 'double_double', 'group': 'skater', 'display': 'NBA', 'near': 0},
+    'KXNBATD':    {'sport': 'nba', 'stat_name': 'triple_double', 'group': 'skater', 'display': 'NBA', 'near': 0},
     # NHL
-    'KXNHLPTS':   {'sport': 'nhl', 'stat_name': 'points',  'group': 'skater', 'display': 'NHL'},
-    'KXNHLGOALS': {'sport': 'nhl', 'stat_name': 'goals',   'group': 'skater', 'display': 'NHL'},
-    'KXNHLAST':   {'sport': 'nhl', 'stat_name': 'assists', 'group': 'skater', 'display': 'NHL'},
-    'KXNHLSAVES': {'sport': 'nhl', 'stat_name': 'saves',   'group': 'goalie', 'display': 'NHL'},
+    'KXNHLPTS':   {'sport': 'nhl', 'stat_name': 'points',  'group': 'skater', 'display': 'NHL', 'near': 1},
+    'KXNHLGOALS': {'sport': 'nhl', 'stat_name': 'goals',   'group': 'skater', 'display': 'NHL', 'near': 1},
+    'KXNHLAST':   {'sport': 'nhl', 'stat_name': 'assists', 'group': 'skater', 'display': 'NHL', 'near': 1},
+    'KXNHLSAVES': {'sport': 'nhl', 'stat_name': 'saves',   'group': 'goalie', 'display': 'NHL', 'near': 2},
 }
 
 # Max price to pay for a completed prop — buy anything below $1.00
 # Even at $0.99, profit is ~$0.0093/contract after fees (free money is free money)
 COMPLETED_PROP_MAX_PRICE = 1.00
+COMPLETED_PROP_MAX_COST = 5000.00  # Per-sweep spend cap (balance is the real cap)
+# Sweep IOC limit: the highest YES price still profitable after fees (99c at today's fees)
+SWEEP_LIMIT_CENTS = max(c for c in range(1, 100)
+                        if c / 100 < COMPLETED_PROP_MAX_PRICE and c / 100 + KALSHI_FEE_TABLE[c] < 1.0)
+BALANCE_SYNC_SECONDS = 60          # Re-read balance over REST at most this often between sweeps
 
 
 def _parse_espn_stat(stat_str: str, parse_type: str, stat_config=None) -> int:
@@ -4108,7 +5656,7 @@ def _get_live_games(espn_path: str) -> List[Dict]:
     """Get currently live games from ESPN scoreboard for any sport.
     Includes game_date_str to prevent matching yesterday's finals to today's markets."""
     try:
-        resp = requests.get(
+        resp = _http.get(
             f'https://site.api.espn.com/apis/site/v2/sports/{espn_path}/scoreboard',
             timeout=10
         )
@@ -4145,6 +5693,7 @@ def _get_live_games(espn_path: str) -> List[Dict]:
                     'home': teams.get('home', ''),
                     'away': teams.get('away', ''),
                     'status': status,
+                    'period': event.get('status', {}).get('period', 0) or 0,
                     'game_date_str': game_date_str,
                 })
         return live_games
@@ -4153,276 +5702,722 @@ def _get_live_games(espn_path: str) -> List[Dict]:
         return []
 
 
-def _get_box_score(game_id: str, espn_path: str, sport_config: dict,
-                   home_abbr: str = '', away_abbr: str = '',
-                   game_date_str: str = '') -> Dict[str, Dict]:
-    """Fetch box score for a game. Returns {player_name: {stat_name: value, ..., '_team': 'SA', '_game_teams': ('CHA','SA'), '_game_date': '26JAN31'}}."""
-    try:
-        resp = requests.get(
-            f'https://site.api.espn.com/apis/site/v2/sports/{espn_path}/summary?event={game_id}',
-            timeout=10
-        )
-        resp.raise_for_status()
-        data = resp.json()
+def _fetch_espn_summary(game_id: str, espn_path: str) -> Dict:
+    resp = _http.get(
+        f'https://site.api.espn.com/apis/site/v2/sports/{espn_path}/summary?event={game_id}',
+        timeout=10
+    )
+    resp.raise_for_status()
+    return resp.json()
+
+
+def _get_box_score(game_id: str, espn_path: str, sport_config: dict,
+                   home_abbr: str = '', away_abbr: str = '',
+                   game_date_str: str = '') -> Dict[str, Dict]:
+    """Fetch box score for a game. Returns {player_name: {stat_name: value, ..., '_team': 'SA', '_game_teams': ('CHA','SA'), '_game_date': '26JAN31'}}."""
+    try:
+        data = _fetch_espn_summary(game_id, espn_path)
+        return _parse_box_score(data, espn_path, sport_config, home_abbr, away_abbr, game_date_str)
+    except Exception as e:
+        print(f"   ESPN box score error for game {game_id}: {e}")
+        return {}
+
+
+def _parse_box_score(data: Dict, espn_path: str, sport_config: dict,
+                     home_abbr: str = '', away_abbr: str = '',
+                     game_date_str: str = '') -> Dict[str, Dict]:
+    """Parse an ESPN summary payload into the _get_box_score player dict."""
+    player_stats = {}
+    for team_data in data.get('boxscore', {}).get('players', []):
+        espn_team = team_data.get('team', {}).get('abbreviation', '')
+        team_abbr = ESPN_TO_KALSHI.get(espn_team, espn_team)
+        for stat_group in team_data.get('statistics', []):
+            labels = stat_group.get('labels', [])
+
+            # Determine which stat group this is (skater vs goalie) by checking labels
+            matched_group = None
+            for group_name, group_config in sport_config['stat_groups'].items():
+                detect = group_config['detect_labels']
+                if len(labels) >= len(detect) and all(d in labels for d in detect):
+                    # Make sure it's the right group (not a false match)
+                    # Check first label matches
+                    if labels[0] == detect[0]:
+                        matched_group = (group_name, group_config)
+                        break
+
+            if not matched_group:
+                continue
+
+            group_name, group_config = matched_group
+
+            for athlete in stat_group.get('athletes', []):
+                name = athlete.get('athlete', {}).get('displayName', '')
+                stats = athlete.get('stats', [])
+                if not name or not stats:
+                    continue
+
+                player_data = player_stats.get(name, {})
+                player_data['_team'] = team_abbr  # Track which team this player is on
+                player_data['_game_teams'] = (home_abbr, away_abbr)  # Both teams in this game
+                player_data['_game_date'] = game_date_str  # Track game date for cross-day verification
+                for stat_name, cfg in group_config['stats'].items():
+                    idx = cfg['index']
+                    parse = cfg['parse']
+                    if parse == 'sum':
+                        # Sum multiple indices
+                        val = 0
+                        for i in idx:
+                            if i < len(stats):
+                                try:
+                                    val += int(stats[i])
+                                except (ValueError, IndexError):
+                                    pass
+                        player_data[stat_name] = val
+                    else:
+                        if isinstance(idx, int) and idx < len(stats):
+                            player_data[stat_name] = _parse_espn_stat(stats[idx], parse)
+                player_stats[name] = player_data
+
+    # Compute double-double and triple-double for NBA players
+    if 'basketball' in espn_path:
+        for name, pdata in player_stats.items():
+            cats_with_10 = 0
+            for cat in ('points', 'rebounds', 'assists', 'steals', 'blocks'):
+                if pdata.get(cat, 0) >= 10:
+                    cats_with_10 += 1
+            pdata['double_double'] = 1 if cats_with_10 >= 2 else 0
+            pdata['triple_double'] = 1 if cats_with_10 >= 3 else 0
+
+    return player_stats
+
+
+def _match_prop_player(kalshi_player: str, box_score: Dict[str, Dict]) -> Optional[str]:
+    """Match a Kalshi player name to an ESPN box score name."""
+    kp = kalshi_player.lower().strip()
+    for espn_name in box_score:
+        en = espn_name.lower()
+        if kp == en:
+            return espn_name
+        # Last name match
+        kp_parts = kp.split()
+        en_parts = en.split()
+        if kp_parts and en_parts and kp_parts[-1] == en_parts[-1]:
+            if len(kp_parts) == 1 or len(en_parts) == 1:
+                return espn_name
+            if kp_parts[0] == en_parts[0]:
+                return espn_name
+            if len(kp_parts[0]) >= 3 and len(en_parts[0]) >= 3 and kp_parts[0][:3] == en_parts[0][:3]:
+                return espn_name
+        # Substring
+        if kp in en or en in kp:
+            return espn_name
+    return None
+
+
+# ============================================================
+# BOX SCORE DELTA STREAM
+# ============================================================
+# Keeps the last parsed box score per ESPN game and diffs each new payload against
+# it, so the sniper reacts to stat changes instead of re-reading every stat. Events
+# (and the sniper's actions on them) are appended to BOX_EVENTS_FILE as JSONL so we
+# can measure detection-to-order latency after the fact.
+
+BOX_EVENTS_FILE = os.path.join(ENGINE_STATE_DIR, 'box_score_events.jsonl')  # None disables persistence
+BOX_EVENTS_MAX_BYTES = 50 * 1024 * 1024  # Rotate to .1 past this size
+_box_events_lock = threading.Lock()
+
+
+def _espn_game_clock(data: Dict) -> Dict:
+    """{'period': 4, 'clock': '2:31', 'status': 'STATUS_IN_PROGRESS'} from an ESPN summary."""
+    try:
+        status = data.get('header', {}).get('competitions', [{}])[0].get('status', {})
+    except (IndexError, AttributeError):
+        status = {}
+    return {
+        'period': status.get('period'),
+        'clock': status.get('displayClock', ''),
+        'status': status.get('type', {}).get('name', ''),
+    }
+
+
+def append_box_events(records: List[Dict]):
+    """Append event/action records to BOX_EVENTS_FILE, one JSON object per line."""
+    if not records or not BOX_EVENTS_FILE:
+        return
+    try:
+        with _box_events_lock:
+            try:
+                if os.path.getsize(BOX_EVENTS_FILE) > BOX_EVENTS_MAX_BYTES:
+                    os.replace(BOX_EVENTS_FILE, BOX_EVENTS_FILE + '.1')
+            except OSError:
+                pass
+            with open(BOX_EVENTS_FILE, 'a') as f:
+                for rec in records:
+                    f.write(json.dumps(rec, separators=(',', ':')) + '\n')
+    except Exception as e:
+        print(f"   Box event log error: {e}")
+
+
+class BoxScoreStore:
+    """Last box score per ESPN game; update() returns the stat change events since the previous poll.
+
+    Event: {'type': 'stat', 'ts', 'sport', 'game_id', 'game_date', 'player', 'team',
+            'stat', 'old', 'new', 'period', 'clock'}. old is None the first time a
+    player/stat is seen (engine start or player enters the box score)."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._games = {}  # game_id -> {'date': game_date_str, 'players': {name: {stat: value}}}
+
+    def reset(self):
+        with self._lock:
+            self._games.clear()
+
+    def update(self, sport_key: str, game: Dict, espn_path: str, sport_config: dict) -> Tuple[Dict[str, Dict], List[Dict], Dict]:
+        """Poll one live game. Returns (box score, events, game clock); ({}, [], {}) on a fetch
+        or parse error, leaving the game's previous box score in place."""
+        game_id = game['game_id']
+        game_date_str = game.get('game_date_str', '')
+        try:
+            data = _fetch_espn_summary(game_id, espn_path)
+            box = _parse_box_score(data, espn_path, sport_config, game['home'], game['away'], game_date_str)
+            clock = _espn_game_clock(data)
+        except Exception as e:
+            print(f"   ESPN box score error for game {game_id}: {e}")
+            return {}, [], {}
+        now = time.time()
+
+        events = []
+        with self._lock:
+            prev = self._games.get(game_id)
+            if prev is None or prev['date'] != game_date_str:
+                prev = {'date': game_date_str, 'players': {}}
+            prev_players = prev['players']
+            for name, pdata in box.items():
+                before = prev_players.get(name, {})
+                for stat, value in pdata.items():
+                    if stat.startswith('_'):
+                        continue
+                    old = before.get(stat)
+                    if old == value or (old is None and not value):
+                        continue
+                    events.append({
+                        'type': 'stat', 'ts': now, 'sport': sport_key, 'game_id': game_id,
+                        'game_date': game_date_str, 'player': name, 'team': pdata.get('_team', ''),
+                        'stat': stat, 'old': old, 'new': value,
+                        'period': clock['period'], 'clock': clock['clock'],
+                    })
+            self._games[game_id] = {
+                'date': game_date_str,
+                'players': {name: {k: v for k, v in pdata.items() if not k.startswith('_')}
+                            for name, pdata in box.items()},
+            }
+
+        if events:
+            metric_inc('box_score_events_total', {'sport': sport_key}, len(events))
+            append_box_events(events)
+        return box, events, clock
+
+
+_box_score_store = BoxScoreStore()
+
+
+# ============================================================
+# THRESHOLD INDEX (completed props sniper / NHL tied totals)
+# ============================================================
+# Kalshi lists each player prop as a ladder of thresholds ("8+", "10+", "12+" ...) and
+# each NHL total as a ladder of Over strikes. Both are parsed once into sorted ladders,
+# so a stat or score change is bisected against the ladder instead of re-walking,
+# re-regexing and re-matching every market in every series each sniper cycle.
+
+THRESHOLD_INDEX_TTL = 300  # Re-list markets every 5 min to pick up newly listed ladders
+
+
+def _split_game_code(game_part: str) -> Tuple[str, str]:
+    """'26JAN31SACHA' -> ('26JAN31', 'SACHA')."""
+    rec = parse_ticker(f"X-{game_part}")
+    return rec.date, rec.teams
+
+
+class ThresholdLadder:
+    """Sorted (threshold, ticker) pairs for one player/stat or one game's Over strikes."""
+    __slots__ = ('thresholds', 'tickers')
+
+    def __init__(self):
+        self.thresholds = []
+        self.tickers = []
+
+    def add(self, threshold: float, ticker: str):
+        i = bisect.bisect_right(self.thresholds, threshold)
+        self.thresholds.insert(i, threshold)
+        self.tickers.insert(i, ticker)
+
+    def met(self, value: float) -> List[Tuple[float, str]]:
+        """Every (threshold, ticker) already guaranteed at value."""
+        i = bisect.bisect_right(self.thresholds, value)
+        return list(zip(self.thresholds[:i], self.tickers[:i]))
+
+    def crossed(self, old: float, new: float) -> List[Tuple[float, str]]:
+        """The (threshold, ticker) pairs that became guaranteed as value moved old -> new."""
+        lo = bisect.bisect_right(self.thresholds, old)
+        hi = bisect.bisect_right(self.thresholds, new)
+        return list(zip(self.thresholds[lo:hi], self.tickers[lo:hi]))
+
+    def gap(self, value: float) -> Optional[float]:
+        """Distance from value to the next rung not yet met (None if all are met)."""
+        i = bisect.bisect_right(self.thresholds, value)
+        return self.thresholds[i] - value if i < len(self.thresholds) else None
+
+    def exact(self, value: float, tol: float = 0.01) -> List[Tuple[float, str]]:
+        lo = bisect.bisect_left(self.thresholds, value - tol)
+        hi = bisect.bisect_right(self.thresholds, value + tol)
+        return list(zip(self.thresholds[lo:hi], self.tickers[lo:hi]))
+
+
+class _GameIndex(abc.ABC):
+    """Ladders grouped by Kalshi game code, rebuilt on TTL expiry or ET date rollover."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.built_at = 0.0
+        self.date_strs = set()
+        self.games = {}  # {group: {game_code: {key: ThresholdLadder}}}
+        self.prefixes = {}  # {group: Kalshi sport prefix}, for slate registry lookups
+
+    @abc.abstractmethod
+    def _build(self, kalshi_api, date_strs: set) -> Dict:
+        """List the markets and return the new {group: {game_code: {key: ThresholdLadder}}}."""
+
+    def refresh(self, kalshi_api, force: bool = False):
+        date_strs = _get_today_date_strs()
+        with self._lock:
+            if not force and date_strs == self.date_strs and time.time() - self.built_at < THRESHOLD_INDEX_TTL:
+                return
+            if date_strs != self.date_strs:
+                self._on_new_day()
+            self._install(self._build(kalshi_api, date_strs))
+            self.date_strs = date_strs
+            self.built_at = time.time()
+
+    def _install(self, games: Dict):
+        self.games = games
+
+    def _on_new_day(self):
+        pass
+
+    def game_codes(self, group: str, espn_game: Dict) -> List[str]:
+        """Kalshi game codes for an ESPN game: both teams in the code, same ET date."""
+        return _slate.espn_game_parts(self.prefixes.get(group, group), espn_game, self.games.get(group, {}))
+
+
+class PropThresholdIndex(_GameIndex):
+    """{sport: {game_code: {(kalshi player, stat_name): ThresholdLadder}}} over PROP_STAT_MAP.
+
+    Also tracks which ladders resolve to which ESPN player, and the armed rungs:
+    markets whose threshold a stat event crossed, re-priced until the game drops
+    off the scoreboard so we keep buying while liquidity below $1 remains."""
+
+    def __init__(self):
+        super().__init__()
+        self._state_lock = threading.RLock()
+        self._by_espn = {}     # game_code -> {'by_name': {(espn name, stat): [(player, ladder)]}, 'pending': {...}}
+        self.armed = {}        # ticker -> rung dict (see arm())
+
+    def _on_new_day(self):
+        self.reset_state()
+
+    def reset_state(self):
+        with self._state_lock:
+            self._by_espn.clear()
+            self.armed.clear()
+
+    def _build(self, kalshi_api, date_strs: set) -> Dict:
+        games = {}
+        n_markets = n_ladders = 0
+        for series_ticker, stat_info in PROP_STAT_MAP.items():
+            for m in kalshi_api.get_markets(series_ticker):
+                ticker = m.get('ticker', '')
+                if not any(ds in ticker for ds in date_strs):
+                    continue
+                # Ticker: KXNBAREB-26JAN31SACHA-CHASSCASTLE25-4, title: "LaMelo Ball: 8+ assists"
+                game_part = parse_ticker(ticker).game_part
+                if not game_part:
+                    continue
+                prop_match = re.match(r'^(.+?):\s*(\d+)\+', m.get('title', ''))
+                if not prop_match:
+                    continue
+                self.prefixes[stat_info['sport']] = parse_ticker(ticker).sport_prefix
+                ladders = games.setdefault(stat_info['sport'], {}).setdefault(game_part, {})
+                key = (prop_match.group(1).strip(), stat_info['stat_name'])
+                if key not in ladders:
+                    ladders[key] = ThresholdLadder()
+                    n_ladders += 1
+                ladders[key].add(int(prop_match.group(2)), ticker)
+                n_markets += 1
+        print(f"   Prop threshold index: {n_markets} markets in {n_ladders} ladders")
+        return games
+
+    def _install(self, games: Dict):
+        # Swap together so ladders_by_player can't re-cache the old ladder objects
+        with self._state_lock:
+            self.games = games
+            self._by_espn.clear()  # New ladder objects; re-resolve (names stay in the player registry)
+
+    def resolve_player(self, sport_key: str, game_code: str, kalshi_player: str,
+                       box_score: Dict[str, Dict]) -> Optional[str]:
+        prefix = self.prefixes.get(sport_key, sport_key)
+        return _players.resolve(prefix, _slate.game_part_teams(prefix, game_code), 'kalshi', kalshi_player,
+                                'espn', box_score, _match_prop_player)
+
+    def ladders_by_player(self, sport_key: str, game_code: str, box_score: Dict[str, Dict]) -> Tuple[Dict, List]:
+        """({(espn name, stat): [(kalshi player, ladder)]}, newly resolved [(espn name, stat, player, ladder)]).
+        Newly resolved ladders (index rebuilt, player just entered the box score) have
+        no event to react to, so the caller arms whatever they already meet."""
+        with self._state_lock:
+            entry = self._by_espn.get(game_code)
+            if entry is None:
+                entry = self._by_espn[game_code] = {
+                    'by_name': {}, 'pending': dict(self.games.get(sport_key, {}).get(game_code, {}))}
+            fresh = []
+            for key, ladder in list(entry['pending'].items()):
+                player_name, stat_name = key
+                espn_name = self.resolve_player(sport_key, game_code, player_name, box_score)
+                if not espn_name:
+                    continue
+                del entry['pending'][key]
+                entry['by_name'].setdefault((espn_name, stat_name), []).append((player_name, ladder))
+                fresh.append((espn_name, stat_name, player_name, ladder))
+            return entry['by_name'], fresh
+
+    def arm(self, ticker: str, rung: Dict) -> bool:
+        """Start pricing a guaranteed rung. No-op if it's already armed."""
+        with self._state_lock:
+            if ticker in self.armed:
+                return False
+            self.armed[ticker] = dict(rung, next_check=0.0, acted=False)
+            return True
+
+    def disarm(self, ticker: str):
+        with self._state_lock:
+            self.armed.pop(ticker, None)
+
+    def due(self, game_id: str, now: float) -> List[Tuple[str, Dict]]:
+        """Claim the armed rungs of game_id whose next re-price is due (new rungs are due
+        immediately). Claimed rungs aren't due again for ARMED_REPRICE_INTERVAL, so two
+        callers can never price, and order, the same rung at once."""
+        with self._state_lock:
+            claimed = [(t, r) for t, r in self.armed.items() if r['game_id'] == game_id and r['next_check'] <= now]
+            for _, rung in claimed:
+                rung['next_check'] = now + ARMED_REPRICE_INTERVAL
+            return claimed
+
+
+class NhlTotalIndex(_GameIndex):
+    """{'nhl': {game_code: {'over': ThresholdLadder}}} over active KXNHLTOTAL strikes."""
+
+    def _build(self, kalshi_api, date_strs: set) -> Dict:
+        games = {}
+        n_markets = 0
+        for mkt in kalshi_api.get_markets('KXNHLTOTAL'):
+            if mkt.get('status', '') != 'active':
+                continue
+            # Ticker format: KXNHLTOTAL-26FEB03DETBOS-5 (Over 5.5)
+            ticker = mkt.get('ticker', '')
+            rec = parse_ticker(ticker)
+            if not rec.suffix:
+                continue
+            # Line from floor_strike (preferred), else ticker "5" -> Over 5.5
+            floor_strike = mkt.get('floor_strike')
+            if floor_strike is not None:
+                line = float(floor_strike)
+            elif rec.strike is not None and not rec.outcome:
+                line = rec.strike + 0.5
+            else:
+                continue
+            self.prefixes['nhl'] = rec.sport_prefix
+            ladders = games.setdefault('nhl', {}).setdefault(rec.game_part, {})
+            ladders.setdefault('over', ThresholdLadder()).add(line, ticker)
+            n_markets += 1
+        print(f"   NHL total index: {n_markets} strikes in {len(games.get('nhl', {}))} games")
+        return games
+
+
+_prop_threshold_index = PropThresholdIndex()
+_nhl_total_index = NhlTotalIndex()
+ARMED_REPRICE_INTERVAL = 60  # Re-sweep an already-guaranteed rung at most once a minute
 
-        player_stats = {}
-        for team_data in data.get('boxscore', {}).get('players', []):
-            espn_team = team_data.get('team', {}).get('abbreviation', '')
-            team_abbr = ESPN_TO_KALSHI.get(espn_team, espn_team)
-            for stat_group in team_data.get('statistics', []):
-                labels = stat_group.get('labels', [])
-
-                # Determine which stat group this is (skater vs goalie) by checking labels
-                matched_group = None
-                for group_name, group_config in sport_config['stat_groups'].items():
-                    detect = group_config['detect_labels']
-                    if len(labels) >= len(detect) and all(d in labels for d in detect):
-                        # Make sure it's the right group (not a false match)
-                        # Check first label matches
-                        if labels[0] == detect[0]:
-                            matched_group = (group_name, group_config)
-                            break
 
-                if not matched_group:
-                    continue
+def reset_completed_props_state():
+    """Forget box scores and armed rungs; the next poll re-derives everything from scratch."""
+    _box_score_store.reset()
+    _prop_threshold_index.reset_state()
 
-                group_name, group_config = matched_group
 
-                for athlete in stat_group.get('athletes', []):
-                    name = athlete.get('athlete', {}).get('displayName', '')
-                    stats = athlete.get('stats', [])
-                    if not name or not stats:
-                        continue
+def _completed_prop_edge(kalshi_api, ticker: str, player_name: str, stat_name: str, target: int,
+                         current_stat: int, display_sport: str) -> Optional[Tuple[Dict, OrderBook]]:
+    """Price a prop whose target is already met. Returns (edge, book) if YES is buyable below $1."""
+    ob = kalshi_api.get_orderbook(ticker)
+    if not ob:
+        return None
+    _sleep(0.2)
 
-                    player_data = player_stats.get(name, {})
-                    player_data['_team'] = team_abbr  # Track which team this player is on
-                    player_data['_game_teams'] = (home_abbr, away_abbr)  # Both teams in this game
-                    player_data['_game_date'] = game_date_str  # Track game date for cross-day verification
-                    for stat_name, cfg in group_config['stats'].items():
-                        idx = cfg['index']
-                        parse = cfg['parse']
-                        if parse == 'sum':
-                            # Sum multiple indices
-                            val = 0
-                            for i in idx:
-                                if i < len(stats):
-                                    try:
-                                        val += int(stats[i])
-                                    except (ValueError, IndexError):
-                                        pass
-                            player_data[stat_name] = val
-                        else:
-                            if isinstance(idx, int) and idx < len(stats):
-                                player_data[stat_name] = _parse_espn_stat(stats[idx], parse)
-                    player_stats[name] = player_data
-
-        # Compute double-double and triple-double for NBA players
-        if 'basketball' in espn_path:
-            for name, pdata in player_stats.items():
-                cats_with_10 = 0
-                for cat in ('points', 'rebounds', 'assists', 'steals', 'blocks'):
-                    if pdata.get(cat, 0) >= 10:
-                        cats_with_10 += 1
-                pdata['double_double'] = 1 if cats_with_10 >= 2 else 0
-                pdata['triple_double'] = 1 if cats_with_10 >= 3 else 0
-
-        return player_stats
-    except Exception as e:
-        print(f"   ESPN box score error for game {game_id}: {e}")
-        return {}
+    yes_price = get_best_yes_price(ob)
+    if yes_price is None or yes_price >= COMPLETED_PROP_MAX_PRICE:
+        return None
 
+    # Calculate profit
+    fee = kalshi_fee(yes_price)
+    profit_per = 1.0 - yes_price - fee
+    if profit_per <= 0:
+        return None
+
+    return {
+        'market_type': 'Completed Prop',
+        'sport': display_sport,
+        'game': f"{player_name} - {stat_name}",
+        'team': player_name,
+        'opposite_team': '',
+        'kalshi_price': yes_price,
+        'kalshi_price_after_fees': yes_price + fee,
+        'kalshi_prob_after_fees': (yes_price + fee) * 100,
+        'kalshi_method': f"YES on {player_name} {target}+ {stat_name}",
+        'kalshi_ticker': ticker,
+        'kalshi_side': 'yes',
+        'fanduel_opposite_team': f"Already at {current_stat} {stat_name} (target: {target}+)",
+        'fanduel_opposite_odds': 0,
+        'fanduel_opposite_prob': 0,
+        'total_implied_prob': (yes_price + fee) * 100,
+        'arbitrage_profit': profit_per / (yes_price + fee) * 100,
+        'is_live': True,
+        'is_completed_prop': True,
+        'recommendation': f"BUY {player_name} {target}+ {stat_name} at ${yes_price:.2f} — ALREADY AT {current_stat} (guaranteed)",
+    }, ob  # book goes to auto_trade_completed_prop for max sizing, not into the (serialized) edge
+
+
+# ============================================================
+# SNIPER POLL SCHEDULER
+# ============================================================
+# The sniper polls each scoreboard and box score on its own clock. A game where a
+# tracked player sits just under a rung (or an NHL game is tied late) is polled every
+# second or two, a quiet game every 10s, and a sport with nothing live backs off to
+# minutes.
+
+SNIPER_POLL_INTERVALS = {
+    'critical': 1,   # within reach of a rung late in the game / NHL tied late
+    'hot': 2,        # within reach of a rung / NHL tied or one-goal game
+    'live': 10,      # in progress, nothing close
+    'break': 30,     # halftime / between periods
+    'final': 60,     # final — stragglers still sometimes sell below $1
+    'idle': 300,     # nothing live (e.g. 6am ET)
+}
+SNIPER_LATE_PERIOD = {'nba': 4, 'ncaab': 2, 'nhl': 3}
+SNIPER_BREAK_STATUSES = ('STATUS_HALFTIME', 'STATUS_END_PERIOD')
+SNIPER_FINAL_STATUSES = ('STATUS_FINAL', 'STATUS_FULL_TIME')
 
-def _match_prop_player(kalshi_player: str, box_score: Dict[str, Dict]) -> Optional[str]:
-    """Match a Kalshi player name to an ESPN box score name."""
-    kp = kalshi_player.lower().strip()
-    for espn_name in box_score:
-        en = espn_name.lower()
-        if kp == en:
-            return espn_name
-        # Last name match
-        kp_parts = kp.split()
-        en_parts = en.split()
-        if kp_parts and en_parts and kp_parts[-1] == en_parts[-1]:
-            if len(kp_parts) == 1 or len(en_parts) == 1:
-                return espn_name
-            if kp_parts[0] == en_parts[0]:
-                return espn_name
-            if len(kp_parts[0]) >= 3 and len(en_parts[0]) >= 3 and kp_parts[0][:3] == en_parts[0][:3]:
-                return espn_name
-        # Substring
-        if kp in en or en in kp:
-            return espn_name
-    return None
 
+def _hotter(a: str, b: str) -> str:
+    return a if SNIPER_POLL_INTERVALS[a] <= SNIPER_POLL_INTERVALS[b] else b
 
-def find_completed_props(kalshi_api) -> List[Dict]:
+
+def _prop_game_level(sport_key: str, status: str, period: int, near: bool) -> str:
+    """Poll level for a live game's box score."""
+    if status in SNIPER_FINAL_STATUSES:
+        return 'final'
+    if status in SNIPER_BREAK_STATUSES:
+        return 'break'
+    if not near:
+        return 'live'
+    return 'critical' if (period or 0) >= SNIPER_LATE_PERIOD.get(sport_key, 99) else 'hot'
+
+
+class SniperScheduler:
+    """Next-poll time per key: 'scoreboard:<sport>', 'box:<espn game id>', 'nhl_tied'."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._next = {}
+        self.levels = {}
+        self.live_games = {}  # sport -> live games from its last scoreboard poll
+
+    def due(self, key: str) -> bool:
+        with self._lock:
+            return self._next.get(key, 0.0) <= time.time()
+
+    def schedule(self, key: str, level: str):
+        with self._lock:
+            self._next[key] = time.time() + SNIPER_POLL_INTERVALS[level]
+            self.levels[key] = level
+
+    def set_live_games(self, sport_key: str, live_games: List[Dict]):
+        """Cache a fresh scoreboard and stop polling games that dropped off it."""
+        with self._lock:
+            gone = ({g['game_id'] for g in self.live_games.get(sport_key, [])}
+                    - {g['game_id'] for g in live_games})
+            self.live_games[sport_key] = live_games
+            for game_id in gone:
+                self._next.pop(f"box:{game_id}", None)
+                self.levels.pop(f"box:{game_id}", None)
+
+    def seconds_until_next(self) -> float:
+        with self._lock:
+            if not self._next:
+                return SNIPER_POLL_INTERVALS['idle']
+            return max(0.0, min(self._next.values()) - time.time())
+
+    def summary(self) -> str:
+        with self._lock:
+            levels = [level for key, level in self.levels.items() if key.startswith('box:')]
+        counts = sorted({level: levels.count(level) for level in levels}.items(),
+                        key=lambda kv: SNIPER_POLL_INTERVALS[kv[0]])
+        return ', '.join(f"{n} {level}" for level, n in counts) or 'no live prop games'
+
+
+_sniper_schedule = SniperScheduler()
+
+
+@profiled()
+def find_completed_props(kalshi_api, scheduled: bool = False) -> List[Dict]:
     """Find player prop markets where the target has already been met during live games.
     These are essentially guaranteed wins — buy YES at any price below $1.
-    Supports NBA, NCAAB, NHL, and any sport with ESPN box score data."""
+    Supports NBA, NCAAB, NHL, and any sport with ESPN box score data.
+
+    Driven by box score deltas: a stat change event bisects the player's ladder and
+    arms the rungs it crossed; armed rungs are priced immediately, then re-priced
+    every ARMED_REPRICE_INTERVAL while the game is on the scoreboard.
+
+    scheduled=True (the sniper thread) only polls scoreboards and box scores that
+    _sniper_schedule says are due, then reschedules them from game state."""
     edges = []
+    index = _prop_threshold_index
+    sched = _sniper_schedule if scheduled else None
 
     # Group prop series by ESPN sport so we fetch each sport's scoreboard once
-    sports_to_scan = {}  # sport_key -> list of (series_ticker, stat_info)
-    for series_ticker, stat_info in PROP_STAT_MAP.items():
-        sport_key = stat_info['sport']
-        if sport_key not in sports_to_scan:
-            sports_to_scan[sport_key] = []
-        sports_to_scan[sport_key].append((series_ticker, stat_info))
-
-    date_strs = _get_today_date_strs()
+    display_by_sport = {}
+    near_by_stat = {}  # (sport, stat_name) -> distance that makes a game hot
+    for stat_info in PROP_STAT_MAP.values():
+        display_by_sport.setdefault(stat_info['sport'], stat_info['display'])
+        near_by_stat[(stat_info['sport'], stat_info['stat_name'])] = stat_info.get('near', 1)
 
-    for sport_key, prop_series_list in sports_to_scan.items():
+    for sport_key, display_sport in display_by_sport.items():
         sport_config = ESPN_SPORTS.get(sport_key)
         if not sport_config:
             continue
-
+        scoreboard_key = f"scoreboard:{sport_key}"
         espn_path = sport_config['espn_path']
 
-        # Step 1: Get live games for this sport
-        live_games = _get_live_games(espn_path)
+        # Step 1: Get live games for this sport (scheduled: reuse the last scoreboard until due)
+        if sched and not sched.due(scoreboard_key):
+            live_games = sched.live_games.get(sport_key, [])
+        else:
+            live_games = _get_live_games(espn_path)
+            if sched:
+                sched.set_live_games(sport_key, live_games)
+                sched.schedule(scoreboard_key, 'live' if live_games else 'idle')
+            if live_games:
+                print(f"   Live {display_sport} games: {len(live_games)} ({', '.join(g['away']+'@'+g['home'] for g in live_games)})")
         if not live_games:
             continue
 
-        live_game_abbrevs = set()
-        for g in live_games:
-            live_game_abbrevs.add(g['home'])
-            live_game_abbrevs.add(g['away'])
-        display_sport = prop_series_list[0][1]['display']
-        print(f"   Live {display_sport} games: {len(live_games)} ({', '.join(g['away']+'@'+g['home'] for g in live_games)})")
-
-        # Step 2: Fetch box scores for all live games
-        all_player_stats = {}
-        for game in live_games:
-            box = _get_box_score(game['game_id'], espn_path, sport_config,
-                                home_abbr=game['home'], away_abbr=game['away'],
-                                game_date_str=game.get('game_date_str', ''))
-            all_player_stats.update(box)
-            time.sleep(0.3)
-
-        if not all_player_stats:
+        # Ladders are only listed once something is live (TTL-gated after that)
+        index.refresh(kalshi_api)
+        if not index.games.get(sport_key):
             continue
 
-        print(f"   {display_sport} box scores loaded: {len(all_player_stats)} players")
-
-        # Step 3: For each prop type in this sport, find Kalshi markets where target is already met
-        for series_ticker, stat_info in prop_series_list:
-            stat_name = stat_info['stat_name']
-            kalshi_markets = kalshi_api.get_markets(series_ticker)
-            today_markets = [m for m in kalshi_markets
-                             if any(ds in m.get('ticker', '') for ds in date_strs)]
-
-            for m in today_markets:
-                ticker = m.get('ticker', '')
-                title = m.get('title', '')
-
-                # Extract game teams from ticker for cross-checking
-                # Ticker: KXNBAREB-26JAN31SACHA-CHASSCASTLE25-4
-                # game_part: 26JAN31SACHA -> date_stripped: SACHA
-                ticker_parts = ticker.split('-')
-                if len(ticker_parts) < 2:
-                    continue
-                game_part = ticker_parts[1]
-                date_stripped = re.sub(r'^\d{2}[A-Z]{3}\d{2}', '', game_part)
-
-                # Verify at least one live game team is in this ticker's game
-                game_is_live = any(abbr in date_stripped for abbr in live_game_abbrevs if len(abbr) >= 2)
-                if not game_is_live:
-                    continue
-
-                # Parse player name and target from title: "LaMelo Ball: 8+ assists"
-                prop_match = re.match(r'^(.+?):\s*(\d+)\+', title)
-                if not prop_match:
-                    continue
-
-                player_name = prop_match.group(1).strip()
-                target = int(prop_match.group(2))
-
-                # Match to box score
-                espn_name = _match_prop_player(player_name, all_player_stats)
-                if not espn_name:
-                    continue
-
-                # CRITICAL: Verify the game date matches the ticker date
-                # This prevents matching yesterday's FINAL stats to today's markets
-                # (e.g., Bam Adebayo 21pts from Jan 31 MIA@CHI matching Feb 1 MIA@CHI ticker)
-                ticker_date_match = re.match(r'^(\d{2}[A-Z]{3}\d{2})', game_part)
-                ticker_date_str = ticker_date_match.group(1) if ticker_date_match else ''
-                if not ticker_date_str:
-                    continue  # Require valid date to prevent stale matching
-                player_game_date = all_player_stats[espn_name].get('_game_date', '')
-                if player_game_date and ticker_date_str != player_game_date:
-                    _skip_key = f"{player_name}:{player_game_date}:{ticker_date_str}"
-                    if not hasattr(find_completed_props, '_logged'):
-                        find_completed_props._logged = set()
-                    if _skip_key not in find_completed_props._logged:
-                        find_completed_props._logged.add(_skip_key)
-                        print(f"   Skipping {player_name}: game date {player_game_date} != ticker date {ticker_date_str}")
-                    continue
+        for game in live_games:
+            # Step 2: Only poll box scores for games that have prop ladders listed.
+            # Matching on both teams + ET date prevents yesterday's FINAL stats (or a
+            # different game between the same teams) landing on today's markets.
+            game_codes = index.game_codes(sport_key, game)
+            if not game_codes:
+                continue
+            box_key = f"box:{game['game_id']}"
+            if sched and not sched.due(box_key):
+                continue
+            box, events, clock = _box_score_store.update(sport_key, game, espn_path, sport_config)
+            if not sched:
+                _sleep(0.3)
+            if not box:
+                if sched:
+                    sched.schedule(box_key, 'live')
+                continue
 
-                # Verify the player's game teams BOTH appear in this ticker
-                # This prevents matching a player's stats from one game against a
-                # different game's Kalshi market (e.g., Jan 31 SA@CHA stats vs Feb 1 SA@NYK market)
-                player_game_teams = all_player_stats[espn_name].get('_game_teams', ('', ''))
-                home_t, away_t = player_game_teams
-                if home_t and away_t:
-                    # Both teams from the ESPN game must appear in the ticker's game code
-                    if home_t not in date_stripped or away_t not in date_stripped:
-                        print(f"   Skipping {player_name}: game teams {away_t}@{home_t} don't match ticker {date_stripped}")
+            # Step 3: Each stat change bisects the player's ladder; crossed rungs get armed
+            changed = {(ev['player'], ev['stat']): ev for ev in events}
+            near = False
+            for game_code in game_codes:
+                by_name, fresh = index.ladders_by_player(sport_key, game_code, box)
+                to_check = [(espn_name, stat_name, player_name, ladder, -1)
+                            for espn_name, stat_name, player_name, ladder in fresh]
+                for (espn_name, stat_name), ev in changed.items():
+                    old = ev['old'] if ev['old'] is not None else -1
+                    for player_name, ladder in by_name.get((espn_name, stat_name), ()):
+                        to_check.append((espn_name, stat_name, player_name, ladder, old))
+
+                for espn_name, stat_name, player_name, ladder, old in to_check:
+                    current_stat = box[espn_name].get(stat_name, 0)
+                    crossed = ladder.crossed(old, current_stat)
+                    if not crossed:
                         continue
+                    ev = changed.get((espn_name, stat_name), {})
+                    armed = [int(target) for target, ticker in crossed if index.arm(ticker, {
+                        'game_id': game['game_id'], 'player': player_name, 'espn_name': espn_name,
+                        'stat_name': stat_name, 'target': int(target), 'display': display_sport,
+                        'detected_at': ev.get('ts', time.time()),
+                        'period': ev.get('period'), 'clock': ev.get('clock', ''),
+                    })]
+                    if armed:
+                        metric_inc('thresholds_crossed_total', {'kind': 'prop'}, len(armed))
+                        print(f"   {player_name} {stat_name} -> {current_stat}: crossed {', '.join(f'{t}+' for t in armed)}")
+
+                # Hot if any tracked player is within reach of their next rung
+                if sched and not near:
+                    for (espn_name, stat_name), entries in by_name.items():
+                        reach = near_by_stat.get((sport_key, stat_name), 1)
+                        value = box[espn_name].get(stat_name, 0)
+                        if reach > 0 and any((ladder.gap(value) or reach + 1) <= reach for _, ladder in entries):
+                            near = True
+                            break
 
-                current_stat = all_player_stats[espn_name].get(stat_name, 0)
+            if sched:
+                sched.schedule(box_key, _prop_game_level(sport_key, clock.get('status') or game['status'],
+                                                         clock.get('period') or game.get('period', 0), near))
 
-                # Check if target is already met
+            # Step 4: Price this game's armed rungs that are due
+            now = time.time()
+            for ticker, rung in index.due(game['game_id'], now):
+                player_name, stat_name, target = rung['player'], rung['stat_name'], rung['target']
+                current_stat = box.get(rung['espn_name'], {}).get(stat_name, 0)
                 if current_stat < target:
+                    # ESPN stat correction took the player back under — no longer guaranteed
+                    print(f"   Disarming {ticker}: {player_name} back to {current_stat} {stat_name}")
+                    index.disarm(ticker)
                     continue
-
-                # Target met! Get full orderbook to buy everything available
-                ob = kalshi_api.get_orderbook(ticker)
-                if not ob:
-                    continue
-                time.sleep(0.2)
-
-                yes_price = get_best_yes_price(ob)
-                if yes_price is None or yes_price >= COMPLETED_PROP_MAX_PRICE:
-                    continue
-
-                # Calculate profit
-                fee = kalshi_fee(yes_price)
-                profit_per = 1.0 - yes_price - fee
-                if profit_per <= 0:
+                priced = _completed_prop_edge(kalshi_api, ticker, player_name, stat_name, target,
+                                              current_stat, display_sport)
+                if not priced:
                     continue
-
-                edge = {
-                    'market_type': 'Completed Prop',
-                    'sport': display_sport,
-                    'game': f"{player_name} - {stat_name}",
-                    'team': player_name,
-                    'opposite_team': '',
-                    'kalshi_price': yes_price,
-                    'kalshi_price_after_fees': yes_price + fee,
-                    'kalshi_prob_after_fees': (yes_price + fee) * 100,
-                    'kalshi_method': f"YES on {player_name} {target}+ {stat_name}",
-                    'kalshi_ticker': ticker,
-                    'kalshi_side': 'yes',
-                    'fanduel_opposite_team': f"Already at {current_stat} {stat_name} (target: {target}+)",
-                    'fanduel_opposite_odds': 0,
-                    'fanduel_opposite_prob': 0,
-                    'total_implied_prob': (yes_price + fee) * 100,
-                    'arbitrage_profit': profit_per / (yes_price + fee) * 100,
-                    'is_live': True,
-                    'is_completed_prop': True,
-                    'orderbook': ob,  # Pass full orderbook for max sizing
-                    'recommendation': f"BUY {player_name} {target}+ {stat_name} at ${yes_price:.2f} — ALREADY AT {current_stat} (guaranteed)",
-                }
+                edge, book = priced
                 edges.append(edge)
-                print(f"   COMPLETED PROP: {player_name} has {current_stat} {stat_name} (target {target}+) — ask ${yes_price:.2f}")
+                print(f"   COMPLETED PROP: {player_name} has {current_stat} {stat_name} (target {target}+) — ask ${edge['kalshi_price']:.2f}")
                 send_telegram_notification(edge)
-                auto_trade_completed_prop(edge, kalshi_api)
+                order = auto_trade_completed_prop(edge, kalshi_api, book)
+                if not rung['acted']:
+                    rung['acted'] = True
+                    latency = time.time() - rung['detected_at']
+                    metric_observe('threshold_to_action_seconds', latency)
+                    append_box_events([{
+                        'type': 'action', 'ts': time.time(), 'ticker': ticker, 'player': player_name,
+                        'stat': stat_name, 'target': target, 'value': current_stat,
+                        'detected_at': rung['detected_at'], 'latency': round(latency, 3),
+                        'period': rung['period'], 'clock': rung['clock'],
+                        'price': edge['kalshi_price'], 'traded': bool(order),
+                    }])
 
     return edges
 
 
-def find_nhl_tied_game_totals(kalshi_api) -> List[Dict]:
+@profiled()
+def find_nhl_tied_game_totals(kalshi_api, scheduled: bool = False) -> List[Dict]:
     """Find NHL totals markets that are GUARANTEED due to tied games.
 
     In NHL, games cannot end in ties (OT/shootout decides winner).
@@ -4434,25 +6429,32 @@ def find_nhl_tied_game_totals(kalshi_api) -> List[Dict]:
     - Tied 3-3 → minimum 7 goals → Over 6.5 GUARANTEED
 
     Buy YES on any Over market below the guaranteed threshold at any price < $1.00.
+
+    scheduled=True polls the scoreboard only when _sniper_schedule's 'nhl_tied' key
+    is due: every second with a tied game in the 3rd/OT, minutes with nothing live.
     """
     edges = []
+    if scheduled and not _sniper_schedule.due('nhl_tied'):
+        return edges
 
     try:
         # Get live NHL games with scores from ESPN
-        resp = requests.get(
+        resp = _http.get(
             'https://site.api.espn.com/apis/site/v2/sports/hockey/nhl/scoreboard',
             timeout=10
         )
         resp.raise_for_status()
         data = resp.json()
 
-        tied_games = []  # [(home_abbr, away_abbr, score, guaranteed_total, game_date_str), ...]
+        tied_games = []  # [(espn game_id, home_abbr, away_abbr, score, guaranteed_total, game_date_str), ...]
+        level = 'idle'
 
         for event in data.get('events', []):
             status = event.get('status', {}).get('type', {}).get('name', '')
             # Only look at games in progress (not finished)
             if status not in ('STATUS_IN_PROGRESS', 'STATUS_END_PERIOD', 'STATUS_HALFTIME'):
                 continue
+            period = event.get('status', {}).get('period', 0) or 0
 
             # Extract game date for ticker matching
             game_date_str = ''
@@ -4480,88 +6482,53 @@ def find_nhl_tied_game_totals(kalshi_api) -> List[Dict]:
                     away_score = score
                     away_abbr = abbr
 
+            # Poll faster while a goal could create (or a tie already is) a guaranteed line
+            late = period >= SNIPER_LATE_PERIOD['nhl']
+            if status in SNIPER_BREAK_STATUSES:
+                level = _hotter(level, 'break')
+            elif home_score == away_score and home_score > 0:
+                level = _hotter(level, 'critical' if late else 'hot')
+            elif abs(home_score - away_score) == 1 and late:
+                level = _hotter(level, 'hot')
+            else:
+                level = _hotter(level, 'live')
+
             # Check if tied
             if home_score == away_score and home_score > 0:
                 # Minimum final total = 2 * tie_score + 1 (someone must win)
                 guaranteed_total = 2 * home_score + 1
-                tied_games.append((home_abbr, away_abbr, home_score, guaranteed_total, game_date_str))
+                tied_games.append((event.get('id', ''), home_abbr, away_abbr, home_score, guaranteed_total, game_date_str))
                 print(f"   NHL tied game: {away_abbr}@{home_abbr} {home_score}-{away_score} → Over {guaranteed_total - 0.5} guaranteed")
 
+        if scheduled:
+            _sniper_schedule.schedule('nhl_tied', level)
         if not tied_games:
             return edges
 
-        # Fetch NHL total markets from Kalshi
-        markets = kalshi_api.get_markets('KXNHLTOTAL')
-        if not markets:
-            return edges
-
-        for mkt in markets:
-            ticker = mkt.get('ticker', '')
-            title = mkt.get('title', '')
-            status = mkt.get('status', '')
-
-            if status != 'active':
-                continue
-
-            # Ticker format: KXNHLTOTAL-26FEB03DETBOS-55 (Over 5.5)
-            # Extract teams and line from ticker
-            parts = ticker.split('-')
-            if len(parts) < 3:
-                continue
-
-            game_part = parts[1]  # e.g., 26FEB03DETBOS
-            line_part = parts[2]  # e.g., 5 (means Over 5.5)
-
-            # Extract date and teams from game_part
-            ticker_date = game_part[:7] if len(game_part) >= 7 else ''  # 26FEB03
-            teams_part = game_part[7:] if len(game_part) > 7 else ''  # DETBOS
-
-            # Get the line from floor_strike field (preferred) or parse from ticker
-            # Kalshi format: ticker ending in "5" = Over 5.5, "6" = Over 6.5, etc.
-            floor_strike = mkt.get('floor_strike')
-            if floor_strike is not None:
-                line = float(floor_strike)
-            else:
-                try:
-                    line = float(line_part) + 0.5  # "5" -> 5.5
-                except ValueError:
-                    continue
-
-            # Check if this market matches any tied game
-            for home_abbr, away_abbr, tie_score, guaranteed_total, game_date_str in tied_games:
-                # Match teams (either order since it's a total)
-                if not (home_abbr in teams_part and away_abbr in teams_part):
-                    continue
-
-                # Match date
-                if ticker_date and game_date_str and ticker_date != game_date_str:
+        # Strike ladders for KXNHLTOTAL (listed lazily — only needed once a game is tied)
+        _nhl_total_index.refresh(kalshi_api)
+        nhl_games = _nhl_total_index.games.get('nhl', {})
+
+        for game_id, home_abbr, away_abbr, tie_score, guaranteed_total, game_date_str in tied_games:
+            # Tied X-X → guaranteed_total = 2X+1 → ONLY the Over (2X+0.5) line is guaranteed
+            # 1-1 → Over 2.5, 2-2 → Over 4.5, 3-3 → Over 6.5 ...
+            target_line = guaranteed_total - 0.5
+            espn_game = {'game_id': game_id, 'home': home_abbr, 'away': away_abbr, 'game_date_str': game_date_str}
+            for game_code in _nhl_total_index.game_codes('nhl', espn_game):
+                ladder = nhl_games[game_code].get('over')
+                if not ladder:
                     continue
-
-                # Check if this is THE EXACT guaranteed line
-                # Tied X-X → guaranteed_total = 2X+1 → target_line = 2X+0.5
-                # 1-1 → 3 → Over 2.5 ONLY
-                # 2-2 → 5 → Over 4.5 ONLY
-                # 3-3 → 7 → Over 6.5 ONLY
-                # 4-4 → 9 → Over 8.5 ONLY
-                # 5-5 → 11 → Over 10.5 ONLY
-                # 6-6 → 13 → Over 12.5 ONLY
-                target_line = guaranteed_total - 0.5
-                print(f"      Checking {ticker}: line={line}, target_line={target_line}, tied={tie_score}-{tie_score}")
-                if abs(line - target_line) < 0.01:  # Only exact match
+                for line, ticker in ladder.exact(target_line):
+                    metric_inc('thresholds_crossed_total', {'kind': 'nhl_total'})
+                    print(f"      Checking {ticker}: line={line}, tied={tie_score}-{tie_score}")
                     # This is a guaranteed win! Get the orderbook
-                    time.sleep(0.2)
+                    _sleep(0.2)
                     ob = kalshi_api.get_orderbook(ticker)
                     if not ob:
                         continue
 
-                    ob_data = ob.get('orderbook', {})
-                    no_bids = ob_data.get('no', [])  # YES ask = 100 - no_bid
-
-                    # Find best YES ask price
-                    yes_price = None
-                    if no_bids:
-                        best_no_bid = max(no_bids, key=lambda x: x[0])
-                        yes_price = (100 - best_no_bid[0]) / 100.0
+                    # Find best YES ask price (YES ask = 100 - best NO bid)
+                    yes_price = ob.yes_ask()
 
                     if yes_price is None or yes_price >= COMPLETED_PROP_MAX_PRICE:
                         continue
@@ -4583,18 +6550,18 @@ def find_nhl_tied_game_totals(kalshi_api) -> List[Dict]:
                         'arbitrage_profit': ((1.0 / yes_price) - 1) * 100,
                         'is_live': True,
                         'recommendation': f"BUY YES on Over {line} — game tied {tie_score}-{tie_score}, minimum {guaranteed_total} goals",
-                        'orderbook': ob,
                     }
                     edges.append(edge)
                     print(f"   GUARANTEED NHL TOTAL: {away_abbr}@{home_abbr} Over {line} @ ${yes_price:.2f} (tied {tie_score}-{tie_score})")
                     send_telegram_notification(edge)
-                    auto_trade_completed_prop(edge, kalshi_api)
-                    break  # Only one match per market
+                    auto_trade_completed_prop(edge, kalshi_api, ob)
 
     except Exception as e:
         import traceback
         traceback.print_exc()
         print(f"   NHL tied game totals error: {e}")
+        if scheduled:
+            _sniper_schedule.schedule('nhl_tied', 'live')
 
     return edges
 
@@ -4734,7 +6701,7 @@ def find_basketball_analytically_final(kalshi_api) -> List[Dict]:
         try:
             # Get live games with scores and time from ESPN
             # Note: Many international leagues may not have ESPN coverage - that's OK, we silently skip them
-            resp = requests.get(
+            resp = _http.get(
                 f"https://site.api.espn.com/apis/site/v2/sports/{config['espn_path']}/scoreboard",
                 timeout=5
             )
@@ -4842,6 +6809,7 @@ def find_basketball_analytically_final(kalshi_api) -> List[Dict]:
                 # Check if game is analytically final
                 if seconds_remaining < safe_seconds:
                     analytically_final_games.append({
+                        'game_id': event.get('id', ''),
                         'home_abbr': home_abbr,
                         'away_abbr': away_abbr,
                         'leading_abbr': leading_abbr,
@@ -4885,6 +6853,16 @@ def find_basketball_analytically_final(kalshi_api) -> List[Dict]:
 
             print(f"   {config['sport_name']}: Found {len(markets)} Kalshi markets, checking for matches...")
 
+            # Link each analytically final ESPN game to its Kalshi game part (teams + ET date) once
+            sport_prefix = parse_ticker(config['kalshi_series']).sport_prefix
+            game_parts = {parse_ticker(m.get('ticker', '')).game_part for m in markets}
+            final_by_part = {}
+            for game in analytically_final_games:
+                espn_game = {'game_id': game['game_id'], 'home': game['home_abbr'],
+                             'away': game['away_abbr'], 'game_date_str': game['game_date_str']}
+                for part in _slate.espn_game_parts(sport_prefix, espn_game, game_parts):
+                    final_by_part.setdefault(part, []).append(game)
+
             for mkt in markets:
                 ticker = mkt.get('ticker', '')
                 title = mkt.get('title', '')
@@ -4894,46 +6872,28 @@ def find_basketball_analytically_final(kalshi_api) -> List[Dict]:
                     continue
 
                 # Ticker format: KXNBAGAME-26FEB03BOSLAL-BOS
-                parts = ticker.split('-')
-                if len(parts) < 3:
+                rec = parse_ticker(ticker)
+                if not rec.suffix:
                     continue
 
-                game_part = parts[1]  # e.g., 26FEB03BOSLAL
-                team_part = parts[2]  # e.g., BOS (the team this contract is for)
-
-                ticker_date = game_part[:7] if len(game_part) >= 7 else ''
-                teams_part = game_part[7:] if len(game_part) > 7 else ''
+                team_part = rec.suffix  # e.g., BOS (the team this contract is for)
 
                 # Check if this market matches any analytically final game
-                for game in analytically_final_games:
-                    # Match teams
-                    if not (game['home_abbr'] in teams_part and game['away_abbr'] in teams_part):
-                        continue
-
-                    # Match date
-                    if ticker_date and game['game_date_str'] and ticker_date != game['game_date_str']:
-                        continue
-
+                for game in final_by_part.get(rec.game_part, []):
                     # Check if this contract is for the LEADING team
                     if team_part != game['leading_abbr']:
                         continue
 
                     # Found a match! Get the orderbook
                     print(f"   MATCH: {ticker} for {game['leading_name']} (up {game['lead']})")
-                    time.sleep(0.2)
+                    _sleep(0.2)
                     ob = kalshi_api.get_orderbook(ticker)
                     if not ob:
                         print(f"   SKIP: {ticker} - no orderbook data")
                         continue
 
-                    ob_data = ob.get('orderbook', {})
-                    no_bids = ob_data.get('no', [])
-
                     # Find best YES ask price
-                    yes_price = None
-                    if no_bids:
-                        best_no_bid = max(no_bids, key=lambda x: x[0])
-                        yes_price = (100 - best_no_bid[0]) / 100.0
+                    yes_price = ob.yes_ask()
 
                     if yes_price is None:
                         print(f"   SKIP: {ticker} - no liquidity (no asks)")
@@ -4963,12 +6923,11 @@ def find_basketball_analytically_final(kalshi_api) -> List[Dict]:
                         'arbitrage_profit': ((1.0 / yes_price) - 1) * 100,
                         'is_live': True,
                         'recommendation': f"BUY YES {game['leading_name']} — up {game['lead']} with {mins_left}:{secs_left:02d} left (analytically final)",
-                        'orderbook': ob,
                     }
                     edges.append(edge)
                     print(f"   ANALYTICALLY FINAL: {game['away_abbr']}@{game['home_abbr']} {game['leading_name']} @ ${yes_price:.2f}")
                     send_telegram_notification(edge)
-                    auto_trade_completed_prop(edge, kalshi_api)
+                    auto_trade_completed_prop(edge, kalshi_api, ob)
                     break
 
         except requests.exceptions.HTTPError as e:
@@ -4987,9 +6946,109 @@ def find_basketball_analytically_final(kalshi_api) -> List[Dict]:
     return edges
 
 
-def auto_trade_completed_prop(edge: Dict, kalshi_api) -> Optional[Dict]:
+# ============================================================
+# IOC SWEEP EXECUTOR (guaranteed-outcome trades)
+# ============================================================
+
+class LocalBalance:
+    """Account cash tracked in-process so sweeps don't pay a get_balance round trip.
+
+    The REST balance is re-read at most every BALANCE_SYNC_SECONDS (or on the next sweep
+    after invalidate(), which other order paths call). Sweeps reserve what their planned
+    levels cost; available = synced - outstanding reservations. settle() releases the
+    reservation and debits what filled, unless a sync ran meanwhile, in which case that
+    REST value may already include the fill and the balance is re-read instead.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._synced_cents = 0
+        self._outstanding_cents = 0
+        self._synced_at = 0.0
+        self._epoch = 0  # bumped on every sync
+
+    def invalidate(self):
+        """Money moved outside a sweep (resting order, combo fill): re-read before the next one."""
+        with self._lock:
+            self._synced_at = 0.0
+
+    def _sync(self, kalshi_api):
+        if time.time() - self._synced_at <= BALANCE_SYNC_SECONDS:
+            return
+        balance = kalshi_api.get_balance()
+        if balance:
+            with self._lock:
+                self._synced_cents = balance.get('balance', 0)
+                self._synced_at = time.time()
+                self._epoch += 1
+
+    def available(self, kalshi_api) -> int:
+        """Cents not held by an in-flight sweep."""
+        self._sync(kalshi_api)
+        with self._lock:
+            return max(0, self._synced_cents - self._outstanding_cents)
+
+    def reserve(self, cents: int) -> Optional[int]:
+        """Hold cents for a sweep. Returns a token for settle(), None if they're no longer available."""
+        with self._lock:
+            if cents <= 0 or self._synced_cents - self._outstanding_cents < cents:
+                return None
+            self._outstanding_cents += cents
+            return self._epoch
+
+    def settle(self, token: int, reserved_cents: int, spent_cents: int):
+        with self._lock:
+            self._outstanding_cents -= reserved_cents
+            if token == self._epoch:
+                self._synced_cents -= spent_cents
+            else:
+                self._synced_at = 0.0
+
+
+_balance = LocalBalance()
+
+
+def _order_fill(result: Optional[Dict], price_cents: int) -> Tuple[int, int, int]:
+    """(contracts filled, cost cents, fee cents) for a create-order response."""
+    if not result:
+        return 0, 0, 0
+    order = result.get('order', result)
+    filled = order.get('fill_count')
+    if filled is None:
+        filled = order.get('taker_fill_count')
+    if filled is None:
+        filled = 0 if order.get('status') != 'executed' else order.get('count', 0) - order.get('remaining_count', 0)
+    filled = int(filled or 0)
+    if not filled:
+        return 0, 0, 0
+    cost = order.get('taker_fill_cost')
+    if cost is None:
+        cost = filled * price_cents
+    fees = order.get('taker_fees')
+    if fees is None:
+        fees = math.ceil(0.07 * filled * (price_cents / 100) * (1 - price_cents / 100) * 100)
+    return filled, int(cost), int(fees)
+
+
+def sweep_yes_asks(kalshi_api, ticker: str, limit_cents: int, count: int) -> Dict:
+    """Buy up to count YES with one immediate-or-cancel order limited at limit_cents.
+    The matching engine fills it cheapest level first, so every ask at or below the
+    limit is taken in one round trip and nothing is left resting.
+    Returns {'contracts', 'cost_cents' (incl. fees), 'fee_cents', 'order'}."""
+    try:
+        result = kalshi_api.place_order(ticker, 'yes', limit_cents, count, time_in_force='immediate_or_cancel')
+    except Exception as e:
+        print(f"   >>> SWEEP {ticker} error: {e}")
+        result = None
+    filled, cost, fees = _order_fill(result, limit_cents)
+    return {'contracts': filled, 'cost_cents': cost + fees, 'fee_cents': fees,
+            'order': result.get('order', result) if result else {}}
+
+
+def auto_trade_completed_prop(edge: Dict, kalshi_api, book: OrderBook = None) -> Optional[Dict]:
     """Auto-trade a completed prop. Buy MAX contracts since it's guaranteed money.
-    Sweeps the entire ask side of the orderbook up to account balance."""
+    Plans the profitable ask levels of the orderbook (book, or fetched) against the locally
+    tracked balance and takes them all with one IOC order at the worst planned price."""
     global _order_tracker
 
     if not AUTO_TRADE_ENABLED:
@@ -5007,135 +7066,103 @@ def auto_trade_completed_prop(edge: Dict, kalshi_api) -> Optional[Dict]:
     if not _order_tracker.can_trade():
         return None
 
-    price = edge['kalshi_price']
-
-    # Get account balance to determine max spend
-    balance = kalshi_api.get_balance()
-    avail = 0
-    if balance:
-        avail = balance.get('balance', 0) / 100  # cents to dollars
-
-    if avail <= 0:
-        print(f"   >>> No balance available for completed prop {ticker}")
-        return None
-
-    # Sweep the ask side: buy at the best ask price, as many as we can afford
+    # Sweep the ask side: buy at every price level below $0.99
     # The orderbook has no_bids — YES ask = 100 - no_bid price
-    # We want to buy at every price level below $0.99
-    ob = edge.get('orderbook') or kalshi_api.get_orderbook(ticker)
+    ob = book or kalshi_api.get_orderbook(ticker)
     if not ob:
         return None
 
-    ob_data = ob.get('orderbook', {})
-    no_bids = ob_data.get('no', [])  # Each is [price_cents, quantity]
-
-    if not no_bids:
+    # Every ask at or below the limit is profitable; the book answers "how many" in O(1)
+    depth = ob.yes_depth(SWEEP_LIMIT_CENTS)
+    if depth <= 0:
         return None
 
-    # Sort no bids descending by price (highest no bid = cheapest YES ask)
-    no_bids_sorted = sorted(no_bids, key=lambda x: x[0], reverse=True)
-
     # Completed props are GUARANTEED — player already hit the threshold.
     # Buy as much as the orderbook and balance allow (no artificial caps).
-    remaining_balance = min(avail, 5000.00)  # Up to $5000 (balance is real cap)
-    remaining_profit_target = 999.00  # Effectively uncapped
-    total_contracts = 0
-    total_cost = 0
-    best_price = None
-
-    for bid_price_cents, qty in no_bids_sorted:
-        yes_price = (100 - bid_price_cents) / 100.0
-        if yes_price >= COMPLETED_PROP_MAX_PRICE:
-            continue
-
-        fee_per = kalshi_fee(yes_price)
-        cost_per = yes_price + fee_per
-        profit_per = 1.0 - cost_per
-
-        if profit_per <= 0:
-            continue
-
-        if best_price is None:
-            best_price = yes_price
-
-        # How many can we buy at this level?
-        can_afford = int(remaining_balance / cost_per) if cost_per > 0 else 0
-        # Cap by remaining profit target
-        max_by_profit = int(remaining_profit_target / profit_per) if profit_per > 0 else 0
-        buy_qty = min(qty, can_afford, max(1, max_by_profit))
-
-        if buy_qty <= 0:
-            break
-
-        level_fee = math.ceil(0.07 * buy_qty * yes_price * (1 - yes_price) * 100) / 100
-        level_cost = (yes_price * buy_qty) + level_fee
-        level_profit = (1.0 * buy_qty) - level_cost
-
-        total_contracts += buy_qty
-        total_cost += level_cost
-        remaining_balance -= level_cost
-        remaining_profit_target -= level_profit
-
-        # Stop if we've hit our profit target
-        if remaining_profit_target <= 0:
-            break
-
-    if total_contracts <= 0 or best_price is None:
+    available_cents = _balance.available(kalshi_api)
+    if available_cents <= 0:
+        print(f"   >>> No balance available for completed prop {ticker}")
         return None
+    budget = min(available_cents / 100, COMPLETED_PROP_MAX_COST)
+
+    # Cost per contract (price + fee) rises with price, so the limit is the worst case
+    limit_cents = SWEEP_LIMIT_CENTS
+    worst_cost_per = limit_cents / 100 + kalshi_fee(limit_cents / 100)
+    if depth * worst_cost_per <= budget:
+        # The whole profitable depth fits the budget: take it all, no level walk
+        total_contracts = depth
+        total_cost = depth * worst_cost_per  # Upper bound (to fee rounding); the IOC fills cheapest first
+    else:
+        # Budget binds: walk the levels cheapest first until it runs out
+        remaining_balance = budget
+        total_contracts = 0
+        total_cost = 0
+        limit_cents = None  # worst (highest) YES price we're willing to pay
+        for ask_cents, qty in ob.yes_asks(SWEEP_LIMIT_CENTS):
+            yes_price = ask_cents / 100.0
+            cost_per = yes_price + kalshi_fee(yes_price)
+            buy_qty = min(qty, int(remaining_balance / cost_per))
+            if buy_qty <= 0:
+                break
 
-    total_profit = (1.0 * total_contracts) - total_cost
+            # Fee rounded up per level: never less than Kalshi's fee on the whole fill
+            level_fee = math.ceil(0.07 * buy_qty * yes_price * (1 - yes_price) * 100) / 100
+            level_cost = (yes_price * buy_qty) + level_fee
+            total_contracts += buy_qty
+            total_cost += level_cost
+            remaining_balance -= level_cost
+            limit_cents = ask_cents
 
-    if total_profit <= 0:
+    if limit_cents is None or total_contracts <= 0 or total_contracts - total_cost <= 0:
         return None
 
     # Final safety check (generous for guaranteed props)
-    if total_cost > 5000.00:
-        print(f"   >>> SAFETY BLOCK: {ticker} cost ${total_cost:.2f} exceeds $5000 limit")
+    if total_cost > COMPLETED_PROP_MAX_COST:
+        print(f"   >>> SAFETY BLOCK: {ticker} cost ${total_cost:.2f} exceeds ${COMPLETED_PROP_MAX_COST:.0f} limit")
         return None
 
-    # Place the order at the best ask price for the total contracts
-    # Kalshi will fill at best available prices up to our limit price
-    # Use the worst (highest) YES price we're willing to pay as limit
-    worst_yes_cents = 99  # max $0.99
-    for bid_price_cents, qty in no_bids_sorted:
-        yes_price = (100 - bid_price_cents) / 100.0
-        if yes_price >= COMPLETED_PROP_MAX_PRICE:
-            continue
-        fee_per = kalshi_fee(yes_price)
-        if (1.0 - yes_price - fee_per) > 0:
-            worst_yes_cents = int(round(yes_price * 100))
-
-    # Place at best price — Kalshi limit orders fill at best available
-    price_cents = int(round(best_price * 100))
+    reserved = int(math.ceil(total_cost * 100))
+    token = _balance.reserve(reserved)
+    if token is None:
+        print(f"   >>> No balance available for completed prop {ticker} (held by other sweeps)")
+        return None
 
-    print(f"   >>> COMPLETED PROP MAX TRADE: {ticker} YES {total_contracts}x @ ${best_price:.2f} = ${total_cost:.2f} (guaranteed profit ${total_profit:.2f})")
+    best_price = ob.yes_ask()
+    print(f"   >>> COMPLETED PROP SWEEP: {ticker} YES {total_contracts}x {round(best_price * 100)}-{limit_cents}¢ IOC "
+          f"<= ${total_cost:.2f} (guaranteed profit >= ${total_contracts - total_cost:.2f})")
 
-    order = kalshi_api.place_order(ticker, 'yes', price_cents, total_contracts)
-    if order:
-        fee_total = math.ceil(0.07 * total_contracts * best_price * (1 - best_price) * 100) / 100
-        order_info = {
-            'ticker': ticker,
-            'side': 'yes',
-            'price': best_price,
-            'fee': fee_total,
-            'contracts': total_contracts,
-            'cost': total_cost,
-            'potential_profit': total_profit,
-            'edge_pct': edge['arbitrage_profit'],
-            'sport': edge.get('sport', 'NBA'),
-            'market_type': 'Completed Prop',
-            'game': edge.get('game', ''),
-            'team': edge.get('team', ''),
-            'recommendation': edge.get('recommendation', ''),
-            'timestamp': datetime.utcnow().isoformat(),
-            'order_id': order.get('order_id', ''),
-            'status': order.get('status', 'unknown'),
-        }
-        _order_tracker.add_order(ticker, order_info)
-        send_order_telegram(order_info, 'COMPLETED PROP')
-        return order_info
+    sweep = sweep_yes_asks(kalshi_api, ticker, limit_cents, total_contracts)
+    _balance.settle(token, reserved, sweep['cost_cents'])
+    filled = sweep['contracts']
+    if filled <= 0:
+        print(f"   >>> SWEEP {ticker}: nothing filled (book moved)")
+        return None
 
-    return None
+    filled_cost = sweep['cost_cents'] / 100
+    avg_price = filled_cost / filled
+    print(f"   >>> SWEEP {ticker}: filled {filled}/{total_contracts} for ${filled_cost:.2f} (avg ${avg_price:.3f} incl. fees)")
+
+    order_info = {
+        'ticker': ticker,
+        'side': 'yes',
+        'price': best_price,
+        'fee': sweep['fee_cents'] / 100,
+        'contracts': filled,
+        'cost': filled_cost,
+        'potential_profit': filled - filled_cost,
+        'edge_pct': edge['arbitrage_profit'],
+        'sport': edge.get('sport', 'NBA'),
+        'market_type': 'Completed Prop',
+        'game': edge.get('game', ''),
+        'team': edge.get('team', ''),
+        'recommendation': edge.get('recommendation', ''),
+        'timestamp': datetime.utcnow().isoformat(),
+        'order_id': sweep['order'].get('order_id', ''),
+        'status': 'executed' if filled == total_contracts else 'partial',
+    }
+    _order_tracker.add_order(ticker, order_info)
+    send_order_telegram(order_info, 'COMPLETED PROP')
+    return order_info
 
 
 # ============================================================
@@ -5151,38 +7178,36 @@ def auto_trade_completed_prop(edge: Dict, kalshi_api) -> Optional[Dict]:
 # COMPLETED PROPS SNIPER — dedicated fast-scan thread
 # ============================================================
 
-COMPLETED_PROPS_SCAN_INTERVAL = 15  # Scan every 15 seconds — guaranteed markets only, faster for analytically final
+SNIPER_HEARTBEAT_SECONDS = 60  # Log poll levels this often (cycles can be 1s apart)
+
 
 def _completed_props_sniper_loop():
-    """Dedicated thread that scans completed player props more frequently.
+    """Dedicated thread that snipes completed player props and tied NHL totals.
 
     The main scan loop takes minutes due to moneyline/spread/total checks.
     Completed props are free money — a player has ALREADY hit the stat threshold
     but cheap YES contracts are still available. We need to find and buy these
     as fast as possible before the market catches up.
 
-    This thread runs independently every 60 seconds, checking only prop markets
-    against live ESPN box scores.
+    Each game is polled at its own rate (see SNIPER_POLL_INTERVALS): every 1-2s
+    when a rung is within reach, backing off to minutes when nothing is live.
     """
     # Wait for initial startup
     time.sleep(30)
     print("Completed props sniper thread started")
+    kalshi = get_kalshi_client()
+    last_heartbeat = 0.0
 
     while True:
+        cycle_start = time.perf_counter()
         try:
-            kalshi = KalshiAPI(KALSHI_API_KEY_ID, KALSHI_PRIVATE_KEY)
-            print(f"\n--- Completed Props Sniper Scan ---")
-
-            all_guaranteed = []
-
             # 1. Completed player props (stat already hit)
-            completed = find_completed_props(kalshi)
-            all_guaranteed.extend(completed)
+            completed = find_completed_props(kalshi, scheduled=True)
 
             # 2. NHL tied game totals (guaranteed by no-tie rule)
-            nhl_tied = find_nhl_tied_game_totals(kalshi)
-            all_guaranteed.extend(nhl_tied)
+            nhl_tied = find_nhl_tied_game_totals(kalshi, scheduled=True)
 
+            all_guaranteed = completed + nhl_tied
             if all_guaranteed:
                 with _scan_lock:
                     # Merge into cached edges (avoid duplicates by ticker)
@@ -5190,16 +7215,24 @@ def _completed_props_sniper_loop():
                     for edge in all_guaranteed:
                         if edge.get('kalshi_ticker') not in existing_tickers:
                             _scan_cache['edges'].append(edge)
+                        # Kept for the next full scan, which reports but never re-trades them
+                        _scan_cache['guaranteed_edges'][edge.get('kalshi_ticker')] = edge
+                    _publish_edges_snapshot()
                 print(f"   Props sniper: {len(completed)} props, {len(nhl_tied)} NHL tied")
-            else:
-                print(f"   Props sniper: no guaranteed opportunities")
+
+            if time.time() - last_heartbeat >= SNIPER_HEARTBEAT_SECONDS:
+                last_heartbeat = time.time()
+                print(f"   Props sniper polling: {_sniper_schedule.summary()}, "
+                      f"NHL tied {_sniper_schedule.levels.get('nhl_tied', 'pending')}")
 
         except Exception as e:
             import traceback
             traceback.print_exc()
             print(f"Completed props sniper error: {e}")
 
-        time.sleep(COMPLETED_PROPS_SCAN_INTERVAL)
+        metric_observe('sniper_cycle_seconds', time.perf_counter() - cycle_start)
+        time.sleep(min(max(_sniper_schedule.seconds_until_next(), SNIPER_POLL_INTERVALS['critical']),
+                       SNIPER_POLL_INTERVALS['idle']))
 
 
 def start_completed_props_sniper():
@@ -5214,137 +7247,167 @@ def start_completed_props_sniper():
 # MAIN SCANNER
 # ============================================================
 
+class _scan_stage:
+    """Time one stage of scan_all_sports into scan_stage_duration_seconds
+    and, when profiling, a profile frame of the same name."""
+    def __init__(self, name: str):
+        self.timer = metric_timer('scan_stage_duration_seconds', {'stage': name})
+        self.frame = profile_frame(name)
+
+    def __enter__(self):
+        self.timer.__enter__()
+        self.frame.__enter__()
+        return self
+
+    def __exit__(self, *exc):
+        self.frame.__exit__(*exc)
+        self.timer.__exit__(*exc)
+        return False
+
+
 def scan_all_sports(kalshi_api, fanduel_api):
     all_edges = []
     sports_scanned = []
     sports_with_games = []
 
     # Sync positions from Kalshi API at start of each scan
-    _order_tracker.refresh_from_api(kalshi_api)
+    with _scan_stage('positions_sync'):
+        _order_tracker.refresh_from_api(kalshi_api)
 
     # 1. Pre-game player prop comparison (FD one-way vs Kalshi YES/NO)
     # Run FIRST so /props page populates quickly after deploy
-    all_prop_comparisons = []
-    prop_sport_groups = {}  # sport_key -> {market_key: series_ticker, 'name': display_name}
-    for series_ticker, (sport_key, market_key, display_name) in PLAYER_PROP_SPORTS.items():
-        if sport_key not in prop_sport_groups:
-            prop_sport_groups[sport_key] = {'tickers': {}, 'name': display_name.split()[0]}  # 'NBA', 'NHL'
-        prop_sport_groups[sport_key]['tickers'][market_key] = series_ticker
-
-    for sport_key, group in prop_sport_groups.items():
-        group_name = f"{group['name']} Props"
-        print(f"\n--- {group_name} (pregame) ---")
-        market_keys = list(group['tickers'].keys())
-        fd = fanduel_api.get_player_props_pregame(sport_key, market_keys)
-        sports_scanned.append(group_name)
-        if not fd['props']:
-            continue
-        sports_with_games.append(group_name)
-        comps = compare_pregame_props(kalshi_api, fd, group['tickers'], group_name)
-        all_prop_comparisons.extend(comps)
-        print(f"   {group_name}: {len(comps)} FD-matched props compared")
-        time.sleep(1.0)
+    with _scan_stage('props_pregame'):
+        all_prop_comparisons = []
+        prop_sport_groups = {}  # sport_key -> {market_key: series_ticker, 'name': display_name}
+        for series_ticker, (sport_key, market_key, display_name) in PLAYER_PROP_SPORTS.items():
+            if sport_key not in prop_sport_groups:
+                prop_sport_groups[sport_key] = {'tickers': {}, 'name': display_name.split()[0]}  # 'NBA', 'NHL'
+            prop_sport_groups[sport_key]['tickers'][market_key] = series_ticker
+
+        for sport_key, group in prop_sport_groups.items():
+            group_name = f"{group['name']} Props"
+            print(f"\n--- {group_name} (pregame) ---")
+            market_keys = list(group['tickers'].keys())
+            fd = fanduel_api.get_player_props_pregame(sport_key, market_keys, stream=True)
+            sports_scanned.append(group_name)
+            if not fd['games']:
+                continue
+            comps = compare_pregame_props(kalshi_api, fd, group['tickers'], group_name)
+            if not fd['props']:
+                continue
+            sports_with_games.append(group_name)
+            all_prop_comparisons.extend(comps)
+            print(f"   {group_name}: {len(comps)} FD-matched props compared")
+            _sleep(1.0)
 
-    # Store prop comparisons to file (shared across gunicorn processes)
-    with _scan_lock:
-        _scan_cache['prop_comparisons'] = all_prop_comparisons
-    try:
-        import tempfile
-        props_file = '/tmp/props_cache.json'
-        tmp_file = props_file + '.tmp'
-        with open(tmp_file, 'w') as f:
-            json.dump({'comparisons': all_prop_comparisons, 'ts': datetime.utcnow().isoformat()}, f)
-        os.replace(tmp_file, props_file)
-    except Exception as e:
-        print(f"   Warning: failed to write props cache file: {e}")
-    print(f"   Prop comparisons cached: {len(all_prop_comparisons)} total")
+        # Store prop comparisons to file (shared across gunicorn processes)
+        with _scan_lock:
+            _scan_cache['prop_comparisons'] = all_prop_comparisons
+        try:
+            import tempfile
+            props_file = '/tmp/props_cache.json'
+            tmp_file = props_file + '.tmp'
+            with open(tmp_file, 'w') as f:
+                json.dump({'comparisons': all_prop_comparisons, 'ts': datetime.utcnow().isoformat()}, f)
+            os.replace(tmp_file, props_file)
+        except Exception as e:
+            print(f"   Warning: failed to write props cache file: {e}")
+        print(f"   Prop comparisons cached: {len(all_prop_comparisons)} total")
 
     # 1b. Prop market-making: place/adjust NO limit orders
-    if all_prop_comparisons:
-        print(f"\n--- Prop Market Making ---")
-        manage_prop_orders(kalshi_api, all_prop_comparisons)
+    with _scan_stage('prop_mm'):
+        if all_prop_comparisons:
+            print(f"\n--- Prop Market Making ---")
+            manage_prop_orders(kalshi_api, all_prop_comparisons)
 
     # 2. Moneyline markets
-    for kalshi_series, (odds_key, name, team_map) in MONEYLINE_SPORTS.items():
-        print(f"\n--- {name} Moneyline ({kalshi_series}) ---")
-        fd = fanduel_api.get_moneyline(odds_key)
-        sports_scanned.append(name)
-        if not fd['odds']:
-            continue
-        sports_with_games.append(name)
-        edges = find_moneyline_edges(kalshi_api, fd, kalshi_series, name, team_map)
-        all_edges.extend(edges)
-        print(f"   {name} moneyline: {len(edges)} edges")
-        time.sleep(1.0)
+    with _scan_stage('moneyline'):
+        for kalshi_series, (odds_key, name, team_map) in MONEYLINE_SPORTS.items():
+            print(f"\n--- {name} Moneyline ({kalshi_series}) ---")
+            fd = fanduel_api.get_moneyline(odds_key)
+            sports_scanned.append(name)
+            if not fd['odds']:
+                continue
+            sports_with_games.append(name)
+            edges = find_moneyline_edges(kalshi_api, fd, kalshi_series, name, team_map)
+            all_edges.extend(edges)
+            print(f"   {name} moneyline: {len(edges)} edges")
+            _sleep(1.0)
 
     # 3. Spread markets
-    for kalshi_series, (odds_key, name, team_map) in SPREAD_SPORTS.items():
-        print(f"\n--- {name} ({kalshi_series}) ---")
-        fd = fanduel_api.get_spreads(odds_key)
-        sports_scanned.append(name)
-        if not fd['spreads']:
-            continue
-        sports_with_games.append(name)
-        edges = find_spread_edges(kalshi_api, fd, kalshi_series, name, team_map)
-        all_edges.extend(edges)
-        print(f"   {name}: {len(edges)} edges")
-        time.sleep(1.0)
+    with _scan_stage('spread'):
+        for kalshi_series, (odds_key, name, team_map) in SPREAD_SPORTS.items():
+            print(f"\n--- {name} ({kalshi_series}) ---")
+            fd = fanduel_api.get_spreads(odds_key)
+            sports_scanned.append(name)
+            if not fd['spreads']:
+                continue
+            sports_with_games.append(name)
+            edges = find_spread_edges(kalshi_api, fd, kalshi_series, name, team_map)
+            all_edges.extend(edges)
+            print(f"   {name}: {len(edges)} edges")
+            _sleep(1.0)
 
     # 4. Total markets
-    for kalshi_series, (odds_key, name) in TOTAL_SPORTS.items():
-        print(f"\n--- {name} ({kalshi_series}) ---")
-        # Use team_map from moneyline config if available
-        team_map = {}
-        for ms, (mk, mn, tm) in MONEYLINE_SPORTS.items():
-            if mk == odds_key:
-                team_map = tm
-                break
-        fd = fanduel_api.get_totals(odds_key)
-        sports_scanned.append(name)
-        if not fd['totals']:
-            continue
-        sports_with_games.append(name)
-        edges = find_total_edges(kalshi_api, fd, kalshi_series, name, team_map)
-        all_edges.extend(edges)
-        print(f"   {name}: {len(edges)} edges")
-        time.sleep(1.0)
+    with _scan_stage('total'):
+        for kalshi_series, (odds_key, name) in TOTAL_SPORTS.items():
+            print(f"\n--- {name} ({kalshi_series}) ---")
+            # Use team_map from moneyline config if available
+            team_map = {}
+            for ms, (mk, mn, tm) in MONEYLINE_SPORTS.items():
+                if mk == odds_key:
+                    team_map = tm
+                    break
+            fd = fanduel_api.get_totals(odds_key)
+            sports_scanned.append(name)
+            if not fd['totals']:
+                continue
+            sports_with_games.append(name)
+            edges = find_total_edges(kalshi_api, fd, kalshi_series, name, team_map)
+            all_edges.extend(edges)
+            print(f"   {name}: {len(edges)} edges")
+            _sleep(1.0)
 
     # 5. BTTS markets
-    for kalshi_series, (odds_key, name) in BTTS_SPORTS.items():
-        print(f"\n--- {name} ({kalshi_series}) ---")
-        fd = fanduel_api.get_btts(odds_key)
-        sports_scanned.append(name)
-        if not fd['btts']:
-            continue
-        sports_with_games.append(name)
-        edges = find_btts_edges(kalshi_api, fd, kalshi_series, name)
-        all_edges.extend(edges)
-        print(f"   {name}: {len(edges)} edges")
-        time.sleep(1.0)
+    with _scan_stage('btts'):
+        for kalshi_series, (odds_key, name) in BTTS_SPORTS.items():
+            print(f"\n--- {name} ({kalshi_series}) ---")
+            fd = fanduel_api.get_btts(odds_key)
+            sports_scanned.append(name)
+            if not fd['btts']:
+                continue
+            sports_with_games.append(name)
+            edges = find_btts_edges(kalshi_api, fd, kalshi_series, name)
+            all_edges.extend(edges)
+            print(f"   {name}: {len(edges)} edges")
+            _sleep(1.0)
 
     # 6. Tennis match-winner markets
-    for kalshi_series, (odds_keys, name) in TENNIS_SPORTS.items():
-        print(f"\n--- {name} ({kalshi_series}) ---")
-        sports_scanned.append(name)
-        edges = find_tennis_edges(kalshi_api, fanduel_api, kalshi_series, odds_keys, name)
-        if edges:
-            sports_with_games.append(name)
-        all_edges.extend(edges)
-        print(f"   {name}: {len(edges)} edges")
-        time.sleep(1.0)
-
-    # 7. Live stat arbitrage — buy completed player props
-    print(f"\n--- Completed Props (Live Stat Arb) ---")
-    sports_scanned.append('Live Props')
-    completed = find_completed_props(kalshi_api)
-    all_edges.extend(completed)
-    print(f"   Completed props: {len(completed)} opportunities")
-
-    # 7b. NHL tied game totals — guaranteed by no-tie rule
-    print(f"\n--- NHL Tied Game Totals (Guaranteed) ---")
-    nhl_tied = find_nhl_tied_game_totals(kalshi_api)
-    all_edges.extend(nhl_tied)
-    print(f"   NHL tied totals: {len(nhl_tied)} opportunities")
+    with _scan_stage('tennis'):
+        for kalshi_series, (odds_keys, name) in TENNIS_SPORTS.items():
+            print(f"\n--- {name} ({kalshi_series}) ---")
+            sports_scanned.append(name)
+            edges = find_tennis_edges(kalshi_api, fanduel_api, kalshi_series, odds_keys, name)
+            if edges:
+                sports_with_games.append(name)
+            all_edges.extend(edges)
+            print(f"   {name}: {len(edges)} edges")
+            _sleep(1.0)
+
+    # 7. Live stat arbitrage — completed player props and NHL tied totals.
+    # The sniper thread owns these (box-score diffs, armed rungs, auto-trading);
+    # the scan only reports what it found since the last scan.
+    with _scan_stage('guaranteed'):
+        print(f"\n--- Completed Props / NHL Tied Totals (from sniper) ---")
+        sports_scanned.append('Live Props')
+        with _scan_lock:
+            guaranteed = list(_scan_cache['guaranteed_edges'].values())
+            _scan_cache['guaranteed_edges'] = {}
+        completed = [e for e in guaranteed if e.get('market_type') != 'NHL Total (Tied)']
+        nhl_tied = [e for e in guaranteed if e.get('market_type') == 'NHL Total (Tied)']
+        all_edges.extend(guaranteed)
+        print(f"   Completed props: {len(completed)} opportunities")
+        print(f"   NHL tied totals: {len(nhl_tied)} opportunities")
 
     # 7c. Basketball analytically final — DISABLED (not working reliably)
     # print(f"\n--- Basketball Analytically Final (Haslametrics) ---")
@@ -5358,6 +7421,16 @@ def scan_all_sports(kalshi_api, fanduel_api):
     # Filter out edges below minimum threshold before returning
     before_count = len(all_edges)
     all_edges = [e for e in all_edges if e.get('arbitrage_profit', 0) >= MIN_EDGE_PERCENT]
+    current_by_type = {}
+    for e in all_edges:
+        mt = e.get('market_type', 'Moneyline')
+        metric_inc('edges_emitted_total', {'market_type': mt})
+        current_by_type[mt] = current_by_type.get(mt, 0) + 1
+    with _metrics_lock:
+        for key in [k for k in _metric_gauges if k[0] == 'edges_current']:
+            _metric_gauges[key] = 0  # Zero out types with no edges this scan
+    for mt, n in current_by_type.items():
+        metric_set('edges_current', n, {'market_type': mt})
 
     print(f"\n{'='*60}")
     print(f"SCAN COMPLETE")
@@ -5381,10 +7454,12 @@ def _background_scan_loop():
         try:
             with _scan_lock:
                 _scan_cache['is_scanning'] = True
+                _publish_edges_snapshot()
 
-            kalshi = KalshiAPI(KALSHI_API_KEY_ID, KALSHI_PRIVATE_KEY)
+            kalshi = get_kalshi_client()
             fanduel = FanDuelAPI(ODDS_API_KEY)
-            all_edges, scanned, active = scan_all_sports(kalshi, fanduel)
+            with metric_timer('scan_duration_seconds'), profile_scan():
+                all_edges, scanned, active = scan_all_sports(kalshi, fanduel)
 
             with _scan_lock:
                 _scan_cache['edges'] = all_edges
@@ -5393,6 +7468,7 @@ def _background_scan_loop():
                 _scan_cache['timestamp'] = datetime.utcnow().isoformat()
                 _scan_cache['scan_count'] += 1
                 _scan_cache['is_scanning'] = False
+                _publish_edges_snapshot()
 
             print(f"Background scan #{_scan_cache['scan_count']} complete: {len(all_edges)} edges. Resting {SCAN_REST_SECONDS}s...")
 
@@ -5409,6 +7485,7 @@ def _background_scan_loop():
             print(f"Background scan error: {e}")
             with _scan_lock:
                 _scan_cache['is_scanning'] = False
+                _publish_edges_snapshot()
 
         time.sleep(SCAN_REST_SECONDS)
 
@@ -5420,10 +7497,102 @@ def start_background_scanner():
     print("Background scanner thread launched")
 
 
-# Start scanner when module loads (gunicorn will call this)
-start_background_scanner()  # Multi-book fair value scanner (notifications only, no trading)
-start_completed_props_sniper()  # Guaranteed markets: completed props, NHL tied totals (auto-trades)
-start_combo_mm()  # Combo (parlay) market maker: quote NO on RFQs
+def start_engine():
+    """Start every scanning/trading thread. Must run in exactly one process."""
+    start_background_scanner()  # Multi-book fair value scanner (notifications only, no trading)
+    start_completed_props_sniper()  # Guaranteed markets: completed props, NHL tied totals (auto-trades)
+    start_combo_mm()  # Combo (parlay) market maker: quote NO on RFQs
+    threading.Thread(target=_kalshi_keepalive_loop, daemon=True).start()
+
+
+# ============================================================
+# ENGINE STATE SHARING (engine process -> web workers)
+# ============================================================
+
+_engine_state_lock = threading.Lock()
+_engine_state_mtime = 0.0
+_engine_state_last_written = ''
+_engine_state_missing_logged = False
+
+
+def publish_engine_state():
+    """Write scan cache, pending combo quotes and open positions to ENGINE_STATE_FILE
+    (atomic tmp + rename). Skips the write when nothing changed. Also refreshes METRICS_FILE."""
+    global _engine_state_last_written
+    try:
+        tmp_file = METRICS_FILE + '.tmp'
+        with open(tmp_file, 'w') as f:
+            f.write(render_metrics())
+        os.replace(tmp_file, METRICS_FILE)
+    except Exception as e:
+        print(f"   Metrics write error: {e}")
+    with _scan_lock:
+        state = {
+            'edges': _scan_cache['edges'],
+            'sports_scanned': _scan_cache['sports_scanned'],
+            'sports_with_games': _scan_cache['sports_with_games'],
+            'timestamp': _scan_cache['timestamp'],
+            'scan_count': _scan_cache['scan_count'],
+            'is_scanning': _scan_cache['is_scanning'],
+            'edges_version': _edges_snapshot['version'],
+            'boot_id': _edges_snapshot['boot_id'],
+        }
+    state['combo_pending_quotes'] = dict(_combo_pending_quotes)
+    state['open_tickers'] = sorted(_order_tracker.open_tickers())
+    payload = json.dumps(state, separators=(',', ':'))
+    if payload == _engine_state_last_written:
+        return
+    try:
+        tmp_file = ENGINE_STATE_FILE + '.tmp'
+        with open(tmp_file, 'w') as f:
+            f.write(payload)
+        os.replace(tmp_file, ENGINE_STATE_FILE)
+        _engine_state_last_written = payload
+    except Exception as e:
+        print(f"   Engine state write error: {e}")
+
+
+def _load_engine_state():
+    """Web mode: reload ENGINE_STATE_FILE into the in-process caches if it changed."""
+    global _engine_state_mtime, _engine_state_missing_logged
+    try:
+        mtime = os.stat(ENGINE_STATE_FILE).st_mtime
+    except FileNotFoundError:
+        if not _engine_state_missing_logged:
+            _engine_state_missing_logged = True
+            print(f"   WARNING: ENGINE_MODE=web but {ENGINE_STATE_FILE} doesn't exist. Is engine.py running "
+                  f"with the same ENGINE_STATE_DIR? Serving empty state until it appears.")
+        return
+    if mtime == _engine_state_mtime:
+        return
+    with _engine_state_lock:
+        if mtime == _engine_state_mtime:
+            return
+        try:
+            with open(ENGINE_STATE_FILE) as f:
+                state = json.load(f)
+        except (OSError, json.JSONDecodeError):
+            return  # Engine mid-restart; keep serving the previous state
+        with _scan_lock:
+            for key in ('edges', 'sports_scanned', 'sports_with_games', 'timestamp', 'scan_count', 'is_scanning'):
+                _scan_cache[key] = state.get(key, _scan_cache[key])
+            _publish_edges_snapshot(state.get('edges_version', 0), state.get('boot_id', _EDGES_BOOT_ID))
+        _combo_pending_quotes.clear()
+        _combo_pending_quotes.update(state.get('combo_pending_quotes', {}))
+        _order_tracker.load_open_tickers(state.get('open_tickers', []))
+        _engine_state_mtime = mtime
+
+
+@app.before_request
+def _sync_engine_state():
+    if ENGINE_MODE == 'web':
+        _load_engine_state()
+
+
+# Start engine threads when module loads (gunicorn will call this) unless a separate
+# engine process owns them
+if ENGINE_MODE == 'embedded':
+    start_engine()
 
 
 # ============================================================
@@ -5452,17 +7621,96 @@ def status():
 
 @app.route('/api/edges')
 def get_edges():
-    with _scan_lock:
-        cache = dict(_scan_cache)
-    return jsonify({
-        'edges': cache['edges'],
-        'total_count': len(cache['edges']),
-        'sports_scanned': cache['sports_scanned'],
-        'sports_with_games': cache['sports_with_games'],
-        'timestamp': cache['timestamp'],
-        'scan_count': cache['scan_count'],
-        'is_scanning': cache['is_scanning'],
-    })
+    """Serve the pre-encoded edges snapshot. Answers If-None-Match with 304
+    so polling clients only download a new body when a scan has changed it."""
+    snap = _edges_snapshot
+    headers = {'Cache-Control': 'no-cache', 'Vary': 'Accept-Encoding'}
+    if request.if_none_match.contains_weak(snap['etag']):
+        resp = Response(status=304, headers=headers)
+        resp.set_etag(snap['etag'])
+        return resp
+    if 'gzip' in request.accept_encodings:
+        resp = Response(snap['gzip_body'], mimetype='application/json', headers=headers)
+        resp.headers['Content-Encoding'] = 'gzip'
+    else:
+        resp = Response(snap['body'], mimetype='application/json', headers=headers)
+    resp.set_etag(snap['etag'])
+    return resp
+
+
+@app.route('/metrics')
+def metrics_view():
+    """Prometheus scrape endpoint. Web workers serve the engine's published metrics."""
+    if ENGINE_MODE == 'web':
+        try:
+            with open(METRICS_FILE) as f:
+                text = f.read()
+        except FileNotFoundError:
+            text = ''
+    else:
+        text = render_metrics()
+    return Response(text, mimetype='text/plain; version=0.0.4')
+
+
+@app.route('/debug/profile', methods=['GET', 'POST'])
+def profile_view():
+    """Scan profiler: GET shows the latest scans as an indented flame-style breakdown;
+    POST enable=1 / enable=0 toggles profiling (also in the engine process)."""
+    if request.method == 'POST':
+        enable = request.form.get('enable')
+        if enable == '1':
+            open(PROFILE_FLAG_FILE, 'w').close()
+        elif enable == '0' and os.path.exists(PROFILE_FLAG_FILE):
+            os.remove(PROFILE_FLAG_FILE)
+        return redirect('/debug/profile')
+    enabled = profiling_enabled()
+    profiles = read_scan_profiles()
+
+    html = """<!DOCTYPE html>
+<html><head><title>Scan Profile</title>
+<style>
+body { font-family: monospace; background: #1a1a2e; color: #eee; padding: 20px; }
+h1 { color: #00ff88; } h2 { color: #3498db; margin-top: 30px; }
+.nav a { color: #00ff88; text-decoration: none; margin: 0 15px; }
+table { border-collapse: collapse; } td, th { padding: 3px 10px; text-align: right; }
+td.name { text-align: left; white-space: pre; }
+.bar { display: inline-block; height: 10px; background: #3498db; }
+.sleep { color: #f1c40f; } .net { color: #e67e22; } .cpu { color: #00ff88; }
+form { display: inline; } button { font-family: monospace; background: none; border: none; cursor: pointer; padding: 0; }
+</style></head><body>
+<h1>Scan Profile</h1>
+<div class="nav"><a href="/debug">Edge Scanner</a> | <a href="/orders">Orders</a> | <a href="/history">History</a> | <a href="/combo-debug">Combo Debug</a></div>
+"""
+    toggle = ('<form method="post"><input type="hidden" name="enable" value="0">'
+              '<button style="color:#e74c3c">disable</button></form>') if enabled else \
+        ('<form method="post"><input type="hidden" name="enable" value="1">'
+         '<button style="color:#00ff88">enable</button></form>')
+    html += f"<p>Profiling: {'ON' if enabled else 'OFF'} ({toggle}) — applies from the next scan. Times are inclusive.</p>"
+    if not profiles:
+        html += "<p>No profiled scans yet.</p>"
+
+    def render_node(node, depth, total):
+        rows = ''
+        other = max(0.0, node['wall'] - node['sleep'] - node['network'] - node['cpu'])
+        width = int(300 * node['wall'] / total) if total else 0
+        rows += (f"<tr><td class='name'>{'  ' * depth}{node['name']}</td><td>{node['calls']}</td>"
+                 f"<td>{node['wall']:.2f}</td><td class='sleep'>{node['sleep']:.2f}</td>"
+                 f"<td class='net'>{node['network']:.2f}</td><td class='cpu'>{node['cpu']:.2f}</td>"
+                 f"<td>{other:.2f}</td><td style='text-align:left'><span class='bar' style='width:{width}px'></span></td></tr>")
+        for child in sorted(node['children'].values(), key=lambda c: c['wall'], reverse=True):
+            rows += render_node(child, depth + 1, total)
+        return rows
+
+    for prof in profiles:
+        tree = prof['tree']
+        html += f"<h2>Scan at {prof['started_at'][:19]} — {tree['wall']:.1f}s</h2>"
+        html += ("<table><tr><th style='text-align:left'>frame</th><th>calls</th><th>wall s</th>"
+                 "<th class='sleep'>sleep s</th><th class='net'>network s</th><th class='cpu'>cpu s</th>"
+                 "<th>other s</th><th></th></tr>")
+        html += render_node(tree, 0, tree['wall'])
+        html += "</table>"
+    html += "</body></html>"
+    return html
 
 
 @app.route('/debug')
@@ -5683,52 +7931,32 @@ def _lookup_team_name(abbrev: str, series_prefix: str = '') -> Optional[str]:
     Uses series_prefix (e.g. 'KXNHL', 'KXNBA') to search ONLY the correct sport's map,
     avoiding cross-sport collisions like PHI (76ers vs Flyers) or VAN (Canucks vs Vanderbilt).
     Only falls back to all maps if no series_prefix is provided."""
-    if series_prefix:
-        # ONLY search the matching sport's team map — do NOT fall back
-        for sports_map in [MONEYLINE_SPORTS, SPREAD_SPORTS]:
-            for series_key, v in sports_map.items():
-                if series_key.startswith(series_prefix):
-                    tmap = v[2] if len(v) > 2 else {}
-                    if abbrev in tmap:
-                        return tmap[abbrev]
-        return None
-    # No prefix: search all maps (used when sport is unknown)
-    for sports_map in [MONEYLINE_SPORTS, SPREAD_SPORTS]:
-        for _, v in sports_map.items():
-            tmap = v[2] if len(v) > 2 else {}
-            if abbrev in tmap:
-                return tmap[abbrev]
-    return None
+    # With a prefix ONLY the matching sport's team map is searched — no fallback.
+    # No prefix: all maps (used when sport is unknown).
+    return _team_map_for_prefix(series_prefix).get(abbrev)
 
 
 def _get_sport_prefix(ticker: str) -> str:
     """Extract sport prefix from ticker for sport-aware team lookup.
     e.g. KXNHLGAME-... -> 'KXNHL', KXNCAAMBGAME-... -> 'KXNCAAMB'"""
-    series_part = ticker.split('-')[0] if '-' in ticker else ticker
-    for suffix in ['CHALLENGERMATCH', 'MATCH', 'BGAME', 'GAME', 'SPREAD', 'TOTALSETS', 'TOTAL', 'BTTS', 'PTS', 'REB', 'AST', '3PT', 'SAVES', 'SETWINNER', 'ANYSET']:
-        if series_part.endswith(suffix):
-            return series_part[:-len(suffix)]
-    return series_part
+    return parse_ticker(ticker).sport_prefix
 
 
 def _parse_ticker_teams(ticker: str) -> Tuple[Optional[str], Optional[str], Optional[str]]:
     """Parse ticker to extract team abbreviation, opponent abbreviation, and game name.
     e.g. KXNCAAMBGAME-26JAN31BALLTOL-TOL -> ('TOL', 'BALL', 'Ball St. at Toledo')
     Returns (team_abbrev, opp_abbrev, game_display) or (None, None, None)."""
-    parts = ticker.split('-')
-    if len(parts) < 3:
+    rec = parse_ticker(ticker)
+    if not rec.suffix:
         return None, None, None
 
-    sport_prefix = _get_sport_prefix(ticker)
-    team_abbrev = parts[-1]
-    game_part = parts[1]
+    sport_prefix = rec.sport_prefix
+    team_abbrev = rec.suffix
 
-    date_match = re.match(r'\d{2}[A-Z]{3}\d{2}', game_part)
-    if not date_match:
+    if not rec.date:
         return team_abbrev, None, None
 
-    teams_str = game_part[len(date_match.group(0)):]
-    opp_abbrev = teams_str.replace(team_abbrev, '', 1).strip()
+    opp_abbrev = rec.teams.replace(team_abbrev, '', 1).strip()
     if not opp_abbrev:
         return team_abbrev, None, None
 
@@ -5900,35 +8128,19 @@ def _describe_position(market_info: Optional[Dict], ticker: str, side: str) -> T
 
     elif mtype == 'Total':
         # Extract line from ticker: KXNBATOTAL-26JAN31SASCHA-231 -> 231 -> 231.5
-        parts = ticker.split('-')
-        line_str = parts[-1] if len(parts) >= 3 else ''
-        try:
-            line = float(line_str) + 0.5
-            line_display = f"{line:g}"
-        except ValueError:
+        rec = parse_ticker(ticker)
+        if rec.strike is not None and not rec.outcome:
+            line_display = f"{rec.strike + 0.5:g}"
+        else:
             line_display = subtitle or title
 
-        # Build game name from ticker teams
-        if len(parts) >= 3:
-            gp = parts[1]
-            dm = re.match(r'\d{2}[A-Z]{3}\d{2}', gp)
-            if dm:
-                teams_str = gp[len(dm.group(0)):]
-                # For totals, teams_str is like "SASCHA" - split into two team abbrevs
-                # Try all known abbrevs to split
-                game_name = None
-                for length in range(2, len(teams_str) - 1):
-                    t1 = teams_str[:length]
-                    t2 = teams_str[length:]
-                    n1 = _lookup_team_name(t1, sport_prefix)
-                    n2 = _lookup_team_name(t2, sport_prefix)
-                    if n1 and n2:
-                        game_name = f"{n1} at {n2}"
-                        break
-                if not game_name:
-                    game_name = game_display or subtitle
+        # Build game name from ticker teams ("SASCHA" -> San Antonio Spurs at Charlotte Hornets)
+        if rec.suffix and rec.date:
+            if rec.team_pair:
+                t1, t2 = rec.team_pair
+                game_name = f"{_lookup_team_name(t1, sport_prefix)} at {_lookup_team_name(t2, sport_prefix)}"
             else:
-                game_name = subtitle
+                game_name = game_display or subtitle
         else:
             game_name = subtitle
 
@@ -5957,7 +8169,7 @@ def _describe_position(market_info: Optional[Dict], ticker: str, side: str) -> T
 @app.route('/orders')
 def orders_view():
     try:
-        kalshi = KalshiAPI(KALSHI_API_KEY_ID, KALSHI_PRIVATE_KEY)
+        kalshi = get_kalshi_client()
         balance_data = kalshi.get_balance()
         balance_dollars = balance_data.get('balance', 0) / 100 if balance_data else 0
         portfolio_value = balance_data.get('portfolio_value', 0) / 100 if balance_data else 0
@@ -6073,7 +8285,7 @@ h1 {{ color: #00ff88; text-align: center; font-size: 2em; margin-bottom: 5px; }}
 def combo_debug():
     """Debug page showing combo MM status: pending quotes, recent fills, and quote verification."""
     try:
-        kalshi = KalshiAPI(KALSHI_API_KEY_ID, KALSHI_PRIVATE_KEY)
+        kalshi = get_kalshi_client()
 
         # Read combo bets file
         combo_data = _read_combo_bets()
@@ -6151,7 +8363,7 @@ pre { background: #16213e; padding: 15px; border-radius: 8px; overflow-x: auto;
 def history_page():
     """Show settled bets history with P&L and ROI."""
     try:
-        kalshi = KalshiAPI(KALSHI_API_KEY_ID, KALSHI_PRIVATE_KEY)
+        kalshi = get_kalshi_client()
         balance_data = kalshi.get_balance()
         balance_dollars = balance_data.get('balance', 0) / 100 if balance_data else 0
 
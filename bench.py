@@ -0,0 +1,470 @@
+"""
+Offline scan benchmarks.
+
+Times scan_all_sports, find_completed_props, find_nhl_tied_game_totals and each
+find_*_edges against a synthetic NBA/NHL/soccer slate (default) or a bundle
+recorded with `python replay.py record ...`. No network access is used.
+
+    python bench.py                          # synthetic slate, 5 repeats
+    python bench.py --fixture slate.json.gz  # recorded live slate
+    python bench.py --json results.json      # machine-readable output for regression checks
+    python bench.py --signing                # Kalshi request signing throughput per signer
+"""
+import argparse
+import json
+import random
+import statistics
+import threading
+import time
+from datetime import datetime, timedelta, timezone
+from zoneinfo import ZoneInfo
+
+import replay
+from replay import FixtureBundle
+
+app = replay.app
+
+ODDS = 'https://api.the-odds-api.com/v4/sports'
+KALSHI = 'https://api.elections.kalshi.com/trade-api/v2'
+ESPN = 'https://site.api.espn.com/apis/site/v2/sports'
+
+SLATE_CLOCK = datetime(2026, 2, 4, 0, 30, tzinfo=timezone.utc)  # 7:30pm ET, evening slate in progress
+
+FIRST_NAMES = ['Jalen', 'Marcus', 'Tyrese', 'Devin', 'Jaylen', 'Anthony', 'Luka', 'Derrick',
+               'Mikal', 'Scottie', 'Evan', 'Cade', 'Alperen', 'Franz', 'Paolo', 'Victor']
+LAST_NAMES = ['Brooks', 'Carter', 'Mitchell', 'Harper', 'Sullivan', 'Reyes', 'Walker', 'Okafor',
+              'Jensen', 'Morrow', 'Delgado', 'Whitfield', 'Ambrose', 'Kowalski', 'Navarro', 'Pruitt']
+
+NBA_PROP_LINES = {  # market_key -> (stat, mean, kalshi thresholds)
+    'player_points': ('points', 18, [10, 15, 20, 25, 30, 35, 40]),
+    'player_rebounds': ('rebounds', 6, [4, 6, 8, 10, 12, 14]),
+    'player_assists': ('assists', 5, [2, 4, 6, 8, 10, 12]),
+    'player_threes': ('threes', 2, [1, 2, 3, 4, 5]),
+}
+NBA_PROP_SERIES = {'player_points': 'KXNBAPTS', 'player_rebounds': 'KXNBAREB',
+                   'player_assists': 'KXNBAAST', 'player_threes': 'KXNBA3PT'}
+NHL_PROP_LINES = {
+    'player_points': ('points', 0.8, [1, 2, 3]),
+    'player_assists': ('assists', 0.5, [1, 2, 3]),
+    'player_total_saves': ('saves', 26, [20, 25, 30, 35]),
+}
+NHL_PROP_SERIES = {'player_points': 'KXNHLPTS', 'player_assists': 'KXNHLAST', 'player_total_saves': 'KXNHLSAVES'}
+EPL_TEAMS = {'ARS': 'Arsenal', 'CHE': 'Chelsea', 'LIV': 'Liverpool', 'EVE': 'Everton', 'FUL': 'Fulham',
+             'BRE': 'Brentford', 'TOT': 'Tottenham Hotspur', 'NEW': 'Newcastle United',
+             'BUR': 'Burnley', 'WOL': 'Wolverhampton Wanderers'}
+
+
+class SlateBuilder:
+    """Builds a FixtureBundle answering the requests one scan makes for a synthetic slate."""
+
+    def __init__(self, seed: int = 7, nba_games: int = 8, nhl_games: int = 6, epl_games: int = 5):
+        self.rng = random.Random(seed)
+        self.bundle = FixtureBundle(meta={'clock': SLATE_CLOCK.isoformat(), 'synthetic': True})
+        self.date_code = SLATE_CLOCK.astimezone(ZoneInfo('America/New_York')).strftime('%y%b%d').upper()
+        self.markets = {}  # series_ticker -> [market]
+        self.n_games = {'nba': nba_games, 'nhl': nhl_games, 'epl': epl_games}
+
+    # ---- helpers ----
+    def _iso(self, dt: datetime) -> str:
+        return dt.strftime('%Y-%m-%dT%H:%M:%SZ')
+
+    def _commence(self, i: int, n_live: int) -> datetime:
+        if i < n_live:
+            return SLATE_CLOCK - timedelta(minutes=40 + 25 * i)
+        return SLATE_CLOCK + timedelta(minutes=30 + 30 * (i - n_live))
+
+    def _two_way(self, p: float, vig: float) -> tuple:
+        return round(1 / (p + vig / 2), 3), round(1 / (1 - p + vig / 2), 3)
+
+    def _add_market(self, series: str, ticker: str, title: str, fair_yes: float, floor_strike=None):
+        """Kalshi market + orderbook around fair_yes; ~10% are mispriced to produce edges."""
+        fair_c = min(98, max(2, int(round(fair_yes * 100))))
+        if self.rng.random() < 0.1:
+            fair_c = max(2, fair_c - self.rng.randint(4, 9))
+        yes_bid = max(1, fair_c - self.rng.randint(1, 3))
+        no_bid = max(1, 100 - fair_c - self.rng.randint(1, 3))
+        market = {
+            'ticker': ticker, 'event_ticker': ticker.rsplit('-', 1)[0], 'title': title, 'subtitle': '',
+            'status': 'active', 'yes_bid': yes_bid, 'yes_ask': 100 - no_bid,
+            'no_bid': no_bid, 'no_ask': 100 - yes_bid, 'volume': self.rng.randint(0, 5000),
+        }
+        if floor_strike is not None:
+            market['floor_strike'] = floor_strike
+        self.markets.setdefault(series, []).append(market)
+        book = {
+            'yes': [[yes_bid - k, self.rng.randint(5, 400)] for k in range(min(5, yes_bid)) if yes_bid - k >= 1],
+            'no': [[no_bid - k, self.rng.randint(5, 400)] for k in range(min(5, no_bid)) if no_bid - k >= 1],
+        }
+        self.bundle.add_json('GET', f"{KALSHI}/markets/{ticker}/orderbook", {'orderbook': book})
+
+    def _odds_game(self, game_id, home, away, commence, markets: list) -> dict:
+        last_update = self._iso(SLATE_CLOCK - timedelta(seconds=5))
+        return {
+            'id': game_id, 'sport_key': '', 'commence_time': self._iso(commence),
+            'home_team': home, 'away_team': away,
+            'bookmakers': [{'key': book, 'last_update': last_update,
+                            'markets': [{'key': k, 'last_update': last_update, 'outcomes': o[book]}
+                                        for k, o in markets]}
+                           for book in ('fanduel', 'pinnacle')],
+        }
+
+    def _player(self) -> str:
+        return f"{self.rng.choice(FIRST_NAMES)} {self.rng.choice(LAST_NAMES)}"
+
+    # ---- sports ----
+    def build_nba(self):
+        abbrs = sorted(app.NBA_TEAMS)
+        self.rng.shuffle(abbrs)
+        h2h, spreads, totals, events, scoreboard = [], [], [], [], []
+        n = self.n_games['nba']
+        n_live = max(1, n // 3)
+        for i in range(n):
+            away, home = abbrs[2 * i], abbrs[2 * i + 1]
+            away_name, home_name = app.NBA_TEAMS[away], app.NBA_TEAMS[home]
+            game_id = f"nba{i:02d}{self.rng.getrandbits(64):016x}"
+            commence = self._commence(i, n_live)
+            code = f"{self.date_code}{away}{home}"
+            p_home = self.rng.uniform(0.3, 0.75)
+            line = self.rng.choice([2.5, 4.5, 6.5, 8.5])
+            total = round(self.rng.uniform(212, 238)) + 0.5
+
+            outcomes = {}
+            for book, vig in (('fanduel', 0.045), ('pinnacle', 0.025)):
+                ph, pa = self._two_way(p_home, vig)
+                outcomes[book] = [{'name': home_name, 'price': ph}, {'name': away_name, 'price': pa}]
+            h2h.append(self._odds_game(game_id, home_name, away_name, commence, [('h2h', outcomes)]))
+            spread_o = {b: [{'name': home_name, 'price': 1.91, 'point': -line},
+                            {'name': away_name, 'price': 1.91, 'point': line}] for b in ('fanduel', 'pinnacle')}
+            spreads.append(self._odds_game(game_id, home_name, away_name, commence, [('spreads', spread_o)]))
+            total_o = {b: [{'name': 'Over', 'price': 1.91, 'point': total},
+                           {'name': 'Under', 'price': 1.91, 'point': total}] for b in ('fanduel', 'pinnacle')}
+            totals.append(self._odds_game(game_id, home_name, away_name, commence, [('totals', total_o)]))
+            events.append({'id': game_id, 'home_team': home_name, 'away_team': away_name,
+                           'commence_time': self._iso(commence)})
+
+            for abbr, p in ((home, p_home), (away, 1 - p_home)):
+                self._add_market('KXNBAGAME', f"KXNBAGAME-{code}-{abbr}", f"{away_name} at {home_name} Winner?", p)
+            for abbr, sign in ((home, 1), (away, -1)):
+                for pts in range(1, 16, 3):
+                    fair = min(0.95, max(0.05, 0.5 + sign * (line - pts) * 0.035))
+                    self._add_market('KXNBASPREAD', f"KXNBASPREAD-{code}-{abbr}{pts}",
+                                     f"{app.NBA_TEAMS[abbr]} wins by over {pts - 0.5} points?", fair, pts - 0.5)
+            for strike in range(int(total) - 15, int(total) + 16, 3):
+                fair = min(0.97, max(0.03, 0.5 - (strike + 0.5 - total) * 0.03))
+                self._add_market('KXNBATOTAL', f"KXNBATOTAL-{code}-{strike}",
+                                 f"{away_name} at {home_name}: Over {strike + 0.5} points?", fair, strike + 0.5)
+
+            live = i < n_live
+            self._nba_players(game_id, code, home, away, live, commence, scoreboard)
+
+        self.bundle.add_json('GET', f"{ODDS}/basketball_nba/odds/", h2h, self._odds_params('h2h'))
+        self.bundle.add_json('GET', f"{ODDS}/basketball_nba/odds/", spreads, self._odds_params('spreads'))
+        self.bundle.add_json('GET', f"{ODDS}/basketball_nba/odds/", totals, self._odds_params('totals'))
+        self.bundle.add_json('GET', f"{ODDS}/basketball_nba/events/", events)
+        self.bundle.add_json('GET', f"{ESPN}/basketball/nba/scoreboard", {'events': scoreboard})
+
+    def _nba_players(self, game_id, code, home, away, live, commence, scoreboard):
+        props = {mk: [] for mk in NBA_PROP_LINES}
+        box = {home: [], away: []}
+        for abbr in (home, away):
+            for _ in range(5):
+                name = self._player()
+                last = name.split()[-1].upper()
+                current = {}
+                for mk, (stat, mean, thresholds) in NBA_PROP_LINES.items():
+                    expected = max(0.5, self.rng.gauss(mean, mean * 0.3))
+                    fd_line = round(expected) - 0.5 if round(expected) >= 1 else 0.5
+                    props[mk].append({'name': 'Over', 'description': name, 'point': fd_line,
+                                      'price': round(self.rng.uniform(1.7, 2.2), 2)})
+                    current[stat] = int(expected * self.rng.uniform(0.4, 1.3)) if live else 0
+                    for t in thresholds:
+                        if live and current[stat] >= t:
+                            fair = 0.99
+                        else:
+                            fair = min(0.97, max(0.02, 0.5 + (expected - t + 0.5) / (mean + 2)))
+                        self._add_market(NBA_PROP_SERIES[mk], f"{NBA_PROP_SERIES[mk]}-{code}-{abbr}{last}{t}-{t}",
+                                         f"{name}: {t}+ {stat}", fair)
+                box[abbr].append({'athlete': {'displayName': name}, 'stats': [
+                    '30', str(current['points']), '7-15', f"{current['threes']}-6", '2-2',
+                    str(current['rebounds']), str(current['assists']), '2', '1', '0', '1', '4', '2', '+3']})
+        if not live:
+            payload = {'id': game_id, 'bookmakers': [{'key': 'fanduel', 'last_update': self._iso(SLATE_CLOCK),
+                       'markets': [{'key': mk, 'outcomes': o} for mk, o in props.items()]}]}
+            self.bundle.add_json('GET', f"{ODDS}/basketball_nba/events/{game_id}/odds", payload,
+                                 {'regions': 'us,us2', 'markets': ','.join(NBA_PROP_LINES),
+                                  'bookmakers': 'fanduel', 'oddsFormat': 'decimal'})
+            return
+        espn_id = str(401700000 + len(scoreboard))
+        scoreboard.append(self._espn_event(espn_id, commence, home, away, 'STATUS_IN_PROGRESS',
+                                           self.rng.randint(40, 90), self.rng.randint(40, 90)))
+        labels = ['MIN', 'PTS', 'FG', '3PT', 'FT', 'REB', 'AST', 'TO', 'STL', 'BLK', 'OREB', 'DREB', 'PF', '+/-']
+        self.bundle.add_json('GET', f"{ESPN}/basketball/nba/summary?event={espn_id}", {'boxscore': {'players': [
+            {'team': {'abbreviation': abbr}, 'statistics': [{'labels': labels, 'athletes': athletes}]}
+            for abbr, athletes in box.items()]}})
+
+    def _espn_event(self, espn_id, commence, home, away, status, home_score, away_score) -> dict:
+        return {'id': espn_id, 'date': self._iso(commence), 'status': {'type': {'name': status}},
+                'competitions': [{'competitors': [
+                    {'homeAway': 'home', 'team': {'abbreviation': home}, 'score': str(home_score)},
+                    {'homeAway': 'away', 'team': {'abbreviation': away}, 'score': str(away_score)}]}]}
+
+    def build_nhl(self):
+        abbrs = sorted(app.NHL_TEAMS)
+        self.rng.shuffle(abbrs)
+        events, scoreboard = [], []
+        n = self.n_games['nhl']
+        n_live = max(1, n // 2)
+        skater_labels = ['BS', 'HT', 'TK', '+/-', 'TOI', 'PPTOI', 'SHTOI', 'ESTOI', 'SHFT', 'G', 'YTDG',
+                         'A', 'S', 'SM', 'SOG', 'FW', 'FL', 'FO%', 'GV', 'PN', 'PIM']
+        goalie_labels = ['GA', 'SA', 'SOS', 'SOSA', 'SV', 'SV%', 'ESSV', 'PPSV', 'SHSV', 'TOI', 'YTDG', 'PIM']
+        for i in range(n):
+            away, home = abbrs[2 * i], abbrs[2 * i + 1]
+            game_id = f"nhl{i:02d}{self.rng.getrandbits(64):016x}"
+            commence = self._commence(i, n_live)
+            code = f"{self.date_code}{away}{home}"
+            live = i < n_live
+            events.append({'id': game_id, 'home_team': app.NHL_TEAMS[home], 'away_team': app.NHL_TEAMS[away],
+                           'commence_time': self._iso(commence)})
+            tied = live and i % 2 == 0
+            home_score = self.rng.randint(1, 3) if live else 0
+            away_score = home_score if tied else (self.rng.randint(0, 4) if live else 0)
+            for strike in range(3, 9):
+                reached = live and home_score + away_score > strike
+                self._add_market('KXNHLTOTAL', f"KXNHLTOTAL-{code}-{strike}",
+                                 f"{app.NHL_TEAMS[away]} at {app.NHL_TEAMS[home]}: Over {strike + 0.5} goals?",
+                                 0.99 if reached else max(0.05, 0.9 - 0.15 * (strike - 3)), strike + 0.5)
+            props = {mk: [] for mk in NHL_PROP_LINES}
+            box = {}
+            for abbr in (home, away):
+                skaters, goalies = [], []
+                for j in range(4):
+                    name = self._player()
+                    last = name.split()[-1].upper()
+                    goalie = j == 3
+                    lines = {'player_total_saves': NHL_PROP_LINES['player_total_saves']} if goalie else \
+                        {k: v for k, v in NHL_PROP_LINES.items() if k != 'player_total_saves'}
+                    current = {}
+                    for mk, (stat, mean, thresholds) in lines.items():
+                        props[mk].append({'name': 'Over', 'description': name, 'point': max(0.5, round(mean) - 0.5),
+                                          'price': round(self.rng.uniform(1.7, 2.6), 2)})
+                        current[stat] = int(max(0, self.rng.gauss(mean, mean * 0.5))) if live else 0
+                        for t in thresholds:
+                            fair = 0.99 if live and current[stat] >= t else max(0.03, min(0.9, mean / (t + 1)))
+                            self._add_market(NHL_PROP_SERIES[mk], f"{NHL_PROP_SERIES[mk]}-{code}-{abbr}{last}{t}-{t}",
+                                             f"{name}: {t}+ {stat}", fair)
+                    if goalie:
+                        saves = current.get('saves', 0)
+                        goalies.append({'athlete': {'displayName': name}, 'stats': [
+                            '2', str(saves + 2), '0', '0', str(saves), '.920', '0', '0', '0', '40:00', '10', '0']})
+                    else:
+                        goals = min(current.get('points', 0), 2)
+                        assists = current.get('assists', 0)
+                        stats = ['1', '2', '0', '0', '15:00', '2:00', '0:00', '13:00', '20', str(goals), '10',
+                                 str(assists), '3', '1', str(goals + 2), '0', '0', '0', '0', '0', '0']
+                        skaters.append({'athlete': {'displayName': name}, 'stats': stats})
+                box[abbr] = [{'labels': skater_labels, 'athletes': skaters},
+                             {'labels': goalie_labels, 'athletes': goalies}]
+            if live:
+                espn_id = str(401800000 + i)
+                scoreboard.append(self._espn_event(espn_id, commence, home, away, 'STATUS_IN_PROGRESS',
+                                                   home_score, away_score))
+                self.bundle.add_json('GET', f"{ESPN}/hockey/nhl/summary?event={espn_id}", {'boxscore': {'players': [
+                    {'team': {'abbreviation': abbr}, 'statistics': groups} for abbr, groups in box.items()]}})
+            else:
+                payload = {'id': game_id, 'bookmakers': [{'key': 'fanduel', 'last_update': self._iso(SLATE_CLOCK),
+                           'markets': [{'key': mk, 'outcomes': o} for mk, o in props.items()]}]}
+                self.bundle.add_json('GET', f"{ODDS}/icehockey_nhl/events/{game_id}/odds", payload,
+                                     {'regions': 'us,us2', 'markets': ','.join(NHL_PROP_LINES),
+                                      'bookmakers': 'fanduel', 'oddsFormat': 'decimal'})
+        self.bundle.add_json('GET', f"{ODDS}/icehockey_nhl/events/", events)
+        self.bundle.add_json('GET', f"{ESPN}/hockey/nhl/scoreboard", {'events': scoreboard})
+
+    def build_epl(self):
+        abbrs = sorted(EPL_TEAMS)
+        self.rng.shuffle(abbrs)
+        h2h, totals, events = [], [], []
+        for i in range(min(self.n_games['epl'], len(abbrs) // 2)):
+            away, home = abbrs[2 * i], abbrs[2 * i + 1]
+            home_name, away_name = EPL_TEAMS[home], EPL_TEAMS[away]
+            game_id = f"epl{i:02d}{self.rng.getrandbits(64):016x}"
+            commence = SLATE_CLOCK + timedelta(hours=12 + 2 * i)
+            code = f"{self.date_code}{away}{home}"
+            p_home = self.rng.uniform(0.3, 0.55)
+            p_draw = self.rng.uniform(0.22, 0.3)
+            p_away = 1 - p_home - p_draw
+            outcomes = {b: [{'name': home_name, 'price': round(1 / (p_home * v), 3)},
+                            {'name': away_name, 'price': round(1 / (p_away * v), 3)},
+                            {'name': 'Draw', 'price': round(1 / (p_draw * v), 3)}]
+                        for b, v in (('fanduel', 1.05), ('pinnacle', 1.025))}
+            h2h.append(self._odds_game(game_id, home_name, away_name, commence, [('h2h', outcomes)]))
+            total_o = {b: [{'name': 'Over', 'price': 1.95, 'point': 2.5},
+                           {'name': 'Under', 'price': 1.87, 'point': 2.5}] for b in ('fanduel', 'pinnacle')}
+            totals.append(self._odds_game(game_id, home_name, away_name, commence, [('totals', total_o)]))
+            events.append({'id': game_id, 'home_team': home_name, 'away_team': away_name,
+                           'commence_time': self._iso(commence)})
+            btts_o = {b: [{'name': 'Yes', 'price': 1.8}, {'name': 'No', 'price': 2.0}] for b in ('fanduel', 'pinnacle')}
+            self.bundle.add_json('GET', f"{ODDS}/soccer_epl/events/{game_id}/odds",
+                                 self._odds_game(game_id, home_name, away_name, commence, [('btts', btts_o)]),
+                                 {'regions': 'us,us2', 'markets': 'btts', 'bookmakers': 'fanduel,pinnacle',
+                                  'oddsFormat': 'decimal'})
+            for abbr, p in ((home, p_home), (away, p_away), ('DRAW', p_draw)):
+                self._add_market('KXEPLGAME', f"KXEPLGAME-{code}-{abbr}", f"{away_name} vs {home_name}", p)
+            for strike in (1, 2, 3, 4):
+                fair = {1: 0.78, 2: 0.52, 3: 0.3, 4: 0.15}[strike]
+                self._add_market('KXEPLTOTAL', f"KXEPLTOTAL-{code}-{strike}", f"Over {strike + 0.5} goals?",
+                                 fair, strike + 0.5)
+            self._add_market('KXEPLBTTS', f"KXEPLBTTS-{code}", f"{away_name} vs {home_name}: Both teams to score?", 0.54)
+        self.bundle.add_json('GET', f"{ODDS}/soccer_epl/odds/", h2h, self._odds_params('h2h'))
+        self.bundle.add_json('GET', f"{ODDS}/soccer_epl/odds/", totals, self._odds_params('totals'))
+        self.bundle.add_json('GET', f"{ODDS}/soccer_epl/odds/", [], self._odds_params('spreads'))
+        self.bundle.add_json('GET', f"{ODDS}/soccer_epl/events/", events)
+
+    def add_idle_sports(self):
+        """Empty responses for every other configured series/sport, as on a quiet night."""
+        series = set(app.MONEYLINE_SPORTS) | set(app.SPREAD_SPORTS) | set(app.TOTAL_SPORTS) | \
+            set(app.PLAYER_PROP_SPORTS) | set(app.BTTS_SPORTS) | set(app.TENNIS_SPORTS) | set(app.PROP_STAT_MAP)
+        for s in series - set(self.markets):
+            self.markets[s] = []
+        sport_keys = {v[0] for v in app.MONEYLINE_SPORTS.values()} | {v[0] for v in app.TOTAL_SPORTS.values()} | \
+            {v[0] for v in app.PLAYER_PROP_SPORTS.values()} | {v[0] for v in app.BTTS_SPORTS.values()}
+        busy = {'basketball_nba', 'icehockey_nhl', 'soccer_epl'}
+        for key in sport_keys - busy:
+            for markets in ('h2h', 'spreads', 'totals'):
+                self.bundle.add_json('GET', f"{ODDS}/{key}/odds/", [], self._odds_params(markets))
+            self.bundle.add_json('GET', f"{ODDS}/{key}/events/", [])
+        self.bundle.add_json('GET', ODDS, [{'key': k, 'active': True} for k in sorted(busy)])
+        for cfg in app.ESPN_SPORTS.values():
+            if cfg['espn_path'] not in ('basketball/nba', 'hockey/nhl'):
+                self.bundle.add_json('GET', f"{ESPN}/{cfg['espn_path']}/scoreboard", {'events': []})
+
+    def _odds_params(self, markets: str) -> dict:
+        return {'regions': 'us,us2', 'markets': markets, 'bookmakers': ','.join(sorted(app.FAIR_VALUE_BOOKS)),
+                'oddsFormat': 'decimal'}
+
+    def build(self) -> FixtureBundle:
+        self.build_nba()
+        self.build_nhl()
+        self.build_epl()
+        self.add_idle_sports()
+        for series, markets in self.markets.items():
+            self.bundle.add_json('GET', f"{KALSHI}/markets", {'markets': markets, 'cursor': ''},
+                                 {'limit': 200, 'status': 'open', 'series_ticker': series})
+        self.bundle.add_json('GET', f"{KALSHI}/portfolio/positions", {'market_positions': [], 'cursor': ''},
+                             {'limit': 200})
+        return self.bundle
+
+
+def _time(fn, repeat: int) -> dict:
+    samples = []
+    result = None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = fn()
+        samples.append(time.perf_counter() - start)
+    n = len(result[0]) if isinstance(result, tuple) else len(result or [])
+    return {'min': min(samples), 'median': statistics.median(samples), 'max': max(samples), 'results': n}
+
+
+def run(bundle: FixtureBundle, repeat: int, latency: float = 0.0) -> dict:
+    kalshi, fanduel = replay.prepare_replay(bundle, latency)
+    results = {}
+
+    def bench(name, fn):
+        bundle.rewind()
+        results[name] = _time(fn, repeat)
+        r = results[name]
+        print(f"{name:<40} min {r['min'] * 1000:9.1f}ms  median {r['median'] * 1000:9.1f}ms  results {r['results']}")
+
+    def cold_completed_props():
+        # First poll after engine start: every met rung is a new event and gets priced
+        app.reset_completed_props_state()
+        return app.find_completed_props(kalshi)
+
+    print(f"{'benchmark':<40} {'(' + str(repeat) + ' runs, sleeps disabled)':>40}")
+    bench('scan_all_sports', lambda: app.scan_all_sports(kalshi, fanduel))
+    bench('find_completed_props[cold]', cold_completed_props)
+    bench('find_completed_props[steady]', lambda: app.find_completed_props(kalshi))
+    bench('find_nhl_tied_game_totals', lambda: app.find_nhl_tied_game_totals(kalshi))
+
+    nba_ml = fanduel.get_moneyline('basketball_nba')
+    nba_spreads = fanduel.get_spreads('basketball_nba')
+    nba_totals = fanduel.get_totals('basketball_nba')
+    epl_ml = fanduel.get_moneyline('soccer_epl')
+    epl_totals = fanduel.get_totals('soccer_epl')
+    epl_btts = fanduel.get_btts('soccer_epl')
+    nba_props = fanduel.get_player_props_pregame('basketball_nba', list(NBA_PROP_LINES))
+    bench('find_moneyline_edges[NBA]', lambda: app.find_moneyline_edges(
+        kalshi, nba_ml, 'KXNBAGAME', 'NBA', app.NBA_TEAMS))
+    bench('find_moneyline_edges[EPL]', lambda: app.find_moneyline_edges(kalshi, epl_ml, 'KXEPLGAME', 'EPL', {}))
+    bench('find_spread_edges[NBA]', lambda: app.find_spread_edges(
+        kalshi, nba_spreads, 'KXNBASPREAD', 'NBA Spread', app.NBA_TEAMS))
+    bench('find_total_edges[NBA]', lambda: app.find_total_edges(
+        kalshi, nba_totals, 'KXNBATOTAL', 'NBA Total', app.NBA_TEAMS))
+    bench('find_total_edges[EPL]', lambda: app.find_total_edges(kalshi, epl_totals, 'KXEPLTOTAL', 'EPL Total', {}))
+    bench('find_btts_edges[EPL]', lambda: app.find_btts_edges(kalshi, epl_btts, 'KXEPLBTTS', 'EPL BTTS'))
+    bench('compare_pregame_props[NBA]', lambda: app.compare_pregame_props(
+        kalshi, nba_props, NBA_PROP_SERIES, 'NBA Props'))
+    bench('props_pregame[NBA, fetch+compare]', lambda: app.compare_pregame_props(
+        kalshi, fanduel.get_player_props_pregame('basketball_nba', list(NBA_PROP_LINES), stream=True),
+        NBA_PROP_SERIES, 'NBA Props'))
+    if bundle.misses:
+        print(f"({sum(bundle.misses.values())} requests not in bundle on the last run)")
+    return results
+
+
+def run_signing(seconds: float = 2.0, threads=(1, 4, 8)) -> dict:
+    """Signatures/sec and per-call latency for each signer, with N threads signing concurrently
+    (the scanner, sniper and combo MM all sign from their own threads)."""
+    _, pem = replay.throwaway_credentials()
+    results = {}
+    print(f"{'signer':<22} {'sig/s':>8} {'p50':>9} {'p99':>9}")
+    for kind in ('inline', 'thread', 'process'):
+        signer = app.make_signer(pem, kind)
+        signer.sign('warmup')
+        for n in threads:
+            latencies = [[] for _ in range(n)]
+            deadline = time.perf_counter() + seconds
+
+            def worker(out):
+                i = 0
+                while time.perf_counter() < deadline:
+                    start = time.perf_counter()
+                    signer.sign(f"{int(time.time() * 1000)}POST/trade-api/v2/portfolio/orders{i}")
+                    out.append(time.perf_counter() - start)
+                    i += 1
+
+            pool = [threading.Thread(target=worker, args=(out,)) for out in latencies]
+            for t in pool:
+                t.start()
+            for t in pool:
+                t.join()
+            samples = sorted(x for out in latencies for x in out)
+            name = f"{kind}[{n} thread{'s' if n > 1 else ''}]"
+            r = results[name] = {'per_sec': len(samples) / seconds,
+                                 'p50': samples[len(samples) // 2],
+                                 'p99': samples[min(len(samples) - 1, int(len(samples) * 0.99))]}
+            print(f"{name:<22} {r['per_sec']:8.0f} {r['p50'] * 1000:7.2f}ms {r['p99'] * 1000:7.2f}ms")
+        signer.close()
+    return results
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--fixture', help='Recorded bundle from replay.py (default: synthetic slate)')
+    parser.add_argument('--repeat', type=int, default=5)
+    parser.add_argument('--seed', type=int, default=7, help='Synthetic slate seed')
+    parser.add_argument('--json', help='Write results to this file')
+    parser.add_argument('--latency', type=float, default=0.0,
+                        help='Simulated seconds per HTTP response (e.g. 0.05)')
+    parser.add_argument('--signing', action='store_true',
+                        help='Benchmark Kalshi request signing (inline / thread / process) instead of the scan')
+    args = parser.parse_args()
+
+    if args.signing:
+        results = run_signing()
+    else:
+        bundle = FixtureBundle.load(args.fixture) if args.fixture else SlateBuilder(seed=args.seed).build()
+        results = run(bundle, args.repeat, args.latency)
+    if args.json:
+        with open(args.json, 'w') as f:
+            json.dump(results, f, indent=2)
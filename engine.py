@@ -0,0 +1,29 @@
+"""
+Trading engine entry point.
+
+Runs the background scanner, completed props sniper and combo market maker in
+their own process, publishing state to ENGINE_STATE_FILE for the web tier.
+Run web workers with ENGINE_MODE=web so they never start trading threads. Both
+processes must share ENGINE_STATE_DIR (default /tmp): same host or a shared volume.
+
+    python engine.py &
+    ENGINE_MODE=web gunicorn app:app
+"""
+import os
+import time
+
+os.environ['ENGINE_MODE'] = 'engine'
+
+import app  # noqa: E402  (ENGINE_MODE must be set before import)
+
+
+def main():
+    print("Engine process starting")
+    app.start_engine()
+    while True:
+        app.publish_engine_state()
+        time.sleep(app.ENGINE_STATE_INTERVAL)
+
+
+if __name__ == '__main__':
+    main()
@@ -1,3 +1,10 @@
+import os
+
 timeout = 600
-workers = 1
 threads = 2
+# Embedded mode runs the trading threads inside the web process, so it must stay
+# at one worker. With ENGINE_MODE=web (engine.py running alongside) workers scale freely.
+if os.environ.get('ENGINE_MODE', 'embedded') == 'web':
+    workers = int(os.environ.get('WEB_WORKERS', 4))
+else:
+    workers = 1
@@ -0,0 +1,217 @@
+"""
+Offline record/replay for full scans.
+
+Record one live scan (trading and Telegram disabled) into a fixture bundle:
+    python replay.py record fixtures/slate.json.gz
+
+Replay it with no network access, deterministically (frozen clock, no sleeps):
+    python replay.py replay fixtures/slate.json.gz
+
+A bundle is gzipped JSON: {'meta': {...}, 'entries': {request_key: [response, ...]}}.
+Repeated identical requests (e.g. the same orderbook polled twice) are served in
+recorded order; the last response repeats once the sequence is exhausted.
+"""
+import base64
+import gzip
+import json
+import os
+import sys
+import threading
+import time
+from datetime import datetime, timezone
+from urllib.parse import urlsplit, parse_qsl, urlencode
+
+os.environ.setdefault('ENGINE_MODE', 'engine')  # Import app without starting trading threads
+
+import requests  # noqa: E402
+from requests.adapters import BaseAdapter, HTTPAdapter  # noqa: E402
+from requests.structures import CaseInsensitiveDict  # noqa: E402
+
+import app  # noqa: E402
+
+# Query params that change between runs without changing the response we want
+VOLATILE_PARAMS = {'apiKey', 'commenceTimeFrom', 'commenceTimeTo'}
+KEPT_HEADERS = ('Content-Type', 'Retry-After')
+
+
+def request_key(method: str, url: str) -> str:
+    """Stable lookup key: METHOD host/path?sorted-params (volatile params dropped,
+    comma-separated lists sorted since e.g. FAIR_VALUE_BOOKS comes from a set)."""
+    parts = urlsplit(url)
+    params = sorted((k, ','.join(sorted(v.split(',')))) for k, v in parse_qsl(parts.query, keep_blank_values=True)
+                    if k not in VOLATILE_PARAMS)
+    query = f"?{urlencode(params)}" if params else ''
+    return f"{method.upper()} {parts.netloc}{parts.path}{query}"
+
+
+class FixtureBundle:
+    def __init__(self, entries: dict = None, meta: dict = None):
+        self.entries = entries or {}
+        self.meta = meta or {}
+        self._cursors = {}
+        self._lock = threading.Lock()
+        self.misses = {}
+
+    @classmethod
+    def load(cls, path: str) -> 'FixtureBundle':
+        with gzip.open(path, 'rt') as f:
+            data = json.load(f)
+        return cls(data.get('entries', {}), data.get('meta', {}))
+
+    def save(self, path: str):
+        os.makedirs(os.path.dirname(path) or '.', exist_ok=True)
+        with gzip.open(path, 'wt') as f:
+            json.dump({'meta': self.meta, 'entries': self.entries}, f)
+
+    def add(self, key: str, status: int, headers: dict, body: bytes):
+        entry = {'status': status, 'headers': {h: headers[h] for h in KEPT_HEADERS if h in headers}}
+        try:
+            entry['text'] = body.decode('utf-8')
+        except UnicodeDecodeError:
+            entry['b64'] = base64.b64encode(body).decode('ascii')
+        with self._lock:
+            self.entries.setdefault(key, []).append(entry)
+
+    def add_json(self, method: str, url: str, payload, params: dict = None, status: int = 200):
+        """Add a synthetic JSON response for the request requests would build from (url, params)."""
+        prepared = requests.Request(method, url, params=params).prepare()
+        self.add(request_key(method, prepared.url), status,
+                 {'Content-Type': 'application/json'}, json.dumps(payload).encode('utf-8'))
+
+    def next(self, key: str):
+        with self._lock:
+            responses = self.entries.get(key)
+            if not responses:
+                self.misses[key] = self.misses.get(key, 0) + 1
+                return None
+            i = self._cursors.get(key, 0)
+            self._cursors[key] = i + 1
+            return responses[min(i, len(responses) - 1)]
+
+    def rewind(self):
+        with self._lock:
+            self._cursors.clear()
+            self.misses.clear()
+
+
+class RecordingAdapter(HTTPAdapter):
+    """Live transport that copies every response into a FixtureBundle."""
+    def __init__(self, bundle: FixtureBundle, **kwargs):
+        super().__init__(**kwargs)
+        self.bundle = bundle
+
+    def send(self, request, **kwargs):
+        response = super().send(request, **kwargs)
+        self.bundle.add(request_key(request.method, request.url), response.status_code,
+                        response.headers, response.content)
+        return response
+
+
+class ReplayAdapter(BaseAdapter):
+    """Offline transport serving responses from a FixtureBundle. Unknown requests get a 404.
+    latency: seconds each response takes, to make connection/concurrency changes measurable."""
+    def __init__(self, bundle: FixtureBundle, latency: float = 0.0):
+        super().__init__()
+        self.bundle = bundle
+        self.latency = latency
+
+    def send(self, request, **kwargs):
+        if self.latency:
+            time.sleep(self.latency)
+        entry = self.bundle.next(request_key(request.method, request.url))
+        response = requests.Response()
+        response.request = request
+        response.url = request.url
+        response.encoding = 'utf-8'
+        if entry is None:
+            response.status_code = 404
+            response.reason = 'Not in fixture bundle'
+            response._content = b'{}'
+            response.headers = CaseInsensitiveDict({'Content-Type': 'application/json'})
+        else:
+            response.status_code = entry['status']
+            response.reason = 'Replayed'
+            response.headers = CaseInsensitiveDict(entry.get('headers', {}))
+            response._content = entry['text'].encode('utf-8') if 'text' in entry else base64.b64decode(entry['b64'])
+        return response
+
+    def close(self):
+        pass
+
+
+def install_transport(adapter):
+    """Route all app HTTP (shared session + every KalshiAPI built afterwards) through adapter."""
+    app.HTTP_TRANSPORT = adapter
+    app._http.mount('https://', adapter)
+    app._http.mount('http://', adapter)
+
+
+def freeze_clock(when: datetime):
+    app.CLOCK_OVERRIDE = when.astimezone(timezone.utc)
+
+
+def disable_side_effects():
+    """No orders, no Telegram: recording and replaying must never trade."""
+    app.AUTO_TRADE_ENABLED = False
+    app.PROP_MM_ENABLED = False
+    app.TELEGRAM_BOT_TOKEN = None
+    app.BOX_EVENTS_FILE = None
+
+
+def throwaway_credentials():
+    """Generate an in-memory RSA key so authenticated code paths (and signing cost) run offline."""
+    from cryptography.hazmat.primitives import serialization
+    from cryptography.hazmat.primitives.asymmetric import rsa
+    key = rsa.generate_private_key(public_exponent=65537, key_size=2048)
+    pem = key.private_bytes(serialization.Encoding.PEM, serialization.PrivateFormat.PKCS8,
+                            serialization.NoEncryption()).decode()
+    return 'replay-key-id', pem
+
+
+def prepare_replay(bundle: FixtureBundle, latency: float = 0.0):
+    """Configure app for a deterministic offline run against bundle. Returns (kalshi, fanduel)."""
+    disable_side_effects()
+    install_transport(ReplayAdapter(bundle, latency))
+    clock = bundle.meta.get('clock')
+    if clock:
+        freeze_clock(datetime.fromisoformat(clock))
+    app.SLEEP_SCALE = 0
+    key_id, pem = throwaway_credentials()
+    app._kalshi_client = app.KalshiAPI(key_id, pem)
+    return app._kalshi_client, app.FanDuelAPI('replay')
+
+
+def record(path: str):
+    bundle = FixtureBundle(meta={'clock': datetime.now(timezone.utc).isoformat(),
+                                 'recorded_at': datetime.utcnow().isoformat()})
+    disable_side_effects()
+    install_transport(RecordingAdapter(bundle))
+    kalshi = app.get_kalshi_client()
+    fanduel = app.FanDuelAPI(app.ODDS_API_KEY)
+    start = time.perf_counter()
+    edges, scanned, active = app.scan_all_sports(kalshi, fanduel)
+    bundle.save(path)
+    n = sum(len(v) for v in bundle.entries.values())
+    print(f"Recorded {n} responses ({len(bundle.entries)} distinct requests) in "
+          f"{time.perf_counter() - start:.1f}s, {len(edges)} edges -> {path}")
+
+
+def replay(path: str):
+    bundle = FixtureBundle.load(path)
+    kalshi, fanduel = prepare_replay(bundle)
+    start = time.perf_counter()
+    edges, scanned, active = app.scan_all_sports(kalshi, fanduel)
+    print(f"Replayed scan in {time.perf_counter() - start:.2f}s: {len(edges)} edges, "
+          f"{sum(bundle.misses.values())} unmatched requests")
+    for key, n in sorted(bundle.misses.items()):
+        print(f"   miss x{n}: {key}")
+
+
+if __name__ == '__main__':
+    if len(sys.argv) != 3 or sys.argv[1] not in ('record', 'replay'):
+        print(__doc__)
+        sys.exit(1)
+    if sys.argv[1] == 'record':
+        record(sys.argv[2])
+    else:
+        replay(sys.argv[2])
@@ -0,0 +1,6 @@
+import os
+import sys
+
+# Import app without starting the trading threads (same as replay.py / bench.py)
+os.environ.setdefault('ENGINE_MODE', 'engine')
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
@@ -0,0 +1,56 @@
+import pytest
+
+import app
+
+GAME = {'game_id': '401', 'home': 'BOS', 'away': 'NYK', 'game_date_str': '26FEB03'}
+
+
+@pytest.fixture
+def store(monkeypatch):
+    """A BoxScoreStore whose ESPN summary is whatever the test puts in payload['data']."""
+    payload = {}
+
+    def fetch(game_id, espn_path):
+        if isinstance(payload['data'], Exception):
+            raise payload['data']
+        return payload['data']
+
+    monkeypatch.setattr(app, '_fetch_espn_summary', fetch)
+    monkeypatch.setattr(app, '_parse_box_score', lambda data, *args: data['box'])
+    monkeypatch.setattr(app, 'BOX_EVENTS_FILE', None)
+    s = app.BoxScoreStore()
+    s.payload = payload
+    return s
+
+
+def poll(store, box, game=GAME):
+    store.payload['data'] = {'box': box}
+    return store.update('nba', game, 'basketball/nba', {})
+
+
+def test_first_poll_reports_nonzero_stats_as_new(store):
+    _, events, _ = poll(store, {'Jayson Tatum': {'points': 12, 'rebounds': 0, '_team': 'BOS'}})
+    assert [(e['player'], e['stat'], e['old'], e['new'], e['team']) for e in events] == [
+        ('Jayson Tatum', 'points', None, 12, 'BOS')]
+
+
+def test_only_changed_stats_emit_events(store):
+    poll(store, {'Jayson Tatum': {'points': 12, 'rebounds': 3}})
+    _, events, _ = poll(store, {'Jayson Tatum': {'points': 14, 'rebounds': 3}})
+    assert [(e['stat'], e['old'], e['new']) for e in events] == [('points', 12, 14)]
+    assert poll(store, {'Jayson Tatum': {'points': 14, 'rebounds': 3}})[1] == []
+
+
+def test_new_game_date_starts_a_fresh_box(store):
+    poll(store, {'Jayson Tatum': {'points': 12}})
+    _, events, _ = poll(store, {'Jayson Tatum': {'points': 12}}, dict(GAME, game_date_str='26FEB05'))
+    assert [(e['old'], e['new']) for e in events] == [(None, 12)]
+
+
+@pytest.mark.parametrize('failure', [RuntimeError('timeout'), {'unexpected': 'payload'}])
+def test_fetch_or_parse_error_returns_empty_and_keeps_previous_box(store, failure):
+    poll(store, {'Jayson Tatum': {'points': 12}})
+    store.payload['data'] = failure  # raises in the fetch, or KeyError in the parse
+    assert store.update('nba', GAME, 'basketball/nba', {}) == ({}, [], {})
+    _, events, _ = poll(store, {'Jayson Tatum': {'points': 15}})
+    assert [(e['old'], e['new']) for e in events] == [(12, 15)]
@@ -0,0 +1,42 @@
+import threading
+
+import app
+
+
+def test_reserve_and_release():
+    exp = app.ComboExposure(max_quote_cents=500, max_total_cents=1000)
+    assert exp.reserve('r1', 400) is None
+    assert exp.reserve('r2', 500) is None
+    assert exp.total_cents == 900
+    assert exp.release('r1') == 400
+    assert exp.total_cents == 500
+    assert exp.release('r1') == 0
+
+
+def test_refusals_name_the_cap():
+    exp = app.ComboExposure(max_quote_cents=500, max_total_cents=1000)
+    assert exp.reserve('big', 501) == 'quote'
+    assert exp.reserve('r1', 500) is None
+    assert exp.reserve('r1', 100) == 'duplicate'
+    assert exp.reserve('r2', 500) is None
+    assert exp.reserve('r3', 1) == 'global'
+    assert exp.total_cents == 1000
+
+
+def test_parallel_workers_never_overshoot_the_global_cap():
+    exp = app.ComboExposure(max_quote_cents=100, max_total_cents=1000)
+    granted = []
+    start = threading.Barrier(8)
+
+    def worker(n):
+        start.wait()
+        for i in range(50):
+            if exp.reserve(f"{n}-{i}", 100) is None:
+                granted.append(100)
+
+    threads = [threading.Thread(target=worker, args=(n,)) for n in range(8)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+    assert sum(granted) == exp.total_cents == 1000
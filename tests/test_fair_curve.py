@@ -0,0 +1,110 @@
+import pytest
+from statistics import NormalDist
+
+import app
+
+NORMAL = ('normal', 12.0, 8.0)
+POISSON = ('poisson', None, 1.0)
+
+
+@pytest.mark.parametrize('params,line,p_over', [
+    (NORMAL, 4.5, 0.5), (NORMAL, -3.5, 0.62), (NORMAL, 221.5, 0.3),
+    (POISSON, 2.5, 0.55), (POISSON, 5.5, 0.4), (POISSON, 0.5, 0.8),
+])
+def test_fit_reproduces_p_over_at_the_line(params, line, p_over):
+    curve = app.FairCurve.fit(params, line, p_over)
+    assert curve.prob_over(line) == pytest.approx(p_over, abs=1e-6)
+    assert curve.prob_over_many([line]) == [pytest.approx(p_over, abs=1e-6)]
+
+
+def test_fit_rejects_extreme_prices():
+    assert app.FairCurve.fit(NORMAL, 4.5, 0.995) is None
+    assert app.FairCurve.fit(POISSON, 2.5, 0.005) is None
+
+
+@pytest.mark.parametrize('params,line', [(NORMAL, 4.5), (POISSON, 5.5)])
+def test_prob_over_falls_as_the_strike_rises(params, line):
+    curve = app.FairCurve.fit(params, line, 0.5)
+    strikes = [line + step for step in (-3, -2, -1, 0, 1, 2, 3)]
+    probs = curve.prob_over_many(strikes)
+    assert probs == [pytest.approx(curve.prob_over(k)) for k in strikes]
+    assert all(a > b for a, b in zip(probs, probs[1:]))
+
+
+def test_covers_respects_reach():
+    curve = app.FairCurve.fit(NORMAL, 4.5, 0.5)
+    assert curve.covers(4.5 + 8.0) and curve.covers(4.5 - 8.0)
+    assert not curve.covers(4.5 + 8.5) and not curve.covers(4.5 - 8.5)
+
+
+def test_fair_curve_for_uses_the_series_model(monkeypatch):
+    assert app.fair_curve_for('KXNBASPREAD', 'margin', 4.5, 0.5).sd == 12.0
+    assert app.fair_curve_for('KXNHLTOTAL', 'total', 5.5, 0.5).model == 'poisson'
+    assert app.fair_curve_for('KXUNKNOWN', 'margin', 4.5, 0.5) is None
+    monkeypatch.setattr(app, 'FAIR_CURVE_ENABLED', False)
+    assert app.fair_curve_for('KXNBASPREAD', 'margin', 4.5, 0.5) is None
+
+
+def test_curve_per_book_refits_each_book():
+    curve = app.FairCurve.fit(NORMAL, 4.5, 0.5)
+    per_book = app._curve_per_book(curve, {'fanduel': 0.5, 'draftkings': 0.6, 'bad': 0.999}, 6.5, over=True)
+    assert set(per_book) == {'fanduel', 'draftkings'}  # unfittable prices are dropped
+    assert per_book['fanduel'] == pytest.approx(curve.prob_over(6.5))
+    assert per_book['draftkings'] > per_book['fanduel']
+    under = app._curve_per_book(curve, {'fanduel': 0.5}, 6.5, over=False)
+    assert under['fanduel'] == pytest.approx(1 - per_book['fanduel'])
+
+
+# --- find_spread_edges sign convention ---
+
+TEAMS = {'BOS': 'Boston Celtics', 'NYK': 'New York Knicks'}
+
+
+class FakeKalshi:
+    def __init__(self, markets):
+        self.markets = markets
+
+    def get_markets(self, series_ticker):
+        return self.markets
+
+    def get_orderbook(self, ticker):
+        return app.OrderBook(no_levels=[(60, 10)])
+
+
+@pytest.fixture
+def spread_candidates(monkeypatch):
+    """find_spread_edges' candidates for a BOS -4.5 / NYK +4.5 game priced at 50/50."""
+    date = sorted(app._get_today_date_strs())[0]
+    monkeypatch.setattr(app, 'emit_fair_value_edges', lambda candidates, kalshi_api: candidates)
+    monkeypatch.setattr(app, '_sleep', lambda seconds: None)
+    monkeypatch.setattr(app._slate, 'match_odds_event', lambda code, t1, t2, games, *abbrs: (t1, t2, 'g1'))
+    markets = [{'ticker': f'KXNBASPREAD-{date}NYKBOS-{suffix}', 'floor_strike': strike}
+               for suffix, strike in (('BOS5', 4.5), ('BOS7', 6.5), ('NYK2', 1.5))]
+    fd = {
+        'games': {'g1': {'home': 'Boston Celtics', 'away': 'New York Knicks', 'live': False}},
+        'spreads': {'g1': {
+            'Boston Celtics': {'point': -4.5, 'fair_prob': 0.5, 'odds': 1.91, 'per_book': {'fanduel': 0.5}},
+            'New York Knicks': {'point': 4.5, 'fair_prob': 0.5, 'odds': 1.91, 'per_book': {'fanduel': 0.5}},
+            '_mode': 'consensus', '_last_update': '',
+        }},
+    }
+    edges = app.find_spread_edges(FakeKalshi(markets), fd, 'KXNBASPREAD', 'NBA Spread', TEAMS)
+    return {e['kalshi_ticker'].rsplit('-', 1)[1]: e for e in edges}
+
+
+def test_spread_at_the_quoted_line_keeps_the_direct_price(spread_candidates):
+    assert spread_candidates['BOS5']['fd_opp_prob'] == pytest.approx(1 / 1.91)
+    assert spread_candidates['BOS5']['fair_value_mode'] == 'consensus'
+
+
+def test_favorite_off_the_line_comes_off_the_margin_curve(spread_candidates):
+    # BOS by 6.5+ is M > 6.5 with M ~ N(4.5, 12): the opposite side is P(M <= 6.5)
+    assert spread_candidates['BOS7']['fd_opp_prob'] == pytest.approx(NormalDist(4.5, 12.0).cdf(6.5))
+
+
+def test_underdog_spread_is_priced_at_minus_the_strike(spread_candidates):
+    # NYK by 1.5+ is M < -1.5: the opposite side is P(M > -1.5), the curve's p_over at -strike
+    nyk = spread_candidates['NYK2']
+    assert nyk['fd_opp_prob'] == pytest.approx(1 - NormalDist(4.5, 12.0).cdf(-1.5))
+    assert nyk['fair_value_mode'] == 'consensus+curve'
+    assert nyk['per_book_detail']['fanduel'] == pytest.approx(nyk['fd_opp_prob'])
@@ -0,0 +1,43 @@
+import pytest
+
+import app
+
+
+@pytest.mark.parametrize('cents', range(101))
+def test_fee_table_matches_the_exact_fee(cents):
+    assert app.KALSHI_FEE_TABLE[cents] == app._kalshi_fee_exact(cents / 100)
+    assert app.kalshi_fee(cents / 100) == app._kalshi_fee_exact(cents / 100)
+
+
+def test_complement_prices_use_the_whole_cent_fee():
+    # 1 - 0.90 is 0.0999...98; the exact formula rounds that a hundredth of a cent low
+    assert app._kalshi_fee_exact(1 - 0.90) == 0.0063
+    assert app.kalshi_fee(1 - 0.90) == app.KALSHI_FEE_TABLE[10] == 0.0064
+
+
+def test_sub_cent_prices_and_other_sizes_use_the_exact_fee():
+    assert app.kalshi_fee(0.905) == app._kalshi_fee_exact(0.905)
+    assert app.kalshi_fee(0.5, 10) == app._kalshi_fee_exact(0.5, 10) == 0.018
+    assert app.kalshi_fee(0.5) == app.KALSHI_FEE_TABLE[50] != 0.018
+
+
+def test_rank_edges_applies_the_min_edge_cutoff():
+    # Profits: 0.40 vs 0.50 -> ~9.1%, 0.45 vs 0.50 -> ~3.4%, 0.60 vs 0.45 -> no edge
+    prices, opp = [0.40, 0.45, 0.60], [0.50, 0.50, 0.45]
+    assert [r[0] for r in app.rank_edges(prices, opp, min_edge=2.0)] == [0, 1]
+    assert [r[0] for r in app.rank_edges(prices, opp, min_edge=5.0)] == [0]
+    assert app.rank_edges(prices, opp, min_edge=10.0) == []
+
+
+def test_rank_edges_is_best_first_and_stable():
+    ranked = app.rank_edges([0.45, 0.40, None, 0.40], [0.50, 0.50, 0.30, 0.50], min_edge=0.0)
+    assert [r[0] for r in ranked] == [1, 3, 0]  # equal profits keep candidate order; None skipped
+    i, eff, total, profit = ranked[0]
+    assert eff == 0.40 + app.kalshi_fee(0.40)
+    assert total == eff + 0.50
+    assert profit == pytest.approx((1 / total - 1) * 100)
+
+
+def test_rank_edges_prices_custom_sizes_at_their_fee():
+    [(_, eff, _, _)] = app.rank_edges([0.5], [0.4], sizes=[10], min_edge=0.0)
+    assert eff == 0.5 + app._kalshi_fee_exact(0.5, 10)
@@ -0,0 +1,71 @@
+import json
+
+import app
+
+
+class FakeSocket:
+    def __init__(self):
+        self.sent = []
+
+    def send(self, raw):
+        self.sent.append(json.loads(raw))
+
+
+def connected_ws():
+    ws = app.KalshiWebSocket(None)
+    ws._ws = FakeSocket()
+    return ws
+
+
+def commands(ws):
+    return [(m['cmd'], m['params']) for m in ws._ws.sent]
+
+
+def subscribed(ws, sid):
+    ws._on_reply({'id': ws._cmd_id, 'type': 'subscribed', 'msg': {'sid': sid}})
+
+
+def test_tickers_added_before_the_sid_arrives_go_out_as_add_markets():
+    ws = connected_ws()
+    ws.subscribe('ticker', ['A', 'B'])
+    ws.subscribe('ticker', ['B', 'C'])
+    assert commands(ws) == [('subscribe', {'channels': ['ticker'], 'market_tickers': ['A', 'B']})]
+    subscribed(ws, 7)
+    assert commands(ws)[1:] == [('update_subscription', {'sids': [7], 'market_tickers': ['C'], 'action': 'add_markets'})]
+
+
+def test_repeat_subscribe_updates_the_existing_subscription():
+    ws = connected_ws()
+    ws.subscribe('ticker', ['A'])
+    subscribed(ws, 3)
+    ws.subscribe('ticker', ['A'])
+    ws.subscribe('ticker', ['D'])
+    assert [cmd for cmd, _ in commands(ws)] == ['subscribe', 'update_subscription']
+
+
+def test_unsubscribing_the_last_ticker_closes_the_channel():
+    ws = connected_ws()
+    ws.subscribe('ticker', ['A', 'B'])
+    subscribed(ws, 5)
+    ws.unsubscribe('ticker', ['A'])
+    ws.unsubscribe('ticker', ['B'])
+    assert commands(ws)[1:] == [
+        ('update_subscription', {'sids': [5], 'market_tickers': ['A'], 'action': 'delete_markets'}),
+        ('unsubscribe', {'sids': [5]}),
+    ]
+    assert ws._subscriptions['ticker'] == set() and 'ticker' not in ws._sids
+
+
+def test_channel_wide_subscription_is_sent_once():
+    ws = connected_ws()
+    ws.subscribe('communications')
+    ws.subscribe('communications')
+    assert commands(ws) == [('subscribe', {'channels': ['communications']})]
+
+
+def test_offline_subscriptions_are_only_registered():
+    ws = app.KalshiWebSocket(None)
+    ws.subscribe('ticker', ['A'])
+    ws.unsubscribe('ticker', ['A'])
+    ws.subscribe('ticker', ['B'])
+    assert ws._subscriptions == {'ticker': {'B'}}
@@ -0,0 +1,59 @@
+import app
+
+
+def book(yes=(), no=()):
+    return app.OrderBook.from_response({'orderbook': {'yes': [list(l) for l in yes], 'no': [list(l) for l in no]}})
+
+
+def test_best_bids_asks_and_mid():
+    ob = book(yes=[(40, 10), (42, 5)], no=[(55, 3), (50, 8)])
+    assert (ob.best_yes_bid, ob.best_no_bid) == (42, 55)
+    assert ob.yes_ask() == 0.45
+    assert ob.no_ask() == 0.58
+    assert ob.mid_yes() == (42 + 45) / 200
+
+
+def test_one_sided_and_empty_books():
+    ob = book(no=[(30, 1)])
+    assert ob.yes_ask() == 0.70 and ob.no_ask() is None and ob.mid_yes() is None
+    assert not ob.empty
+    assert book().empty
+    assert book(yes=[(40, 0)]).empty  # zero-size levels aren't bids
+
+
+def test_yes_asks_cheapest_first_with_cap():
+    ob = book(no=[(2, 50), (9, 10), (4, 30), (8, 100)])
+    assert ob.yes_asks() == [(91, 10), (92, 100), (96, 30), (98, 50)]
+    assert ob.yes_asks(max_cents=96) == [(91, 10), (92, 100), (96, 30)]
+
+
+def test_repeated_levels_add_up():
+    ob = app.OrderBook(yes_levels=[(40, 10), (40, 5)])
+    assert ob.yes[40] == 15
+
+
+def test_is_empty_book():
+    assert app._is_empty_book({})  # 404
+    assert app._is_empty_book(book())
+    assert not app._is_empty_book(None)  # transient error: never cached
+    assert not app._is_empty_book(book(yes=[(1, 1)]))
+
+
+def test_depth_at_or_below_a_price():
+    ob = book(yes=[(40, 10), (42, 5)], no=[(2, 50), (9, 10), (4, 30), (8, 100)])  # YES asks 91/92/96/98
+    assert [ob.yes_depth(c) for c in (90, 91, 92, 96, 97, 98, 99)] == [0, 10, 110, 140, 140, 190, 190]
+    assert ob.yes_depth(0) == 0
+    assert [ob.no_depth(c) for c in (57, 58, 60, 99)] == [0, 5, 15, 15]
+
+
+def test_delta_maintains_best_bids_and_depth():
+    ob = book(no=[(8, 100), (9, 10)])
+    assert ob.yes_depth(92) == 110
+    ob.apply_delta('no', 9, -10)  # best level emptied: next best takes over
+    assert ob.best_no_bid == 8 and ob.yes_depth(92) == 100
+    ob.apply_delta('no', 12, 5)  # new better bid
+    assert ob.yes_ask() == 0.88 and ob.yes_depth(88) == 5
+    ob.apply_delta('no', 8, -500)  # never negative
+    assert ob.no[8] == 0 and ob.yes_depth(99) == 5
+    ob.apply_delta('no', 12, -5)
+    assert ob.empty
@@ -0,0 +1,80 @@
+from datetime import datetime
+
+import pytest
+
+import app
+
+SCOPE = frozenset(('BOS', 'NYK'))
+
+
+@pytest.fixture
+def registry(monkeypatch):
+    day = [datetime(2026, 2, 3, 12)]
+    monkeypatch.setattr(app, '_get_eastern_now', lambda: day[0])
+    reg = app.PlayerRegistry()
+    reg.today = day
+    return reg
+
+
+class Matcher:
+    """Fallback matcher that records how often it was asked."""
+    def __init__(self, answer=None):
+        self.answer = answer
+        self.calls = 0
+
+    def __call__(self, name, candidates):
+        self.calls += 1
+        return self.answer if self.answer in candidates else None
+
+
+@pytest.mark.parametrize('name, normalized', [
+    ('Luka Dončić', 'luka doncic'),
+    ('Jaren Jackson Jr.', 'jaren jackson'),
+    ('P.J. Tucker', 'pj tucker'),
+    ('Karl-Anthony Towns', 'karl anthony towns'),
+])
+def test_normalize_player_name(name, normalized):
+    assert app.normalize_player_name(name) == normalized
+
+
+def test_same_normalized_name_links_without_the_fallback(registry):
+    match = Matcher()
+    found = registry.resolve('nba', SCOPE, 'kalshi', 'Luka Doncic', 'fanduel', ['Luka Dončić', 'Kyrie Irving'], match)
+    assert found == 'Luka Dončić' and match.calls == 0
+
+
+def test_fallback_match_is_remembered_both_ways(registry):
+    match = Matcher('Nic Claxton')
+    candidates = ['Nic Claxton', 'Mikal Bridges']
+    assert registry.resolve('nba', SCOPE, 'kalshi', 'Nicolas Claxton', 'fanduel', candidates, match) == 'Nic Claxton'
+    assert registry.resolve('nba', SCOPE, 'kalshi', 'Nicolas Claxton', 'fanduel', candidates, match) == 'Nic Claxton'
+    assert match.calls == 1
+    # The reverse lookup reuses the link too
+    assert registry.resolve('nba', SCOPE, 'fanduel', 'Nic Claxton', 'kalshi', ['Nicolas Claxton'], match) == 'Nicolas Claxton'
+    assert match.calls == 1
+
+
+def test_miss_is_remembered_until_candidates_change(registry):
+    match = Matcher()
+    for _ in range(2):
+        assert registry.resolve('nba', SCOPE, 'kalshi', 'Nobody Here', 'fanduel', ['Kyrie Irving'], match) is None
+    assert match.calls == 1
+    match.answer = 'Nobody Heree'
+    assert registry.resolve('nba', SCOPE, 'kalshi', 'Nobody Here', 'fanduel',
+                            ['Kyrie Irving', 'Nobody Heree'], match) == 'Nobody Heree'
+    assert match.calls == 2
+
+
+def test_links_are_scoped_to_the_game(registry):
+    match = Matcher('Nic Claxton')
+    registry.resolve('nba', SCOPE, 'kalshi', 'Nicolas Claxton', 'fanduel', ['Nic Claxton'], match)
+    registry.resolve('nba', frozenset(('LAL', 'GSW')), 'kalshi', 'Nicolas Claxton', 'fanduel', ['Nic Claxton'], match)
+    assert match.calls == 2
+
+
+def test_new_day_forgets_links(registry):
+    match = Matcher('Nic Claxton')
+    registry.resolve('nba', SCOPE, 'kalshi', 'Nicolas Claxton', 'fanduel', ['Nic Claxton'], match)
+    registry.today[0] = datetime(2026, 2, 4, 12)
+    registry.resolve('nba', SCOPE, 'kalshi', 'Nicolas Claxton', 'fanduel', ['Nic Claxton'], match)
+    assert match.calls == 2 and registry.day == '26FEB04'
@@ -0,0 +1,26 @@
+import pytest
+
+import app
+
+
+@pytest.fixture
+def client(monkeypatch, tmp_path):
+    monkeypatch.setattr(app, 'PROFILE_FLAG_FILE', str(tmp_path / 'profile.flag'))
+    monkeypatch.setattr(app, 'PROFILE_FILE', str(tmp_path / 'profiles.jsonl'))
+    monkeypatch.delenv('SCAN_PROFILE', raising=False)
+    return app.app.test_client()
+
+
+def test_get_is_read_only(client):
+    resp = client.get('/debug/profile?enable=1')
+    assert resp.status_code == 200 and b'Profiling: OFF' in resp.data
+    assert not app.profiling_enabled()
+
+
+def test_post_toggles_profiling(client):
+    resp = client.post('/debug/profile', data={'enable': '1'})
+    assert resp.status_code == 302
+    assert app.profiling_enabled()
+    assert b'Profiling: ON' in client.get('/debug/profile').data
+    client.post('/debug/profile', data={'enable': '0'})
+    assert not app.profiling_enabled()
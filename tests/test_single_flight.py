@@ -0,0 +1,73 @@
+import threading
+import time
+
+import pytest
+
+import app
+
+
+def test_concurrent_calls_share_one_execution():
+    flight = app.SingleFlight('test')
+    started, release = threading.Event(), threading.Event()
+    calls = []
+
+    def fetch():
+        calls.append(1)
+        started.set()
+        release.wait(5)
+        return {'book': 1}
+
+    results = []
+    threads = [threading.Thread(target=lambda: results.append(flight.do('T', fetch))) for _ in range(5)]
+    for t in threads:
+        t.start()
+    started.wait(5)
+    time.sleep(0.1)  # let the followers reach the in-flight wait
+    release.set()
+    for t in threads:
+        t.join(5)
+    assert len(calls) == 1
+    assert len(results) == 5 and all(r is results[0] for r in results)
+
+
+def test_negative_results_are_cached_until_ttl(monkeypatch):
+    now = [100.0]
+    monkeypatch.setattr(app.time, 'time', lambda: now[0])
+    flight = app.SingleFlight('test')
+    calls = []
+    fetch = lambda: calls.append(1) or {}
+    assert flight.do('T', fetch, cache_if=lambda r: r == {}) == {}
+    assert flight.do('T', fetch, cache_if=lambda r: r == {}) == {}
+    assert len(calls) == 1
+    now[0] += app.KALSHI_NEGATIVE_TTL + 1
+    flight.do('T', fetch, cache_if=lambda r: r == {})
+    assert len(calls) == 2
+
+
+def test_positive_results_and_errors_are_not_cached():
+    flight = app.SingleFlight('test')
+    calls = []
+
+    def fail():
+        calls.append(1)
+        raise RuntimeError('boom')
+
+    for _ in range(2):
+        with pytest.raises(RuntimeError):
+            flight.do('T', fail, cache_if=lambda r: True)
+    assert len(calls) == 2
+    assert flight.do('U', lambda: calls.append(1) or [1], cache_if=lambda r: not r) == [1]
+    flight.do('U', lambda: calls.append(1) or [1], cache_if=lambda r: not r)
+    assert len(calls) == 4
+
+
+def test_clear_one_key():
+    flight = app.SingleFlight('test')
+    calls = []
+    fetch = lambda: calls.append(1) or None
+    for key in ('A', 'B'):
+        flight.do(key, fetch, cache_if=lambda r: r is None)
+    flight.clear('A')
+    flight.do('A', fetch, cache_if=lambda r: r is None)
+    flight.do('B', fetch, cache_if=lambda r: r is None)
+    assert len(calls) == 3
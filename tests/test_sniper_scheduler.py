@@ -0,0 +1,48 @@
+import pytest
+
+import app
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    now = [1000.0]
+    monkeypatch.setattr(app.time, 'time', lambda: now[0])
+    return now
+
+
+def test_unscheduled_key_is_due(clock):
+    assert app.SniperScheduler().due('box:1')
+
+
+def test_schedule_waits_the_level_interval(clock):
+    sched = app.SniperScheduler()
+    sched.schedule('box:1', 'hot')
+    assert not sched.due('box:1')
+    clock[0] += app.SNIPER_POLL_INTERVALS['hot']
+    assert sched.due('box:1')
+
+
+def test_seconds_until_next_is_the_soonest_key(clock):
+    sched = app.SniperScheduler()
+    assert sched.seconds_until_next() == app.SNIPER_POLL_INTERVALS['idle']
+    sched.schedule('scoreboard:nba', 'idle')
+    sched.schedule('box:1', 'critical')
+    assert sched.seconds_until_next() == app.SNIPER_POLL_INTERVALS['critical']
+
+
+def test_games_dropping_off_the_scoreboard_stop_polling(clock):
+    sched = app.SniperScheduler()
+    sched.set_live_games('nba', [{'game_id': '1'}, {'game_id': '2'}])
+    sched.schedule('box:1', 'hot')
+    sched.schedule('box:2', 'live')
+    sched.set_live_games('nba', [{'game_id': '2'}])
+    assert 'box:1' not in sched.levels and 'box:2' in sched.levels
+    assert sched.summary() == '1 live'
+
+
+def test_prop_game_level():
+    assert app._prop_game_level('nba', 'STATUS_FINAL', 4, True) == 'final'
+    assert app._prop_game_level('nba', 'STATUS_HALFTIME', 2, True) == 'break'
+    assert app._prop_game_level('nba', 'STATUS_IN_PROGRESS', 2, False) == 'live'
+    assert app._prop_game_level('nba', 'STATUS_IN_PROGRESS', 2, True) == 'hot'
+    assert app._prop_game_level('nba', 'STATUS_IN_PROGRESS', 4, True) == 'critical'
@@ -0,0 +1,146 @@
+import pytest
+
+import app
+
+
+class FakeKalshi:
+    """get_balance / place_order stand-in. place_order fills fill_ratio of each order,
+    charging its limit price and a 1c fee per fill."""
+    def __init__(self, balance_cents=100000, fill_ratio=1.0):
+        self.balance_cents = balance_cents
+        self.fill_ratio = fill_ratio
+        self.balance_calls = 0
+        self.orders = []
+
+    def get_balance(self):
+        self.balance_calls += 1
+        return {'balance': self.balance_cents}
+
+    def place_order(self, ticker, side, price_cents, count, client_order_id=None, time_in_force=None):
+        self.orders.append((ticker, side, price_cents, count, time_in_force))
+        filled = int(count * self.fill_ratio)
+        return {'order': {'order_id': f'o{len(self.orders)}', 'status': 'executed' if filled == count else 'canceled',
+                          'fill_count': filled, 'remaining_count': count - filled,
+                          'taker_fill_cost': filled * price_cents, 'taker_fees': 1 if filled else 0}}
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    now = [1000.0]
+    monkeypatch.setattr(app.time, 'time', lambda: now[0])
+    return now
+
+
+# --- LocalBalance ---
+
+def test_balance_is_read_over_rest_once_per_sync_window(clock):
+    kalshi, bal = FakeKalshi(5000), app.LocalBalance()
+    assert bal.available(kalshi) == 5000
+    assert bal.available(kalshi) == 5000
+    assert kalshi.balance_calls == 1
+    clock[0] += app.BALANCE_SYNC_SECONDS + 1
+    bal.available(kalshi)
+    assert kalshi.balance_calls == 2
+
+
+def test_concurrent_reservations_share_the_balance(clock):
+    kalshi, bal = FakeKalshi(5000), app.LocalBalance()
+    bal.available(kalshi)
+    first = bal.reserve(3000)
+    assert first is not None
+    assert bal.available(kalshi) == 2000
+    assert bal.reserve(2500) is None  # only 2000 left while the first sweep is in flight
+    assert bal.reserve(2000) is not None
+
+
+def test_settle_debits_what_filled(clock):
+    kalshi, bal = FakeKalshi(5000), app.LocalBalance()
+    bal.available(kalshi)
+    token = bal.reserve(3000)
+    bal.settle(token, 3000, 1200)
+    assert bal.available(kalshi) == 3800
+    assert kalshi.balance_calls == 1
+
+
+def test_sync_during_a_sweep_is_not_double_counted(clock):
+    kalshi, bal = FakeKalshi(5000), app.LocalBalance()
+    bal.available(kalshi)
+    token = bal.reserve(3000)
+    clock[0] += app.BALANCE_SYNC_SECONDS + 1
+    kalshi.balance_cents = 3800  # REST already reflects the fill
+    assert bal.available(kalshi) == 800  # fresh balance less the still-open reservation
+    bal.settle(token, 3000, 1200)
+    assert bal.available(kalshi) == 3800  # re-read rather than debiting the fill twice
+    assert kalshi.balance_calls == 3
+
+
+def test_invalidate_forces_a_reread(clock):
+    kalshi, bal = FakeKalshi(5000), app.LocalBalance()
+    bal.available(kalshi)
+    kalshi.balance_cents = 4000  # a resting prop MM order or combo fill elsewhere
+    bal.invalidate()
+    assert bal.available(kalshi) == 4000
+
+
+# --- sweep_yes_asks / auto_trade_completed_prop ---
+
+def test_sweep_sends_one_ioc_order_at_the_limit():
+    kalshi = FakeKalshi(fill_ratio=0.5)
+    sweep = app.sweep_yes_asks(kalshi, 'T', 96, 40)
+    assert kalshi.orders == [('T', 'yes', 96, 40, 'immediate_or_cancel')]
+    assert sweep['contracts'] == 20
+    assert sweep['cost_cents'] == 20 * 96 + 1 and sweep['fee_cents'] == 1
+
+
+def test_sweep_survives_an_order_error():
+    class Failing(FakeKalshi):
+        def place_order(self, *args, **kwargs):
+            raise RuntimeError('timeout')
+    sweep = app.sweep_yes_asks(Failing(), 'T', 96, 40)
+    assert sweep['contracts'] == 0 and sweep['cost_cents'] == 0
+
+
+@pytest.fixture
+def trading(monkeypatch):
+    monkeypatch.setattr(app, 'AUTO_TRADE_ENABLED', True)
+    monkeypatch.setattr(app, '_order_tracker', app.OrderTracker())
+    monkeypatch.setattr(app, '_balance', app.LocalBalance())
+    monkeypatch.setattr(app, 'send_order_telegram', lambda *args, **kwargs: None)
+
+
+EDGE = {'kalshi_ticker': 'T', 'arbitrage_profit': 5.0}
+BOOK = app.OrderBook(no_levels=[(2, 50), (4, 30), (8, 100), (9, 10)])  # YES asks 91/92/96/98
+
+
+def test_sweep_limit_is_the_highest_profitable_price():
+    assert app.SWEEP_LIMIT_CENTS == 99
+    assert 0.99 + app.kalshi_fee(0.99) < 1.0
+
+
+def test_completed_prop_takes_the_whole_depth_with_one_order(trading):
+    kalshi = FakeKalshi()
+    info = app.auto_trade_completed_prop(EDGE, kalshi, BOOK)
+    assert kalshi.orders == [('T', 'yes', app.SWEEP_LIMIT_CENTS, 190, 'immediate_or_cancel')]
+    assert info['contracts'] == 190 and info['status'] == 'executed' and info['price'] == 0.91
+    assert app._balance.available(kalshi) == 100000 - (190 * app.SWEEP_LIMIT_CENTS + 1)
+    assert kalshi.balance_calls == 1
+
+
+def test_completed_prop_skips_books_with_nothing_profitable(trading):
+    kalshi = FakeKalshi()
+    assert app.auto_trade_completed_prop(EDGE, kalshi, app.OrderBook(yes_levels=[(40, 10)])) is None
+    assert kalshi.orders == [] and kalshi.balance_calls == 0
+
+
+def test_completed_prop_is_sized_to_the_local_balance(trading):
+    kalshi = FakeKalshi(balance_cents=2000)
+    app.auto_trade_completed_prop(EDGE, kalshi, BOOK)
+    (_, _, limit, count, _), = kalshi.orders
+    assert (limit, count) == (92, 21)  # 10 @ 91c + 11 @ 92c fit in $20 with fees
+    assert app._balance._outstanding_cents == 0
+
+
+def test_completed_prop_partial_fill_is_recorded(trading):
+    kalshi = FakeKalshi(fill_ratio=0.5)
+    info = app.auto_trade_completed_prop(EDGE, kalshi, BOOK)
+    assert info['contracts'] == 95 and info['status'] == 'partial'
@@ -0,0 +1,60 @@
+import pytest
+
+import app
+
+
+class FakeKalshi:
+    def __init__(self):
+        self.listed = []
+
+    def get_markets(self, series_ticker):
+        self.listed.append(series_ticker)
+        return []
+
+
+def ladder(*rungs):
+    lad = app.ThresholdLadder()
+    for threshold, ticker in rungs:
+        lad.add(threshold, ticker)
+    return lad
+
+
+@pytest.fixture
+def index(monkeypatch):
+    idx = app.PropThresholdIndex()
+    monkeypatch.setattr(idx, 'resolve_player', lambda sport, code, player, box: player)
+    return idx
+
+
+def test_rebuild_drops_ladders_cached_from_the_old_index(index, monkeypatch):
+    old = {'nba': {'26FEB03NYKBOS': {('Jayson Tatum', 'points'): ladder((20, 'T-20'))}}}
+    new = {'nba': {'26FEB03NYKBOS': {('Jayson Tatum', 'points'): ladder((20, 'T-20'), (25, 'T-25'))}}}
+    monkeypatch.setattr(index, '_build', lambda kalshi_api, date_strs: new)
+    index.games = old
+    index.ladders_by_player('nba', '26FEB03NYKBOS', {'Jayson Tatum': {}})
+
+    index.refresh(None, force=True)
+    by_name, fresh = index.ladders_by_player('nba', '26FEB03NYKBOS', {'Jayson Tatum': {}})
+    [(player, lad)] = by_name[('Jayson Tatum', 'points')]
+    assert lad.tickers == ['T-20', 'T-25']
+    assert len(fresh) == 1
+
+
+def test_game_index_requires_a_build():
+    with pytest.raises(TypeError):
+        app._GameIndex()
+
+
+def test_no_markets_listed_while_nothing_is_live(monkeypatch):
+    monkeypatch.setattr(app, '_get_live_games', lambda espn_path: [])
+    monkeypatch.setattr(app, '_prop_threshold_index', app.PropThresholdIndex())
+    kalshi = FakeKalshi()
+    assert app.find_completed_props(kalshi) == []
+    assert kalshi.listed == []
+
+
+def test_due_claims_a_rung_so_a_second_caller_cannot_price_it(index):
+    index.arm('T-20', {'game_id': '401'})
+    assert [t for t, _ in index.due('401', 100.0)] == ['T-20']
+    assert index.due('401', 100.0) == []
+    assert [t for t, _ in index.due('401', 100.0 + app.ARMED_REPRICE_INTERVAL)] == ['T-20']